@@ -40,6 +40,45 @@ logger = logging.getLogger(__name__)
 type SSEEvent = StepEvent | StreamDoneEvent | FileCreatedEvent | SubAgentProgressEvent | SubAgentTextEvent
 
 
+class DeltaReassembler:
+    """Reassemble delta-encoded text streams into contiguous appends.
+
+    Tracks how many characters of each text stream (per step, thinking vs. response text)
+    have been delivered, so every yielded event's `delta` can simply be appended by the
+    consumer. Overlapping deltas are trimmed, and after a gap events are dropped until the
+    next checkpoint, whose full `content` fills in the missing text. Only lengths are kept,
+    so CPU and memory stay linear in the output size.
+    """
+
+    def __init__(self) -> None:
+        self._received: dict[tuple[int, str], int] = {}
+        self._out_of_sync: set[tuple[int, str]] = set()
+
+    def apply(self, event: StepEvent) -> StepEvent | None:
+        """Normalize a delta event, returning None if it must be dropped."""
+        if event.offset is None:
+            return event
+
+        key = (event.step_number, "thinking" if event.type == "thinking" else "text")
+        received = self._received.get(key, 0)
+
+        if event.is_checkpoint and event.content is not None:
+            self._out_of_sync.discard(key)
+            self._received[key] = len(event.content)
+            return event.model_copy(update={"delta": event.content[received:]})
+
+        delta = event.delta or ""
+        if key in self._out_of_sync or event.offset > received:
+            if key not in self._out_of_sync:
+                logger.warning("Gap in delta stream (step=%s, expected offset %s, got %s)", key, received, event.offset)
+            self._out_of_sync.add(key)
+            return None
+
+        delta = delta[received - event.offset :]
+        self._received[key] = received + len(delta)
+        return event.model_copy(update={"delta": delta})
+
+
 class BaseClient:
     """Base client with shared functionality."""
 
@@ -88,8 +127,13 @@ class BaseClient:
         if status >= 400:
             raise RossumAgentError(f"Request failed: {status}", status, body)
 
-    def _parse_sse_event(self, event_type: str, data: str) -> SSEEvent | None:
-        """Parse an SSE event into the appropriate model."""
+    def _parse_sse_event(
+        self, event_type: str, data: str, reassembler: DeltaReassembler | None = None
+    ) -> SSEEvent | None:
+        """Parse an SSE event into the appropriate model.
+
+        When a reassembler is given, delta-encoded step events are normalized by it.
+        """
         try:
             parsed = json.loads(data)
         except json.JSONDecodeError:
@@ -98,7 +142,8 @@ class BaseClient:
 
         match event_type:
             case "step":
-                return StepEvent.model_validate(parsed)
+                step_event = StepEvent.model_validate(parsed)
+                return reassembler.apply(step_event) if reassembler else step_event
             case "done":
                 return StreamDoneEvent.model_validate(parsed)
             case "file_created":
@@ -205,13 +250,23 @@ class RossumAgentClient(BaseClient):
         images: list[ImageContent] | None = None,
         documents: list[DocumentContent] | None = None,
         rossum_url: str | None = None,
+        stream_deltas: bool = False,
     ) -> Iterator[SSEEvent]:
-        """Send a message and stream the agent's response via SSE."""
+        """Send a message and stream the agent's response via SSE.
+
+        With `stream_deltas=True`, the server sends only new text for streaming thinking and
+        answer events. Such events are yielded with `content=None` and the new text in `delta`,
+        already deduplicated and ordered, so appending each `delta` rebuilds the full text.
+        Checkpoint events (`is_checkpoint=True`), sent when a text first reaches 4096 characters
+        and then each time it doubles, keep the full text in `content` next to their `delta`.
+        Non-streaming events (e.g. the final answer) still carry the full `content`.
+        """
         request = MessageRequest(
             content=content,
             images=images,
             documents=documents,
             rossum_url=rossum_url,
+            stream_deltas=stream_deltas or None,
         )
 
         with self._client.stream(
@@ -225,6 +280,7 @@ class RossumAgentClient(BaseClient):
                 response.read()
                 self._handle_error(response)
 
+            reassembler = DeltaReassembler() if stream_deltas else None
             event_type: str | None = None
             data_buffer: list[str] = []
 
@@ -235,7 +291,7 @@ class RossumAgentClient(BaseClient):
                     data_buffer.append(line[5:].strip())
                 elif line == "" and event_type and data_buffer:
                     data = "\n".join(data_buffer)
-                    event = self._parse_sse_event(event_type, data)
+                    event = self._parse_sse_event(event_type, data, reassembler)
                     if event:
                         yield event
                     event_type = None
@@ -357,13 +413,23 @@ class AsyncRossumAgentClient(BaseClient):
         images: list[ImageContent] | None = None,
         documents: list[DocumentContent] | None = None,
         rossum_url: str | None = None,
+        stream_deltas: bool = False,
     ) -> AsyncIterator[SSEEvent]:
-        """Send a message and stream the agent's response via SSE."""
+        """Send a message and stream the agent's response via SSE.
+
+        With `stream_deltas=True`, the server sends only new text for streaming thinking and
+        answer events. Such events are yielded with `content=None` and the new text in `delta`,
+        already deduplicated and ordered, so appending each `delta` rebuilds the full text.
+        Checkpoint events (`is_checkpoint=True`), sent when a text first reaches 4096 characters
+        and then each time it doubles, keep the full text in `content` next to their `delta`.
+        Non-streaming events (e.g. the final answer) still carry the full `content`.
+        """
         request = MessageRequest(
             content=content,
             images=images,
             documents=documents,
             rossum_url=rossum_url,
+            stream_deltas=stream_deltas or None,
         )
 
         async with self._client.stream(
@@ -377,6 +443,7 @@ class AsyncRossumAgentClient(BaseClient):
                 await response.aread()
                 self._handle_error(response)
 
+            reassembler = DeltaReassembler() if stream_deltas else None
             event_type: str | None = None
             data_buffer: list[str] = []
 
@@ -387,7 +454,7 @@ class AsyncRossumAgentClient(BaseClient):
                     data_buffer.append(line[5:].strip())
                 elif line == "" and event_type and data_buffer:
                     data = "\n".join(data_buffer)
-                    event = self._parse_sse_event(event_type, data)
+                    event = self._parse_sse_event(event_type, data, reassembler)
                     if event:
                         yield event
                     event_type = None
@@ -17,6 +17,7 @@ from rossum_agent_client.models.responses import (
     FileListResponse,
     HealthResponse,
     Message,
+    RequestPacingStats,
     StepEvent,
     StreamDoneEvent,
     SubAgentProgressEvent,
@@ -39,6 +40,7 @@ __all__ = [
     "ChatListResponse",
     "ChatSummary",
     "HealthResponse",
+    "RequestPacingStats",
     "DeleteResponse",
     "FileListResponse",
     "FileInfo",
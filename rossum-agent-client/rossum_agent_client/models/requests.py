@@ -45,3 +45,6 @@ class MessageRequest(BaseModel):
         description="Optional list of PDF documents (max 5) to include with the message",
     )
     rossum_url: str | None = Field(default=None, description="Optional Rossum app URL for context")
+    stream_deltas: bool | None = Field(
+        default=None, description="Stream only new text for thinking and answer events instead of the full text"
+    )
@@ -78,7 +78,11 @@ class DeleteResponse(BaseModel):
 
 
 class StepEvent(BaseModel):
-    """Event emitted during agent execution via SSE."""
+    """Event emitted during agent execution via SSE.
+
+    With delta streaming, streaming text events carry the new text in `delta` (starting at
+    `offset`) instead of the full text in `content`; checkpoints carry both.
+    """
 
     type: Literal["thinking", "intermediate", "tool_start", "tool_result", "final_answer", "error"]
     step_number: int
@@ -90,6 +94,10 @@ class StepEvent(BaseModel):
     is_error: bool = False
     is_streaming: bool = False
     is_final: bool = False
+    delta: str | None = None
+    offset: int | None = None
+    seq: int | None = None
+    is_checkpoint: bool = False
 
 
 class SubAgentProgressEvent(BaseModel):
@@ -131,11 +139,16 @@ class SubAgentTokenUsageDetail(BaseModel):
 
 
 class TokenUsageBreakdown(BaseModel):
-    """Token usage breakdown by agent vs sub-agents."""
+    """Token usage breakdown by agent vs sub-agents.
+
+    Prompt cache writes and reads are reported separately from the input token counts.
+    """
 
     total: TokenUsageBySource
     main_agent: TokenUsageBySource
     sub_agents: SubAgentTokenUsageDetail
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
     def format_summary_lines(self) -> list[str]:
         """Format token usage as human-readable lines."""
@@ -160,9 +173,16 @@ class TokenUsageBreakdown(BaseModel):
             [
                 "-" * 60,
                 f"{'TOTAL':<25} {total.input_tokens:>12,} {total.output_tokens:>12,} {total.total_tokens:>12,}",
-                "=" * 60,
             ]
         )
+        if self.cache_creation_input_tokens or self.cache_read_input_tokens:
+            lines.extend(
+                [
+                    f"{'Prompt cache write':<25} {self.cache_creation_input_tokens:>12,}",
+                    f"{'Prompt cache read':<25} {self.cache_read_input_tokens:>12,}",
+                ]
+            )
+        lines.append("=" * 60)
         return lines
 
 
@@ -184,12 +204,27 @@ class FileCreatedEvent(BaseModel):
     url: str
 
 
+class RequestPacingStats(BaseModel):
+    """Per-process model request pacing counters."""
+
+    max_rate: float
+    current_rate: float
+    burst: int
+    available_tokens: float
+    acquisitions: int
+    delayed_acquisitions: int
+    total_delay_seconds: float
+    max_delay_seconds: float
+    rate_limit_events: int
+
+
 class HealthResponse(BaseModel):
     """Response for health check endpoint."""
 
     status: Literal["healthy", "unhealthy"]
     redis_connected: bool
     version: str
+    pacing: RequestPacingStats | None = None
 
 
 class FileListResponse(BaseModel):
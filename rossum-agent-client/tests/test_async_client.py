@@ -236,6 +236,26 @@ class TestAsyncSendMessageStream:
         assert request is not None
         assert b'"rossum_url"' in request.content
 
+    @pytest.mark.asyncio
+    async def test_send_message_stream_reassembles_deltas(
+        self, httpx_mock: HTTPXMock, async_client: AsyncRossumAgentClient, agent_api_url: str
+    ) -> None:
+        sse_response = (
+            'event: step\ndata: {"type": "thinking", "step_number": 1, "delta": "Hmm", "offset": 0, '
+            '"seq": 1, "is_streaming": true}\n\n'
+            'event: step\ndata: {"type": "thinking", "step_number": 1, "delta": "mm...", "offset": 1, '
+            '"seq": 2, "is_streaming": true}\n\n'
+        )
+        httpx_mock.add_response(
+            url=f"{agent_api_url}/api/v1/chats/chat-123/messages",
+            method="POST",
+            content=sse_response.encode(),
+        )
+
+        events = [event async for event in async_client.send_message_stream("chat-123", "Hi", stream_deltas=True)]
+
+        assert [e.delta for e in events if isinstance(e, StepEvent)] == ["Hmm", "..."]
+
 
 class TestAsyncClose:
     @pytest.mark.asyncio
@@ -6,6 +6,7 @@ import pytest
 from pytest_httpx import HTTPXMock
 
 from rossum_agent_client import RossumAgentClient
+from rossum_agent_client.client import DeltaReassembler
 from rossum_agent_client.exceptions import (
     AuthenticationError,
     NotFoundError,
@@ -518,3 +519,107 @@ class TestParseSSEEvent:
         assert isinstance(result, StepEvent)
         assert result.type == "error"
         assert result.is_error is True
+
+    def test_step_event_is_normalized_by_reassembler(self, client: RossumAgentClient) -> None:
+        reassembler = DeltaReassembler()
+        result = client._parse_sse_event(
+            "step",
+            '{"type": "final_answer", "step_number": 1, "delta": "Hi", "offset": 0, "seq": 1, "is_streaming": true}',
+            reassembler,
+        )
+        assert isinstance(result, StepEvent)
+        assert result.delta == "Hi"
+        assert result.content is None
+
+
+def _delta_event(delta: str, offset: int, **kwargs: object) -> StepEvent:
+    return StepEvent.model_validate(
+        {"type": "final_answer", "step_number": 1, "delta": delta, "offset": offset, "is_streaming": True, **kwargs}
+    )
+
+
+class TestDeltaReassembler:
+    def test_contiguous_deltas_pass_through(self) -> None:
+        reassembler = DeltaReassembler()
+        events = [reassembler.apply(_delta_event("Hello", 0)), reassembler.apply(_delta_event(" world", 5))]
+        assert "".join(e.delta for e in events if e and e.delta) == "Hello world"
+
+    def test_overlapping_delta_is_trimmed(self) -> None:
+        reassembler = DeltaReassembler()
+        reassembler.apply(_delta_event("Hello", 0))
+        event = reassembler.apply(_delta_event("lo world", 3))
+        assert event is not None
+        assert event.delta == " world"
+
+    def test_gap_drops_events_until_checkpoint(self) -> None:
+        reassembler = DeltaReassembler()
+        reassembler.apply(_delta_event("Hello", 0))
+        assert reassembler.apply(_delta_event("!", 11)) is None
+        assert reassembler.apply(_delta_event("?", 12)) is None
+
+        checkpoint = reassembler.apply(_delta_event("?", 12, content="Hello world!?", is_checkpoint=True))
+
+        assert checkpoint is not None
+        assert checkpoint.delta == " world!?"
+        after = reassembler.apply(_delta_event(" Bye", 13))
+        assert after is not None
+        assert after.delta == " Bye"
+
+    def test_thinking_and_text_streams_are_independent(self) -> None:
+        reassembler = DeltaReassembler()
+        reassembler.apply(
+            StepEvent.model_validate(
+                {"type": "thinking", "step_number": 1, "delta": "Hmm", "offset": 0, "is_streaming": True}
+            )
+        )
+        event = reassembler.apply(_delta_event("Answer", 0))
+        assert event is not None
+        assert event.delta == "Answer"
+
+    def test_full_content_events_are_untouched(self) -> None:
+        reassembler = DeltaReassembler()
+        event = StepEvent(type="final_answer", step_number=1, content="Done", is_final=True)
+        assert reassembler.apply(event) is event
+
+
+class TestSendMessageStreamDeltas:
+    def test_stream_deltas_requests_and_reassembles(
+        self, httpx_mock: HTTPXMock, client: RossumAgentClient, agent_api_url: str
+    ) -> None:
+        sse_response = (
+            'event: step\ndata: {"type": "final_answer", "step_number": 1, "delta": "Hel", "offset": 0, '
+            '"seq": 1, "is_streaming": true}\n\n'
+            'event: step\ndata: {"type": "final_answer", "step_number": 1, "delta": "lo", "offset": 3, '
+            '"seq": 2, "is_streaming": true}\n\n'
+            'event: step\ndata: {"type": "final_answer", "step_number": 1, "content": "Hello", "seq": 3, '
+            '"is_final": true}\n\n'
+        )
+        httpx_mock.add_response(
+            url=f"{agent_api_url}/api/v1/chats/chat-123/messages",
+            method="POST",
+            content=sse_response.encode(),
+        )
+
+        events = list(client.send_message_stream("chat-123", "Hi", stream_deltas=True))
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert b'"stream_deltas":true' in request.content.replace(b" ", b"")
+        assert [e.delta for e in events[:2] if isinstance(e, StepEvent)] == ["Hel", "lo"]
+        assert isinstance(events[2], StepEvent)
+        assert events[2].content == "Hello"
+
+    def test_stream_deltas_not_sent_by_default(
+        self, httpx_mock: HTTPXMock, client: RossumAgentClient, agent_api_url: str
+    ) -> None:
+        httpx_mock.add_response(
+            url=f"{agent_api_url}/api/v1/chats/chat-123/messages",
+            method="POST",
+            content=b'event: done\ndata: {"total_steps": 1, "input_tokens": 10, "output_tokens": 5}\n\n',
+        )
+
+        list(client.send_message_stream("chat-123", "Hi"))
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert b"stream_deltas" not in request.content
@@ -274,6 +274,29 @@ class TestHealthResponse:
         resp = HealthResponse(status="unhealthy", redis_connected=False, version="1.0.0dev")
         assert resp.status == "unhealthy"
 
+    def test_response_with_pacing_stats(self) -> None:
+        resp = HealthResponse.model_validate(
+            {
+                "status": "healthy",
+                "redis_connected": True,
+                "version": "1.0.0dev",
+                "pacing": {
+                    "max_rate": 1.0,
+                    "current_rate": 0.5,
+                    "burst": 10,
+                    "available_tokens": 3.5,
+                    "acquisitions": 12,
+                    "delayed_acquisitions": 2,
+                    "total_delay_seconds": 1.5,
+                    "max_delay_seconds": 1.0,
+                    "rate_limit_events": 1,
+                },
+            }
+        )
+        assert resp.pacing is not None
+        assert resp.pacing.current_rate == 0.5
+        assert resp.pacing.rate_limit_events == 1
+
 
 class TestDeleteResponse:
     def test_deleted_true(self) -> None:
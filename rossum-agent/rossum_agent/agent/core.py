@@ -11,7 +11,7 @@ at multiple points to provide real-time updates to the client. The yield flow is
 
     _stream_model_response
         │
-        ├── #5 forwards from _process_stream_events ──┬── #1 Timeout flush (buffer stale after 1.5s)
+        ├── #5 forwards from _process_stream_events ──┬── #1 Deadline flush (buffer stale after 1.5s)
         │                                             ├── #2 Stream end flush (final text)
         │                                             ├── #3 Thinking tokens (chain-of-thought)
         │                                             └── #4 Text deltas (after initial buffer)
@@ -27,6 +27,9 @@ Key concepts:
   (INTERMEDIATE vs FINAL_ANSWER) before streaming to client
 - After initial flush, text tokens stream immediately
 - Tool execution yields progress updates for UI responsiveness
+- The pipeline is event-driven: stream events, sub-agent progress and tool completions are
+  delivered to `asyncio.Queue`s (via `call_soon_threadsafe` from worker threads) and awaited
+  directly, so nothing polls on a timer
 - In a single step, a thinking block is always followed by an intermediate block
   (tool calls or text response)
 """
@@ -37,7 +40,6 @@ import asyncio
 import dataclasses
 import json
 import logging
-import queue
 import random
 import time
 from contextvars import copy_context
@@ -75,6 +77,12 @@ from rossum_agent.agent.models import (
     ToolResult,
     truncate_content,
 )
+from rossum_agent.agent.pacing import AdaptivePacer, get_pacer, get_retry_after
+from rossum_agent.agent.prompt_caching import (
+    add_message_cache_breakpoints,
+    add_tools_cache_breakpoint,
+    build_cached_system,
+)
 from rossum_agent.agent.request_classifier import RequestScope, classify_request, generate_rejection_response
 from rossum_agent.api.models.schemas import TokenUsageBreakdown
 from rossum_agent.bedrock_client import create_bedrock_client, get_model_id
@@ -174,13 +182,11 @@ class _StreamState:
     first_text_token_time: float | None = None
     initial_buffer_flushed: bool = False
 
-    def _should_flush_initial_buffer(self) -> bool:
-        """Check if the initial buffer delay has elapsed and buffer should be flushed."""
-        if self.initial_buffer_flushed:
-            return True
-        if self.first_text_token_time is None:
-            return False
-        return (time.monotonic() - self.first_text_token_time) >= INITIAL_TEXT_BUFFER_DELAY
+    def seconds_until_buffer_flush(self) -> float | None:
+        """Get how long buffered initial text may still wait, or None if nothing is waiting on a deadline."""
+        if self.initial_buffer_flushed or not self.text_buffer or self.first_text_token_time is None:
+            return None
+        return max(0.0, self.first_text_token_time + INITIAL_TEXT_BUFFER_DELAY - time.monotonic())
 
     def get_step_type(self) -> StepType:
         """Get the step type based on whether tool calls are pending."""
@@ -225,12 +231,14 @@ class RossumAgent:
         system_prompt: str,
         config: AgentConfig | None = None,
         additional_tools: list[ToolParam] | None = None,
+        pacer: AdaptivePacer | None = None,
     ) -> None:
         self.client = client
         self.mcp_connection = mcp_connection
         self.system_prompt = system_prompt
         self.config = config or AgentConfig()
         self.additional_tools = additional_tools or []
+        self.pacer = pacer or get_pacer()
 
         self.memory = AgentMemory()
         self._tools_cache: list[ToolParam] | None = None
@@ -242,6 +250,9 @@ class RossumAgent:
         self._sub_agent_input_tokens: int = 0
         self._sub_agent_output_tokens: int = 0
         self._sub_agent_usage: dict[str, tuple[int, int]] = {}  # tool_name -> (input, output)
+        # Prompt caching (main agent); not included in input token counts
+        self._cache_creation_input_tokens: int = 0
+        self._cache_read_input_tokens: int = 0
 
     @property
     def messages(self) -> list[MessageParam]:
@@ -258,6 +269,8 @@ class RossumAgent:
         self._sub_agent_input_tokens = 0
         self._sub_agent_output_tokens = 0
         self._sub_agent_usage = {}
+        self._cache_creation_input_tokens = 0
+        self._cache_read_input_tokens = 0
         reset_dynamic_tools()
 
     def _accumulate_sub_agent_tokens(self, usage: SubAgentTokenUsage) -> None:
@@ -285,6 +298,8 @@ class RossumAgent:
             sub_input=self._sub_agent_input_tokens,
             sub_output=self._sub_agent_output_tokens,
             sub_by_tool=self._sub_agent_usage,
+            cache_creation_input=self._cache_creation_input_tokens,
+            cache_read_input=self._cache_read_input_tokens,
         )
 
     def log_token_usage_summary(self) -> None:
@@ -312,6 +327,8 @@ class RossumAgent:
         Initially loads only the discovery tool from MCP (list_tool_categories)
         plus internal tools and deploy tools. Additional MCP tools are loaded dynamically
         via load_tool_category and added to the tool list through get_dynamic_tools().
+        The stable tools are marked as a prompt cache prefix, so loading more tools
+        does not invalidate their cache entry.
         """
         if self._tools_cache is None:
             # Load only discovery tool from MCP initially to reduce context usage
@@ -324,7 +341,7 @@ class RossumAgent:
                 + self.additional_tools
             )
         # Include dynamically loaded tools
-        return self._tools_cache + get_dynamic_tools()
+        return add_tools_cache_breakpoint(self._tools_cache + get_dynamic_tools(), len(self._tools_cache))
 
     def _serialize_tool_result(self, result: object) -> str:
         """Serialize a tool result to a string for storage in context.
@@ -387,7 +404,7 @@ class RossumAgent:
         with self.client.messages.stream(
             model=model_id,
             max_tokens=self.config.max_output_tokens,
-            system=self.system_prompt,
+            system=build_cached_system(self.system_prompt),
             messages=messages,
             tools=tools if tools else Omit(),
             thinking=thinking_config,
@@ -469,7 +486,7 @@ class RossumAgent:
     async def _process_stream_events(
         self,
         step_num: int,
-        event_queue: queue.Queue[tuple[MessageStreamEvent | None, Message | None] | None],
+        event_queue: asyncio.Queue[tuple[MessageStreamEvent | None, Message | None] | None],
         state: _StreamState,
     ) -> AsyncIterator[AgentStep]:
         """Process stream events and yield AgentSteps.
@@ -480,17 +497,15 @@ class RossumAgent:
         step type classification before streaming to the client.
 
         After the initial buffer is flushed, subsequent text tokens are streamed immediately.
+        The queue is awaited directly; a timeout is only armed while buffered text waits for
+        its flush deadline.
         """
         while True:
             try:
-                item = await asyncio.to_thread(event_queue.get, timeout=INITIAL_TEXT_BUFFER_DELAY)
-            except queue.Empty:
-                # Yield #1: Timeout-based flush of initial text buffer (ensures responsiveness during model pauses)
-                if (
-                    state.text_buffer
-                    and state._should_flush_initial_buffer()
-                    and (step := state.flush_buffer(step_num, state.get_step_type()))
-                ):
+                item = await asyncio.wait_for(event_queue.get(), timeout=state.seconds_until_buffer_flush())
+            except TimeoutError:
+                # Yield #1: Deadline flush of initial text buffer (ensures responsiveness during model pauses)
+                if step := state.flush_buffer(step_num, state.get_step_type()):
                     state.initial_buffer_flushed = True
                     yield step
                 continue
@@ -540,20 +555,25 @@ class RossumAgent:
         Yields:
             AgentStep objects - partial steps while streaming, then final step with tool results.
         """
-        messages = self.memory.write_to_messages()
+        messages = add_message_cache_breakpoints(self.memory.write_to_messages())
         tools = await self._get_tools()
         model_id = get_model_id()
         state = _StreamState()
 
-        event_queue: queue.Queue[tuple[MessageStreamEvent | None, Message | None] | None] = queue.Queue()
+        loop = asyncio.get_running_loop()
+        event_queue: asyncio.Queue[tuple[MessageStreamEvent | None, Message | None] | None] = asyncio.Queue()
+        publish = partial(loop.call_soon_threadsafe, event_queue.put_nowait)
 
         def producer() -> None:
-            for item in self._sync_stream_events(model_id, messages, tools):
-                event_queue.put(item)
-            event_queue.put(None)
+            try:
+                for item in self._sync_stream_events(model_id, messages, tools):
+                    publish(item)
+            finally:
+                # Always terminate the consumer; a stream error is re-raised by awaiting the producer
+                publish(None)
 
         ctx = copy_context()
-        producer_task = asyncio.get_event_loop().run_in_executor(None, partial(ctx.run, producer))
+        producer_task = loop.run_in_executor(None, partial(ctx.run, producer))
 
         # Yield #5: Forward all streaming steps from _process_stream_events (yields #1-4)
         async for step in self._process_stream_events(step_num, event_queue, state):
@@ -565,14 +585,20 @@ class RossumAgent:
             raise RuntimeError("Stream ended without final message")
 
         thinking_blocks = self._extract_thinking_blocks(state.final_message)
-        input_tokens = state.final_message.usage.input_tokens
-        output_tokens = state.final_message.usage.output_tokens
+        usage = state.final_message.usage
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        cache_creation_tokens = usage.cache_creation_input_tokens or 0
+        cache_read_tokens = usage.cache_read_input_tokens or 0
         self._total_input_tokens += input_tokens
         self._total_output_tokens += output_tokens
         self._main_agent_input_tokens += input_tokens
         self._main_agent_output_tokens += output_tokens
+        self._cache_creation_input_tokens += cache_creation_tokens
+        self._cache_read_input_tokens += cache_read_tokens
         logger.info(
             f"Step {step_num}: input_tokens={input_tokens}, output_tokens={output_tokens}, "
+            f"cache_write={cache_creation_tokens}, cache_read={cache_read_tokens}, "
             f"total_input={self._total_input_tokens}, total_output={self._total_output_tokens}"
         )
 
@@ -583,6 +609,8 @@ class RossumAgent:
             is_streaming=False,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cache_creation_input_tokens=cache_creation_tokens,
+            cache_read_input_tokens=cache_read_tokens,
             step_type=StepType.FINAL_ANSWER if not state.tool_calls else StepType.INTERMEDIATE,
         )
 
@@ -638,32 +666,35 @@ class RossumAgent:
             step_type=StepType.INTERMEDIATE,
         )
 
-        progress_queue: asyncio.Queue[AgentStep] = asyncio.Queue()
+        # Progress steps from all tools; each tool task posts None when it finishes
+        progress_queue: asyncio.Queue[AgentStep | None] = asyncio.Queue()
         results_by_id: dict[str, ToolResult] = {}
 
         async def execute_single_tool(tool_call: ToolCall, idx: int) -> None:
             tool_progress = (idx, total_tools)
-            async for progress_or_result in self._execute_tool_with_progress(
-                tool_call, step_num, tool_calls, tool_progress
-            ):
-                if isinstance(progress_or_result, AgentStep):
-                    await progress_queue.put(progress_or_result)
-                elif isinstance(progress_or_result, ToolResult):
-                    results_by_id[tool_call.id] = progress_or_result
+            try:
+                async for progress_or_result in self._execute_tool_with_progress(
+                    tool_call, step_num, tool_calls, tool_progress
+                ):
+                    if isinstance(progress_or_result, AgentStep):
+                        progress_queue.put_nowait(progress_or_result)
+                    elif isinstance(progress_or_result, ToolResult):
+                        results_by_id[tool_call.id] = progress_or_result
+            finally:
+                progress_queue.put_nowait(None)
 
         tasks = [
             asyncio.create_task(execute_single_tool(tool_call, idx)) for idx, tool_call in enumerate(tool_calls, 1)
         ]
 
-        pending = set(tasks)
-        while pending:
-            _done, pending = await asyncio.wait(pending, timeout=0.05, return_when=asyncio.FIRST_COMPLETED)
-
-            while not progress_queue.empty():
-                yield progress_queue.get_nowait()
+        running = len(tasks)
+        while running:
+            if (progress := await progress_queue.get()) is None:
+                running -= 1
+            else:
+                yield progress
 
-        while not progress_queue.empty():
-            yield progress_queue.get_nowait()
+        await asyncio.gather(*tasks)
 
         tool_results = [results_by_id[tc.id] for tc in tool_calls if tc.id in results_by_id]
 
@@ -674,15 +705,6 @@ class RossumAgent:
 
         yield step
 
-    def _drain_token_queue(self, token_queue: queue.Queue[SubAgentTokenUsage]) -> None:
-        """Drain all pending token usage from the queue."""
-        while True:
-            try:
-                usage = token_queue.get_nowait()
-                self._accumulate_sub_agent_tokens(usage)
-            except queue.Empty:
-                break
-
     async def _execute_tool_with_progress(
         self, tool_call: ToolCall, step_num: int, tool_calls: list[ToolCall], tool_progress: tuple[int, int]
     ) -> AsyncIterator[AgentStep | ToolResult]:
@@ -691,52 +713,46 @@ class RossumAgent:
         For tools with sub-agents (like debug_hook), this yields AgentStep updates
         with sub_agent_progress. Always yields the final ToolResult.
         """
-        progress_queue: queue.Queue[SubAgentProgress] = queue.Queue()
-        token_queue: queue.Queue[SubAgentTokenUsage] = queue.Queue()
+        try:
+            if tool_call.name in get_internal_tool_names():
+                loop = asyncio.get_running_loop()
+                # Sub-agent callbacks fire in the worker thread; hand their payloads to the event loop.
+                # The executor future completes after all earlier callbacks were scheduled, so None
+                # (posted on completion) is always the last item.
+                progress_queue: asyncio.Queue[SubAgentProgress | None] = asyncio.Queue()
 
-        def progress_callback(progress: SubAgentProgress) -> None:
-            progress_queue.put(progress)
+                def progress_callback(progress: SubAgentProgress) -> None:
+                    loop.call_soon_threadsafe(progress_queue.put_nowait, progress)
 
-        def token_callback(usage: SubAgentTokenUsage) -> None:
-            token_queue.put(usage)
+                def token_callback(usage: SubAgentTokenUsage) -> None:
+                    loop.call_soon_threadsafe(self._accumulate_sub_agent_tokens, usage)
 
-        try:
-            if tool_call.name in get_internal_tool_names():
                 set_progress_callback(progress_callback)
                 set_token_callback(token_callback)
 
-                loop = asyncio.get_event_loop()
                 ctx = copy_context()
                 future = loop.run_in_executor(
                     None, partial(ctx.run, execute_internal_tool, tool_call.name, tool_call.arguments)
                 )
+                future.add_done_callback(lambda _: progress_queue.put_nowait(None))
 
-                while not future.done():
-                    try:
-                        progress = progress_queue.get_nowait()
-                        yield AgentStep(
-                            step_number=step_num,
-                            tool_calls=tool_calls,
-                            is_streaming=True,
-                            current_tool=tool_call.name,
-                            tool_progress=tool_progress,
-                            sub_agent_progress=progress,
-                            step_type=StepType.INTERMEDIATE,
-                        )
-                    except queue.Empty:
-                        pass
-
-                    self._drain_token_queue(token_queue)
-                    await asyncio.sleep(0.1)
-
-                self._drain_token_queue(token_queue)
+                while (progress := await progress_queue.get()) is not None:
+                    yield AgentStep(
+                        step_number=step_num,
+                        tool_calls=tool_calls,
+                        is_streaming=True,
+                        current_tool=tool_call.name,
+                        tool_progress=tool_progress,
+                        sub_agent_progress=progress,
+                        step_type=StepType.INTERMEDIATE,
+                    )
 
-                result = future.result()
+                result = await future
                 content = str(result)
                 set_progress_callback(None)
                 set_token_callback(None)
             elif tool_call.name in get_deploy_tool_names():
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 ctx = copy_context()
                 future = loop.run_in_executor(
                     None, partial(ctx.run, execute_tool, tool_call.name, tool_call.arguments, DEPLOY_TOOLS)
@@ -818,7 +834,9 @@ class RossumAgent:
         executing tools, and continuing until the model produces a final
         answer or the maximum number of steps is reached.
 
-        Rate limiting is handled with exponential backoff and jitter.
+        Model requests are paced by the shared adaptive pacer, which only delays them
+        when the upstream rate limit is close to saturation. Rate limit errors are retried
+        with exponential backoff and jitter (or the upstream `retry-after` hint, if longer).
         """
         if rejection := self._check_request_scope(prompt):
             yield rejection
@@ -845,9 +863,9 @@ class RossumAgent:
         for step_num in range(1, self.config.max_steps + 1):
             rate_limit_retries = 0
 
-            # Throttle requests to avoid rate limiting (skip delay on first step)
-            if step_num > 1:
-                await asyncio.sleep(self.config.request_delay)
+            if (pacing_delay := self.pacer.reserve()) > 0:
+                logger.info(f"Pacing step {step_num}: waiting {pacing_delay:.2f}s")
+                await asyncio.sleep(pacing_delay)
 
             while True:
                 try:
@@ -857,6 +875,7 @@ class RossumAgent:
                         if not step.is_streaming:
                             final_step = step
 
+                    self.pacer.record_success()
                     if final_step and final_step.is_final:
                         return
 
@@ -874,7 +893,9 @@ class RossumAgent:
                         )
                         return
 
-                    wait_time = self._calculate_rate_limit_delay(rate_limit_retries)
+                    retry_after = get_retry_after(e)
+                    self.pacer.record_rate_limit(retry_after)
+                    wait_time = max(self._calculate_rate_limit_delay(rate_limit_retries), retry_after or 0.0)
                     logger.warning(
                         f"Rate limit hit at step {step_num} (attempt {rate_limit_retries}/{RATE_LIMIT_MAX_RETRIES}), "
                         f"retrying in {wait_time:.1f}s: {e}"
@@ -118,6 +118,8 @@ class AgentStep:
     is_streaming: bool = False
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
     current_tool: str | None = None
     tool_progress: tuple[int, int] | None = None
     sub_agent_progress: SubAgentProgress | None = None
@@ -137,7 +139,6 @@ class AgentConfig:
     max_output_tokens: int = 64000  # Opus 4.5 limit
     max_steps: int = 50
     temperature: float = 1.0  # Required for extended thinking
-    request_delay: float = 3.0  # Delay in seconds between API calls to avoid rate limiting
     thinking_budget_tokens: int = 10000  # Budget for extended thinking (min 1024)
 
     def __post_init__(self) -> None:
@@ -0,0 +1,159 @@
+"""Adaptive pacing of model requests.
+
+Replaces a fixed sleep between agent steps with a process-wide token bucket. Requests pass
+through without delay while the bucket has tokens; delays are only applied when the
+observed request rate approaches the refill rate.
+
+The refill rate adapts to upstream throttling (AIMD): every rate limit response halves it
+and drains the bucket, every successful request increases it additively back towards the
+configured maximum. A `retry-after` hint from the upstream pauses the whole bucket, so
+concurrent agents in the same process back off together.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from anthropic import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PACING_MAX_RATE = 1.0  # requests per second
+DEFAULT_PACING_BURST = 10
+MIN_PACING_RATE = 0.05
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_FRACTION = 0.1  # of max_rate, per successful request
+
+
+@dataclass
+class PacingStats:
+    """Snapshot of pacing counters for capacity planning."""
+
+    max_rate: float
+    current_rate: float
+    burst: int
+    available_tokens: float
+    acquisitions: int = 0
+    delayed_acquisitions: int = 0
+    total_delay_seconds: float = 0.0
+    max_delay_seconds: float = 0.0
+    rate_limit_events: int = 0
+
+
+class AdaptivePacer:
+    """Token bucket with an adaptive refill rate.
+
+    `reserve()` never blocks; it books a slot and returns how long the caller should wait
+    before sending its request. This keeps the pacer usable from several event loops
+    (API workers and Streamlit threads) at once.
+    """
+
+    def __init__(
+        self,
+        max_rate: float | None = None,
+        burst: int | None = None,
+        min_rate: float = MIN_PACING_RATE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_rate = max_rate or float(os.getenv("ROSSUM_AGENT_PACING_MAX_RATE", DEFAULT_PACING_MAX_RATE))
+        self._burst = burst or int(os.getenv("ROSSUM_AGENT_PACING_BURST", DEFAULT_PACING_BURST))
+        self._min_rate = min(min_rate, self._max_rate)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = self._max_rate
+        self._tokens = float(self._burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._stats = PacingStats(
+            max_rate=self._max_rate, current_rate=self._rate, burst=self._burst, available_tokens=self._tokens
+        )
+
+    @property
+    def stats(self) -> PacingStats:
+        """Return a snapshot of the pacing counters."""
+        with self._lock:
+            self._refill()
+            return dataclasses.replace(self._stats, current_rate=self._rate, available_tokens=max(self._tokens, 0.0))
+
+    def reserve(self) -> float:
+        """Take a token from the bucket and return the delay in seconds before the request may be sent."""
+        with self._lock:
+            now = self._refill()
+            delay = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+            delay = max(delay, self._paused_until - now)
+            self._tokens -= 1
+
+            self._stats.acquisitions += 1
+            if delay > 0:
+                self._stats.delayed_acquisitions += 1
+                self._stats.total_delay_seconds += delay
+                self._stats.max_delay_seconds = max(self._stats.max_delay_seconds, delay)
+            return delay
+
+    def record_success(self) -> None:
+        """Additively raise the refill rate after a request that was not throttled."""
+        with self._lock:
+            self._refill()
+            self._rate = min(self._max_rate, self._rate + self._max_rate * RATE_INCREASE_FRACTION)
+
+    def record_rate_limit(self, retry_after: float | None = None) -> None:
+        """Halve the refill rate and drain the bucket after a throttling response."""
+        with self._lock:
+            now = self._refill()
+            self._rate = max(self._min_rate, self._rate * RATE_DECREASE_FACTOR)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            self._stats.rate_limit_events += 1
+            logger.info(f"Pacing rate lowered to {self._rate:.3f} req/s after rate limit (retry_after={retry_after})")
+
+    def _refill(self) -> float:
+        now = self._clock()
+        self._tokens = min(float(self._burst), self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        return now
+
+
+def get_retry_after(error: RateLimitError) -> float | None:
+    """Extract the `retry-after` hint (in seconds) from a rate limit error, if present."""
+    value = error.response.headers.get("retry-after")
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+_pacer: AdaptivePacer | None = None
+_pacer_lock = threading.Lock()
+
+
+def get_pacer() -> AdaptivePacer:
+    """Return the process-wide pacer shared by all agents."""
+    global _pacer
+    with _pacer_lock:
+        if _pacer is None:
+            _pacer = AdaptivePacer()
+        return _pacer
+
+
+def get_pacing_stats() -> PacingStats:
+    """Return pacing stats of the process-wide pacer."""
+    return get_pacer().stats
+
+
+def reset_pacer() -> None:
+    """Drop the process-wide pacer so the next call to `get_pacer()` starts fresh."""
+    global _pacer
+    with _pacer_lock:
+        _pacer = None
@@ -0,0 +1,91 @@
+"""Prompt caching helpers for the Anthropic Messages API.
+
+Anthropic caches the request prefix up to each `cache_control` breakpoint. The API allows
+at most four breakpoints per request, which are placed as follows:
+
+1. The last stable tool definition (MCP discovery, internal and deploy tools).
+   Dynamically loaded tools are appended after it, so loading a category does not
+   invalidate this entry.
+2. The end of the system prompt (covers all tools plus the system prompt).
+3. The last user message, so the next step can read everything up to here.
+4. The previous user message, which matches the entry written by the previous step.
+
+Breakpoints are added to copies of the request structures; memory and cached tool lists
+are never mutated.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from anthropic.types import CacheControlEphemeralParam, MessageParam, TextBlockParam
+
+if TYPE_CHECKING:
+    from anthropic.types import ToolParam
+
+MESSAGE_CACHE_BREAKPOINTS = 2
+
+
+def _ephemeral() -> CacheControlEphemeralParam:
+    return CacheControlEphemeralParam(type="ephemeral")
+
+
+def build_cached_system(system_prompt: str) -> list[TextBlockParam]:
+    """Wrap the system prompt into a text block with a cache breakpoint."""
+    return [TextBlockParam(type="text", text=system_prompt, cache_control=_ephemeral())]
+
+
+def add_tools_cache_breakpoint(tools: list[ToolParam], stable_count: int) -> list[ToolParam]:
+    """Return tools with a cache breakpoint on the last of the first `stable_count` tools."""
+    if not tools or stable_count <= 0:
+        return tools
+    index = min(stable_count, len(tools)) - 1
+    cached_tools = list(tools)
+    cached_tools[index] = {**tools[index], "cache_control": _ephemeral()}
+    return cached_tools
+
+
+def add_message_cache_breakpoints(
+    messages: list[MessageParam], max_breakpoints: int = MESSAGE_CACHE_BREAKPOINTS
+) -> list[MessageParam]:
+    """Return messages with cache breakpoints on the last block of the latest user messages.
+
+    Each agent step ends with a user message (the task or tool results), so marking the
+    latest user messages caches the whole conversation prefix between steps.
+    """
+    cached_messages = list(messages)
+    remaining = max_breakpoints
+    for index in range(len(cached_messages) - 1, -1, -1):
+        if remaining == 0:
+            break
+        message = cached_messages[index]
+        if message["role"] != "user":
+            continue
+        if (cached := _with_cache_breakpoint(message)) is not None:
+            cached_messages[index] = cached
+            remaining -= 1
+    return cached_messages
+
+
+def _with_cache_breakpoint(message: MessageParam) -> MessageParam | None:
+    """Copy a message with cache_control set on its last cacheable block."""
+    content = message["content"]
+    if isinstance(content, str):
+        if not content:
+            return None
+        return MessageParam(
+            role=message["role"],
+            content=[TextBlockParam(type="text", text=content, cache_control=_ephemeral())],
+        )
+
+    blocks = list(content)
+    for index in range(len(blocks) - 1, -1, -1):
+        block = blocks[index]
+        # Thinking blocks cannot carry cache_control
+        if not isinstance(block, dict) or block["type"] == "thinking" or block["type"] == "redacted_thinking":
+            continue
+        cached_block = block.copy()
+        cached_block["cache_control"] = _ephemeral()
+        blocks[index] = cached_block
+        return MessageParam(role=message["role"], content=blocks)
+    return None
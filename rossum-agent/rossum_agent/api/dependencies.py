@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Annotated  # noqa: TC003 - Required at runtime for FastAPI dependency injection
+from functools import partial
+from typing import TYPE_CHECKING, Annotated  # Annotated is required at runtime for FastAPI dependency injection
 from urllib.parse import urlparse
 
 import httpx
 from fastapi import Header, HTTPException, status
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 logger = logging.getLogger(__name__)
 
 # Base allowed hosts pattern
@@ -36,6 +44,11 @@ def _build_allowed_hosts_pattern() -> re.Pattern[str]:
 
 ALLOWED_ROSSUM_HOST_PATTERN = _build_allowed_hosts_pattern()
 
+DEFAULT_CREDENTIALS_CACHE_TTL = 300.0  # seconds a validated token is trusted without asking Rossum again
+DEFAULT_CREDENTIALS_NEGATIVE_TTL = 30.0  # seconds a rejected token is refused without asking Rossum again
+DEFAULT_CREDENTIALS_CACHE_SIZE = 1024
+AUTH_REQUEST_TIMEOUT = 10.0
+
 
 def validate_rossum_api_url(url: str) -> str:
     """Validate that the Rossum API URL is a trusted Rossum domain.
@@ -123,14 +136,213 @@ async def get_rossum_credentials(
     return RossumCredentials(token=x_rossum_token, api_url=x_rossum_api_url)
 
 
+class CredentialsCache:
+    """Bounded LRU cache of token validation results keyed by (token hash, API base URL).
+
+    Successful validations are kept for `ttl` seconds, rejected tokens (401) for `negative_ttl`
+    seconds. Transient upstream failures are never cached. Raw tokens are not kept as keys.
+    Concurrent misses for the same key share a single validation (see `resolve`).
+    """
+
+    def __init__(
+        self, max_size: int | None = None, ttl: float | None = None, negative_ttl: float | None = None
+    ) -> None:
+        self.max_size = max_size or int(
+            os.getenv("ROSSUM_AGENT_CREDENTIALS_CACHE_SIZE", str(DEFAULT_CREDENTIALS_CACHE_SIZE))
+        )
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else float(os.getenv("ROSSUM_AGENT_CREDENTIALS_CACHE_TTL", str(DEFAULT_CREDENTIALS_CACHE_TTL)))
+        )
+        self.negative_ttl = negative_ttl if negative_ttl is not None else DEFAULT_CREDENTIALS_NEGATIVE_TTL
+        self._entries: OrderedDict[tuple[str, str], tuple[float, str | None]] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Task[str | None]] = {}
+
+    @staticmethod
+    def _key(token: str, api_base: str) -> tuple[str, str]:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest(), api_base
+
+    def get(self, token: str, api_base: str) -> tuple[bool, str | None]:
+        """Look up a token.
+
+        Returns:
+            Tuple of (hit, user_id); on a hit, user_id is None when the token was rejected.
+        """
+        key = self._key(token, api_base)
+        if (entry := self._entries.get(key)) is None:
+            return False, None
+        expires_at, user_id = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, user_id
+
+    def store(self, token: str, api_base: str, user_id: str | None) -> None:
+        """Remember a validated user ID, or a rejected token when `user_id` is None."""
+        ttl = self.ttl if user_id is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        key = self._key(token, api_base)
+        self._entries[key] = (time.monotonic() + ttl, user_id)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def resolve(self, token: str, api_base: str, fetch: Callable[[], Awaitable[str]]) -> str | None:
+        """Return the user ID of a token, calling `fetch` to validate it on a cache miss.
+
+        Concurrent misses for the same key await one shared `fetch`, which keeps running if a
+        waiter is cancelled. A 401 from `fetch` is cached as a rejection and returned as None;
+        other errors propagate to every waiter and are not cached.
+        """
+        hit, user_id = self.get(token, api_base)
+        if hit:
+            return user_id
+        key = self._key(token, api_base)
+        if (task := self._inflight.get(key)) is None:
+            task = asyncio.create_task(self._validate(token, api_base, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._validation_done, key))
+        return await asyncio.shield(task)
+
+    async def _validate(self, token: str, api_base: str, fetch: Callable[[], Awaitable[str]]) -> str | None:
+        try:
+            user_id = await fetch()
+        except HTTPException as e:
+            if e.status_code != status.HTTP_401_UNAUTHORIZED:
+                raise
+            self.store(token, api_base, None)
+            return None
+        self.store(token, api_base, user_id)
+        return user_id
+
+    def _validation_done(self, key: tuple[str, str], task: asyncio.Task[str | None]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here so an error nobody awaited anymore is not logged as unhandled
+
+    def invalidate(self, token: str, api_base: str | None = None) -> int:
+        """Drop cached results of a token (for one API base, or all of them); returns entries removed.
+
+        A validation of the token still in flight is detached, so the next lookup validates again.
+        """
+        token_hash = self._key(token, "")[0]
+        keys = [key for key in self._entries if key[0] == token_hash and api_base in (None, key[1])]
+        for key in keys:
+            del self._entries[key]
+        for key in [key for key in self._inflight if key[0] == token_hash and api_base in (None, key[1])]:
+            del self._inflight[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        self._inflight.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_credentials_cache: CredentialsCache | None = None
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_credentials_cache() -> CredentialsCache:
+    """Return the process-wide credentials cache."""
+    global _credentials_cache
+    if _credentials_cache is None:
+        _credentials_cache = CredentialsCache()
+    return _credentials_cache
+
+
+def invalidate_credentials(token: str, api_url: str | None = None) -> int:
+    """Forget cached validation results of a token so its next request is validated against Rossum.
+
+    Args:
+        token: Rossum API token.
+        api_url: Rossum API URL the token was used with (None = all URLs).
+
+    Returns:
+        Number of cache entries removed.
+    """
+    api_base = _normalize_api_base(validate_rossum_api_url(api_url)) if api_url else None
+    return get_credentials_cache().invalidate(token, api_base)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client used for token validation (keeps connections to Rossum warm)."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=AUTH_REQUEST_TIMEOUT)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def reset_credentials_state() -> None:
+    """Drop the credentials cache and the shared HTTP client without closing it (for tests)."""
+    global _credentials_cache, _http_client
+    _credentials_cache = None
+    _http_client = None
+
+
+def _normalize_api_base(api_base: str) -> str:
+    """Strip trailing slash and /v1 to avoid duplication (URL might be .../api or .../api/v1)."""
+    api_base = api_base.rstrip("/")
+    return api_base.removesuffix("/v1")
+
+
+async def _fetch_user_id(api_base: str, token: str) -> str:
+    """Validate a token by calling the Rossum API /v1/auth/user endpoint and return the user ID."""
+    try:
+        response = await get_http_client().get(
+            f"{api_base}/v1/auth/user",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=AUTH_REQUEST_TIMEOUT,
+        )
+    except httpx.RequestError as e:
+        logger.error(f"Failed to connect to Rossum API: {e}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Failed to connect to Rossum API") from e
+
+    if response.status_code == 401:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Rossum API token")
+
+    if response.status_code != 200:
+        logger.warning(f"Rossum API returned {response.status_code}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Failed to validate token with Rossum API")
+
+    try:
+        user_data = response.json()
+    except json.JSONDecodeError as e:
+        logger.error(f"Rossum API returned invalid JSON: {e}. Response text: {response.text!r}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY, detail="Rossum API returned invalid response"
+        ) from e
+
+    user_id = str(user_data.get("id", ""))
+    if not user_id:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Rossum API did not return user ID")
+    return user_id
+
+
 async def get_validated_credentials(
     x_rossum_token: Annotated[str, Header(alias="X-Rossum-Token")],
     x_rossum_api_url: Annotated[str, Header(alias="X-Rossum-Api-Url")],
 ) -> RossumCredentials:
     """Extract credentials and validate against Rossum API.
 
-    Validates the token by calling the Rossum API /v1/auth/user endpoint.
-    Extracts user ID from the response for user isolation.
+    Validates the token by calling the Rossum API /v1/auth/user endpoint through a shared
+    pooled client. Results are cached (see `CredentialsCache`), so repeated requests with the
+    same token skip the round trip. Extracts user ID from the response for user isolation.
 
     Args:
         x_rossum_token: Rossum API token from X-Rossum-Token header.
@@ -145,46 +357,12 @@ async def get_validated_credentials(
     credentials = await get_rossum_credentials(x_rossum_token, x_rossum_api_url)
 
     # Validate and normalize API URL to prevent SSRF
-    api_base = validate_rossum_api_url(credentials.api_url)
-    # Strip trailing /v1 to avoid duplication (URL might be .../api or .../api/v1)
-    api_base_normalized = api_base.rstrip("/")
-    if api_base_normalized.endswith("/v1"):
-        api_base_normalized = api_base_normalized[:-3]
+    api_base = _normalize_api_base(validate_rossum_api_url(credentials.api_url))
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{api_base_normalized}/v1/auth/user",
-                headers={"Authorization": f"Bearer {credentials.token}"},
-                timeout=10.0,
-            )
-
-            if response.status_code == 401:
-                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Rossum API token")
-
-            if response.status_code != 200:
-                logger.warning(f"Rossum API returned {response.status_code}")
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY, detail="Failed to validate token with Rossum API"
-                )
-
-            try:
-                user_data = response.json()
-            except json.JSONDecodeError as e:
-                logger.error(f"Rossum API returned invalid JSON: {e}. Response text: {response.text!r}")
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY, detail="Rossum API returned invalid response"
-                ) from e
-
-            user_id = str(user_data.get("id", ""))
-
-            if not user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY, detail="Rossum API did not return user ID"
-                )
-
-            return RossumCredentials(token=credentials.token, api_url=credentials.api_url, user_id=user_id)
+    user_id = await get_credentials_cache().resolve(
+        credentials.token, api_base, partial(_fetch_user_id, api_base, credentials.token)
+    )
+    if user_id is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Rossum API token")
 
-    except httpx.RequestError as e:
-        logger.error(f"Failed to connect to Rossum API: {e}")
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Failed to connect to Rossum API") from e
+    return RossumCredentials(token=credentials.token, api_url=credentials.api_url, user_id=user_id)
@@ -20,6 +20,7 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from rossum_agent.api.dependencies import close_http_client
 from rossum_agent.api.routes import chats, files, health, messages
 from rossum_agent.api.services.agent_service import AgentService
 from rossum_agent.api.services.chat_service import ChatService
@@ -89,8 +90,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     logger.info("Rossum Agent API starting up...")
 
     chat_service = get_chat_service()
-    if chat_service.is_connected():
+    if await chat_service.is_connected():
         logger.info("Redis connection established")
+        await chat_service.storage.ensure_chat_index()
+        await chat_service.storage.ensure_file_index()
     else:
         logger.warning("Redis connection failed - some features may not work")
 
@@ -98,7 +101,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
     logger.info("Rossum Agent API shutting down...")
     if _chat_service is not None:
-        _chat_service.storage.close()
+        await _chat_service.storage.close()
+    if _agent_service is not None:
+        await _agent_service.close()
+    await close_http_client()
 
 
 app = FastAPI(
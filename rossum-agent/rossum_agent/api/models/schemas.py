@@ -133,6 +133,10 @@ class MessageRequest(BaseModel):
         description="Optional list of PDF documents (max 5) to include with the message",
     )
     rossum_url: str | None = Field(default=None, description="Optional Rossum app URL for context")
+    stream_deltas: bool = Field(
+        default=False,
+        description="Stream only new text (delta/offset) for thinking and answer events instead of the full text",
+    )
 
 
 class StepEvent(BaseModel):
@@ -142,6 +146,11 @@ class StepEvent(BaseModel):
     - "thinking": Model's chain-of-thought reasoning (from thinking blocks)
     - "intermediate": Model's response text before tool calls
     - "final_answer": Final response when no more tool calls needed
+
+    When the client opts into delta streaming, streaming text events carry only the new text
+    in `delta`, starting at character `offset` of the accumulated text, and `content` is None.
+    Checkpoint events (`is_checkpoint`) additionally carry the full text in `content`.
+    `seq` numbers every step event of the stream so clients can detect gaps.
     """
 
     type: Literal["thinking", "intermediate", "tool_start", "tool_result", "final_answer", "error"]
@@ -154,6 +163,10 @@ class StepEvent(BaseModel):
     is_error: bool = False
     is_streaming: bool = False
     is_final: bool = False
+    delta: str | None = None
+    offset: int | None = None
+    seq: int | None = None
+    is_checkpoint: bool = False
 
 
 class SubAgentProgressEvent(BaseModel):
@@ -212,11 +225,17 @@ class SubAgentTokenUsageDetail(BaseModel):
 
 
 class TokenUsageBreakdown(BaseModel):
-    """Token usage breakdown by agent vs sub-agents."""
+    """Token usage breakdown by agent vs sub-agents.
+
+    Prompt cache writes and reads (main agent) are reported separately and are not
+    included in the input token counts.
+    """
 
     total: TokenUsageBySource
     main_agent: TokenUsageBySource
     sub_agents: SubAgentTokenUsageDetail
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
     @classmethod
     def from_raw_counts(
@@ -228,12 +247,16 @@ class TokenUsageBreakdown(BaseModel):
         sub_input: int,
         sub_output: int,
         sub_by_tool: dict[str, tuple[int, int]],
+        cache_creation_input: int = 0,
+        cache_read_input: int = 0,
     ) -> TokenUsageBreakdown:
         """Create breakdown from raw token counts."""
         return cls(
             total=TokenUsageBySource.from_counts(total_input, total_output),
             main_agent=TokenUsageBySource.from_counts(main_input, main_output),
             sub_agents=SubAgentTokenUsageDetail.from_counts(sub_input, sub_output, sub_by_tool),
+            cache_creation_input_tokens=cache_creation_input,
+            cache_read_input_tokens=cache_read_input,
         )
 
     def format_summary_lines(self) -> list[str]:
@@ -256,9 +279,16 @@ class TokenUsageBreakdown(BaseModel):
             [
                 "-" * 60,
                 f"{'TOTAL':<25} {self.total.input_tokens:>12,} {self.total.output_tokens:>12,} {self.total.total_tokens:>12,}",
-                "=" * 60,
             ]
         )
+        if self.cache_creation_input_tokens or self.cache_read_input_tokens:
+            lines.extend(
+                [
+                    f"{'Prompt cache write':<25} {self.cache_creation_input_tokens:>12,}",
+                    f"{'Prompt cache read':<25} {self.cache_read_input_tokens:>12,}",
+                ]
+            )
+        lines.append("=" * 60)
         return lines
 
 
@@ -279,12 +309,27 @@ class FileCreatedEvent(BaseModel):
     url: str
 
 
+class RequestPacingStats(BaseModel):
+    """Per-process model request pacing counters."""
+
+    max_rate: float = Field(description="Configured maximum model requests per second")
+    current_rate: float = Field(description="Current adaptive refill rate (requests per second)")
+    burst: int
+    available_tokens: float
+    acquisitions: int
+    delayed_acquisitions: int
+    total_delay_seconds: float
+    max_delay_seconds: float
+    rate_limit_events: int
+
+
 class HealthResponse(BaseModel):
     """Response for health check endpoint."""
 
     status: Literal["healthy", "unhealthy"]
     redis_connected: bool
     version: str
+    pacing: RequestPacingStats | None = None
 
 
 class ErrorResponse(BaseModel):
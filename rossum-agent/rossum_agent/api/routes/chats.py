@@ -51,7 +51,7 @@ async def create_chat(
 ) -> ChatResponse:
     """Create a new chat session."""
     mcp_mode = body.mcp_mode if body else "read-only"
-    return chat_service.create_chat(user_id=credentials.user_id, mcp_mode=mcp_mode)
+    return await chat_service.create_chat(user_id=credentials.user_id, mcp_mode=mcp_mode)
 
 
 @router.get("", response_model=ChatListResponse)
@@ -62,7 +62,7 @@ async def list_chats(
     chat_service: Annotated[ChatService, Depends(get_chat_service_dep)] = None,  # type: ignore[assignment]
 ) -> ChatListResponse:
     """List chat sessions for the authenticated user."""
-    return chat_service.list_chats(user_id=credentials.user_id, limit=limit, offset=offset)
+    return await chat_service.list_chats(user_id=credentials.user_id, limit=limit, offset=offset)
 
 
 @router.get("/{chat_id}", response_model=ChatDetail)
@@ -72,7 +72,7 @@ async def get_chat(
     chat_service: Annotated[ChatService, Depends(get_chat_service_dep)] = None,  # type: ignore[assignment]
 ) -> ChatDetail:
     """Get detailed information about a chat session."""
-    chat = chat_service.get_chat(user_id=credentials.user_id, chat_id=chat_id)
+    chat = await chat_service.get_chat(user_id=credentials.user_id, chat_id=chat_id)
 
     if chat is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Chat {chat_id} not found")
@@ -87,9 +87,9 @@ async def delete_chat(
     chat_service: Annotated[ChatService, Depends(get_chat_service_dep)] = None,  # type: ignore[assignment]
 ) -> DeleteResponse:
     """Delete a chat session."""
-    if not chat_service.chat_exists(credentials.user_id, chat_id):
+    if not await chat_service.chat_exists(credentials.user_id, chat_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Chat {chat_id} not found")
 
-    deleted = chat_service.delete_chat(user_id=credentials.user_id, chat_id=chat_id)
+    deleted = await chat_service.delete_chat(user_id=credentials.user_id, chat_id=chat_id)
 
     return DeleteResponse(deleted=deleted)
@@ -7,8 +7,8 @@ from collections.abc import Callable  # noqa: TC003 - Required at runtime for se
 from pathlib import Path
 from typing import Annotated  # noqa: TC003 - Required at runtime for FastAPI dependency injection
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from rossum_agent.api.dependencies import RossumCredentials, get_validated_credentials
 from rossum_agent.api.models.schemas import FileListResponse
@@ -21,6 +21,8 @@ from rossum_agent.api.services.file_service import (
 
 router = APIRouter(prefix="/chats/{chat_id}/files", tags=["files"])
 
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+
 _get_chat_service: Callable[[], ChatService] | None = None
 _get_file_service: Callable[[], FileService] | None = None
 
@@ -59,10 +61,10 @@ async def list_files(
     file_service: Annotated[FileService, Depends(get_file_service_dep)] = None,  # type: ignore[assignment]
 ) -> FileListResponse:
     """List all files for a chat session."""
-    if not chat_service.chat_exists(credentials.user_id, chat_id):
+    if not await chat_service.chat_exists(credentials.user_id, chat_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Chat {chat_id} not found")
 
-    files = file_service.list_files(chat_id)
+    files = await file_service.list_files(chat_id)
     return FileListResponse(files=files, total=len(files))
 
 
@@ -83,31 +85,72 @@ def _sanitize_filename(filename: str) -> str:
     return safe_name[:255]
 
 
+def _parse_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single-range `Range` header into an inclusive (start, end) byte range.
+
+    Returns None when the header is absent or not a single byte range (the full file is served).
+    Raises 416 when the range cannot be satisfied for a file of the given size.
+    """
+    if range_header is None or (match := _RANGE_PATTERN.fullmatch(range_header.strip())) is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
 @router.get("/{filename:path}")
 async def download_file(
     chat_id: str,
     filename: str,
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
     credentials: Annotated[RossumCredentials, Depends(get_validated_credentials)] = None,  # type: ignore[assignment]
     chat_service: Annotated[ChatService, Depends(get_chat_service_dep)] = None,  # type: ignore[assignment]
     file_service: Annotated[FileService, Depends(get_file_service_dep)] = None,  # type: ignore[assignment]
-) -> Response:
-    """Download a file from a chat session."""
-    if not chat_service.chat_exists(credentials.user_id, chat_id):
+) -> StreamingResponse:
+    """Download a file from a chat session, streamed in chunks; single byte ranges are supported."""
+    if not await chat_service.chat_exists(credentials.user_id, chat_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Chat {chat_id} not found")
 
     safe_filename = _sanitize_filename(filename)
     if not safe_filename:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid filename")
 
-    result = file_service.get_file(chat_id, safe_filename)
+    result = await file_service.open_file(chat_id, safe_filename)
     if result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"File {safe_filename} not found in chat {chat_id}"
         )
 
-    content, mime_type = result
-    return Response(
-        content=content,
+    entry, mime_type = result
+    size = entry["size"]
+    headers = {
+        "Content-Disposition": f'attachment; filename="{safe_filename}"',
+        "Accept-Ranges": "bytes",
+        "ETag": f'"{entry["sha256"]}"',
+    }
+    status_code = status.HTTP_200_OK
+    start, end = 0, size - 1
+    if (byte_range := _parse_range(range_header, size)) is not None:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        file_service.iter_file(chat_id, entry, start, end),
+        status_code=status_code,
         media_type=mime_type,
-        headers={"Content-Disposition": f'attachment; filename="{safe_filename}"'},
+        headers=headers,
     )
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import dataclasses
 from collections.abc import Callable  # noqa: TC003 - Required at runtime for service getter type hints
 from typing import Annotated  # noqa: TC003 - Required at runtime for FastAPI dependency injection
 
 from fastapi import APIRouter, Depends
 
-from rossum_agent.api.models.schemas import HealthResponse
+from rossum_agent.agent.pacing import get_pacing_stats
+from rossum_agent.api.models.schemas import HealthResponse, RequestPacingStats
 from rossum_agent.api.services.chat_service import (
     ChatService,  # noqa: TC001 - Required at runtime for FastAPI Depends()
 )
@@ -36,9 +38,12 @@ def get_chat_service_dep() -> ChatService:
 async def health_check(
     chat_service: Annotated[ChatService, Depends(get_chat_service_dep)],
 ) -> HealthResponse:
-    """Check API health and dependencies."""
-    redis_connected = chat_service.is_connected()
+    """Check API health and dependencies, including model request pacing stats."""
+    redis_connected = await chat_service.is_connected()
 
     return HealthResponse(
-        status="healthy" if redis_connected else "unhealthy", redis_connected=redis_connected, version=VERSION
+        status="healthy" if redis_connected else "unhealthy",
+        redis_connected=redis_connected,
+        version=VERSION,
+        pacing=RequestPacingStats.model_validate(dataclasses.asdict(get_pacing_stats())),
     )
@@ -151,7 +151,7 @@ async def send_message(
     Raises:
         HTTPException: If chat not found.
     """
-    chat_data = chat_service.get_chat_data(credentials.user_id, chat_id)
+    chat_data = await chat_service.get_chat_data(credentials.user_id, chat_id)
     if chat_data is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Chat {chat_id} not found")
 
@@ -175,6 +175,7 @@ async def send_message(
                 rossum_api_base_url=credentials.api_url,
                 rossum_url=message.rossum_url,
                 mcp_mode=mcp_mode,
+                stream_deltas=message.stream_deltas,
             ):
                 result = _process_agent_event(event)
                 if result.done_event:
@@ -197,7 +198,7 @@ async def send_message(
             images=images,
             documents=documents,
         )
-        chat_service.save_messages(
+        await chat_service.save_messages(
             user_id=credentials.user_id,
             chat_id=chat_id,
             messages=updated_history,
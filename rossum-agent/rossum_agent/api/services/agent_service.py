@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 
 from rossum_agent.agent.core import RossumAgent, create_agent
 from rossum_agent.agent.memory import AgentMemory
 from rossum_agent.agent.models import AgentConfig, AgentStep, StepType
+from rossum_agent.api.dependencies import invalidate_credentials
 from rossum_agent.api.models.schemas import (
     DocumentContent,
     ImageContent,
@@ -18,15 +20,17 @@ from rossum_agent.api.models.schemas import (
     SubAgentTextEvent,
 )
 from rossum_agent.prompts import get_system_prompt
-from rossum_agent.rossum_mcp_integration import connect_mcp_server
+from rossum_agent.rossum_mcp_integration import MCPConnectionPool
 from rossum_agent.streamlit_app.response_formatting import get_display_tool_name
 from rossum_agent.tools import (
+    AgentRunContext,
     SubAgentProgress,
     SubAgentText,
+    get_run_context,
     set_mcp_connection,
-    set_output_dir,
     set_progress_callback,
     set_rossum_credentials,
+    set_run_context,
     set_text_callback,
 )
 from rossum_agent.url_context import extract_url_context, format_context_for_prompt
@@ -129,47 +133,125 @@ def convert_step_to_event(step: AgentStep) -> StepEvent:
     return event
 
 
+# Checkpoints (full text) are sent when the text first reaches this many characters
+# and then each time it doubles, so checkpoint bytes stay below 2x the final text size.
+DELTA_CHECKPOINT_MIN_CHARS = 4096
+DELTA_CHECKPOINT_GROWTH = 2
+_DELTA_EVENT_TYPES = frozenset({"thinking", "intermediate", "final_answer"})
+
+
+class DeltaEventEncoder:
+    """Rewrite streaming StepEvents into the delta-based event protocol.
+
+    Streaming thinking/intermediate/final_answer events normally carry the full accumulated
+    text, so the bytes sent grow quadratically with the answer length. The encoder remembers
+    how much of each text stream (per step, thinking vs. response text) was already sent and
+    replaces `content` with the new suffix in `delta` plus its `offset`. Full-text checkpoints
+    are interleaved at geometrically growing lengths so clients can resynchronize.
+    """
+
+    def __init__(self) -> None:
+        self._seq = 0
+        self._sent_lengths: dict[tuple[int, str], int] = {}
+        self._next_checkpoint: dict[tuple[int, str], int] = {}
+
+    def encode(self, event: StepEvent) -> StepEvent:
+        """Assign a sequence number and, for streaming text events, convert content to a delta."""
+        self._seq += 1
+        if not (event.is_streaming and event.content is not None and event.type in _DELTA_EVENT_TYPES):
+            return event.model_copy(update={"seq": self._seq})
+
+        key = (event.step_number, "thinking" if event.type == "thinking" else "text")
+        text = event.content
+        sent = self._sent_lengths.get(key, 0)
+        if len(text) < sent:
+            # Text stream restarted (should not happen) - resynchronize with a checkpoint.
+            sent = 0
+            self._next_checkpoint[key] = 0
+
+        self._sent_lengths[key] = len(text)
+        next_checkpoint = self._next_checkpoint.get(key, DELTA_CHECKPOINT_MIN_CHARS)
+        if len(text) >= next_checkpoint:
+            self._next_checkpoint[key] = max(len(text) * DELTA_CHECKPOINT_GROWTH, DELTA_CHECKPOINT_MIN_CHARS)
+            return event.model_copy(
+                update={"delta": text[sent:], "offset": sent, "seq": self._seq, "is_checkpoint": True}
+            )
+        return event.model_copy(update={"content": None, "delta": text[sent:], "offset": sent, "seq": self._seq})
+
+
 class AgentService:
     """Service for running the Rossum Agent.
 
     Manages MCP connection lifecycle and agent execution for API requests.
+    MCP server processes are reused across requests through an MCPConnectionPool.
+    The service itself is stateless per run: each run binds its own AgentRunContext
+    (output directory, sub-agent events, memory, loaded tools) to the calling task, so
+    one instance can serve many concurrent streams.
     """
 
-    def __init__(self) -> None:
-        """Initialize agent service."""
-        self._output_dir: Path | None = None
-        self._sub_agent_queue: asyncio.Queue[SubAgentProgressEvent | SubAgentTextEvent] | None = None
-        self._last_memory: AgentMemory | None = None
+    def __init__(self, mcp_pool: MCPConnectionPool | None = None) -> None:
+        """Initialize agent service.
+
+        Args:
+            mcp_pool: Pool of warm MCP connections. A new pool is created if not provided.
+        """
+        self._mcp_pool = mcp_pool or MCPConnectionPool()
 
     @property
     def output_dir(self) -> Path | None:
-        """Get the output directory for the current run."""
-        return self._output_dir
+        """Get the output directory of the run bound to the current context."""
+        run_context = get_run_context()
+        return run_context.output_dir if run_context is not None else None
+
+    @property
+    def mcp_pool(self) -> MCPConnectionPool:
+        """Get the MCP connection pool used by this service."""
+        return self._mcp_pool
+
+    async def close(self) -> None:
+        """Release pooled MCP server processes."""
+        await self._mcp_pool.close()
 
     def _on_sub_agent_progress(self, progress: SubAgentProgress) -> None:
         """Callback for sub-agent progress updates.
 
-        Converts the progress to an event and puts it on the queue for streaming.
+        Puts the progress on the current run's event queue for streaming.
         """
-        if self._sub_agent_queue is not None:
-            event = convert_sub_agent_progress_to_event(progress)
+        if (run_context := get_run_context()) is not None and run_context.sub_agent_events is not None:
             try:
-                self._sub_agent_queue.put_nowait(event)
+                run_context.sub_agent_events.put_nowait(progress)
             except asyncio.QueueFull:
                 logger.warning("Sub-agent progress queue full, dropping event")
 
     def _on_sub_agent_text(self, text: SubAgentText) -> None:
         """Callback for sub-agent text streaming.
 
-        Converts the text to an event and puts it on the queue for streaming.
+        Puts the text on the current run's event queue for streaming.
         """
-        if self._sub_agent_queue is not None:
-            event = SubAgentTextEvent(tool_name=text.tool_name, text=text.text, is_final=text.is_final)
+        if (run_context := get_run_context()) is not None and run_context.sub_agent_events is not None:
             try:
-                self._sub_agent_queue.put_nowait(event)
+                run_context.sub_agent_events.put_nowait(text)
             except asyncio.QueueFull:
                 logger.warning("Sub-agent text queue full, dropping event")
 
+    @staticmethod
+    def _drain_sub_agent_events(run_context: AgentRunContext) -> list[SubAgentProgressEvent | SubAgentTextEvent]:
+        """Take all pending sub-agent updates of a run and convert them to SSE events."""
+        events: list[SubAgentProgressEvent | SubAgentTextEvent] = []
+        queue = run_context.sub_agent_events
+        while queue is not None and not queue.empty():
+            try:
+                update = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if isinstance(update, SubAgentProgress):
+                events.append(convert_sub_agent_progress_to_event(update))
+            else:
+                events.append(
+                    SubAgentTextEvent(tool_name=update.tool_name, text=update.text, is_final=update.is_final)
+                )
+        return events
+
     async def run_agent(
         self,
         prompt: str,
@@ -180,11 +262,16 @@ class AgentService:
         rossum_url: str | None = None,
         images: list[ImageContent] | None = None,
         documents: list[DocumentContent] | None = None,
+        stream_deltas: bool = False,
     ) -> AsyncIterator[StepEvent | StreamDoneEvent | SubAgentProgressEvent | SubAgentTextEvent]:
         """Run the agent with a new prompt.
 
-        Creates a fresh MCP connection, initializes the agent with conversation
-        history, and streams step events.
+        Leases a warm MCP connection from the pool, initializes the agent with conversation
+        history, and streams step events. With `stream_deltas`, streaming text events are
+        encoded by DeltaEventEncoder.
+
+        A fresh AgentRunContext is bound to the calling task and stays bound after the
+        stream ends, so `output_dir` and `build_updated_history` can read the run's results.
 
         Yields:
             StepEvent objects during execution, SubAgentProgressEvent for sub-agent progress,
@@ -196,16 +283,16 @@ class AgentService:
         if documents:
             logger.info(f"Including {len(documents)} documents in the prompt")
 
-        self._output_dir = create_session_output_dir()
-        set_session_output_dir(self._output_dir)
-        set_output_dir(self._output_dir)
+        output_dir = create_session_output_dir()
+        run_context = AgentRunContext(output_dir=output_dir, sub_agent_events=asyncio.Queue(maxsize=100))
+        set_run_context(run_context)
+        set_session_output_dir(output_dir)
         set_rossum_credentials(rossum_api_base_url, rossum_api_token)
-        logger.info(f"Created session output directory: {self._output_dir}")
+        logger.info(f"Created session output directory: {output_dir}")
 
         if documents:
-            self._save_documents_to_output_dir(documents)
+            self._save_documents_to_output_dir(documents, output_dir)
 
-        self._sub_agent_queue = asyncio.Queue(maxsize=100)
         set_progress_callback(self._on_sub_agent_progress)
         set_text_callback(self._on_sub_agent_text)
 
@@ -216,11 +303,13 @@ class AgentService:
             system_prompt = system_prompt + "\n\n---\n" + context_section
 
         try:
-            async with connect_mcp_server(
+            async with self._mcp_pool.lease(
                 rossum_api_token=rossum_api_token,
                 rossum_api_base_url=rossum_api_base_url,
                 mcp_mode=mcp_mode,
             ) as mcp_connection:
+                # A token revoked mid-run must not stay validated in the credentials cache
+                mcp_connection.on_unauthorized = partial(invalidate_credentials, rossum_api_token, rossum_api_base_url)
                 agent = await create_agent(
                     mcp_connection=mcp_connection, system_prompt=system_prompt, config=AgentConfig()
                 )
@@ -233,32 +322,26 @@ class AgentService:
                 total_input_tokens = 0
                 total_output_tokens = 0
 
-                user_content = self._build_user_content(prompt, images, documents)
+                user_content = self._build_user_content(prompt, images, documents, output_dir)
+                encoder = DeltaEventEncoder() if stream_deltas else None
 
                 try:
                     async for step in agent.run(user_content):
-                        while not self._sub_agent_queue.empty():
-                            try:
-                                sub_event = self._sub_agent_queue.get_nowait()
-                                yield sub_event
-                            except asyncio.QueueEmpty:
-                                break
+                        for sub_event in self._drain_sub_agent_events(run_context):
+                            yield sub_event
 
-                        yield convert_step_to_event(step)
+                        event = convert_step_to_event(step)
+                        yield encoder.encode(event) if encoder else event
 
                         if not step.is_streaming:
                             total_steps = step.step_number
                             total_input_tokens = agent._total_input_tokens
                             total_output_tokens = agent._total_output_tokens
 
-                    while not self._sub_agent_queue.empty():
-                        try:
-                            sub_event = self._sub_agent_queue.get_nowait()
-                            yield sub_event
-                        except asyncio.QueueEmpty:
-                            break
+                    for sub_event in self._drain_sub_agent_events(run_context):
+                        yield sub_event
 
-                    self._last_memory = agent.memory
+                    run_context.memory = agent.memory
 
                     yield StreamDoneEvent(
                         total_steps=total_steps,
@@ -279,24 +362,20 @@ class AgentService:
         finally:
             set_progress_callback(None)
             set_text_callback(None)
-            set_output_dir(None)
             set_rossum_credentials(None, None)
-            self._sub_agent_queue = None
+            run_context.sub_agent_events = None
 
-    def _save_documents_to_output_dir(self, documents: list[DocumentContent]) -> None:
+    def _save_documents_to_output_dir(self, documents: list[DocumentContent], output_dir: Path) -> None:
         """Save uploaded documents to the output directory.
 
         Args:
             documents: List of documents to save.
+            output_dir: Output directory of the current run.
         """
         import base64  # noqa: PLC0415 - import here to avoid circular import at module level
 
-        if self._output_dir is None:
-            logger.warning("Cannot save documents: output directory not set")
-            return
-
         for doc in documents:
-            file_path = self._output_dir / doc.filename
+            file_path = output_dir / doc.filename
             try:
                 file_data = base64.b64decode(doc.data)
                 file_path.write_bytes(file_data)
@@ -305,7 +384,11 @@ class AgentService:
                 logger.error(f"Failed to save document {doc.filename}: {e}")
 
     def _build_user_content(
-        self, prompt: str, images: list[ImageContent] | None, documents: list[DocumentContent] | None = None
+        self,
+        prompt: str,
+        images: list[ImageContent] | None,
+        documents: list[DocumentContent] | None = None,
+        output_dir: Path | None = None,
     ) -> UserContent:
         """Build user content for the agent, optionally including images and documents.
 
@@ -313,6 +396,7 @@ class AgentService:
             prompt: The user's text prompt.
             images: Optional list of images to include.
             documents: Optional list of documents (paths are included in prompt).
+            output_dir: Output directory the documents were saved to.
 
         Returns:
             Either a plain string (text-only) or a list of content blocks (multimodal).
@@ -333,8 +417,8 @@ class AgentService:
                         },
                     }
                 )
-        if documents and self._output_dir:
-            doc_paths = [str(self._output_dir / doc.filename) for doc in documents]
+        if documents and output_dir:
+            doc_paths = [str(output_dir / doc.filename) for doc in documents]
             doc_info = "\n".join(f"- {path}" for path in doc_paths)
             content.append({"type": "text", "text": f"[Uploaded documents available for processing:\n{doc_info}]"})
         content.append({"type": "text", "text": prompt})
@@ -408,6 +492,7 @@ class AgentService:
 
         Stores task steps and assistant text responses, but strips out tool calls
         and tool results to keep context lean for multi-turn conversations.
+        Uses the memory of the run bound to the current context when available.
 
         Args:
             existing_history: Previous conversation history (ignored if memory available).
@@ -416,9 +501,10 @@ class AgentService:
             images: Optional list of images included with the user prompt.
             documents: Optional list of documents included with the user prompt.
         """
-        if self._last_memory is not None:
+        run_context = get_run_context()
+        if run_context is not None and run_context.memory is not None:
             lean_history: list[dict[str, Any]] = []
-            for step_dict in self._last_memory.to_dict():
+            for step_dict in run_context.memory.to_dict():
                 if step_dict.get("type") == "task_step":
                     lean_history.append(step_dict)
                 elif step_dict.get("type") == "memory_step":
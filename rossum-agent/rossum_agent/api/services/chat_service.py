@@ -15,7 +15,8 @@ from rossum_agent.api.models.schemas import (
     FileInfo,
     Message,
 )
-from rossum_agent.redis_storage import ChatData, ChatMetadata, RedisStorage
+from rossum_agent.async_redis_storage import AsyncRedisStorage
+from rossum_agent.redis_storage import ChatData, ChatMetadata
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -27,23 +28,23 @@ logger = logging.getLogger(__name__)
 class ChatService:
     """Service for managing chat sessions.
 
-    Wraps RedisStorage to provide chat CRUD operations with proper
+    Wraps AsyncRedisStorage to provide chat CRUD operations with proper
     data transformation to/from API schemas.
     """
 
-    def __init__(self, redis_storage: RedisStorage | None = None) -> None:
-        self._storage = redis_storage or RedisStorage()
+    def __init__(self, redis_storage: AsyncRedisStorage | None = None) -> None:
+        self._storage = redis_storage or AsyncRedisStorage()
 
     @property
-    def storage(self) -> RedisStorage:
-        """Get the underlying RedisStorage instance."""
+    def storage(self) -> AsyncRedisStorage:
+        """Get the underlying AsyncRedisStorage instance."""
         return self._storage
 
-    def is_connected(self) -> bool:
+    async def is_connected(self) -> bool:
         """Check if Redis is connected."""
-        return self._storage.is_connected()
+        return await self._storage.is_connected()
 
-    def create_chat(
+    async def create_chat(
         self, user_id: str | None, mcp_mode: Literal["read-only", "read-write"] = "read-only"
     ) -> ChatResponse:
         """Create a new chat session.
@@ -62,12 +63,12 @@ class ChatService:
 
         initial_messages: list[dict[str, Any]] = []
         metadata = ChatMetadata(mcp_mode=mcp_mode)
-        self._storage.save_chat(user_id, chat_id, initial_messages, metadata=metadata)
+        await self._storage.save_chat(user_id, chat_id, initial_messages, metadata=metadata)
 
         logger.info(f"Created chat {chat_id} for user {user_id or 'shared'} with mcp_mode={mcp_mode}")
         return ChatResponse(chat_id=chat_id, created_at=timestamp)
 
-    def list_chats(self, user_id: str | None, limit: int = 50, offset: int = 0) -> ChatListResponse:
+    async def list_chats(self, user_id: str | None, limit: int = 50, offset: int = 0) -> ChatListResponse:
         """List chat sessions for a user.
 
         Args:
@@ -78,9 +79,8 @@ class ChatService:
         Returns:
             ChatListResponse with paginated chat list.
         """
-        all_chats = self._storage.list_all_chats(user_id)
+        page, total = await self._storage.list_chats(user_id, limit=limit, offset=offset)
 
-        paginated = all_chats[offset : offset + limit]
         chats = [
             ChatSummary(
                 chat_id=chat["chat_id"],
@@ -89,12 +89,12 @@ class ChatService:
                 first_message=chat["first_message"],
                 preview=chat.get("preview"),
             )
-            for chat in paginated
+            for chat in page
         ]
 
-        return ChatListResponse(chats=chats, total=len(all_chats), limit=limit, offset=offset)
+        return ChatListResponse(chats=chats, total=total, limit=limit, offset=offset)
 
-    def get_chat(self, user_id: str | None, chat_id: str) -> ChatDetail | None:
+    async def get_chat(self, user_id: str | None, chat_id: str) -> ChatDetail | None:
         """Get detailed chat information.
 
         Args:
@@ -104,7 +104,7 @@ class ChatService:
         Returns:
             ChatDetail with messages and files, or None if not found.
         """
-        if (chat_data := self._storage.load_chat(user_id, chat_id)) is None:
+        if (chat_data := await self._storage.load_chat(user_id, chat_id)) is None:
             return None
 
         messages = []
@@ -122,7 +122,7 @@ class ChatService:
             elif role in ("user", "assistant"):
                 messages.append(Message(role=role, content=msg.get("content", "")))
 
-        files_data = self._storage.list_files(chat_id)
+        files_data = await self._storage.list_files(chat_id)
         files = [FileInfo(filename=f["filename"], size=f["size"], timestamp=f["timestamp"]) for f in files_data]
 
         timestamp_str = chat_id.split("_")[1]
@@ -130,7 +130,7 @@ class ChatService:
 
         return ChatDetail(chat_id=chat_id, messages=messages, created_at=created_at, files=files)
 
-    def delete_chat(self, user_id: str | None, chat_id: str) -> bool:
+    async def delete_chat(self, user_id: str | None, chat_id: str) -> bool:
         """Delete a chat session.
 
         Args:
@@ -140,41 +140,41 @@ class ChatService:
         Returns:
             True if deleted, False otherwise.
         """
-        self._storage.delete_all_files(chat_id)
-        deleted = self._storage.delete_chat(user_id, chat_id)
+        await self._storage.delete_all_files(chat_id)
+        deleted = await self._storage.delete_chat(user_id, chat_id)
         logger.info(f"Deleted chat {chat_id} for user {user_id or 'shared'}: {deleted}")
         return deleted
 
-    def chat_exists(self, user_id: str | None, chat_id: str) -> bool:
+    async def chat_exists(self, user_id: str | None, chat_id: str) -> bool:
         """Check if a chat exists.
 
         Args:
             user_id: User identifier for isolation.
             chat_id: Chat session identifier.
         """
-        return self._storage.chat_exists(user_id, chat_id)
+        return await self._storage.chat_exists(user_id, chat_id)
 
-    def get_messages(self, user_id: str | None, chat_id: str) -> list[dict[str, Any]] | None:
+    async def get_messages(self, user_id: str | None, chat_id: str) -> list[dict[str, Any]] | None:
         """Get raw messages for a chat session.
 
         Args:
             user_id: User identifier for isolation.
             chat_id: Chat session identifier.
         """
-        if (chat_data := self._storage.load_chat(user_id, chat_id)) is None:
+        if (chat_data := await self._storage.load_chat(user_id, chat_id)) is None:
             return None
         return chat_data.messages
 
-    def get_chat_data(self, user_id: str | None, chat_id: str) -> ChatData | None:
+    async def get_chat_data(self, user_id: str | None, chat_id: str) -> ChatData | None:
         """Get full chat data including metadata.
 
         Args:
             user_id: User identifier for isolation.
             chat_id: Chat session identifier.
         """
-        return self._storage.load_chat(user_id, chat_id)
+        return await self._storage.load_chat(user_id, chat_id)
 
-    def save_messages(
+    async def save_messages(
         self,
         user_id: str | None,
         chat_id: str,
@@ -194,4 +194,4 @@ class ChatService:
         Returns:
             True if saved successfully, False otherwise.
         """
-        return self._storage.save_chat(user_id, chat_id, messages, output_dir, metadata)
+        return await self._storage.save_chat(user_id, chat_id, messages, output_dir, metadata)
@@ -3,27 +3,32 @@
 from __future__ import annotations
 
 import mimetypes
+from typing import TYPE_CHECKING
 
 from rossum_agent.api.models.schemas import FileInfo
-from rossum_agent.redis_storage import RedisStorage
+from rossum_agent.async_redis_storage import AsyncRedisStorage
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from typing import Any
 
 
 class FileService:
     """Service for managing files associated with chat sessions.
 
-    Wraps RedisStorage file operations with proper validation and
+    Wraps AsyncRedisStorage file operations with proper validation and
     data transformation to/from API schemas.
     """
 
-    def __init__(self, redis_storage: RedisStorage | None = None) -> None:
-        self._storage = redis_storage or RedisStorage()
+    def __init__(self, redis_storage: AsyncRedisStorage | None = None) -> None:
+        self._storage = redis_storage or AsyncRedisStorage()
 
     @property
-    def storage(self) -> RedisStorage:
-        """Get the underlying RedisStorage instance."""
+    def storage(self) -> AsyncRedisStorage:
+        """Get the underlying AsyncRedisStorage instance."""
         return self._storage
 
-    def list_files(self, chat_id: str) -> list[FileInfo]:
+    async def list_files(self, chat_id: str) -> list[FileInfo]:
         """List all files for a chat session.
 
         Args:
@@ -32,7 +37,7 @@ class FileService:
         Returns:
             List of FileInfo objects with file metadata.
         """
-        files_data = self._storage.list_files(chat_id)
+        files_data = await self._storage.list_files(chat_id)
         return [
             FileInfo(
                 filename=f["filename"],
@@ -43,7 +48,7 @@ class FileService:
             for f in files_data
         ]
 
-    def get_file(self, chat_id: str, filename: str) -> tuple[bytes, str] | None:
+    async def get_file(self, chat_id: str, filename: str) -> tuple[bytes, str] | None:
         """Get file content and MIME type.
 
         Args:
@@ -53,12 +58,31 @@ class FileService:
         Returns:
             Tuple of (content bytes, mime_type) or None if not found.
         """
-        if (content := self._storage.load_file(chat_id, filename)) is None:
+        if (content := await self._storage.load_file(chat_id, filename)) is None:
             return None
 
         mime_type = self._guess_mime_type(filename)
         return content, mime_type
 
+    async def open_file(self, chat_id: str, filename: str) -> tuple[dict[str, Any], str] | None:
+        """Get the stored file entry and MIME type needed to stream a file.
+
+        Args:
+            chat_id: Chat session identifier.
+            filename: Name of the file.
+
+        Returns:
+            Tuple of (file entry with size and sha256, mime_type) or None if not found.
+        """
+        if (entry := await self._storage.get_file_entry(chat_id, filename)) is None:
+            return None
+
+        return entry, self._guess_mime_type(filename)
+
+    def iter_file(self, chat_id: str, entry: dict[str, Any], start: int, end: int) -> AsyncIterator[bytes]:
+        """Stream the inclusive byte range [start, end] of a file opened with `open_file`."""
+        return self._storage.iter_file(chat_id, entry, start, end)
+
     def _guess_mime_type(self, filename: str) -> str:
         """Guess MIME type from filename."""
         mime_type, _ = mimetypes.guess_type(filename)
@@ -0,0 +1,537 @@
+"""Asyncio Redis chat persistence used by the API.
+
+Mirrors `RedisStorage` (same keys and payloads, so chats are shared with the Streamlit app)
+but never blocks the event loop: it uses a pooled `redis.asyncio` client, batches multi-key
+operations into a single round trip (pipelines and MGET), iterates keys with SCAN instead of
+KEYS, and runs local file I/O in worker threads. Chat listing is served from the chat index
+(see `redis_storage.queue_chat_index_update`) and chat files from the content-addressed file
+index (see `redis_storage.FileSync`), which also backs ranged downloads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import redis.asyncio as aioredis
+
+from rossum_agent.redis_storage import (
+    CHAT_INDEX_REBUILD_BATCH_SIZE,
+    CHAT_INDEX_VERSION,
+    CHAT_INDEX_VERSION_KEY,
+    FILE_INDEX_VERSION,
+    FILE_INDEX_VERSION_KEY,
+    ChatData,
+    ChatMetadata,
+    FileSync,
+    collect_chat_summaries,
+    decode_chat_payload,
+    decode_file_entry,
+    decode_file_index,
+    encode_chat_payload,
+    file_listing,
+    get_chat_index_key,
+    get_chat_key,
+    get_chat_pattern,
+    get_chat_summary_key,
+    get_file_blob_key,
+    get_file_index_key,
+    get_legacy_file_key,
+    plan_file_sync,
+    queue_chat_index_rebuild,
+    queue_chat_index_removal,
+    queue_chat_index_update,
+    queue_file_removal,
+    queue_file_sync,
+    queue_legacy_file_migration,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 50
+SCAN_BATCH_SIZE = 500
+FILE_CHUNK_SIZE = 256 * 1024
+
+
+def _write_output_files(output_dir: Path, files: list[tuple[str, bytes]]) -> None:
+    """Write files into an output directory, creating it if needed."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for filename, content in files:
+        (output_dir / filename).write_bytes(content)
+
+
+class AsyncRedisStorage:
+    """Asyncio Redis storage for chat conversations and their files."""
+
+    def __init__(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        ttl_days: int = 30,
+        max_connections: int | None = None,
+    ) -> None:
+        """Initialize async Redis storage.
+
+        Args:
+            host: Redis host (defaults to REDIS_HOST env var or 'localhost')
+            port: Redis port (defaults to REDIS_PORT env var or 6379)
+            ttl_days: Time-to-live for chat data in days (default: 30)
+            max_connections: Connection pool size (defaults to REDIS_MAX_CONNECTIONS env var or 50)
+        """
+        self.host = host or os.getenv("REDIS_HOST", "localhost")
+        self.port = int(port if port is not None else int(os.getenv("REDIS_PORT", "6379")))
+        self.ttl = dt.timedelta(days=ttl_days)
+        self.max_connections = max_connections or int(os.getenv("REDIS_MAX_CONNECTIONS", str(DEFAULT_MAX_CONNECTIONS)))
+        self._client: aioredis.Redis | None = None
+
+    @property
+    def client(self) -> aioredis.Redis:
+        """Get or create the pooled Redis client."""
+        if self._client is None:
+            pool = aioredis.ConnectionPool(
+                host=self.host,
+                port=self.port,
+                max_connections=self.max_connections,
+                decode_responses=False,
+                socket_connect_timeout=5,
+            )
+            self._client = aioredis.Redis(connection_pool=pool)
+        return self._client
+
+    async def save_chat(
+        self,
+        user_id: str | None,
+        chat_id: str,
+        messages: list[dict[str, Any]],
+        output_dir: str | Path | None = None,
+        metadata: ChatMetadata | None = None,
+    ) -> bool:
+        """Save chat, its listing index entry and new or modified output files in a single pipelined write."""
+        try:
+            sync = None
+            if output_dir:
+                sync = await asyncio.to_thread(plan_file_sync, await self._get_file_index(chat_id), Path(output_dir))
+
+            pipe = self.client.pipeline(transaction=False)
+            pipe.setex(get_chat_key(user_id, chat_id), self.ttl, encode_chat_payload(messages, output_dir, metadata))
+            chat_data = ChatData(messages=messages, metadata=metadata or ChatMetadata())
+            queue_chat_index_update(pipe, user_id, chat_id, chat_data, self.ttl)
+            if sync is not None:
+                queue_file_sync(pipe, chat_id, sync, self.ttl)
+            await pipe.execute()
+
+            logger.info(
+                f"Saved chat {chat_id} to Redis "
+                f"(messages={len(messages)}, user: {user_id or 'shared'}, files={len(sync.entries) if sync else 0})"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save chat {chat_id}: {e}", exc_info=True)
+            return False
+
+    async def load_chat(self, user_id: str | None, chat_id: str, output_dir: Path | None = None) -> ChatData | None:
+        """Load chat from Redis and restore files to output directory.
+
+        Args:
+            user_id: Optional user identifier
+            chat_id: Chat identifier
+            output_dir: Directory to restore files to. Files are not restored if None.
+
+        Returns:
+            ChatData containing messages, output_dir, and metadata, or None if chat not found
+        """
+        try:
+            value = await self.client.get(get_chat_key(user_id, chat_id))
+            if value is None:
+                logger.info(f"Chat {chat_id} not found in Redis (user: {user_id or 'shared'})")
+                return None
+
+            chat_data = decode_chat_payload(cast("bytes", value))
+
+            files_loaded = 0
+            if output_dir:
+                files_loaded = await self.load_all_files(chat_id, output_dir)
+
+            logger.info(
+                f"Loaded chat {chat_id} from Redis "
+                f"({len(chat_data.messages)} messages, {files_loaded} files, user: {user_id or 'shared'})"
+            )
+            return chat_data
+        except Exception as e:
+            logger.error(f"Failed to load chat {chat_id}: {e}", exc_info=True)
+            return None
+
+    async def delete_chat(self, user_id: str | None, chat_id: str) -> bool:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.delete(get_chat_key(user_id, chat_id))
+            queue_chat_index_removal(pipe, user_id, chat_id)
+            deleted, *_ = await pipe.execute()
+            logger.info(f"Deleted chat {chat_id} from Redis (deleted={deleted}, user: {user_id or 'shared'})")
+            return bool(deleted)
+        except Exception as e:
+            logger.error(f"Failed to delete chat {chat_id}: {e}", exc_info=True)
+            return False
+
+    async def chat_exists(self, user_id: str | None, chat_id: str) -> bool:
+        try:
+            return bool(await self.client.exists(get_chat_key(user_id, chat_id)))
+        except Exception as e:
+            logger.error(f"Failed to check if chat {chat_id} exists: {e}", exc_info=True)
+            return False
+
+    async def is_connected(self) -> bool:
+        try:
+            await self.client.ping()
+            return True
+        except Exception:
+            return False
+
+    async def list_all_chats(self, user_id: str | None = None) -> list[dict[str, Any]]:
+        """List all chat conversations with metadata, newest first.
+
+        Args:
+            user_id: Optional user ID to filter chats (None = shared chats)
+
+        Returns:
+            List of chat summaries (see `build_chat_summary`)
+        """
+        chats, _ = await self.list_chats(user_id)
+        return chats
+
+    async def list_chats(
+        self, user_id: str | None = None, limit: int | None = None, offset: int = 0
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List a page of chats from the chat index, newest first.
+
+        Reads only the requested page of the per-user sorted set and the matching summary
+        hashes, so the cost does not depend on the total number of chats or their size.
+
+        Args:
+            user_id: Optional user ID to filter chats (None = shared chats)
+            limit: Maximum number of chats to return (None = all)
+            offset: Number of newest chats to skip
+
+        Returns:
+            Tuple of (chat summaries, total number of indexed chats)
+        """
+        try:
+            index_key = get_chat_index_key(user_id)
+            stop = -1 if limit is None else offset + limit - 1
+            pipe = self.client.pipeline(transaction=False)
+            pipe.zcard(index_key)
+            pipe.zrevrange(index_key, offset, stop)
+            total, chat_ids = await pipe.execute()
+
+            summaries: list[dict[bytes, bytes]] = []
+            if chat_ids:
+                pipe = self.client.pipeline(transaction=False)
+                for chat_id in chat_ids:
+                    pipe.hgetall(get_chat_summary_key(user_id, chat_id.decode("utf-8")))
+                summaries = await pipe.execute()
+            chats, expired = collect_chat_summaries(chat_ids, summaries)
+
+            if expired:
+                await self.client.zrem(index_key, *expired)
+            logger.info(f"Listed {len(chats)}/{total} chats from index (user: {user_id or 'shared'})")
+            return chats, max(total - len(expired), 0)
+        except Exception as e:
+            logger.error(f"Failed to list chats: {e}", exc_info=True)
+            return [], 0
+
+    async def ensure_chat_index(self) -> int:
+        """Build the chat index from existing chats once (for chats stored before indexing existed).
+
+        Returns:
+            Number of chats indexed (0 if the index was already built)
+        """
+        try:
+            if await self.client.get(CHAT_INDEX_VERSION_KEY) == CHAT_INDEX_VERSION:
+                return 0
+
+            keys = [
+                key
+                for pattern in (get_chat_pattern(None), get_chat_pattern("*"))
+                for key in await self._scan_keys(pattern)
+            ]
+            indexed = 0
+            for batch_start in range(0, len(keys), CHAT_INDEX_REBUILD_BATCH_SIZE):
+                batch = keys[batch_start : batch_start + CHAT_INDEX_REBUILD_BATCH_SIZE]
+                values = cast("list[bytes | None]", await self.client.mget(batch))
+                pipe = self.client.pipeline(transaction=False)
+                indexed += queue_chat_index_rebuild(pipe, batch, values, self.ttl)
+                await pipe.execute()
+
+            await self.client.set(CHAT_INDEX_VERSION_KEY, CHAT_INDEX_VERSION)
+            logger.info(f"Built chat index for {indexed} existing chats")
+            return indexed
+        except Exception as e:
+            logger.error(f"Failed to build chat index: {e}", exc_info=True)
+            return 0
+
+    async def ensure_file_index(self) -> int:
+        """Move files stored in the legacy base64 JSON format into the file index once.
+
+        Returns:
+            Number of files migrated (0 if the migration already ran)
+        """
+        try:
+            if await self.client.get(FILE_INDEX_VERSION_KEY) == FILE_INDEX_VERSION:
+                return 0
+
+            keys = await self._scan_keys(get_legacy_file_key("*", "*"))
+            migrated = 0
+            for batch_start in range(0, len(keys), CHAT_INDEX_REBUILD_BATCH_SIZE):
+                batch = keys[batch_start : batch_start + CHAT_INDEX_REBUILD_BATCH_SIZE]
+                values = cast("list[bytes | None]", await self.client.mget(batch))
+                pipe = self.client.pipeline(transaction=False)
+                migrated += queue_legacy_file_migration(pipe, batch, values, self.ttl)
+                await pipe.execute()
+
+            await self.client.set(FILE_INDEX_VERSION_KEY, FILE_INDEX_VERSION)
+            logger.info(f"Migrated {migrated} legacy files into the file index")
+            return migrated
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy files: {e}", exc_info=True)
+            return 0
+
+    async def save_file(self, chat_id: str, file_path: Path | str, content: bytes | None = None) -> bool:
+        """Save a file to Redis associated with a chat session.
+
+        Args:
+            chat_id: Chat session ID
+            file_path: Path to the file (or filename)
+            content: Optional file content as bytes. If not provided, reads from file_path
+
+        Returns:
+            True if successful, False otherwise
+        """
+        file_path = Path(file_path)
+        filename = file_path.name
+        try:
+            mtime_ns = None
+            if content is None:
+                if not file_path.exists():
+                    logger.error(f"File not found: {file_path}")
+                    return False
+                content = await asyncio.to_thread(file_path.read_bytes)
+                mtime_ns = file_path.stat().st_mtime_ns
+
+            sync = FileSync(index=await self._get_file_index(chat_id))
+            sync.add(filename, content, mtime_ns)
+            pipe = self.client.pipeline(transaction=False)
+            queue_file_sync(pipe, chat_id, sync, self.ttl)
+            await pipe.execute()
+            logger.info(f"Saved file {filename} for chat {chat_id} to Redis ({len(content)} bytes)")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save file {filename} for chat {chat_id}: {e}", exc_info=True)
+            return False
+
+    async def load_file(self, chat_id: str, filename: str) -> bytes | None:
+        """Load a file from Redis for a chat session.
+
+        Args:
+            chat_id: Chat session ID
+            filename: Name of the file to load
+
+        Returns:
+            File content as bytes, or None if not found
+        """
+        try:
+            entry = await self.get_file_entry(chat_id, filename)
+            content = None
+            if entry is not None:
+                content = cast("bytes | None", await self.client.get(get_file_blob_key(chat_id, entry["sha256"])))
+            if content is None:
+                logger.info(f"File {filename} not found for chat {chat_id}")
+                return None
+
+            logger.info(f"Loaded file {filename} for chat {chat_id} ({len(content)} bytes)")
+            return content
+        except Exception as e:
+            logger.error(f"Failed to load file {filename} for chat {chat_id}: {e}", exc_info=True)
+            return None
+
+    async def get_file_entry(self, chat_id: str, filename: str) -> dict[str, Any] | None:
+        """Get the file index entry (filename, size, timestamp, sha256) of a chat file.
+
+        Args:
+            chat_id: Chat session ID
+            filename: Name of the file
+
+        Returns:
+            File index entry, or None if the file does not exist or its stored content is
+            missing or incomplete (so callers can 404 before streaming starts)
+        """
+        value = await self.client.hget(get_file_index_key(chat_id), filename)
+        if value is None:
+            return None
+        entry = decode_file_entry(cast("bytes", value))
+        stored_size = await self.client.strlen(get_file_blob_key(chat_id, entry["sha256"]))
+        if stored_size != entry["size"]:
+            logger.warning(
+                f"Content of file {filename} in chat {chat_id} is missing ({stored_size} of {entry['size']} bytes stored)"
+            )
+            return None
+        return entry
+
+    async def iter_file(
+        self, chat_id: str, entry: dict[str, Any], start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """Stream a byte range of a chat file in chunks without loading the whole file.
+
+        Args:
+            chat_id: Chat session ID
+            entry: File index entry (see `get_file_entry`)
+            start: First byte to return
+            end: Last byte to return, inclusive (None = end of file)
+
+        Yields:
+            Consecutive chunks of at most `FILE_CHUNK_SIZE` bytes
+        """
+        key = get_file_blob_key(chat_id, entry["sha256"])
+        last = entry["size"] - 1 if end is None else end
+        for offset in range(start, last + 1, FILE_CHUNK_SIZE):
+            yield cast("bytes", await self.client.getrange(key, offset, min(offset + FILE_CHUNK_SIZE, last + 1) - 1))
+
+    async def list_files(self, chat_id: str) -> list[dict[str, Any]]:
+        """List all files for a chat session.
+
+        Args:
+            chat_id: Chat session ID
+
+        Returns:
+            List of dicts with filename, size, and timestamp
+        """
+        try:
+            files = file_listing(await self._get_file_index(chat_id))
+            logger.info(f"Found {len(files)} files for chat {chat_id}")
+            return files
+        except Exception as e:
+            logger.error(f"Failed to list files for chat {chat_id}: {e}", exc_info=True)
+            return []
+
+    async def delete_file(self, chat_id: str, filename: str) -> bool:
+        """Delete a file from Redis for a chat session.
+
+        Args:
+            chat_id: Chat session ID
+            filename: Name of the file to delete
+
+        Returns:
+            True if deleted, False otherwise
+        """
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            deleted = queue_file_removal(pipe, chat_id, await self._get_file_index(chat_id), filename)
+            if deleted:
+                await pipe.execute()
+            logger.info(f"Deleted file {filename} for chat {chat_id} (deleted={deleted})")
+            return deleted
+        except Exception as e:
+            logger.error(f"Failed to delete file {filename} for chat {chat_id}: {e}", exc_info=True)
+            return False
+
+    async def delete_all_files(self, chat_id: str) -> int:
+        """Delete all files for a chat session.
+
+        Args:
+            chat_id: Chat session ID
+
+        Returns:
+            Number of files deleted
+        """
+        try:
+            index = await self._get_file_index(chat_id)
+            if not index:
+                logger.info(f"No files to delete for chat {chat_id}")
+                return 0
+
+            blob_keys = {get_file_blob_key(chat_id, entry["sha256"]) for entry in index.values()}
+            await self.client.delete(get_file_index_key(chat_id), *blob_keys)
+            logger.info(f"Deleted {len(index)} files for chat {chat_id}")
+            return len(index)
+        except Exception as e:
+            logger.error(f"Failed to delete files for chat {chat_id}: {e}", exc_info=True)
+            return 0
+
+    async def save_all_files(self, chat_id: str, output_dir: Path) -> int:
+        """Save new and modified files from output directory to Redis in a single pipelined write.
+
+        Args:
+            chat_id: Chat session ID
+            output_dir: Directory containing files to save
+
+        Returns:
+            Number of new or modified files saved
+        """
+        try:
+            sync = await asyncio.to_thread(plan_file_sync, await self._get_file_index(chat_id), output_dir)
+            if not sync.entries:
+                return 0
+
+            pipe = self.client.pipeline(transaction=False)
+            queue_file_sync(pipe, chat_id, sync, self.ttl)
+            await pipe.execute()
+
+            logger.info(
+                f"Saved {len(sync.entries)} new or modified files for chat {chat_id} to Redis "
+                f"({len(sync.blobs)} uploaded)"
+            )
+            return len(sync.entries)
+        except Exception as e:
+            logger.error(f"Failed to save files for chat {chat_id}: {e}", exc_info=True)
+            return 0
+
+    async def load_all_files(self, chat_id: str, output_dir: Path) -> int:
+        """Load all files from Redis to output directory, fetching their contents with a single MGET.
+
+        Args:
+            chat_id: Chat session ID
+            output_dir: Directory where files will be restored
+
+        Returns:
+            Number of files loaded
+        """
+        try:
+            index = await self._get_file_index(chat_id)
+            files: list[tuple[str, bytes]] = []
+            if index:
+                blob_keys = [get_file_blob_key(chat_id, entry["sha256"]) for entry in index.values()]
+                contents = cast("list[bytes | None]", await self.client.mget(blob_keys))
+                files = [
+                    (filename, content)
+                    for filename, content in zip(index, contents, strict=True)
+                    if content is not None
+                ]
+            await asyncio.to_thread(_write_output_files, output_dir, files)
+
+            logger.info(f"Loaded {len(files)} files for chat {chat_id} from Redis")
+            return len(files)
+        except Exception as e:
+            logger.error(f"Failed to load files for chat {chat_id}: {e}", exc_info=True)
+            return 0
+
+    async def close(self) -> None:
+        """Close the Redis client and disconnect its connection pool."""
+        if self._client is not None:
+            await self._client.aclose(close_connection_pool=True)
+            self._client = None
+            logger.info("Closed async Redis connection pool")
+
+    async def _scan_keys(self, pattern: str) -> list[bytes]:
+        """Collect keys matching a pattern using SCAN (does not block the Redis server like KEYS)."""
+        return [key async for key in self.client.scan_iter(match=pattern.encode("utf-8"), count=SCAN_BATCH_SIZE)]
+
+    async def _get_file_index(self, chat_id: str) -> dict[str, dict[str, Any]]:
+        """Fetch the file index entries of a chat keyed by filename."""
+        return decode_file_index(cast("dict[bytes, bytes]", await self.client.hgetall(get_file_index_key(chat_id))))
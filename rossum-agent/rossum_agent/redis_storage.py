@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import datetime as dt
+import hashlib
 import json
 import logging
 import os
@@ -17,6 +18,17 @@ import redis
 
 logger = logging.getLogger(__name__)
 
+# Chat listing index: a per-user sorted set (chat_id scored by creation timestamp) plus
+# a compact summary hash per chat, maintained on save/delete.
+CHAT_INDEX_VERSION_KEY = "chat_index:version"
+CHAT_INDEX_VERSION = b"1"
+CHAT_INDEX_REBUILD_BATCH_SIZE = 100
+
+# Chat files: a per-chat hash (filename -> JSON entry with size, timestamp, sha256, mtime_ns) plus
+# raw file bytes stored once per distinct content hash of the chat.
+FILE_INDEX_VERSION_KEY = "file_index:version"
+FILE_INDEX_VERSION = b"1"
+
 
 def extract_text_from_content(content: str | list[dict[str, Any]] | None) -> str:
     """Extract text from message content which can be a string or multimodal list."""
@@ -56,6 +68,8 @@ class ChatMetadata:
     commit_sha: str | None = None
     total_input_tokens: int = 0
     total_output_tokens: int = 0
+    total_cache_creation_input_tokens: int = 0
+    total_cache_read_input_tokens: int = 0
     total_tool_calls: int = 0
     total_steps: int = 0
     mcp_mode: str = "read-only"
@@ -66,6 +80,8 @@ class ChatMetadata:
             "commit_sha": self.commit_sha,
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
+            "total_cache_creation_input_tokens": self.total_cache_creation_input_tokens,
+            "total_cache_read_input_tokens": self.total_cache_read_input_tokens,
             "total_tool_calls": self.total_tool_calls,
             "total_steps": self.total_steps,
             "mcp_mode": self.mcp_mode,
@@ -78,6 +94,8 @@ class ChatMetadata:
             commit_sha=data.get("commit_sha"),
             total_input_tokens=data.get("total_input_tokens", 0),
             total_output_tokens=data.get("total_output_tokens", 0),
+            total_cache_creation_input_tokens=data.get("total_cache_creation_input_tokens", 0),
+            total_cache_read_input_tokens=data.get("total_cache_read_input_tokens", 0),
             total_tool_calls=data.get("total_tool_calls", 0),
             total_steps=data.get("total_steps", 0),
             mcp_mode=data.get("mcp_mode", "read-only"),
@@ -93,6 +111,286 @@ class ChatData:
     metadata: ChatMetadata = field(default_factory=ChatMetadata)
 
 
+def get_chat_key(user_id: str | None, chat_id: str) -> str:
+    """Generate Redis key for a chat."""
+    return f"user:{user_id}:chat:{chat_id}" if user_id else f"chat:{chat_id}"
+
+
+def get_chat_pattern(user_id: str | None = None) -> str:
+    """Generate Redis key pattern for listing chats."""
+    return f"user:{user_id}:chat:*" if user_id else "chat:*"
+
+
+def parse_chat_key(key: str) -> tuple[str | None, str]:
+    """Split a chat key into (user_id, chat_id); inverse of `get_chat_key`."""
+    if key.startswith("user:") and ":chat:" in key:
+        user_part, chat_id = key.rsplit(":chat:", 1)
+        return user_part.removeprefix("user:"), chat_id
+    return None, key.removeprefix("chat:")
+
+
+def get_chat_index_key(user_id: str | None) -> str:
+    """Generate Redis key of the sorted set indexing a user's chats by timestamp."""
+    return f"chat_index:user:{user_id}" if user_id else "chat_index:shared"
+
+
+def get_chat_summary_key(user_id: str | None, chat_id: str) -> str:
+    """Generate Redis key of the chat summary hash."""
+    return f"chat_summary:user:{user_id}:{chat_id}" if user_id else f"chat_summary:shared:{chat_id}"
+
+
+def get_file_index_key(chat_id: str) -> str:
+    """Generate Redis key of the hash indexing a chat's files by filename."""
+    return f"file_index:{chat_id}"
+
+
+def get_file_blob_key(chat_id: str, digest: str) -> str:
+    """Generate Redis key holding the raw content of a chat file with the given SHA-256."""
+    return f"file_blob:{chat_id}:{digest}"
+
+
+def get_legacy_file_key(chat_id: str, filename: str) -> str:
+    """Generate Redis key of a file stored in the legacy base64 JSON format."""
+    return f"file:{chat_id}:{filename}"
+
+
+def encode_chat_payload(
+    messages: list[dict[str, Any]], output_dir: str | Path | None, metadata: ChatMetadata | None
+) -> bytes:
+    """Serialize a chat into the stored JSON payload."""
+    payload = {
+        "messages": messages,
+        "output_dir": str(output_dir) if output_dir else None,
+        "metadata": metadata.to_dict() if metadata else ChatMetadata().to_dict(),
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def decode_chat_payload(value: bytes) -> ChatData:
+    """Deserialize a stored chat payload (also accepts the legacy plain message list)."""
+    data = json.loads(value.decode("utf-8"))
+    if isinstance(data, list):
+        return ChatData(messages=data)
+    return ChatData(
+        messages=data.get("messages", []),
+        output_dir=data.get("output_dir"),
+        metadata=ChatMetadata.from_dict(data.get("metadata", {})),
+    )
+
+
+def build_file_entry(filename: str, content: bytes, mtime_ns: int | None = None) -> dict[str, Any]:
+    """Build the file index entry describing a stored file."""
+    return {
+        "filename": filename,
+        "size": len(content),
+        "timestamp": dt.datetime.now(dt.UTC).isoformat(),
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "mtime_ns": mtime_ns,
+    }
+
+
+def decode_file_entry(value: bytes) -> dict[str, Any]:
+    """Decode a file index entry."""
+    return cast("dict[str, Any]", json.loads(value.decode("utf-8")))
+
+
+def decode_file_index(fields: dict[bytes, bytes]) -> dict[str, dict[str, Any]]:
+    """Decode a file index hash into entries keyed by filename."""
+    return {name.decode("utf-8"): decode_file_entry(value) for name, value in fields.items()}
+
+
+def decode_legacy_file_payload(value: bytes) -> tuple[str, bytes]:
+    """Decode a legacy base64 JSON file payload into (filename, content)."""
+    payload = json.loads(value.decode("utf-8"))
+    return payload["filename"], base64.b64decode(payload["content"])
+
+
+@dataclass
+class FileSync:
+    """Changes that bring a chat's stored files up to date, computed against its current file index."""
+
+    index: dict[str, dict[str, Any]]
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    blobs: dict[str, bytes] = field(default_factory=dict)
+
+    def add(self, filename: str, content: bytes, mtime_ns: int | None = None) -> None:
+        """Record a new or changed file; its content is uploaded only if the chat does not store it yet."""
+        entry = build_file_entry(filename, content, mtime_ns)
+        known = {e["sha256"] for e in (*self.index.values(), *self.entries.values())}
+        if entry["sha256"] not in known:
+            self.blobs[entry["sha256"]] = content
+        self.entries[filename] = entry
+
+    @property
+    def referenced(self) -> set[str]:
+        """Content hashes referenced by the file index once the changes are applied."""
+        return {entry["sha256"] for entry in {**self.index, **self.entries}.values()}
+
+    @property
+    def stale(self) -> set[str]:
+        """Content hashes no longer referenced by any file once the changes are applied."""
+        return {entry["sha256"] for entry in self.index.values()} - self.referenced
+
+
+def plan_file_sync(index: dict[str, dict[str, Any]], output_dir: Path) -> FileSync:
+    """Compare an output directory with the stored file index; only new or modified files are read."""
+    sync = FileSync(index=index)
+    if not output_dir.exists() or not output_dir.is_dir():
+        logger.warning(f"Output directory does not exist: {output_dir}")
+        return sync
+
+    for path in output_dir.iterdir():
+        if not path.is_file():
+            continue
+        stat = path.stat()
+        entry = index.get(path.name)
+        if entry is not None and entry["size"] == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            continue
+        sync.add(path.name, path.read_bytes(), stat.st_mtime_ns)
+    return sync
+
+
+def queue_file_sync(pipe: Any, chat_id: str, sync: FileSync, ttl: dt.timedelta) -> None:
+    """Queue commands applying a file sync on a (sync or async) pipeline; all file keys share the chat TTL."""
+    index_key = get_file_index_key(chat_id)
+    for digest, content in sync.blobs.items():
+        pipe.set(get_file_blob_key(chat_id, digest), content, ex=ttl)
+    if sync.entries:
+        pipe.hset(index_key, mapping={name: json.dumps(entry) for name, entry in sync.entries.items()})
+    for digest in sync.referenced - sync.blobs.keys():
+        pipe.expire(get_file_blob_key(chat_id, digest), ttl)
+    if stale := sync.stale:
+        pipe.delete(*(get_file_blob_key(chat_id, digest) for digest in stale))
+    pipe.expire(index_key, ttl)
+
+
+def queue_file_removal(pipe: Any, chat_id: str, index: dict[str, dict[str, Any]], filename: str) -> bool:
+    """Queue commands removing one file (and its content, unless shared); returns whether the file exists."""
+    if (entry := index.get(filename)) is None:
+        return False
+    pipe.hdel(get_file_index_key(chat_id), filename)
+    if all(e["sha256"] != entry["sha256"] for name, e in index.items() if name != filename):
+        pipe.delete(get_file_blob_key(chat_id, entry["sha256"]))
+    return True
+
+
+def queue_legacy_file_migration(pipe: Any, keys: list[bytes], values: list[bytes | None], ttl: dt.timedelta) -> int:
+    """Queue moving a batch of legacy file payloads into the file index; returns the number of files queued."""
+    syncs: dict[str, FileSync] = {}
+    for key, value in zip(keys, values, strict=True):
+        if value is None:
+            continue
+        chat_id = key.decode("utf-8").split(":", 2)[1]
+        filename, content = decode_legacy_file_payload(value)
+        syncs.setdefault(chat_id, FileSync(index={})).add(filename, content)
+
+    for chat_id, sync in syncs.items():
+        queue_file_sync(pipe, chat_id, sync, ttl)
+    if keys:
+        pipe.delete(*keys)
+    return sum(len(sync.entries) for sync in syncs.values())
+
+
+def file_listing(index: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """Build the file listing entries (filename, size, timestamp) of a file index."""
+    return [
+        {"filename": filename, "size": entry["size"], "timestamp": entry["timestamp"]}
+        for filename, entry in index.items()
+    ]
+
+
+def _chat_timestamp(chat_id: str) -> int:
+    """Creation timestamp encoded in chat IDs (`chat_<YYYYmmddHHMMSS>_<suffix>`), or now if absent."""
+    try:
+        return int(dt.datetime.strptime(chat_id.split("_")[1], "%Y%m%d%H%M%S").timestamp())
+    except (IndexError, ValueError):
+        return int(dt.datetime.now(dt.UTC).timestamp())
+
+
+def build_chat_summary(chat_id: str, chat_data: ChatData) -> dict[str, Any]:
+    """Build the chat listing entry for a stored chat."""
+    messages = chat_data.messages
+    timestamp = _chat_timestamp(chat_id)
+    first_message_content = messages[0].get("content") if messages else None
+    first_message = extract_text_from_content(first_message_content)
+    first_user_content = next(
+        (m.get("content") for m in messages if m.get("role") == "user"),
+        None,
+    )
+    first_user = extract_text_from_content(first_user_content)
+    preview = first_user[:100] if first_user else None
+
+    return {
+        "chat_id": chat_id,
+        "timestamp": timestamp,
+        "message_count": len(messages),
+        "first_message": first_message[:100],
+        "preview": preview,
+        "commit_sha": chat_data.metadata.commit_sha,
+        "total_input_tokens": chat_data.metadata.total_input_tokens,
+        "total_output_tokens": chat_data.metadata.total_output_tokens,
+        "total_cache_creation_input_tokens": chat_data.metadata.total_cache_creation_input_tokens,
+        "total_cache_read_input_tokens": chat_data.metadata.total_cache_read_input_tokens,
+        "total_tool_calls": chat_data.metadata.total_tool_calls,
+        "total_steps": chat_data.metadata.total_steps,
+    }
+
+
+def encode_chat_summary(summary: dict[str, Any]) -> dict[str, str]:
+    """Encode a chat summary into hash fields (JSON values keep their types)."""
+    return {name: json.dumps(value) for name, value in summary.items()}
+
+
+def decode_chat_summary(fields: dict[bytes, bytes]) -> dict[str, Any]:
+    """Decode chat summary hash fields."""
+    return {name.decode("utf-8"): json.loads(value) for name, value in fields.items()}
+
+
+def queue_chat_index_update(
+    pipe: Any, user_id: str | None, chat_id: str, chat_data: ChatData, ttl: dt.timedelta
+) -> None:
+    """Queue commands refreshing the chat summary and its index entry on a (sync or async) pipeline."""
+    summary = build_chat_summary(chat_id, chat_data)
+    summary_key = get_chat_summary_key(user_id, chat_id)
+    index_key = get_chat_index_key(user_id)
+    pipe.hset(summary_key, mapping=encode_chat_summary(summary))
+    pipe.expire(summary_key, ttl)
+    pipe.zadd(index_key, {chat_id: summary["timestamp"]})
+    pipe.expire(index_key, ttl)
+
+
+def queue_chat_index_removal(pipe: Any, user_id: str | None, chat_id: str) -> None:
+    """Queue commands removing a chat from the listing index on a (sync or async) pipeline."""
+    pipe.delete(get_chat_summary_key(user_id, chat_id))
+    pipe.zrem(get_chat_index_key(user_id), chat_id)
+
+
+def collect_chat_summaries(
+    chat_ids: list[bytes], summaries: list[dict[bytes, bytes]]
+) -> tuple[list[dict[str, Any]], list[bytes]]:
+    """Decode fetched summary hashes; chats whose summary expired are returned separately."""
+    chats: list[dict[str, Any]] = []
+    expired: list[bytes] = []
+    for chat_id, fields in zip(chat_ids, summaries, strict=True):
+        if fields:
+            chats.append(decode_chat_summary(fields))
+        else:
+            expired.append(chat_id)
+    return chats, expired
+
+
+def queue_chat_index_rebuild(pipe: Any, keys: list[bytes], values: list[bytes | None], ttl: dt.timedelta) -> int:
+    """Queue index updates for a batch of stored chats; returns the number of chats queued."""
+    queued = 0
+    for key, value in zip(keys, values, strict=True):
+        if value is None:
+            continue
+        user_id, chat_id = parse_chat_key(key.decode("utf-8"))
+        queue_chat_index_update(pipe, user_id, chat_id, decode_chat_payload(value), ttl)
+        queued += 1
+    return queued
+
+
 class RedisStorage:
     """Redis storage for chat conversations."""
 
@@ -128,13 +426,12 @@ class RedisStorage:
     ) -> bool:
         try:
             key = self._get_chat_key(user_id, chat_id)
-            payload = {
-                "messages": messages,
-                "output_dir": str(output_dir) if output_dir else None,
-                "metadata": metadata.to_dict() if metadata else ChatMetadata().to_dict(),
-            }
-            value = json.dumps(payload).encode("utf-8")
-            self.client.setex(key, self.ttl, value)
+            self.client.setex(key, self.ttl, encode_chat_payload(messages, output_dir, metadata))
+
+            pipe = self.client.pipeline(transaction=False)
+            chat_data = ChatData(messages=messages, metadata=metadata or ChatMetadata())
+            queue_chat_index_update(pipe, user_id, chat_id, chat_data, self.ttl)
+            pipe.execute()
 
             files_saved = 0
             if output_dir:
@@ -168,11 +465,7 @@ class RedisStorage:
                 logger.info(f"Chat {chat_id} not found in Redis (user: {user_id or 'shared'})")
                 return None
 
-            data = json.loads(cast("bytes", value).decode("utf-8"))
-            messages = data if isinstance(data, list) else data.get("messages", [])
-            stored_output_dir = data.get("output_dir") if isinstance(data, dict) else None
-            metadata_dict = data.get("metadata", {}) if isinstance(data, dict) else {}
-            metadata = ChatMetadata.from_dict(metadata_dict)
+            chat_data = decode_chat_payload(cast("bytes", value))
 
             files_loaded = 0
             if output_dir:
@@ -180,9 +473,9 @@ class RedisStorage:
 
             logger.info(
                 f"Loaded chat {chat_id} from Redis "
-                f"({len(messages)} messages, {files_loaded} files, user: {user_id or 'shared'})"
+                f"({len(chat_data.messages)} messages, {files_loaded} files, user: {user_id or 'shared'})"
             )
-            return ChatData(messages=messages, output_dir=stored_output_dir, metadata=metadata)
+            return chat_data
         except Exception as e:
             logger.error(f"Failed to load chat {chat_id}: {e}", exc_info=True)
             return None
@@ -191,6 +484,10 @@ class RedisStorage:
         try:
             key = self._get_chat_key(user_id, chat_id)
             deleted = self.client.delete(key)
+
+            pipe = self.client.pipeline(transaction=False)
+            queue_chat_index_removal(pipe, user_id, chat_id)
+            pipe.execute()
             logger.info(f"Deleted chat {chat_id} from Redis (deleted={deleted}, user: {user_id or 'shared'})")
             return bool(deleted)
         except Exception as e:
@@ -214,68 +511,118 @@ class RedisStorage:
 
     def _get_chat_key(self, user_id: str | None, chat_id: str) -> str:
         """Generate Redis key for a chat."""
-        return f"user:{user_id}:chat:{chat_id}" if user_id else f"chat:{chat_id}"
+        return get_chat_key(user_id, chat_id)
 
     def _get_chat_pattern(self, user_id: str | None = None) -> str:
         """Generate Redis key pattern for listing chats."""
-        return f"user:{user_id}:chat:*" if user_id else "chat:*"
+        return get_chat_pattern(user_id)
 
     def list_all_chats(self, user_id: str | None = None) -> list[dict[str, Any]]:
-        """List all chat conversations with metadata.
+        """List all chat conversations with metadata, newest first.
 
         Args:
             user_id: Optional user ID to filter chats (None = all chats or shared chats)
 
         Returns:
-            List of dicts with chat_id, timestamp, message_count, first_message,
-            and metadata (commit_sha, total_input_tokens, total_output_tokens,
-            total_tool_calls, total_steps)
+            List of chat summaries (see `build_chat_summary`)
+        """
+        chats, _ = self.list_chats(user_id)
+        return chats
+
+    def list_chats(
+        self, user_id: str | None = None, limit: int | None = None, offset: int = 0
+    ) -> tuple[list[dict[str, Any]], int]:
+        """List a page of chats from the chat index, newest first.
+
+        Reads only the requested page of the per-user sorted set and the matching summary
+        hashes, so the cost does not depend on the total number of chats or their size.
+
+        Args:
+            user_id: Optional user ID to filter chats (None = shared chats)
+            limit: Maximum number of chats to return (None = all)
+            offset: Number of newest chats to skip
+
+        Returns:
+            Tuple of (chat summaries, total number of indexed chats)
         """
         try:
-            pattern = self._get_chat_pattern(user_id)
-            keys = cast("list[bytes]", self.client.keys(pattern.encode("utf-8")))
-            chats = []
-
-            for key in keys:
-                key_str = key.decode("utf-8")
-                chat_id = key_str.replace(f"user:{user_id}:chat:", "") if user_id else key_str.replace("chat:", "")
-
-                chat_data = self.load_chat(user_id, chat_id)
-
-                if chat_data:
-                    messages = chat_data.messages
-                    timestamp_str = chat_id.split("_")[1]
-                    timestamp = int(dt.datetime.strptime(timestamp_str, "%Y%m%d%H%M%S").timestamp())
-                    first_message_content = messages[0].get("content") if messages else None
-                    first_message = extract_text_from_content(first_message_content)
-                    first_user_content = next(
-                        (m.get("content") for m in messages if m.get("role") == "user"),
-                        None,
-                    )
-                    first_user = extract_text_from_content(first_user_content)
-                    preview = first_user[:100] if first_user else None
-
-                    chats.append(
-                        {
-                            "chat_id": chat_id,
-                            "timestamp": timestamp,
-                            "message_count": len(messages),
-                            "first_message": first_message[:100],
-                            "preview": preview,
-                            "commit_sha": chat_data.metadata.commit_sha,
-                            "total_input_tokens": chat_data.metadata.total_input_tokens,
-                            "total_output_tokens": chat_data.metadata.total_output_tokens,
-                            "total_tool_calls": chat_data.metadata.total_tool_calls,
-                            "total_steps": chat_data.metadata.total_steps,
-                        }
-                    )
-
-            chats.sort(key=lambda x: x["timestamp"], reverse=True)
-            logger.info(f"Found {len(chats)} chats in Redis (user: {user_id or 'shared'})")
-            return chats
+            index_key = get_chat_index_key(user_id)
+            stop = -1 if limit is None else offset + limit - 1
+            pipe = self.client.pipeline(transaction=False)
+            pipe.zcard(index_key)
+            pipe.zrevrange(index_key, offset, stop)
+            total, chat_ids = pipe.execute()
+
+            pipe = self.client.pipeline(transaction=False)
+            for chat_id in chat_ids:
+                pipe.hgetall(get_chat_summary_key(user_id, chat_id.decode("utf-8")))
+            chats, expired = collect_chat_summaries(chat_ids, pipe.execute() if chat_ids else [])
+
+            if expired:
+                self.client.zrem(index_key, *expired)
+            logger.info(f"Listed {len(chats)}/{total} chats from index (user: {user_id or 'shared'})")
+            return chats, max(total - len(expired), 0)
         except Exception as e:
             logger.error(f"Failed to list chats: {e}", exc_info=True)
-            return []
+            return [], 0
+
+    def ensure_chat_index(self) -> int:
+        """Build the chat index from existing chats once (for chats stored before indexing existed).
+
+        Returns:
+            Number of chats indexed (0 if the index was already built)
+        """
+        try:
+            if self.client.get(CHAT_INDEX_VERSION_KEY) == CHAT_INDEX_VERSION:
+                return 0
+
+            keys = [
+                key
+                for pattern in (get_chat_pattern(None), get_chat_pattern("*"))
+                for key in self.client.scan_iter(match=pattern.encode("utf-8"), count=CHAT_INDEX_REBUILD_BATCH_SIZE)
+            ]
+            indexed = 0
+            for batch_start in range(0, len(keys), CHAT_INDEX_REBUILD_BATCH_SIZE):
+                batch = keys[batch_start : batch_start + CHAT_INDEX_REBUILD_BATCH_SIZE]
+                pipe = self.client.pipeline(transaction=False)
+                indexed += queue_chat_index_rebuild(pipe, batch, self.client.mget(batch), self.ttl)
+                pipe.execute()
+
+            self.client.set(CHAT_INDEX_VERSION_KEY, CHAT_INDEX_VERSION)
+            logger.info(f"Built chat index for {indexed} existing chats")
+            return indexed
+        except Exception as e:
+            logger.error(f"Failed to build chat index: {e}", exc_info=True)
+            return 0
+
+    def ensure_file_index(self) -> int:
+        """Move files stored in the legacy base64 JSON format into the file index once.
+
+        Returns:
+            Number of files migrated (0 if the migration already ran)
+        """
+        try:
+            if self.client.get(FILE_INDEX_VERSION_KEY) == FILE_INDEX_VERSION:
+                return 0
+
+            keys = list(
+                self.client.scan_iter(
+                    match=get_legacy_file_key("*", "*").encode("utf-8"), count=CHAT_INDEX_REBUILD_BATCH_SIZE
+                )
+            )
+            migrated = 0
+            for batch_start in range(0, len(keys), CHAT_INDEX_REBUILD_BATCH_SIZE):
+                batch = keys[batch_start : batch_start + CHAT_INDEX_REBUILD_BATCH_SIZE]
+                pipe = self.client.pipeline(transaction=False)
+                migrated += queue_legacy_file_migration(pipe, batch, self.client.mget(batch), self.ttl)
+                pipe.execute()
+
+            self.client.set(FILE_INDEX_VERSION_KEY, FILE_INDEX_VERSION)
+            logger.info(f"Migrated {migrated} legacy files into the file index")
+            return migrated
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy files: {e}", exc_info=True)
+            return 0
 
     def save_file(self, chat_id: str, file_path: Path | str, content: bytes | None = None) -> bool:
         """Save a file to Redis associated with a chat session.
@@ -293,28 +640,23 @@ class RedisStorage:
                 file_path = Path(file_path)
 
             filename = file_path.name
-            key = f"file:{chat_id}:{filename}"
-
+            mtime_ns = None
             if content is None:
                 if not file_path.exists():
                     logger.error(f"File not found: {file_path}")
                     return False
                 content = file_path.read_bytes()
+                mtime_ns = file_path.stat().st_mtime_ns
 
-            # Store file with metadata
-            metadata = {
-                "filename": filename,
-                "size": len(content),
-                "timestamp": dt.datetime.now(dt.UTC).isoformat(),
-                "content": base64.b64encode(content).decode("utf-8"),
-            }
-
-            value = json.dumps(metadata).encode("utf-8")
-            self.client.setex(key, self.ttl, value)
+            sync = FileSync(index=self._get_file_index(chat_id))
+            sync.add(filename, content, mtime_ns)
+            pipe = self.client.pipeline(transaction=False)
+            queue_file_sync(pipe, chat_id, sync, self.ttl)
+            pipe.execute()
             logger.info(f"Saved file {filename} for chat {chat_id} to Redis ({len(content)} bytes)")
             return True
         except Exception as e:
-            logger.error(f"Failed to save file {filename} for chat {chat_id}: {e}", exc_info=True)
+            logger.error(f"Failed to save file {file_path} for chat {chat_id}: {e}", exc_info=True)
             return False
 
     def load_file(self, chat_id: str, filename: str) -> bytes | None:
@@ -328,14 +670,15 @@ class RedisStorage:
             File content as bytes, or None if not found
         """
         try:
-            key = f"file:{chat_id}:{filename}"
-            value = self.client.get(key)
-            if value is None:
+            value = self.client.hget(get_file_index_key(chat_id), filename)
+            content = None
+            if value is not None:
+                digest = decode_file_entry(cast("bytes", value))["sha256"]
+                content = cast("bytes | None", self.client.get(get_file_blob_key(chat_id, digest)))
+            if content is None:
                 logger.info(f"File {filename} not found for chat {chat_id}")
                 return None
 
-            metadata: dict[str, Any] = json.loads(cast("bytes", value).decode("utf-8"))
-            content = base64.b64decode(metadata["content"])
             logger.info(f"Loaded file {filename} for chat {chat_id} ({len(content)} bytes)")
             return content
         except Exception as e:
@@ -352,24 +695,7 @@ class RedisStorage:
             List of dicts with filename, size, and timestamp
         """
         try:
-            pattern = f"file:{chat_id}:*"
-            keys = cast("list[bytes]", self.client.keys(pattern.encode("utf-8")))
-            files = []
-
-            for key in keys:
-                key_str = key.decode("utf-8")
-                filename = key_str.split(":")[-1]
-                value = self.client.get(key)
-                if value:
-                    metadata: dict[str, Any] = json.loads(cast("bytes", value).decode("utf-8"))
-                    files.append(
-                        {
-                            "filename": filename,
-                            "size": metadata.get("size", 0),
-                            "timestamp": metadata.get("timestamp", ""),
-                        }
-                    )
-
+            files = file_listing(self._get_file_index(chat_id))
             logger.info(f"Found {len(files)} files for chat {chat_id}")
             return files
         except Exception as e:
@@ -387,10 +713,12 @@ class RedisStorage:
             True if deleted, False otherwise
         """
         try:
-            key = f"file:{chat_id}:{filename}"
-            deleted = self.client.delete(key)
+            pipe = self.client.pipeline(transaction=False)
+            deleted = queue_file_removal(pipe, chat_id, self._get_file_index(chat_id), filename)
+            if deleted:
+                pipe.execute()
             logger.info(f"Deleted file {filename} for chat {chat_id} (deleted={deleted})")
-            return bool(deleted)
+            return deleted
         except Exception as e:
             logger.error(f"Failed to delete file {filename} for chat {chat_id}: {e}", exc_info=True)
             return False
@@ -405,45 +733,46 @@ class RedisStorage:
             Number of files deleted
         """
         try:
-            pattern = f"file:{chat_id}:*"
-            keys = cast("list[bytes]", self.client.keys(pattern.encode("utf-8")))
-            if not keys:
+            index = self._get_file_index(chat_id)
+            if not index:
                 logger.info(f"No files to delete for chat {chat_id}")
                 return 0
 
-            deleted = cast("int", self.client.delete(*keys))
-            logger.info(f"Deleted {deleted} files for chat {chat_id}")
-            return deleted
+            blob_keys = {get_file_blob_key(chat_id, entry["sha256"]) for entry in index.values()}
+            self.client.delete(get_file_index_key(chat_id), *blob_keys)
+            logger.info(f"Deleted {len(index)} files for chat {chat_id}")
+            return len(index)
         except Exception as e:
             logger.error(f"Failed to delete files for chat {chat_id}: {e}", exc_info=True)
             return 0
 
     def save_all_files(self, chat_id: str, output_dir: Path) -> int:
-        """Save all files from output directory to Redis.
+        """Save new and modified files from output directory to Redis.
+
+        Files whose size and modification time match the stored entry are skipped, and
+        content the chat already stores (same SHA-256) is not uploaded again.
 
         Args:
             chat_id: Chat session ID
             output_dir: Directory containing files to save
 
         Returns:
-            Number of files saved successfully
+            Number of new or modified files saved
         """
-        saved_count = 0
         try:
-            if not output_dir.exists() or not output_dir.is_dir():
-                logger.warning(f"Output directory does not exist: {output_dir}")
-                return 0
-
-            files = [f for f in output_dir.iterdir() if f.is_file()]
-            for file_path in files:
-                if self.save_file(chat_id, file_path):
-                    saved_count += 1
+            sync = plan_file_sync(self._get_file_index(chat_id), output_dir)
+            pipe = self.client.pipeline(transaction=False)
+            queue_file_sync(pipe, chat_id, sync, self.ttl)
+            pipe.execute()
 
-            logger.info(f"Saved {saved_count}/{len(files)} files for chat {chat_id} to Redis")
-            return saved_count
+            logger.info(
+                f"Saved {len(sync.entries)} new or modified files for chat {chat_id} to Redis "
+                f"({len(sync.blobs)} uploaded)"
+            )
+            return len(sync.entries)
         except Exception as e:
             logger.error(f"Failed to save files for chat {chat_id}: {e}", exc_info=True)
-            return saved_count
+            return 0
 
     def load_all_files(self, chat_id: str, output_dir: Path) -> int:
         """Load all files from Redis to output directory.
@@ -458,22 +787,28 @@ class RedisStorage:
         loaded_count = 0
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
-            files = self.list_files(chat_id)
-
-            for file_info in files:
-                filename = file_info["filename"]
-                content = self.load_file(chat_id, filename)
-                if content:
-                    file_path = output_dir / filename
-                    file_path.write_bytes(content)
+            index = self._get_file_index(chat_id)
+            if not index:
+                logger.info(f"No files to load for chat {chat_id}")
+                return 0
+
+            blob_keys = [get_file_blob_key(chat_id, entry["sha256"]) for entry in index.values()]
+            contents = cast("list[bytes | None]", self.client.mget(blob_keys))
+            for filename, content in zip(index, contents, strict=True):
+                if content is not None:
+                    (output_dir / filename).write_bytes(content)
                     loaded_count += 1
 
-            logger.info(f"Loaded {loaded_count}/{len(files)} files for chat {chat_id} from Redis")
+            logger.info(f"Loaded {loaded_count}/{len(index)} files for chat {chat_id} from Redis")
             return loaded_count
         except Exception as e:
             logger.error(f"Failed to load files for chat {chat_id}: {e}", exc_info=True)
             return loaded_count
 
+    def _get_file_index(self, chat_id: str) -> dict[str, dict[str, Any]]:
+        """Fetch the file index entries of a chat keyed by filename."""
+        return decode_file_index(cast("dict[bytes, bytes]", self.client.hgetall(get_file_index_key(chat_id))))
+
     def close(self) -> None:
         """Close Redis connection."""
         if self._client is not None:
@@ -1,35 +1,47 @@
 """MCP Tools Integration Module.
 
 Provides functionality to connect to the rossum-mcp server and convert MCP tools
-to Anthropic tool format for use with the Claude API.
+to Anthropic tool format for use with the Claude API. Long-running processes (the API)
+can reuse warm server subprocesses through MCPConnectionPool.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any, Literal
 
 from anthropic.types import ToolParam
 from fastmcp import Client
 from fastmcp.client.transports import StdioTransport
+from fastmcp.exceptions import ToolError
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncGenerator, AsyncIterator, Callable
 
     from mcp.types import Tool as MCPTool
 
 logger = logging.getLogger(__name__)
 
+# How the rossum-mcp server reports Rossum rejecting its token (rossum_api's APIClientError text)
+_ROSSUM_UNAUTHORIZED_MARKER = " - HTTP 401 - "
+
 
 @dataclass
 class MCPConnection:
-    """Holds the MCP client and provides tool operations."""
+    """Holds the MCP client and provides tool operations.
+
+    `on_unauthorized` is called when a tool fails because Rossum rejected the token.
+    """
 
     client: Client
     _tools: list[MCPTool] | None = None
+    on_unauthorized: Callable[[], object] | None = None
 
     async def get_tools(self) -> list[MCPTool]:
         """Get the list of available MCP tools (cached)."""
@@ -49,7 +61,12 @@ class MCPConnection:
         """
         logger.info(f"Calling MCP tool {name}")
 
-        result = await self.client.call_tool(name, arguments or {})
+        try:
+            result = await self.client.call_tool(name, arguments or {})
+        except ToolError as e:
+            if self.on_unauthorized is not None and _ROSSUM_UNAUTHORIZED_MARKER in str(e):
+                self.on_unauthorized()
+            raise
         # Prefer structured_content (raw dict) over data (parsed pydantic model)
         # because FastMCP's json_schema_to_type has a bug where nested dict fields
         # like config: dict[str, Any] become empty dataclasses, losing all data.
@@ -115,6 +132,247 @@ async def connect_mcp_server(
         yield MCPConnection(client=client)
 
 
+type PoolKey = tuple[str, str, str]
+
+
+def _make_pool_key(rossum_api_token: str, rossum_api_base_url: str, mcp_mode: str) -> PoolKey:
+    """Build a pool key without keeping the raw token around as a dict key."""
+    token_digest = hashlib.sha256(rossum_api_token.encode()).hexdigest()
+    return rossum_api_base_url.rstrip("/"), token_digest, mcp_mode
+
+
+@dataclass
+class _PooledEntry:
+    """A warm MCP client together with its leasing bookkeeping."""
+
+    key: PoolKey
+    client: Client
+    connection: MCPConnection
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    in_use: bool = False
+
+
+@dataclass
+class MCPPoolStats:
+    """Counters describing pool behaviour (useful for logging and capacity planning)."""
+
+    size: int = 0
+    in_use: int = 0
+    created: int = 0
+    reused: int = 0
+    evicted: int = 0
+    failed_health_checks: int = 0
+
+
+class MCPConnectionPool:
+    """Pool of long-lived rossum-mcp stdio connections.
+
+    Connections are keyed by (API URL, token, mcp_mode), so a lease never shares a server
+    process between different credentials or modes. Each connection is leased exclusively,
+    idle connections older than ``idle_timeout`` are closed by a background reaper (and on
+    every lease), and the total number of server processes never exceeds ``max_size``.
+    After ``close()`` no new leases are granted and leased connections are closed on release.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        idle_timeout: float | None = None,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_size: Maximum number of concurrently open server processes.
+                Defaults to ROSSUM_MCP_POOL_MAX_SIZE env var or 8.
+            idle_timeout: Seconds after which an unused connection is closed.
+                Defaults to ROSSUM_MCP_POOL_IDLE_TIMEOUT env var or 300.
+            health_check_interval: Idle connections unused for longer than this are
+                pinged before being handed out again.
+        """
+        self.max_size = max_size if max_size is not None else int(os.getenv("ROSSUM_MCP_POOL_MAX_SIZE", "8"))
+        self.idle_timeout = (
+            idle_timeout if idle_timeout is not None else float(os.getenv("ROSSUM_MCP_POOL_IDLE_TIMEOUT", "300"))
+        )
+        self.health_check_interval = health_check_interval
+        self._entries: list[_PooledEntry] = []
+        self._pending = 0
+        self._condition = asyncio.Condition()
+        self._stats = MCPPoolStats()
+        self._closed = False
+        self._reaper: asyncio.Task[None] | None = None
+
+    @property
+    def stats(self) -> MCPPoolStats:
+        """Snapshot of the pool counters."""
+        return replace(self._stats, size=len(self._entries), in_use=sum(1 for entry in self._entries if entry.in_use))
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        rossum_api_token: str,
+        rossum_api_base_url: str,
+        mcp_mode: Literal["read-only", "read-write"] = "read-only",
+    ) -> AsyncGenerator[MCPConnection]:
+        """Lease a warm MCPConnection for the given credentials, creating one if needed.
+
+        The connection is returned to the pool on normal exit. If the body raises,
+        the connection is discarded since its session state is unknown.
+        """
+        entry = await self._acquire(_make_pool_key(rossum_api_token, rossum_api_base_url, mcp_mode))
+        if entry is None:
+            entry = await self._create_entry(rossum_api_token, rossum_api_base_url, mcp_mode)
+        healthy = False
+        try:
+            yield entry.connection
+            healthy = True
+        finally:
+            await self._release(entry, healthy=healthy)
+
+    async def evict_idle(self) -> int:
+        """Close connections idle for longer than idle_timeout. Returns the number evicted."""
+        now = time.monotonic()
+        async with self._condition:
+            expired = [e for e in self._entries if not e.in_use and now - e.last_used > self.idle_timeout]
+            for entry in expired:
+                self._entries.remove(entry)
+            self._stats.evicted += len(expired)
+            if expired:
+                self._condition.notify_all()
+        for entry in expired:
+            await self._close_client(entry.client)
+        return len(expired)
+
+    async def close(self) -> None:
+        """Close the pool (called on application shutdown).
+
+        Idle connections are closed immediately; connections that are still leased are closed
+        when they are released. Further leases raise RuntimeError.
+        """
+        async with self._condition:
+            self._closed = True
+            idle = [e for e in self._entries if not e.in_use]
+            for entry in idle:
+                self._entries.remove(entry)
+            self._condition.notify_all()
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        for entry in idle:
+            await self._close_client(entry.client)
+
+    def _ensure_reaper(self) -> None:
+        """Start the background task that evicts idle connections when there is no traffic."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        interval = max(self.idle_timeout / 2, 1.0)
+        while not self._closed and self._entries:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Failed to evict idle MCP connections: {e}")
+
+    async def _acquire(self, key: PoolKey) -> _PooledEntry | None:
+        """Return a leased idle entry for key, or None after reserving a slot for a new one."""
+        await self.evict_idle()
+        while True:
+            to_close: _PooledEntry | None = None
+            async with self._condition:
+                if self._closed:
+                    raise RuntimeError("MCP connection pool is closed")
+                entry = next((e for e in reversed(self._entries) if e.key == key and not e.in_use), None)
+                if entry is not None:
+                    entry.in_use = True
+                elif len(self._entries) + self._pending < self.max_size:
+                    self._pending += 1
+                    return None
+                else:
+                    idle = [e for e in self._entries if not e.in_use]
+                    if not idle:
+                        await self._condition.wait()
+                        continue
+                    to_close = min(idle, key=lambda e: e.last_used)
+                    self._entries.remove(to_close)
+                    self._stats.evicted += 1
+                    self._pending += 1
+            if entry is None:
+                if to_close is not None:
+                    await self._close_client(to_close.client)
+                return None
+            if await self._is_healthy(entry):
+                self._stats.reused += 1
+                return entry
+            self._stats.failed_health_checks += 1
+            await self._discard(entry)
+
+    async def _create_entry(
+        self, rossum_api_token: str, rossum_api_base_url: str, mcp_mode: Literal["read-only", "read-write"]
+    ) -> _PooledEntry:
+        """Spawn a new server process for a slot reserved by _acquire."""
+        key = _make_pool_key(rossum_api_token, rossum_api_base_url, mcp_mode)
+        try:
+            client = Client(
+                create_mcp_transport(
+                    rossum_api_token=rossum_api_token, rossum_api_base_url=rossum_api_base_url, mcp_mode=mcp_mode
+                )
+            )
+            await client.__aenter__()
+        except BaseException:
+            async with self._condition:
+                self._pending -= 1
+                self._condition.notify_all()
+            raise
+        entry = _PooledEntry(key=key, client=client, connection=MCPConnection(client=client), in_use=True)
+        async with self._condition:
+            self._pending -= 1
+            self._entries.append(entry)
+        self._stats.created += 1
+        self._ensure_reaper()
+        logger.info(f"Started pooled MCP connection ({len(self._entries)}/{self.max_size}, mode={mcp_mode})")
+        return entry
+
+    async def _release(self, entry: _PooledEntry, healthy: bool) -> None:
+        """Return an entry to the pool, or close it if it is unhealthy or the pool is closed."""
+        if not healthy or self._closed:
+            await self._discard(entry)
+            return
+        async with self._condition:
+            entry.in_use = False
+            entry.last_used = time.monotonic()
+            self._condition.notify_all()
+
+    async def _discard(self, entry: _PooledEntry) -> None:
+        """Remove an entry from the pool and close its client."""
+        async with self._condition:
+            if entry in self._entries:
+                self._entries.remove(entry)
+            self._condition.notify_all()
+        await self._close_client(entry.client)
+
+    async def _is_healthy(self, entry: _PooledEntry) -> bool:
+        """Check whether an idle connection can still serve requests."""
+        if not entry.client.is_connected():
+            return False
+        if time.monotonic() - entry.last_used < self.health_check_interval:
+            return True
+        try:
+            return await asyncio.wait_for(entry.client.ping(), timeout=5.0)
+        except Exception as e:
+            logger.warning(f"Pooled MCP connection failed health check: {e}")
+            return False
+
+    @staticmethod
+    async def _close_client(client: Client) -> None:
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"Error closing pooled MCP connection: {e}")
+
+
 def mcp_tools_to_anthropic_format(mcp_tools: list[MCPTool]) -> list[ToolParam]:
     """Convert MCP tools to Anthropic tool format."""
     return [
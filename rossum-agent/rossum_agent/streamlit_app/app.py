@@ -31,7 +31,7 @@ from rossum_agent.streamlit_app.render_modules import (
     render_markdown_with_mermaid,
 )
 from rossum_agent.streamlit_app.response_formatting import ChatResponse, parse_and_format_final_answer
-from rossum_agent.tools import set_mcp_connection, set_output_dir
+from rossum_agent.tools import AgentRunContext, set_mcp_connection, set_output_dir, set_run_context
 from rossum_agent.url_context import RossumUrlContext, extract_url_context, format_context_for_prompt
 from rossum_agent.user_detection import get_user_from_jwt, normalize_user_id
 from rossum_agent.utils import (
@@ -80,6 +80,7 @@ async def run_agent_turn(
     """Run a single agent turn with proper MCP connection lifecycle.
 
     Creates MCP connection, runs the agent, and cleans up within a single event loop.
+    The turn gets its own AgentRunContext so dynamically loaded tools are not shared between sessions.
 
     Args:
         rossum_api_token: Rossum API token.
@@ -90,6 +91,7 @@ async def run_agent_turn(
         on_step: Callback function called for each step as it completes.
         rossum_url: Optional Rossum app URL for context extraction.
     """
+    set_run_context(AgentRunContext())
     system_prompt = get_system_prompt()
 
     url_context = extract_url_context(rossum_url)
@@ -129,6 +131,9 @@ def _initialize_user_and_storage() -> None:
 
     if "redis_storage" not in st.session_state:
         st.session_state.redis_storage = RedisStorage()
+        if st.session_state.redis_storage.is_connected():
+            st.session_state.redis_storage.ensure_chat_index()
+            st.session_state.redis_storage.ensure_file_index()
 
 
 def _initialize_chat_id() -> None:
@@ -606,6 +611,8 @@ def _save_response_to_redis(chat_response: ChatResponse) -> None:
         commit_sha=get_commit_sha(),
         total_input_tokens=chat_response.total_input_tokens,
         total_output_tokens=chat_response.total_output_tokens,
+        total_cache_creation_input_tokens=chat_response.total_cache_creation_input_tokens,
+        total_cache_read_input_tokens=chat_response.total_cache_read_input_tokens,
         total_tool_calls=chat_response.total_tool_calls,
         total_steps=chat_response.total_steps,
     )
@@ -153,6 +153,8 @@ class ChatResponse:
         self._current_step_num: int = 0
         self.total_input_tokens: int = 0
         self.total_output_tokens: int = 0
+        self.total_cache_creation_input_tokens: int = 0
+        self.total_cache_read_input_tokens: int = 0
         self.total_tool_calls: int = 0
         self.total_steps: int = 0
 
@@ -173,6 +175,8 @@ class ChatResponse:
             self.result = step
             self.total_input_tokens += step.input_tokens
             self.total_output_tokens += step.output_tokens
+            self.total_cache_creation_input_tokens += step.cache_creation_input_tokens
+            self.total_cache_read_input_tokens += step.cache_read_input_tokens
             self.total_tool_calls += len(step.tool_calls)
             self.total_steps += 1
 
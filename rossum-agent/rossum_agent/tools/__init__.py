@@ -8,6 +8,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from rossum_agent.tools.core import (
+    AgentRunContext,
+    DynamicToolsState,
     SubAgentProgress,
     SubAgentProgressCallback,
     SubAgentText,
@@ -19,6 +21,7 @@ from rossum_agent.tools.core import (
     get_mcp_mode,
     get_output_dir,
     get_rossum_credentials,
+    get_run_context,
     is_read_only_mode,
     report_progress,
     report_text,
@@ -28,6 +31,7 @@ from rossum_agent.tools.core import (
     set_output_dir,
     set_progress_callback,
     set_rossum_credentials,
+    set_run_context,
     set_text_callback,
     set_token_callback,
 )
@@ -47,7 +51,6 @@ from rossum_agent.tools.deploy import (
 from rossum_agent.tools.dynamic_tools import (
     DISCOVERY_TOOL_NAME,
     CatalogData,
-    DynamicToolsState,
     get_dynamic_tools,
     get_load_tool_category_definition,
     get_load_tool_definition,
@@ -153,6 +156,7 @@ __all__ = [
     "DISCOVERY_TOOL_NAME",
     "INTERNAL_TOOLS",
     "OPUS_MODEL_ID",
+    "AgentRunContext",
     "CatalogData",
     "DynamicToolsState",
     "SpawnedConnection",
@@ -192,6 +196,7 @@ __all__ = [
     "get_mcp_mode",
     "get_output_dir",
     "get_rossum_credentials",
+    "get_run_context",
     "get_write_tools",
     "is_read_only_mode",
     "load_skill",
@@ -209,6 +214,7 @@ __all__ = [
     "set_output_dir",
     "set_progress_callback",
     "set_rossum_credentials",
+    "set_run_context",
     "set_text_callback",
     "set_token_callback",
     "spawn_mcp_connection",
@@ -16,6 +16,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import asyncio
 
+    from anthropic.types import ToolParam
+
+    from rossum_agent.agent.memory import AgentMemory
     from rossum_agent.rossum_mcp_integration import MCPConnection
 
 
@@ -50,6 +53,41 @@ class SubAgentText:
     is_final: bool = False
 
 
+@dataclass
+class DynamicToolsState:
+    """Mutable state container for dynamically loaded tools.
+
+    Owned by the active AgentRunContext and passed to functions that need to modify
+    tool state. Using a class allows modifications in thread pool executors to
+    be visible in the main context (unlike context variables which are copied).
+    """
+
+    loaded_categories: set[str] = field(default_factory=set)
+    tools: list[ToolParam] = field(default_factory=list)
+
+    def reset(self) -> None:
+        """Reset state for a new conversation."""
+        self.loaded_categories.clear()
+        self.tools.clear()
+
+
+@dataclass
+class AgentRunContext:
+    """State owned by a single agent run.
+
+    The context is bound to a context variable for the duration of the run, so concurrent
+    runs served by one process (e.g. several SSE streams on one API worker) each see their
+    own output directory, sub-agent events, memory and dynamically loaded tools. Thread pool
+    executors started with `copy_context()` share the same instance, so mutations made by
+    tools are visible to the run that owns it.
+    """
+
+    output_dir: Path | None = None
+    dynamic_tools: DynamicToolsState = field(default_factory=DynamicToolsState)
+    sub_agent_events: asyncio.Queue[SubAgentProgress | SubAgentText] | None = None
+    memory: AgentMemory | None = None
+
+
 SubAgentProgressCallback = Callable[[SubAgentProgress], None]
 SubAgentTextCallback = Callable[[SubAgentText], None]
 SubAgentTokenCallback = Callable[[SubAgentTokenUsage], None]
@@ -62,6 +100,7 @@ _mcp_connection: ContextVar[MCPConnection | None] = ContextVar("mcp_connection",
 _mcp_event_loop: ContextVar[asyncio.AbstractEventLoop | None] = ContextVar("mcp_event_loop", default=None)
 _mcp_mode: ContextVar[str] = ContextVar("mcp_mode", default="read-only")
 _output_dir: ContextVar[Path | None] = ContextVar("output_dir", default=None)
+_run_context: ContextVar[AgentRunContext | None] = ContextVar("run_context", default=None)
 _rossum_credentials: ContextVar[tuple[str, str] | None] = ContextVar("rossum_credentials", default=None)
 
 
@@ -98,13 +137,28 @@ def report_token_usage(usage: SubAgentTokenUsage) -> None:
         callback(usage)
 
 
+def set_run_context(run_context: AgentRunContext | None) -> None:
+    """Bind the run context for the current context (pass None to clear)."""
+    _run_context.set(run_context)
+
+
+def get_run_context() -> AgentRunContext | None:
+    """Get the run context bound to the current context, if any."""
+    return _run_context.get()
+
+
 def set_output_dir(output_dir: Path | None) -> None:
     """Set the output directory for internal tools."""
     _output_dir.set(output_dir)
 
 
 def get_output_dir() -> Path:
-    """Get the output directory for internal tools."""
+    """Get the output directory for internal tools.
+
+    The active run context takes precedence over the directory set via `set_output_dir`.
+    """
+    if (run_context := _run_context.get()) is not None and run_context.output_dir is not None:
+        return run_context.output_dir
     if (output_dir := _output_dir.get()) is not None:
         return output_dir
     fallback = Path("./outputs")
@@ -15,11 +15,12 @@ from anthropic import beta_tool
 from rossum_deploy.models import IdMapping
 from rossum_deploy.workspace import Workspace
 
-from rossum_agent.tools.core import get_output_dir, require_rossum_credentials
+from rossum_agent.tools.core import SubAgentText, get_output_dir, report_text, require_rossum_credentials
 
 if TYPE_CHECKING:
     from anthropic._tools import BetaTool  # ty: ignore[unresolved-import] - private API
     from anthropic.types import ToolParam
+    from rossum_deploy.models import DeployObjectResult
     from rossum_deploy.workspace import Workspace as WorkspaceType
 
 logger = logging.getLogger(__name__)
@@ -341,32 +342,47 @@ def deploy_to_org(
     target_api_base: str | None = None,
     target_token: str | None = None,
     dry_run: bool = False,
+    resume: bool = False,
     workspace_path: str | None = None,
 ) -> str:
     """Deploy local configuration changes to a target organization.
 
     Uses saved ID mappings from copy_org to update the corresponding objects
     in the target organization. This is the final step in the deployment workflow.
+    Progress is reported object by object while the deploy runs.
 
     Args:
         target_org_id: Target organization ID to deploy to.
         target_api_base: Target API base URL if different from source.
         target_token: Target API token if different from source.
         dry_run: If True, only show what would be deployed without making changes.
+        resume: If True, skip objects the previous deploy already updated and retry only
+            the failed or not yet deployed ones.
         workspace_path: Optional path to the workspace directory.
             Defaults to './rossum-config' in the session output directory.
 
     Returns:
         JSON with deploy summary including counts of created, updated, skipped, and failed objects.
     """
-    logger.info(f"deploy_to_org called with {target_org_id=}, {target_api_base=}, {dry_run=}, {workspace_path=}")
+    logger.info(
+        f"deploy_to_org called with {target_org_id=}, {target_api_base=}, {dry_run=}, {resume=}, {workspace_path=}"
+    )
 
     try:
         ws = create_workspace(workspace_path)
 
-        result = ws.deploy(
-            target_org_id=target_org_id, target_api_base=target_api_base, target_token=target_token, dry_run=dry_run
-        )
+        outcomes = []
+        for outcome in ws.iter_deploy(
+            target_org_id=target_org_id,
+            target_api_base=target_api_base,
+            target_token=target_token,
+            dry_run=dry_run,
+            resume=resume,
+        ):
+            outcomes.append(outcome)
+            report_text(SubAgentText(tool_name="deploy_to_org", text=_format_deploy_outcome(outcome, len(outcomes))))
+
+        result = Workspace.collect_deploy_result(outcomes)
 
         return json.dumps(
             {
@@ -385,6 +401,13 @@ def deploy_to_org(
         return json.dumps({"status": "error", "error": str(e)})
 
 
+def _format_deploy_outcome(outcome: DeployObjectResult, done: int) -> str:
+    line = f"[{done}] {outcome.status.value}: {outcome.object_type.value} {outcome.name} ({outcome.source_id})"
+    if outcome.detail:
+        line += f" - {outcome.detail}"
+    return line + "\n"
+
+
 DEPLOY_TOOLS: list[BetaTool[..., str]] = [
     deploy_pull,
     deploy_diff,
@@ -14,7 +14,13 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from rossum_agent.rossum_mcp_integration import mcp_tools_to_anthropic_format
-from rossum_agent.tools.core import get_mcp_connection, get_mcp_event_loop, is_read_only_mode
+from rossum_agent.tools.core import (
+    DynamicToolsState,
+    get_mcp_connection,
+    get_mcp_event_loop,
+    get_run_context,
+    is_read_only_mode,
+)
 
 if TYPE_CHECKING:
     from anthropic.types import ToolParam
@@ -39,25 +45,7 @@ _catalog_cache: CatalogData | None = None
 DISCOVERY_TOOL_NAME = "list_tool_categories"
 
 
-@dataclass
-class DynamicToolsState:
-    """Mutable state container for dynamically loaded tools.
-
-    Stored on RossumAgent instance and passed to functions that need to modify
-    tool state. Using a class allows modifications in thread pool executors to
-    be visible in the main context (unlike context variables which are copied).
-    """
-
-    loaded_categories: set[str] = field(default_factory=set)
-    tools: list[ToolParam] = field(default_factory=list)
-
-    def reset(self) -> None:
-        """Reset state for a new conversation."""
-        self.loaded_categories.clear()
-        self.tools.clear()
-
-
-# Global state for backwards compatibility (used when agent instance not available)
+# Global state used when no agent run context is active (e.g. direct tool calls in tests)
 _global_state: DynamicToolsState | None = None
 
 
@@ -69,19 +57,26 @@ def get_global_state() -> DynamicToolsState:
     return _global_state
 
 
+def get_dynamic_tools_state() -> DynamicToolsState:
+    """Get the dynamic tool state of the active run context, falling back to the global state."""
+    if (run_context := get_run_context()) is not None:
+        return run_context.dynamic_tools
+    return get_global_state()
+
+
 def reset_dynamic_tools() -> None:
-    """Reset dynamic tool state for a new conversation (global state)."""
-    get_global_state().reset()
+    """Reset dynamic tool state for a new conversation."""
+    get_dynamic_tools_state().reset()
 
 
 def get_loaded_categories() -> set[str]:
-    """Get the set of currently loaded categories (global state)."""
-    return get_global_state().loaded_categories
+    """Get the set of currently loaded categories."""
+    return get_dynamic_tools_state().loaded_categories
 
 
 def get_dynamic_tools() -> list[ToolParam]:
-    """Get the list of dynamically loaded tools (global state)."""
-    return get_global_state().tools
+    """Get the list of dynamically loaded tools."""
+    return get_dynamic_tools_state().tools
 
 
 def _fetch_catalog_from_mcp() -> CatalogData:
@@ -194,7 +189,7 @@ def _load_categories_impl(
     In read-only mode, write tools (read_only=False) are excluded.
     """
     if state is None:
-        state = get_global_state()
+        state = get_dynamic_tools_state()
 
     catalog = get_category_tool_names()
     if not catalog:
@@ -306,7 +301,7 @@ def get_load_tool_definition() -> ToolParam:
 def load_tool(tool_names: list[str], state: DynamicToolsState | None = None) -> str:
     """Load specific MCP tools by name. In read-only mode, write tools are excluded."""
     if state is None:
-        state = get_global_state()
+        state = get_dynamic_tools_state()
 
     mcp_connection, loop = get_mcp_connection(), get_mcp_event_loop()
     if mcp_connection is None or loop is None:
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from typing import Any
 
 from anthropic import beta_tool
+from rossum_mcp.tools.schemas import SchemaIndex
 
 from rossum_agent.tools.subagents.base import (
     SubAgent,
@@ -157,68 +158,62 @@ _OPUS_TOOLS: list[dict[str, Any]] = [
 
 def _collect_field_ids(content: list[dict[str, Any]]) -> set[str]:
     """Collect all field IDs from schema content recursively."""
-    ids: set[str] = set()
-    for node in content:
-        if node_id := node.get("id"):
-            ids.add(node_id)
-        if children := node.get("children"):
-            if isinstance(children, list):
-                ids.update(_collect_field_ids(children))
-            elif isinstance(children, dict):
-                if child_id := children.get("id"):
-                    ids.add(child_id)
-                nested = children.get("children")
-                if nested and isinstance(nested, list):
-                    ids.update(_collect_field_ids(nested))
-    return ids
+    return SchemaIndex(content).ids()
 
 
-def _filter_content(
-    content: list[dict[str, Any]],
+def _filter_nodes(
+    nodes: list[dict[str, Any]],
     fields_to_keep: set[str],
+    index: SchemaIndex,
 ) -> tuple[list[dict[str, Any]], list[str]]:
-    """Filter schema content to keep only specified fields. Sections always preserved."""
-    filtered: list[dict[str, Any]] = []
+    """Filter nodes without copying them. Returns (kept_nodes, removed_ids)."""
+    kept: list[dict[str, Any]] = []
     removed: list[str] = []
 
-    for node in content:
+    for node in nodes:
         node_id = node.get("id", "")
         category = node.get("category", "")
 
         if category == "section":
-            new_section = copy.deepcopy(node)
-            if "children" in new_section and isinstance(new_section["children"], list):
-                new_children, section_removed = _filter_content(new_section["children"], fields_to_keep)
-                new_section["children"] = new_children
+            if isinstance(node.get("children"), list):
+                node["children"], section_removed = _filter_nodes(node["children"], fields_to_keep, index)
                 removed.extend(section_removed)
-            filtered.append(new_section)
+            kept.append(node)
 
         elif category == "multivalue":
-            new_mv = copy.deepcopy(node)
+            descendant_ids = index.subtree_ids(node_id) - {node_id}
             mv_children_removed: list[str] = []
 
-            if "children" in new_mv and isinstance(new_mv["children"], dict):
-                tuple_node = new_mv["children"]
-                if "children" in tuple_node and isinstance(tuple_node["children"], list):
-                    tuple_children, mv_children_removed = _filter_content(tuple_node["children"], fields_to_keep)
-                    tuple_node["children"] = tuple_children
+            tuple_node = node.get("children")
+            if isinstance(tuple_node, dict) and isinstance(tuple_node.get("children"), list):
+                tuple_node["children"], mv_children_removed = _filter_nodes(
+                    tuple_node["children"], fields_to_keep, index
+                )
 
-            has_remaining_children = bool(new_mv.get("children", {}).get("children", []))
+            has_remaining_children = isinstance(tuple_node, dict) and bool(tuple_node.get("children", []))
 
             if node_id in fields_to_keep or has_remaining_children:
-                filtered.append(new_mv)
+                kept.append(node)
                 removed.extend(mv_children_removed)
             else:
                 removed.append(node_id)
-                removed.extend(_collect_field_ids([node]) - {node_id})
+                removed.extend(descendant_ids)
 
-        else:
-            if node_id in fields_to_keep:
-                filtered.append(copy.deepcopy(node))
-            elif node_id:
-                removed.append(node_id)
+        elif node_id in fields_to_keep:
+            kept.append(node)
+        elif node_id:
+            removed.append(node_id)
 
-    return filtered, removed
+    return kept, removed
+
+
+def _filter_content(
+    content: list[dict[str, Any]],
+    fields_to_keep: set[str],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Filter schema content to keep only specified fields. Sections always preserved."""
+    filtered = copy.deepcopy(content)
+    return _filter_nodes(filtered, fields_to_keep, SchemaIndex(filtered))
 
 
 def _build_field_node(spec: dict[str, Any]) -> dict[str, Any]:
@@ -258,31 +253,37 @@ def _add_fields_to_content(
 ) -> tuple[list[dict[str, Any]], list[str]]:
     """Add new fields to schema content. Returns (modified_content, added_ids)."""
     modified = copy.deepcopy(content)
+    index = SchemaIndex(modified)
     added: list[str] = []
 
     for spec in fields_to_add:
         parent_section = spec.get("parent_section")
         table_id = spec.get("table_id")
-        field_node = _build_field_node(spec)
+        if not isinstance(parent_section, str):
+            continue
 
-        for section in modified:
-            if section.get("category") != "section" or section.get("id") != parent_section:
-                continue
+        section = index.get(parent_section)
+        if section is None or section.get("category") != "section" or index.parent(parent_section) is not None:
+            continue
 
-            if table_id:
-                for child in section.get("children", []):
-                    if child.get("category") == "multivalue" and child.get("id") == table_id:
-                        tuple_node = child.get("children", {})
-                        if isinstance(tuple_node, dict) and "children" in tuple_node:
-                            tuple_node["children"].append(field_node)
-                            added.append(spec["id"])
-                            break
+        field_node = _build_field_node(spec)
+        if isinstance(table_id, str) and table_id:
+            table = index.get(table_id)
+            if table is None or table.get("category") != "multivalue" or index.parent(table_id) is not section:
+                continue
+            tuple_node = table.get("children")
+            if not isinstance(tuple_node, dict) or "children" not in tuple_node:
+                continue
+            tuple_id = tuple_node.get("id")
+            if isinstance(tuple_id, str) and tuple_id:
+                index.add(tuple_id, field_node)
             else:
-                if "children" not in section:
-                    section["children"] = []
-                section["children"].append(field_node)
-                added.append(spec["id"])
-            break
+                # A tuple without an ID is not in the index, so append to it directly and re-index
+                tuple_node["children"].append(field_node)
+                index = SchemaIndex(modified)
+        else:
+            index.add(parent_section, field_node)
+        added.append(spec["id"])
 
     return modified, added
 
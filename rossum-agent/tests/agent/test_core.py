@@ -30,8 +30,10 @@ from rossum_agent.agent import (
     ToolResult,
     truncate_content,
 )
-from rossum_agent.agent.core import _parse_json_encoded_strings, _StreamState
+from rossum_agent.agent.core import INITIAL_TEXT_BUFFER_DELAY, _parse_json_encoded_strings, _StreamState
 from rossum_agent.agent.models import StepType
+from rossum_agent.agent.pacing import AdaptivePacer
+from rossum_agent.tools import SubAgentProgress, SubAgentTokenUsage, report_progress, report_token_usage
 
 
 class TestParseJsonEncodedStrings:
@@ -698,7 +700,13 @@ class TestStreamModelResponse:
         mock_stream.get_final_message.return_value = final_message
         return mock_stream
 
-    def _create_final_message(self, input_tokens: int = 100, output_tokens: int = 50) -> Message:
+    def _create_final_message(
+        self,
+        input_tokens: int = 100,
+        output_tokens: int = 50,
+        cache_creation_input_tokens: int | None = None,
+        cache_read_input_tokens: int | None = None,
+    ) -> Message:
         """Create a mock final message with usage stats."""
         return Message(
             id="msg_test",
@@ -708,9 +716,35 @@ class TestStreamModelResponse:
             model="test-model",
             stop_reason="end_turn",
             stop_sequence=None,
-            usage=Usage(input_tokens=input_tokens, output_tokens=output_tokens),
+            usage=Usage(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cache_creation_input_tokens=cache_creation_input_tokens,
+                cache_read_input_tokens=cache_read_input_tokens,
+            ),
         )
 
+    @pytest.mark.asyncio
+    async def test_request_uses_prompt_cache_breakpoints(self):
+        """Test that system prompt and latest user message carry cache_control."""
+        agent = self._create_agent()
+        agent.memory.add_task("Hello")
+
+        final_message = self._create_final_message(cache_creation_input_tokens=1500, cache_read_input_tokens=0)
+        mock_stream = self._create_mock_stream([], final_message)
+
+        with patch.object(agent.client.messages, "stream", return_value=mock_stream) as mock_create:
+            steps = [step async for step in agent._stream_model_response(1)]
+
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["system"] == [{"type": "text", "text": "Test prompt", "cache_control": {"type": "ephemeral"}}]
+        assert kwargs["messages"][-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in repr(agent.memory.write_to_messages())
+        assert steps[-1].cache_creation_input_tokens == 1500
+        assert steps[-1].cache_read_input_tokens == 0
+        assert agent._cache_creation_input_tokens == 1500
+        assert agent.get_token_usage_breakdown().cache_creation_input_tokens == 1500
+
     @pytest.mark.asyncio
     async def test_pure_text_completion_no_tools(self):
         """Test streaming with pure text completion (no tool calls)."""
@@ -738,6 +772,49 @@ class TestStreamModelResponse:
         assert final_step.input_tokens == 100
         assert final_step.output_tokens == 50
 
+    @pytest.mark.asyncio
+    async def test_stream_error_is_raised_instead_of_hanging(self):
+        """Test that an error in the stream producer terminates the consumer and propagates."""
+        agent = self._create_agent()
+        agent.memory.add_task("Hello")
+
+        with (
+            patch.object(agent.client.messages, "stream", side_effect=RuntimeError("connection reset")),
+            pytest.raises(RuntimeError, match="connection reset"),
+        ):
+            async with asyncio.timeout(5):
+                _ = [step async for step in agent._stream_model_response(1)]
+
+    @pytest.mark.asyncio
+    async def test_buffered_text_flushed_at_deadline_during_model_pause(self):
+        """Test that buffered initial text is flushed when the stream pauses past the buffer delay."""
+        agent = self._create_agent()
+        agent.memory.add_task("Hello")
+
+        text_events = [
+            RawContentBlockDeltaEvent(
+                type="content_block_delta", index=0, delta=TextDelta(type="text_delta", text=text)
+            )
+            for text in ("Hello", " world")
+        ]
+
+        def paused_events():
+            yield text_events[0]
+            time.sleep(0.3)
+            yield text_events[1]
+
+        mock_stream = self._create_mock_stream([], self._create_final_message())
+        mock_stream.__iter__ = MagicMock(return_value=paused_events())
+
+        with (
+            patch("rossum_agent.agent.core.INITIAL_TEXT_BUFFER_DELAY", 0.05),
+            patch.object(agent.client.messages, "stream", return_value=mock_stream),
+        ):
+            steps = [step async for step in agent._stream_model_response(1)]
+
+        assert [step.text_delta for step in steps if step.is_streaming] == ["Hello", " world"]
+        assert steps[-1].final_answer == "Hello world"
+
     @pytest.mark.asyncio
     async def test_single_tool_use_block(self):
         """Test streaming with a single tool_use block."""
@@ -1273,6 +1350,25 @@ class TestExecuteTool:
         assert len(result.content) < 30000
         assert "truncated" in result.content.lower()
 
+    @pytest.mark.asyncio
+    async def test_internal_tool_streams_sub_agent_progress_and_tokens(self):
+        """Test that sub-agent callbacks from the worker thread reach the event loop in order."""
+        agent = self._create_agent()
+        tool_call = ToolCall(id="tc_1", name="debug_hook", arguments={})
+
+        def run_tool(name, arguments):
+            for iteration in (1, 2):
+                report_progress(SubAgentProgress(tool_name=name, iteration=iteration, max_iterations=2))
+                report_token_usage(SubAgentTokenUsage(tool_name=name, input_tokens=10, output_tokens=5))
+            return "Debugged"
+
+        with patch("rossum_agent.agent.core.execute_internal_tool", side_effect=run_tool):
+            items = [item async for item in agent._execute_tool_with_progress(tool_call, 1, [tool_call], (1, 1))]
+
+        assert [item.sub_agent_progress.iteration for item in items[:-1]] == [1, 2]
+        assert items[-1] == ToolResult(tool_call_id="tc_1", name="debug_hook", content="Debugged")
+        assert agent._sub_agent_input_tokens == 20
+
     @pytest.mark.asyncio
     async def test_executes_deploy_tool(self):
         """Test that deploy tools are executed locally."""
@@ -1680,58 +1776,99 @@ class TestCheckRequestScope:
         assert result.output_tokens == 20  # 5 + 15
 
 
-class TestAgentRunRequestDelay:
-    """Test RossumAgent.run() request delay behavior."""
+class TestAgentRunPacing:
+    """Test RossumAgent.run() adaptive pacing behavior."""
 
-    def _create_agent(self) -> RossumAgent:
-        """Helper to create an agent with request delay."""
+    def _create_agent(self, pacer: AdaptivePacer | None = None) -> RossumAgent:
+        """Helper to create an agent with an optional dedicated pacer."""
         mock_client = MagicMock()
         mock_mcp_connection = AsyncMock()
         mock_mcp_connection.get_tools.return_value = []
-        config = AgentConfig(max_steps=3, request_delay=1.0)
+        config = AgentConfig(max_steps=3)
         return RossumAgent(
             client=mock_client,
             mcp_connection=mock_mcp_connection,
             system_prompt="Test prompt",
             config=config,
+            pacer=pacer,
         )
 
+    @staticmethod
+    async def _three_step_response(step_num):
+        if step_num < 3:
+            yield AgentStep(
+                step_number=step_num,
+                tool_calls=[ToolCall(id="tc1", name="tool", arguments={})],
+                tool_results=[ToolResult(tool_call_id="tc1", name="tool", content="result")],
+                is_final=False,
+                is_streaming=False,
+            )
+        else:
+            yield AgentStep(step_number=step_num, final_answer="Done", is_final=True, is_streaming=False)
+
     @pytest.mark.asyncio
-    async def test_request_delay_between_steps(self):
-        """Test that request delay is applied between steps (not on first step)."""
+    async def test_no_delay_while_bucket_has_tokens(self):
+        """Test that steps are not delayed when the pacer is far from saturation."""
         agent = self._create_agent()
+        sleep_calls = []
 
-        call_count = [0]
+        async def capture_sleep(duration):
+            sleep_calls.append(duration)
+
+        with (
+            patch.object(agent, "_stream_model_response", side_effect=self._three_step_response),
+            patch("rossum_agent.agent.core.asyncio.sleep", side_effect=capture_sleep),
+        ):
+            steps = [step async for step in agent.run("Test prompt")]
+
+        assert steps[-1].final_answer == "Done"
+        assert sleep_calls == []
+        assert agent.pacer.stats.acquisitions == 3
+
+    @pytest.mark.asyncio
+    async def test_delays_steps_when_bucket_is_exhausted(self):
+        """Test that steps are delayed once the bucket runs out of tokens."""
+        agent = self._create_agent(AdaptivePacer(max_rate=1.0, burst=1, clock=lambda: 0.0))
         sleep_calls = []
 
+        async def capture_sleep(duration):
+            sleep_calls.append(duration)
+
+        with (
+            patch.object(agent, "_stream_model_response", side_effect=self._three_step_response),
+            patch("rossum_agent.agent.core.asyncio.sleep", side_effect=capture_sleep),
+        ):
+            [step async for step in agent.run("Test prompt")]
+
+        assert sleep_calls == [1.0, 2.0]
+        assert agent.pacer.stats.delayed_acquisitions == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_feeds_pacer_and_honors_retry_after(self):
+        """Test that throttling lowers the pacer rate and a longer retry-after hint wins over backoff."""
+        agent = self._create_agent()
+        call_count = [0]
+
         async def mock_stream_response(step_num):
             call_count[0] += 1
-            if call_count[0] < 3:
-                yield AgentStep(
-                    step_number=step_num,
-                    tool_calls=[ToolCall(id="tc1", name="tool", arguments={})],
-                    tool_results=[ToolResult(tool_call_id="tc1", name="tool", content="result")],
-                    is_final=False,
-                    is_streaming=False,
+            if call_count[0] == 1:
+                raise RateLimitError(
+                    message="Rate limit exceeded",
+                    response=MagicMock(status_code=429, headers={"retry-after": "30"}),
+                    body=None,
                 )
-            else:
-                yield AgentStep(step_number=step_num, final_answer="Done", is_final=True, is_streaming=False)
-
-        async def capture_sleep(duration):
-            sleep_calls.append(duration)
-            # Don't actually sleep in tests
+            yield AgentStep(step_number=step_num, final_answer="Done", is_final=True)
 
         with (
             patch.object(agent, "_stream_model_response", side_effect=mock_stream_response),
-            patch("rossum_agent.agent.core.asyncio.sleep", side_effect=capture_sleep),
+            patch("rossum_agent.agent.core.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
         ):
-            steps = []
-            async for step in agent.run("Test prompt"):
-                steps.append(step)
+            [step async for step in agent.run("Test prompt")]
 
-        # Should have delays for step 2 and 3 (not step 1)
-        assert len(sleep_calls) == 2
-        assert all(d == 1.0 for d in sleep_calls)
+        mock_sleep.assert_awaited_once_with(30.0)
+        stats = agent.pacer.stats
+        assert stats.rate_limit_events == 1
+        assert stats.current_rate < stats.max_rate
 
 
 class TestAgentRunOutOfScope:
@@ -2093,33 +2230,32 @@ class TestStreamState:
         assert state.first_text_token_time is None
         assert state.initial_buffer_flushed is False
 
-    def test_should_flush_initial_buffer_when_already_flushed(self):
-        """Test _should_flush_initial_buffer returns True when already flushed."""
-        state = _StreamState()
+    def test_seconds_until_buffer_flush_when_already_flushed(self):
+        """Test no flush deadline is armed once the initial buffer was flushed."""
+        state = _StreamState(text_buffer=["Hi"], first_text_token_time=time.monotonic())
         state.initial_buffer_flushed = True
 
-        assert state._should_flush_initial_buffer() is True
+        assert state.seconds_until_buffer_flush() is None
 
-    def test_should_flush_initial_buffer_when_no_first_token(self):
-        """Test _should_flush_initial_buffer returns False when no first token time."""
-        state = _StreamState()
-        state.first_text_token_time = None
+    def test_seconds_until_buffer_flush_with_empty_buffer(self):
+        """Test no flush deadline is armed when nothing is buffered."""
+        state = _StreamState(first_text_token_time=time.monotonic())
 
-        assert state._should_flush_initial_buffer() is False
+        assert state.seconds_until_buffer_flush() is None
 
-    def test_should_flush_initial_buffer_after_delay(self):
-        """Test _should_flush_initial_buffer returns True after delay elapsed."""
-        state = _StreamState()
-        state.first_text_token_time = time.monotonic() - 2.0
+    def test_seconds_until_buffer_flush_after_delay(self):
+        """Test the deadline is due immediately after the delay elapsed."""
+        state = _StreamState(text_buffer=["Hi"], first_text_token_time=time.monotonic() - 2.0)
 
-        assert state._should_flush_initial_buffer() is True
+        assert state.seconds_until_buffer_flush() == 0.0
 
-    def test_should_flush_initial_buffer_before_delay(self):
-        """Test _should_flush_initial_buffer returns False before delay elapsed."""
-        state = _StreamState()
-        state.first_text_token_time = time.monotonic()
+    def test_seconds_until_buffer_flush_before_delay(self):
+        """Test the deadline counts down from the first text token."""
+        state = _StreamState(text_buffer=["Hi"], first_text_token_time=time.monotonic() - 0.5)
 
-        assert state._should_flush_initial_buffer() is False
+        remaining = state.seconds_until_buffer_flush()
+        assert remaining is not None
+        assert 0.0 < remaining <= INITIAL_TEXT_BUFFER_DELAY - 0.5
 
     def test_get_step_type_with_pending_tools(self):
         """Test get_step_type returns INTERMEDIATE when tools pending."""
@@ -2454,9 +2590,13 @@ class TestRossumAgentTokenTracking:
         mock_agent._sub_agent_input_tokens = 400
         mock_agent._sub_agent_output_tokens = 200
         mock_agent._sub_agent_usage = {"debug_hook": (400, 200)}
+        mock_agent._cache_creation_input_tokens = 100
+        mock_agent._cache_read_input_tokens = 900
 
         mock_agent.reset()
 
+        assert mock_agent._cache_creation_input_tokens == 0
+        assert mock_agent._cache_read_input_tokens == 0
         assert mock_agent._total_input_tokens == 0
         assert mock_agent._total_output_tokens == 0
         assert mock_agent._main_agent_input_tokens == 0
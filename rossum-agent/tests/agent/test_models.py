@@ -135,16 +135,11 @@ class TestAgentConfig:
         assert config.max_steps == 50
         assert config.temperature == 1.0  # Required for extended thinking
 
-    def test_request_delay_default(self):
-        config = AgentConfig()
-        assert config.request_delay == 3.0
-
     def test_custom_values(self):
-        config = AgentConfig(max_output_tokens=4096, max_steps=10, request_delay=1.0)
+        config = AgentConfig(max_output_tokens=4096, max_steps=10)
         assert config.max_output_tokens == 4096
         assert config.max_steps == 10
         assert config.temperature == 1.0  # Must be 1.0 for extended thinking
-        assert config.request_delay == 1.0
 
 
 class TestAgentStep:
@@ -342,3 +337,22 @@ class TestTokenUsageBreakdown:
         assert "TOTAL" in output
         assert "1,000" in output
         assert "3,000" in output
+        assert "Prompt cache" not in output
+
+    def test_format_summary_lines_includes_cache_usage(self):
+        breakdown = TokenUsageBreakdown.from_raw_counts(
+            total_input=100,
+            total_output=50,
+            main_input=100,
+            main_output=50,
+            sub_input=0,
+            sub_output=0,
+            sub_by_tool={},
+            cache_creation_input=2000,
+            cache_read_input=12000,
+        )
+        output = "\n".join(breakdown.format_summary_lines())
+        assert breakdown.cache_creation_input_tokens == 2000
+        assert breakdown.cache_read_input_tokens == 12000
+        assert "Prompt cache write" in output
+        assert "12,000" in output
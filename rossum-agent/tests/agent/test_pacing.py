@@ -0,0 +1,165 @@
+"""Tests for rossum_agent.agent.pacing module."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from anthropic import RateLimitError
+from rossum_agent.agent.pacing import (
+    DEFAULT_PACING_BURST,
+    DEFAULT_PACING_MAX_RATE,
+    MIN_PACING_RATE,
+    AdaptivePacer,
+    get_pacer,
+    get_pacing_stats,
+    get_retry_after,
+    reset_pacer,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestAdaptivePacer:
+    """Test token bucket behavior and rate adaptation."""
+
+    def test_burst_passes_without_delay(self, clock):
+        """Test that requests within the burst are not delayed."""
+        pacer = AdaptivePacer(max_rate=1.0, burst=3, clock=clock)
+
+        assert [pacer.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert pacer.stats.delayed_acquisitions == 0
+
+    def test_delay_grows_once_bucket_is_empty(self, clock):
+        """Test that reservations beyond the burst are spaced by the refill rate."""
+        pacer = AdaptivePacer(max_rate=2.0, burst=1, clock=clock)
+
+        assert pacer.reserve() == 0.0
+        assert pacer.reserve() == 0.5
+        assert pacer.reserve() == 1.0
+
+        stats = pacer.stats
+        assert stats.acquisitions == 3
+        assert stats.delayed_acquisitions == 2
+        assert stats.total_delay_seconds == 1.5
+        assert stats.max_delay_seconds == 1.0
+
+    def test_bucket_refills_over_time(self, clock):
+        """Test that tokens are refilled at the current rate, capped at burst."""
+        pacer = AdaptivePacer(max_rate=1.0, burst=2, clock=clock)
+        pacer.reserve()
+        pacer.reserve()
+
+        clock.now = 100.0
+
+        assert pacer.stats.available_tokens == 2.0
+        assert pacer.reserve() == 0.0
+
+    def test_rate_limit_halves_rate_and_drains_bucket(self, clock):
+        """Test multiplicative decrease on throttling."""
+        pacer = AdaptivePacer(max_rate=1.0, burst=5, clock=clock)
+
+        pacer.record_rate_limit()
+
+        stats = pacer.stats
+        assert stats.current_rate == 0.5
+        assert stats.available_tokens == 0.0
+        assert stats.rate_limit_events == 1
+        assert pacer.reserve() == 2.0
+
+    def test_rate_never_drops_below_minimum(self, clock):
+        """Test that repeated throttling is bounded by the minimum rate."""
+        pacer = AdaptivePacer(max_rate=1.0, burst=1, clock=clock)
+
+        for _ in range(20):
+            pacer.record_rate_limit()
+
+        assert pacer.stats.current_rate == MIN_PACING_RATE
+
+    def test_success_recovers_rate_additively(self, clock):
+        """Test additive increase back towards the maximum rate."""
+        pacer = AdaptivePacer(max_rate=1.0, burst=1, clock=clock)
+        pacer.record_rate_limit()
+
+        pacer.record_success()
+        assert pacer.stats.current_rate == pytest.approx(0.6)
+
+        for _ in range(10):
+            pacer.record_success()
+        assert pacer.stats.current_rate == 1.0
+
+    def test_retry_after_pauses_bucket(self, clock):
+        """Test that a retry-after hint delays all reservations until it expires."""
+        pacer = AdaptivePacer(max_rate=1.0, burst=5, clock=clock)
+
+        pacer.record_rate_limit(retry_after=10.0)
+
+        assert pacer.reserve() == 10.0
+        clock.now = 20.0
+        assert pacer.reserve() == 0.0
+
+    def test_defaults_from_environment(self, monkeypatch):
+        """Test that max rate and burst are read from environment variables."""
+        monkeypatch.setenv("ROSSUM_AGENT_PACING_MAX_RATE", "4.5")
+        monkeypatch.setenv("ROSSUM_AGENT_PACING_BURST", "3")
+
+        stats = AdaptivePacer().stats
+
+        assert stats.max_rate == 4.5
+        assert stats.burst == 3
+
+    def test_builtin_defaults(self, monkeypatch):
+        """Test defaults when no environment variables are set."""
+        monkeypatch.delenv("ROSSUM_AGENT_PACING_MAX_RATE", raising=False)
+        monkeypatch.delenv("ROSSUM_AGENT_PACING_BURST", raising=False)
+
+        stats = AdaptivePacer().stats
+
+        assert stats.max_rate == DEFAULT_PACING_MAX_RATE
+        assert stats.burst == DEFAULT_PACING_BURST
+
+
+class TestGetRetryAfter:
+    """Test retry-after extraction from rate limit errors."""
+
+    @staticmethod
+    def _error(headers: dict) -> RateLimitError:
+        return RateLimitError(message="Rate limited", response=MagicMock(status_code=429, headers=headers), body=None)
+
+    def test_parses_seconds(self):
+        assert get_retry_after(self._error({"retry-after": "12"})) == 12.0
+
+    def test_missing_header(self):
+        assert get_retry_after(self._error({})) is None
+
+    def test_non_numeric_header(self):
+        assert get_retry_after(self._error({"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"})) is None
+
+
+class TestProcessPacer:
+    """Test the process-wide pacer accessors."""
+
+    def test_get_pacer_returns_singleton(self):
+        assert get_pacer() is get_pacer()
+
+    def test_reset_pacer_creates_new_instance(self):
+        pacer = get_pacer()
+        pacer.reserve()
+
+        reset_pacer()
+
+        assert get_pacer() is not pacer
+        assert get_pacing_stats().acquisitions == 0
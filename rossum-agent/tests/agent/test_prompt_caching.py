@@ -0,0 +1,123 @@
+"""Tests for rossum_agent.agent.prompt_caching module."""
+
+from __future__ import annotations
+
+from rossum_agent.agent.prompt_caching import (
+    add_message_cache_breakpoints,
+    add_tools_cache_breakpoint,
+    build_cached_system,
+)
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+def _tool(name: str) -> dict:
+    return {"name": name, "description": f"{name} tool", "input_schema": {"type": "object"}}
+
+
+class TestBuildCachedSystem:
+    """Test system prompt cache breakpoint."""
+
+    def test_wraps_prompt_in_cached_text_block(self):
+        """Test that the system prompt becomes a single text block with cache_control."""
+        system = build_cached_system("You are helpful.")
+
+        assert system == [{"type": "text", "text": "You are helpful.", "cache_control": EPHEMERAL}]
+
+
+class TestAddToolsCacheBreakpoint:
+    """Test tool list cache breakpoint placement."""
+
+    def test_marks_last_stable_tool(self):
+        """Test that the breakpoint is placed after the stable prefix, not on dynamic tools."""
+        tools = [_tool("a"), _tool("b"), _tool("dynamic")]
+
+        result = add_tools_cache_breakpoint(tools, stable_count=2)
+
+        assert "cache_control" not in result[0]
+        assert result[1]["cache_control"] == EPHEMERAL
+        assert "cache_control" not in result[2]
+
+    def test_does_not_mutate_input(self):
+        """Test that the original tool dicts and list are untouched."""
+        tools = [_tool("a"), _tool("b")]
+
+        result = add_tools_cache_breakpoint(tools, stable_count=2)
+
+        assert result is not tools
+        assert all("cache_control" not in tool for tool in tools)
+
+    def test_stable_count_larger_than_list_marks_last_tool(self):
+        """Test that an oversized stable count is clamped to the list length."""
+        tools = [_tool("a")]
+
+        result = add_tools_cache_breakpoint(tools, stable_count=5)
+
+        assert result[0]["cache_control"] == EPHEMERAL
+
+    def test_empty_tools_or_no_stable_tools_unchanged(self):
+        """Test that nothing is marked when there is no stable prefix."""
+        assert add_tools_cache_breakpoint([], stable_count=3) == []
+        tools = [_tool("a")]
+        assert add_tools_cache_breakpoint(tools, stable_count=0) is tools
+
+
+class TestAddMessageCacheBreakpoints:
+    """Test conversation cache breakpoint placement."""
+
+    def test_marks_last_two_user_messages(self):
+        """Test that the two most recent user messages get breakpoints."""
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": "task"}]},
+            {"role": "assistant", "content": [{"type": "tool_use", "id": "t1", "name": "x", "input": {}}]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "r1"}]},
+            {"role": "assistant", "content": [{"type": "tool_use", "id": "t2", "name": "x", "input": {}}]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t2", "content": "r2"}]},
+        ]
+
+        result = add_message_cache_breakpoints(messages)
+
+        assert "cache_control" not in result[0]["content"][0]
+        assert result[2]["content"][0]["cache_control"] == EPHEMERAL
+        assert result[4]["content"][0]["cache_control"] == EPHEMERAL
+        assert all("cache_control" not in message["content"][0] for message in messages)
+
+    def test_converts_string_content_to_cached_text_block(self):
+        """Test that plain string content is converted to a text block."""
+        result = add_message_cache_breakpoints([{"role": "user", "content": "hello"}])
+
+        assert result[0]["content"] == [{"type": "text", "text": "hello", "cache_control": EPHEMERAL}]
+
+    def test_marks_last_block_of_multi_block_message(self):
+        """Test that only the last block of a message is marked."""
+        messages = [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "tool_result", "tool_use_id": "t1", "content": "r1"},
+                    {"type": "tool_result", "tool_use_id": "t2", "content": "r2"},
+                ],
+            }
+        ]
+
+        result = add_message_cache_breakpoints(messages)
+
+        assert "cache_control" not in result[0]["content"][0]
+        assert result[0]["content"][1]["cache_control"] == EPHEMERAL
+
+    def test_skips_thinking_blocks(self):
+        """Test that thinking blocks never receive cache_control."""
+        messages = [{"role": "user", "content": [{"type": "thinking", "thinking": "...", "signature": "s"}]}]
+
+        result = add_message_cache_breakpoints(messages)
+
+        assert "cache_control" not in result[0]["content"][0]
+
+    def test_respects_max_breakpoints(self):
+        """Test that at most max_breakpoints messages are marked."""
+        messages = [{"role": "user", "content": f"m{i}"} for i in range(4)]
+
+        result = add_message_cache_breakpoints(messages, max_breakpoints=1)
+
+        assert isinstance(result[0]["content"], str)
+        assert result[3]["content"][0]["cache_control"] == EPHEMERAL
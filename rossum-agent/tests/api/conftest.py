@@ -12,9 +12,9 @@ if TYPE_CHECKING:
 
 
 @pytest.fixture
-def mock_chat_service() -> MagicMock:
-    """Create a mock ChatService."""
-    return MagicMock()
+def mock_chat_service() -> AsyncMock:
+    """Create a mock ChatService (all service methods are async)."""
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -24,9 +24,9 @@ def mock_agent_service() -> MagicMock:
 
 
 @pytest.fixture
-def mock_file_service() -> MagicMock:
-    """Create a mock FileService."""
-    return MagicMock()
+def mock_file_service() -> AsyncMock:
+    """Create a mock FileService (all service methods are async)."""
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -69,6 +69,16 @@ def mock_httpx_success() -> AsyncMock:
     return create_mock_httpx_client()
 
 
+@pytest.fixture(autouse=True)
+def reset_credentials_cache() -> Generator[None, None, None]:
+    """Start each test with an empty credentials cache and no shared auth HTTP client."""
+    from rossum_agent.api.dependencies import reset_credentials_state
+
+    reset_credentials_state()
+    yield
+    reset_credentials_state()
+
+
 @pytest.fixture(autouse=True)
 def reset_main_service_singletons() -> Generator[None, None, None]:
     """Reset service singletons in main module before and after each test.
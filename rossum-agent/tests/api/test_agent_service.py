@@ -8,15 +8,18 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from rossum_agent.agent.memory import AgentMemory, MemoryStep, TaskStep
 from rossum_agent.agent.models import AgentStep, StepType, ThinkingBlockData, ToolCall, ToolResult
+from rossum_agent.api.dependencies import invalidate_credentials
 from rossum_agent.api.models.schemas import ImageContent, StepEvent, SubAgentProgressEvent, SubAgentTextEvent
 from rossum_agent.api.services.agent_service import (
+    DELTA_CHECKPOINT_MIN_CHARS,
     AgentService,
+    DeltaEventEncoder,
     _create_tool_result_event,
     _create_tool_start_event,
     convert_step_to_event,
     convert_sub_agent_progress_to_event,
 )
-from rossum_agent.tools import SubAgentProgress, SubAgentText
+from rossum_agent.tools import AgentRunContext, SubAgentProgress, SubAgentText, set_run_context
 
 
 class TestConvertStepToEvent:
@@ -167,6 +170,87 @@ class TestConvertStepToEvent:
         assert event.is_streaming is True
 
 
+class TestDeltaEventEncoder:
+    """Tests for DeltaEventEncoder."""
+
+    def test_streaming_text_is_sent_as_deltas(self):
+        """Test that successive streaming events carry only the new text."""
+        encoder = DeltaEventEncoder()
+
+        first = encoder.encode(StepEvent(type="final_answer", step_number=1, content="Hello", is_streaming=True))
+        second = encoder.encode(
+            StepEvent(type="final_answer", step_number=1, content="Hello world", is_streaming=True)
+        )
+
+        assert first.content is None
+        assert (first.delta, first.offset, first.seq) == ("Hello", 0, 1)
+        assert second.content is None
+        assert (second.delta, second.offset, second.seq) == (" world", 5, 2)
+
+    def test_thinking_and_text_streams_are_tracked_separately(self):
+        """Test that thinking offsets do not affect response text offsets."""
+        encoder = DeltaEventEncoder()
+
+        encoder.encode(StepEvent(type="thinking", step_number=1, content="Let me think", is_streaming=True))
+        text = encoder.encode(StepEvent(type="intermediate", step_number=1, content="Sure", is_streaming=True))
+
+        assert text.offset == 0
+        assert text.delta == "Sure"
+
+    def test_intermediate_and_final_answer_share_text_stream(self):
+        """Test that a step type switch continues the same response text."""
+        encoder = DeltaEventEncoder()
+
+        encoder.encode(StepEvent(type="final_answer", step_number=1, content="Checking", is_streaming=True))
+        event = encoder.encode(
+            StepEvent(type="intermediate", step_number=1, content="Checking queues", is_streaming=True)
+        )
+
+        assert (event.delta, event.offset) == (" queues", 8)
+
+    def test_checkpoints_are_sent_at_doubling_lengths(self):
+        """Test that full-text checkpoints are emitted geometrically."""
+        encoder = DeltaEventEncoder()
+        text = ""
+        checkpoint_lengths = []
+        for _ in range(40):
+            text += "x" * 512
+            event = encoder.encode(StepEvent(type="final_answer", step_number=1, content=text, is_streaming=True))
+            if event.is_checkpoint:
+                assert event.content == text
+                checkpoint_lengths.append(len(text))
+
+        assert checkpoint_lengths == [
+            DELTA_CHECKPOINT_MIN_CHARS,
+            2 * DELTA_CHECKPOINT_MIN_CHARS,
+            4 * DELTA_CHECKPOINT_MIN_CHARS,
+        ]
+
+    def test_non_streaming_events_keep_full_content(self):
+        """Test that final and tool events are only sequenced."""
+        encoder = DeltaEventEncoder()
+
+        final = encoder.encode(StepEvent(type="final_answer", step_number=1, content="Done", is_final=True))
+        tool = encoder.encode(StepEvent(type="tool_result", step_number=1, tool_name="t", result="ok"))
+
+        assert final.content == "Done"
+        assert final.delta is None
+        assert final.seq == 1
+        assert tool.seq == 2
+        assert tool.offset is None
+
+    def test_restarted_stream_resynchronizes_with_checkpoint(self):
+        """Test that a shorter text than already sent triggers a checkpoint."""
+        encoder = DeltaEventEncoder()
+
+        encoder.encode(StepEvent(type="final_answer", step_number=1, content="Hello world", is_streaming=True))
+        event = encoder.encode(StepEvent(type="final_answer", step_number=1, content="Hi", is_streaming=True))
+
+        assert event.is_checkpoint is True
+        assert event.content == "Hi"
+        assert event.offset == 0
+
+
 class TestCreateToolStartEvent:
     """Tests for _create_tool_start_event function."""
 
@@ -513,13 +597,13 @@ class TestAgentServiceBuildUpdatedHistoryWithMemory:
     """Tests for build_updated_history using stored memory."""
 
     def test_build_history_uses_stored_memory(self):
-        """Test that build_updated_history uses _last_memory when available."""
+        """Test that build_updated_history uses the run context memory when available."""
         service = AgentService()
 
         memory = AgentMemory()
         memory.add_task("What is 2+2?")
         memory.steps.append(MemoryStep(step_number=1, text="The answer is 4."))
-        service._last_memory = memory
+        set_run_context(AgentRunContext(memory=memory))
 
         updated = service.build_updated_history(existing_history=[], user_prompt="ignored", final_response="ignored")
 
@@ -544,7 +628,7 @@ class TestAgentServiceBuildUpdatedHistoryWithMemory:
             )
         )
         memory.steps.append(MemoryStep(step_number=2, text="It's rainy in NYC."))
-        service._last_memory = memory
+        set_run_context(AgentRunContext(memory=memory))
 
         updated = service.build_updated_history(existing_history=[], user_prompt="ignored", final_response="ignored")
 
@@ -571,7 +655,7 @@ class TestAgentServiceBuildUpdatedHistoryWithMemory:
             )
         )
         memory.steps.append(MemoryStep(step_number=2, text="Final answer"))
-        service._last_memory = memory
+        set_run_context(AgentRunContext(memory=memory))
 
         updated = service.build_updated_history(existing_history=[], user_prompt="ignored", final_response="ignored")
 
@@ -581,9 +665,9 @@ class TestAgentServiceBuildUpdatedHistoryWithMemory:
         assert updated[1]["text"] == "Final answer"
 
     def test_build_history_falls_back_when_no_memory(self):
-        """Test fallback to legacy behavior when _last_memory is None."""
+        """Test fallback to legacy behavior when the run has no memory."""
         service = AgentService()
-        service._last_memory = None
+        set_run_context(AgentRunContext())
 
         existing = [{"role": "user", "content": "Previous"}]
         updated = service.build_updated_history(
@@ -613,7 +697,7 @@ class TestAgentServiceBuildUpdatedHistoryWithMemory:
                 tool_results=[ToolResult(tool_call_id="tc1", name="get_doc", content="doc content")],
             )
         )
-        service._last_memory = memory
+        set_run_context(AgentRunContext(memory=memory))
 
         updated = service.build_updated_history(existing_history=[], user_prompt="ignored", final_response="ignored")
 
@@ -640,7 +724,7 @@ class TestAgentServiceBuildUpdatedHistoryWithMemory:
                 tool_calls=[ToolCall(id="tc1", name="tool", arguments={})],
             )
         )
-        service._last_memory = memory
+        set_run_context(AgentRunContext(memory=memory))
 
         updated = service.build_updated_history(existing_history=[], user_prompt="ignored", final_response="ignored")
 
@@ -676,7 +760,7 @@ class TestAgentServiceRunAgent:
         mock_agent.run = mock_run
 
         with (
-            patch("rossum_agent.api.services.agent_service.connect_mcp_server") as mock_connect,
+            patch.object(service.mcp_pool, "lease") as mock_connect,
             patch("rossum_agent.api.services.agent_service.create_agent") as mock_create_agent,
             patch("rossum_agent.api.services.agent_service.create_session_output_dir", return_value=tmp_path),
             patch("rossum_agent.api.services.agent_service.set_session_output_dir"),
@@ -700,6 +784,8 @@ class TestAgentServiceRunAgent:
             assert isinstance(events[1], StepEvent)
             assert events[1].type == "final_answer"
             assert isinstance(events[2], StreamDoneEvent)
+            assert mock_mcp_connection.on_unauthorized.func is invalidate_credentials
+            assert mock_mcp_connection.on_unauthorized.args == ("test_token", "https://api.rossum.ai")
 
     @pytest.mark.asyncio
     async def test_run_agent_handles_error(self, tmp_path):
@@ -716,7 +802,7 @@ class TestAgentServiceRunAgent:
         mock_agent.run = mock_run
 
         with (
-            patch("rossum_agent.api.services.agent_service.connect_mcp_server") as mock_connect,
+            patch.object(service.mcp_pool, "lease") as mock_connect,
             patch("rossum_agent.api.services.agent_service.create_agent") as mock_create_agent,
             patch("rossum_agent.api.services.agent_service.create_session_output_dir", return_value=tmp_path),
             patch("rossum_agent.api.services.agent_service.set_session_output_dir"),
@@ -760,7 +846,7 @@ class TestAgentServiceRunAgent:
         ]
 
         with (
-            patch("rossum_agent.api.services.agent_service.connect_mcp_server") as mock_connect,
+            patch.object(service.mcp_pool, "lease") as mock_connect,
             patch("rossum_agent.api.services.agent_service.create_agent") as mock_create_agent,
             patch("rossum_agent.api.services.agent_service.create_session_output_dir", return_value=tmp_path),
             patch("rossum_agent.api.services.agent_service.set_session_output_dir"),
@@ -796,7 +882,7 @@ class TestAgentServiceRunAgent:
         mock_agent.run = mock_run
 
         with (
-            patch("rossum_agent.api.services.agent_service.connect_mcp_server") as mock_connect,
+            patch.object(service.mcp_pool, "lease") as mock_connect,
             patch("rossum_agent.api.services.agent_service.create_agent") as mock_create_agent,
             patch(
                 "rossum_agent.api.services.agent_service.create_session_output_dir", return_value=tmp_path
@@ -819,6 +905,55 @@ class TestAgentServiceRunAgent:
             mock_set_dir.assert_called_once_with(tmp_path)
             assert service.output_dir == tmp_path
 
+    @pytest.mark.asyncio
+    async def test_run_agent_encodes_deltas_when_requested(self, tmp_path):
+        """Test that stream_deltas switches streaming text events to the delta protocol."""
+        service = AgentService()
+
+        mock_mcp_connection = MagicMock()
+        mock_agent = MagicMock()
+        mock_agent._total_input_tokens = 0
+        mock_agent._total_output_tokens = 0
+        mock_agent.get_token_usage_breakdown.return_value = None
+
+        async def mock_run(prompt):
+            yield AgentStep(step_number=1, accumulated_text="Hel", is_streaming=True, step_type=StepType.FINAL_ANSWER)
+            yield AgentStep(
+                step_number=1, accumulated_text="Hello", is_streaming=True, step_type=StepType.FINAL_ANSWER
+            )
+            yield AgentStep(step_number=1, final_answer="Hello", is_final=True)
+
+        mock_agent.run = mock_run
+
+        with (
+            patch.object(service.mcp_pool, "lease") as mock_connect,
+            patch("rossum_agent.api.services.agent_service.create_agent") as mock_create_agent,
+            patch("rossum_agent.api.services.agent_service.create_session_output_dir", return_value=tmp_path),
+            patch("rossum_agent.api.services.agent_service.set_session_output_dir"),
+        ):
+            mock_connect.return_value.__aenter__ = AsyncMock(return_value=mock_mcp_connection)
+            mock_connect.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_create_agent.return_value = mock_agent
+
+            events = [
+                event
+                async for event in service.run_agent(
+                    prompt="Test",
+                    conversation_history=[],
+                    rossum_api_token="token",
+                    rossum_api_base_url="https://api.rossum.ai",
+                    stream_deltas=True,
+                )
+            ]
+
+        step_events = [e for e in events if isinstance(e, StepEvent)]
+        assert [(e.content, e.delta, e.offset) for e in step_events] == [
+            (None, "Hel", 0),
+            (None, "lo", 3),
+            ("Hello", None, None),
+        ]
+        assert [e.seq for e in step_events] == [1, 2, 3]
+
     def test_output_dir_initially_none(self):
         """Test that output_dir is None before running agent."""
         service = AgentService()
@@ -1062,7 +1197,8 @@ class TestAgentServiceSubAgentCallbacks:
     def test_on_sub_agent_progress_with_queue(self):
         """Test _on_sub_agent_progress puts event on queue."""
         service = AgentService()
-        service._sub_agent_queue = asyncio.Queue(maxsize=100)
+        run_context = AgentRunContext(sub_agent_events=asyncio.Queue(maxsize=100))
+        set_run_context(run_context)
 
         progress = SubAgentProgress(
             tool_name="test_tool",
@@ -1075,15 +1211,13 @@ class TestAgentServiceSubAgentCallbacks:
 
         service._on_sub_agent_progress(progress)
 
-        assert service._sub_agent_queue.qsize() == 1
-        event = service._sub_agent_queue.get_nowait()
-        assert isinstance(event, SubAgentProgressEvent)
-        assert event.tool_name == "test_tool"
+        assert run_context.sub_agent_events.qsize() == 1
+        assert run_context.sub_agent_events.get_nowait() is progress
 
     def test_on_sub_agent_progress_without_queue(self):
-        """Test _on_sub_agent_progress does nothing when queue is None."""
+        """Test _on_sub_agent_progress does nothing when the run has no event queue."""
         service = AgentService()
-        service._sub_agent_queue = None
+        set_run_context(AgentRunContext())
 
         progress = SubAgentProgress(
             tool_name="test_tool",
@@ -1099,9 +1233,10 @@ class TestAgentServiceSubAgentCallbacks:
     def test_on_sub_agent_progress_queue_full(self, caplog):
         """Test _on_sub_agent_progress logs warning when queue is full."""
         service = AgentService()
-        service._sub_agent_queue = asyncio.Queue(maxsize=1)
+        run_context = AgentRunContext(sub_agent_events=asyncio.Queue(maxsize=1))
+        set_run_context(run_context)
 
-        service._sub_agent_queue.put_nowait(
+        run_context.sub_agent_events.put_nowait(
             SubAgentProgressEvent(
                 tool_name="existing", iteration=1, max_iterations=1, tool_calls=["tool"], status="running"
             )
@@ -1126,23 +1261,20 @@ class TestAgentServiceSubAgentCallbacks:
     def test_on_sub_agent_text_with_queue(self):
         """Test _on_sub_agent_text puts event on queue."""
         service = AgentService()
-        service._sub_agent_queue = asyncio.Queue(maxsize=100)
+        run_context = AgentRunContext(sub_agent_events=asyncio.Queue(maxsize=100))
+        set_run_context(run_context)
 
         text = SubAgentText(tool_name="analyze_hook", text="Analyzing...", is_final=False)
 
         service._on_sub_agent_text(text)
 
-        assert service._sub_agent_queue.qsize() == 1
-        event = service._sub_agent_queue.get_nowait()
-        assert isinstance(event, SubAgentTextEvent)
-        assert event.tool_name == "analyze_hook"
-        assert event.text == "Analyzing..."
-        assert event.is_final is False
+        assert run_context.sub_agent_events.qsize() == 1
+        assert run_context.sub_agent_events.get_nowait() is text
 
     def test_on_sub_agent_text_without_queue(self):
-        """Test _on_sub_agent_text does nothing when queue is None."""
+        """Test _on_sub_agent_text does nothing when the run has no event queue."""
         service = AgentService()
-        service._sub_agent_queue = None
+        set_run_context(AgentRunContext())
 
         text = SubAgentText(tool_name="test_tool", text="Hello", is_final=True)
 
@@ -1151,9 +1283,10 @@ class TestAgentServiceSubAgentCallbacks:
     def test_on_sub_agent_text_queue_full(self, caplog):
         """Test _on_sub_agent_text logs warning when queue is full."""
         service = AgentService()
-        service._sub_agent_queue = asyncio.Queue(maxsize=1)
+        run_context = AgentRunContext(sub_agent_events=asyncio.Queue(maxsize=1))
+        set_run_context(run_context)
 
-        service._sub_agent_queue.put_nowait(SubAgentTextEvent(tool_name="existing", text="x", is_final=False))
+        run_context.sub_agent_events.put_nowait(SubAgentTextEvent(tool_name="existing", text="x", is_final=False))
 
         text = SubAgentText(tool_name="new_tool", text="Hello", is_final=True)
 
@@ -1164,6 +1297,20 @@ class TestAgentServiceSubAgentCallbacks:
 
         assert "queue full" in caplog.text.lower()
 
+    def test_drain_sub_agent_events_converts_updates(self):
+        """Test that pending sub-agent updates are converted to SSE events in order."""
+        run_context = AgentRunContext(sub_agent_events=asyncio.Queue(maxsize=100))
+        run_context.sub_agent_events.put_nowait(
+            SubAgentProgress(tool_name="debug_hook", iteration=1, max_iterations=3)
+        )
+        run_context.sub_agent_events.put_nowait(SubAgentText(tool_name="debug_hook", text="Done", is_final=True))
+
+        events = AgentService._drain_sub_agent_events(run_context)
+
+        assert isinstance(events[0], SubAgentProgressEvent)
+        assert events[1] == SubAgentTextEvent(tool_name="debug_hook", text="Done", is_final=True)
+        assert run_context.sub_agent_events.empty()
+
 
 class TestAgentServiceRunAgentWithImages:
     """Tests for run_agent with images parameter."""
@@ -1191,7 +1338,7 @@ class TestAgentServiceRunAgentWithImages:
         ]
 
         with (
-            patch("rossum_agent.api.services.agent_service.connect_mcp_server") as mock_connect,
+            patch.object(service.mcp_pool, "lease") as mock_connect,
             patch("rossum_agent.api.services.agent_service.create_agent") as mock_create_agent,
             patch("rossum_agent.api.services.agent_service.create_session_output_dir", return_value=tmp_path),
             patch("rossum_agent.api.services.agent_service.set_session_output_dir"),
@@ -1232,7 +1379,7 @@ class TestAgentServiceUrlContext:
         mock_agent.run = mock_run
 
         with (
-            patch("rossum_agent.api.services.agent_service.connect_mcp_server") as mock_connect,
+            patch.object(service.mcp_pool, "lease") as mock_connect,
             patch("rossum_agent.api.services.agent_service.create_agent") as mock_create_agent,
             patch("rossum_agent.api.services.agent_service.create_session_output_dir", return_value=tmp_path),
             patch("rossum_agent.api.services.agent_service.set_session_output_dir"),
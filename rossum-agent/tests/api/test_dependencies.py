@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,12 +10,17 @@ import httpx
 import pytest
 from fastapi import HTTPException
 from rossum_agent.api.dependencies import (
+    CredentialsCache,
     RossumCredentials,
+    close_http_client,
     get_rossum_credentials,
     get_validated_credentials,
+    invalidate_credentials,
     validate_rossum_api_url,
 )
 
+from .conftest import create_mock_httpx_client
+
 
 class TestRossumCredentials:
     """Tests for RossumCredentials dataclass."""
@@ -283,6 +289,132 @@ class TestGetValidatedCredentialsEdgeCases:
             assert "/v1/v1/auth" not in call_args[0][0]
 
 
+class TestCredentialsCaching:
+    """Tests for cached token validation."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_reuse_client_and_cached_user(self):
+        """Test that a validated token is not re-validated and the HTTP client is shared."""
+        with patch("rossum_agent.api.dependencies.httpx.AsyncClient") as mock_client:
+            mock_client.return_value = create_mock_httpx_client()
+
+            for _ in range(3):
+                creds = await get_validated_credentials(
+                    x_rossum_token="token", x_rossum_api_url="https://api.rossum.ai"
+                )
+
+            assert creds.user_id == "12345"
+            mock_client.assert_called_once()
+            mock_client.return_value.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_is_negatively_cached(self):
+        """Test that a 401 is remembered and served without calling Rossum again."""
+        with patch("rossum_agent.api.dependencies.httpx.AsyncClient") as mock_client:
+            mock_client.return_value = create_mock_httpx_client(status_code=401)
+
+            for _ in range(2):
+                with pytest.raises(HTTPException) as exc_info:
+                    await get_validated_credentials(x_rossum_token="bad", x_rossum_api_url="https://api.rossum.ai")
+                assert exc_info.value.status_code == 401
+
+            mock_client.return_value.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_not_cached(self):
+        """Test that upstream errors are retried on the next request."""
+        with patch("rossum_agent.api.dependencies.httpx.AsyncClient") as mock_client:
+            mock_client.return_value = create_mock_httpx_client(status_code=500)
+
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    await get_validated_credentials(x_rossum_token="token", x_rossum_api_url="https://api.rossum.ai")
+
+            assert mock_client.return_value.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_credentials_forces_revalidation(self):
+        """Test that explicit invalidation drops the cached result."""
+        with patch("rossum_agent.api.dependencies.httpx.AsyncClient") as mock_client:
+            mock_client.return_value = create_mock_httpx_client()
+
+            await get_validated_credentials(x_rossum_token="token", x_rossum_api_url="https://api.rossum.ai/v1")
+            assert invalidate_credentials("token", "https://api.rossum.ai") == 1
+            await get_validated_credentials(x_rossum_token="token", x_rossum_api_url="https://api.rossum.ai/v1")
+
+            assert mock_client.return_value.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_validation(self):
+        """Test that simultaneous requests with an uncached token validate it only once."""
+        with patch("rossum_agent.api.dependencies.httpx.AsyncClient") as mock_client:
+            mock_client.return_value = create_mock_httpx_client()
+
+            results = await asyncio.gather(
+                *(
+                    get_validated_credentials(x_rossum_token="token", x_rossum_api_url="https://api.rossum.ai")
+                    for _ in range(5)
+                )
+            )
+
+            assert {creds.user_id for creds in results} == {"12345"}
+            mock_client.return_value.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_rejection(self):
+        """Test that every waiter of a shared validation gets the 401."""
+        with patch("rossum_agent.api.dependencies.httpx.AsyncClient") as mock_client:
+            mock_client.return_value = create_mock_httpx_client(status_code=401)
+
+            results = await asyncio.gather(
+                *(
+                    get_validated_credentials(x_rossum_token="bad", x_rossum_api_url="https://api.rossum.ai")
+                    for _ in range(3)
+                ),
+                return_exceptions=True,
+            )
+
+            assert [r.status_code for r in results if isinstance(r, HTTPException)] == [401, 401, 401]
+            mock_client.return_value.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_http_client(self):
+        """Test that the shared client is closed and recreated on next use."""
+        with patch("rossum_agent.api.dependencies.httpx.AsyncClient") as mock_client:
+            mock_client.return_value = create_mock_httpx_client()
+            await get_validated_credentials(x_rossum_token="token", x_rossum_api_url="https://api.rossum.ai")
+
+            await close_http_client()
+
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    def test_cache_entries_expire(self):
+        """Test that entries are dropped once their TTL elapses."""
+        cache = CredentialsCache(ttl=60, negative_ttl=5)
+
+        with patch("rossum_agent.api.dependencies.time.monotonic", return_value=100.0):
+            cache.store("ok", "https://api.rossum.ai", "1")
+            cache.store("bad", "https://api.rossum.ai", None)
+        with patch("rossum_agent.api.dependencies.time.monotonic", return_value=110.0):
+            assert cache.get("ok", "https://api.rossum.ai") == (True, "1")
+            assert cache.get("bad", "https://api.rossum.ai") == (False, None)
+        with patch("rossum_agent.api.dependencies.time.monotonic", return_value=161.0):
+            assert cache.get("ok", "https://api.rossum.ai") == (False, None)
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays bounded by evicting the least recently used entry."""
+        cache = CredentialsCache(max_size=2, ttl=60)
+        cache.store("a", "url", "1")
+        cache.store("b", "url", "2")
+        cache.get("a", "url")
+
+        cache.store("c", "url", "3")
+
+        assert len(cache) == 2
+        assert cache.get("b", "url") == (False, None)
+        assert cache.get("a", "url") == (True, "1")
+
+
 class TestAllowedHostsPattern:
     """Tests for ADDITIONAL_ALLOWED_ROSSUM_HOSTS environment variable."""
 
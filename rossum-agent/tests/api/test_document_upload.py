@@ -128,8 +128,6 @@ class TestAgentServiceDocumentStorage:
         service = AgentService()
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            service._output_dir = Path(tmpdir)
-
             pdf_content = b"%PDF-1.4 test content"
             data = base64.b64encode(pdf_content).decode()
             docs = [
@@ -140,7 +138,7 @@ class TestAgentServiceDocumentStorage:
                 )
             ]
 
-            service._save_documents_to_output_dir(docs)
+            service._save_documents_to_output_dir(docs, Path(tmpdir))
 
             saved_file = Path(tmpdir) / "test_invoice.pdf"
             assert saved_file.exists()
@@ -151,8 +149,6 @@ class TestAgentServiceDocumentStorage:
         service = AgentService()
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            service._output_dir = Path(tmpdir)
-
             docs = []
             for i in range(3):
                 content = f"PDF content {i}".encode()
@@ -165,29 +161,13 @@ class TestAgentServiceDocumentStorage:
                     )
                 )
 
-            service._save_documents_to_output_dir(docs)
+            service._save_documents_to_output_dir(docs, Path(tmpdir))
 
             for i in range(3):
                 saved_file = Path(tmpdir) / f"doc{i}.pdf"
                 assert saved_file.exists()
                 assert saved_file.read_bytes() == f"PDF content {i}".encode()
 
-    def test_save_documents_no_output_dir(self) -> None:
-        """Test that saving documents without output dir logs warning."""
-        service = AgentService()
-        service._output_dir = None
-
-        data = base64.b64encode(b"PDF").decode()
-        docs = [
-            DocumentContent(
-                media_type="application/pdf",
-                data=data,
-                filename="test.pdf",
-            )
-        ]
-
-        service._save_documents_to_output_dir(docs)
-
 
 class TestBuildUpdatedHistoryWithDocuments:
     """Tests for build_updated_history with documents."""
@@ -195,7 +175,6 @@ class TestBuildUpdatedHistoryWithDocuments:
     def test_history_includes_document_info(self) -> None:
         """Test that document filenames are included in history."""
         service = AgentService()
-        service._last_memory = None
 
         data = base64.b64encode(b"PDF").decode()
         docs = [
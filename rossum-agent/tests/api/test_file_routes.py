@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from rossum_agent.api.main import app
 from rossum_agent.api.models.schemas import FileInfo
 from rossum_agent.api.routes import chats, files, health, messages
 from rossum_agent.api.routes.files import (
+    _parse_range,
     _sanitize_filename,
     get_chat_service_dep,
     get_file_service_dep,
@@ -32,6 +34,16 @@ def client(mock_chat_service, mock_file_service, mock_agent_service):
         yield client
 
 
+def _mock_stored_file(mock_file_service, content: bytes, mime_type: str) -> None:
+    """Make the mocked file service serve `content` (slicing it like the storage byte-range iterator)."""
+
+    async def iter_file(chat_id, entry, start, end):
+        yield content[start : end + 1]
+
+    mock_file_service.open_file.return_value = ({"size": len(content), "sha256": "abc"}, mime_type)
+    mock_file_service.iter_file = MagicMock(side_effect=iter_file)
+
+
 class TestListFilesEndpoint:
     """Tests for GET /api/v1/chats/{chat_id}/files endpoint."""
 
@@ -92,7 +104,7 @@ class TestDownloadFileEndpoint:
         mock_httpx.return_value = create_mock_httpx_client()
 
         mock_chat_service.chat_exists.return_value = True
-        mock_file_service.get_file.return_value = (b"<html>content</html>", "text/html")
+        _mock_stored_file(mock_file_service, b"<html>content</html>", "text/html")
 
         response = client.get("/api/v1/chats/chat_123/files/chart.html", headers=valid_headers)
 
@@ -100,6 +112,39 @@ class TestDownloadFileEndpoint:
         assert response.content == b"<html>content</html>"
         assert "text/html" in response.headers["content-type"]
         assert 'attachment; filename="chart.html"' in response.headers["content-disposition"]
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-length"] == "20"
+        assert response.headers["etag"] == '"abc"'
+
+    @patch("rossum_agent.api.dependencies.httpx.AsyncClient")
+    def test_download_file_range(self, mock_httpx, client, mock_chat_service, mock_file_service, valid_headers):
+        """Test downloading a byte range returns partial content."""
+        mock_httpx.return_value = create_mock_httpx_client()
+
+        mock_chat_service.chat_exists.return_value = True
+        _mock_stored_file(mock_file_service, b"0123456789", "text/plain")
+
+        response = client.get("/api/v1/chats/chat_123/files/data.txt", headers={**valid_headers, "Range": "bytes=2-5"})
+
+        assert response.status_code == 206
+        assert response.content == b"2345"
+        assert response.headers["content-range"] == "bytes 2-5/10"
+        assert response.headers["content-length"] == "4"
+
+    @patch("rossum_agent.api.dependencies.httpx.AsyncClient")
+    def test_download_file_range_not_satisfiable(
+        self, mock_httpx, client, mock_chat_service, mock_file_service, valid_headers
+    ):
+        """Test that a range beyond the end of the file returns 416."""
+        mock_httpx.return_value = create_mock_httpx_client()
+
+        mock_chat_service.chat_exists.return_value = True
+        _mock_stored_file(mock_file_service, b"0123456789", "text/plain")
+
+        response = client.get("/api/v1/chats/chat_123/files/data.txt", headers={**valid_headers, "Range": "bytes=10-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
 
     @patch("rossum_agent.api.dependencies.httpx.AsyncClient")
     def test_download_file_not_found(self, mock_httpx, client, mock_chat_service, mock_file_service, valid_headers):
@@ -107,7 +152,7 @@ class TestDownloadFileEndpoint:
         mock_httpx.return_value = create_mock_httpx_client()
 
         mock_chat_service.chat_exists.return_value = True
-        mock_file_service.get_file.return_value = None
+        mock_file_service.open_file.return_value = None
 
         response = client.get("/api/v1/chats/chat_123/files/missing.html", headers=valid_headers)
 
@@ -129,6 +174,30 @@ class TestDownloadFileEndpoint:
         assert "Chat" in response.json()["detail"]
 
 
+class TestParseRange:
+    """Tests for the Range header parser."""
+
+    def test_parse_range_variants(self):
+        """Test explicit, open-ended and suffix byte ranges."""
+        assert _parse_range("bytes=0-4", 10) == (0, 4)
+        assert _parse_range("bytes=5-", 10) == (5, 9)
+        assert _parse_range("bytes=-3", 10) == (7, 9)
+        assert _parse_range("bytes=8-100", 10) == (8, 9)
+
+    def test_parse_range_ignores_unsupported(self):
+        """Test that absent, malformed and multi-range headers fall back to the full file."""
+        assert _parse_range(None, 10) is None
+        assert _parse_range("items=0-4", 10) is None
+        assert _parse_range("bytes=0-1,4-5", 10) is None
+
+    def test_parse_range_not_satisfiable(self):
+        """Test that ranges outside the file raise 416."""
+        with pytest.raises(HTTPException) as exc_info:
+            _parse_range("bytes=5-2", 10)
+
+        assert exc_info.value.status_code == 416
+
+
 class TestSanitizeFilename:
     """Tests for the _sanitize_filename security function."""
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from rossum_agent.api.models.schemas import FileInfo
@@ -11,8 +11,8 @@ from rossum_agent.api.services.file_service import FileService
 
 @pytest.fixture
 def mock_storage():
-    """Create a mock RedisStorage."""
-    return MagicMock()
+    """Create a mock AsyncRedisStorage."""
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -24,23 +24,23 @@ def file_service(mock_storage):
 class TestListFiles:
     """Tests for FileService.list_files."""
 
-    def test_list_files_empty(self, file_service, mock_storage):
+    async def test_list_files_empty(self, file_service, mock_storage):
         """Test listing files when none exist."""
         mock_storage.list_files.return_value = []
 
-        result = file_service.list_files("chat_123")
+        result = await file_service.list_files("chat_123")
 
         assert result == []
         mock_storage.list_files.assert_called_once_with("chat_123")
 
-    def test_list_files_with_results(self, file_service, mock_storage):
+    async def test_list_files_with_results(self, file_service, mock_storage):
         """Test listing files with results."""
         mock_storage.list_files.return_value = [
             {"filename": "chart.html", "size": 1234, "timestamp": "2024-12-09T14:30:00Z"},
             {"filename": "data.csv", "size": 567, "timestamp": "2024-12-09T14:35:00Z"},
         ]
 
-        result = file_service.list_files("chat_123")
+        result = await file_service.list_files("chat_123")
 
         assert len(result) == 2
         assert isinstance(result[0], FileInfo)
@@ -54,11 +54,11 @@ class TestListFiles:
 class TestGetFile:
     """Tests for FileService.get_file."""
 
-    def test_get_file_success(self, file_service, mock_storage):
+    async def test_get_file_success(self, file_service, mock_storage):
         """Test getting a file successfully."""
         mock_storage.load_file.return_value = b"<html>content</html>"
 
-        result = file_service.get_file("chat_123", "chart.html")
+        result = await file_service.get_file("chat_123", "chart.html")
 
         assert result is not None
         content, mime_type = result
@@ -66,15 +66,15 @@ class TestGetFile:
         assert mime_type == "text/html"
         mock_storage.load_file.assert_called_once_with("chat_123", "chart.html")
 
-    def test_get_file_not_found(self, file_service, mock_storage):
+    async def test_get_file_not_found(self, file_service, mock_storage):
         """Test getting a non-existent file."""
         mock_storage.load_file.return_value = None
 
-        result = file_service.get_file("chat_123", "missing.html")
+        result = await file_service.get_file("chat_123", "missing.html")
 
         assert result is None
 
-    def test_get_file_mime_type_detection(self, file_service, mock_storage):
+    async def test_get_file_mime_type_detection(self, file_service, mock_storage):
         """Test MIME type detection for various file types."""
         mock_storage.load_file.return_value = b"content"
 
@@ -88,12 +88,40 @@ class TestGetFile:
         ]
 
         for filename, expected_mime in test_cases:
-            result = file_service.get_file("chat_123", filename)
+            result = await file_service.get_file("chat_123", filename)
             assert result is not None
             _, mime_type = result
             assert mime_type == expected_mime, f"Failed for {filename}"
 
 
+class TestOpenFile:
+    """Tests for FileService.open_file and iter_file."""
+
+    async def test_open_file_success(self, file_service, mock_storage):
+        """Test opening a file returns its stored entry and MIME type."""
+        entry = {"filename": "chart.html", "size": 20, "sha256": "abc"}
+        mock_storage.get_file_entry.return_value = entry
+
+        result = await file_service.open_file("chat_123", "chart.html")
+
+        assert result == (entry, "text/html")
+        mock_storage.get_file_entry.assert_called_once_with("chat_123", "chart.html")
+
+    async def test_open_file_not_found(self, file_service, mock_storage):
+        """Test opening a non-existent file."""
+        mock_storage.get_file_entry.return_value = None
+
+        assert await file_service.open_file("chat_123", "missing.html") is None
+
+    def test_iter_file_delegates_to_storage(self, file_service, mock_storage):
+        """Test that streaming is delegated to the storage byte-range iterator."""
+        mock_storage.iter_file = MagicMock(return_value="iterator")
+        entry = {"size": 10, "sha256": "abc"}
+
+        assert file_service.iter_file("chat_123", entry, 2, 5) == "iterator"
+        mock_storage.iter_file.assert_called_once_with("chat_123", entry, 2, 5)
+
+
 class TestStorageProperty:
     """Tests for FileService.storage property."""
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import rossum_agent.api.main as main_module
@@ -143,7 +143,7 @@ class TestLifespan:
     @pytest.mark.asyncio
     async def test_lifespan_logs_redis_connected(self, caplog):
         """Test lifespan logs Redis connection status when connected."""
-        mock_chat_service = MagicMock()
+        mock_chat_service = AsyncMock()
         mock_chat_service.is_connected.return_value = True
 
         with (
@@ -160,7 +160,7 @@ class TestLifespan:
     @pytest.mark.asyncio
     async def test_lifespan_logs_redis_disconnected(self, caplog):
         """Test lifespan logs warning when Redis disconnected."""
-        mock_chat_service = MagicMock()
+        mock_chat_service = AsyncMock()
         mock_chat_service.is_connected.return_value = False
 
         with (
@@ -177,8 +177,8 @@ class TestLifespan:
     @pytest.mark.asyncio
     async def test_lifespan_closes_storage_on_shutdown(self):
         """Test lifespan closes storage on shutdown when chat_service exists."""
-        mock_storage = MagicMock()
-        mock_chat_service = MagicMock()
+        mock_storage = AsyncMock()
+        mock_chat_service = AsyncMock()
         mock_chat_service.storage = mock_storage
         mock_chat_service.is_connected.return_value = True
         main_module._chat_service = mock_chat_service
@@ -186,12 +186,27 @@ class TestLifespan:
         async with lifespan(app):
             pass
 
-        mock_storage.close.assert_called_once()
+        mock_storage.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_mcp_pool_on_shutdown(self):
+        """Test lifespan releases pooled MCP connections on shutdown."""
+        mock_chat_service = AsyncMock()
+        mock_chat_service.is_connected.return_value = True
+        main_module._chat_service = mock_chat_service
+        mock_agent_service = MagicMock()
+        mock_agent_service.close = AsyncMock()
+        main_module._agent_service = mock_agent_service
+
+        async with lifespan(app):
+            pass
+
+        mock_agent_service.close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_lifespan_handles_no_chat_service(self, caplog):
         """Test lifespan handles case when chat_service is None on shutdown."""
-        mock_chat_service = MagicMock()
+        mock_chat_service = AsyncMock()
         mock_chat_service.is_connected.return_value = True
 
         with (
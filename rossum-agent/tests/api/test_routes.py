@@ -52,6 +52,8 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert data["redis_connected"] is True
         assert "version" in data
+        assert data["pacing"]["acquisitions"] == 0
+        assert data["pacing"]["rate_limit_events"] == 0
 
     def test_health_unhealthy(self, client, mock_chat_service):
         """Test health check when Redis is disconnected."""
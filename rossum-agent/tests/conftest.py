@@ -1,3 +1,23 @@
 """Root test configuration for rossum-agent tests."""
 
 from __future__ import annotations
+
+import pytest
+from rossum_agent.agent.pacing import reset_pacer
+from rossum_agent.tools import set_run_context
+
+
+@pytest.fixture(autouse=True)
+def _reset_pacer():
+    """Isolate the process-wide request pacer between tests."""
+    reset_pacer()
+    yield
+    reset_pacer()
+
+
+@pytest.fixture(autouse=True)
+def _reset_run_context():
+    """Unbind any agent run context left in the test thread's context."""
+    set_run_context(None)
+    yield
+    set_run_context(None)
@@ -0,0 +1,427 @@
+"""Tests for rossum_agent.async_redis_storage module."""
+
+from __future__ import annotations
+
+import base64
+import fnmatch
+import hashlib
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from rossum_agent.async_redis_storage import AsyncRedisStorage
+from rossum_agent.redis_storage import ChatMetadata, RedisStorage
+
+
+class FakePipeline:
+    """Minimal pipeline recording commands and applying them on execute."""
+
+    def __init__(self, client: FakeAsyncRedis) -> None:
+        self._client = client
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs) -> None:
+            self._commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list:
+        self._client.round_trips += 1
+        return [getattr(self._client, f"_{name}")(*args, **kwargs) for name, args, kwargs in self._commands]
+
+
+class FakeAsyncRedis:
+    """In-memory stand-in for redis.asyncio.Redis counting network round trips."""
+
+    def __init__(self) -> None:
+        self.data: dict[bytes, bytes] = {}
+        self.hashes: dict[bytes, dict[bytes, bytes]] = {}
+        self.zsets: dict[bytes, dict[bytes, float]] = {}
+        self.round_trips = 0
+
+    @staticmethod
+    def encode(key: bytes | str) -> bytes:
+        return key if isinstance(key, bytes) else key.encode("utf-8")
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def _setex(self, key, ttl, value) -> bool:
+        self.data[self.encode(key)] = self.encode(value)
+        return True
+
+    def _set(self, key, value, ex=None) -> bool:
+        self.data[self.encode(key)] = self.encode(value)
+        return True
+
+    def _delete(self, *keys) -> int:
+        deleted = 0
+        for key in map(self.encode, keys):
+            deleted += any(store.pop(key, None) is not None for store in (self.data, self.hashes, self.zsets))
+        return deleted
+
+    def _expire(self, key, ttl) -> bool:
+        return True
+
+    def _hset(self, key, mapping) -> int:
+        fields = self.hashes.setdefault(self.encode(key), {})
+        fields.update({self.encode(name): self.encode(value) for name, value in mapping.items()})
+        return len(mapping)
+
+    def _hdel(self, key, *names) -> int:
+        fields = self.hashes.get(self.encode(key), {})
+        return sum(fields.pop(self.encode(name), None) is not None for name in names)
+
+    def _hgetall(self, key) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(self.encode(key), {}))
+
+    def _zadd(self, key, mapping) -> int:
+        self.zsets.setdefault(self.encode(key), {}).update({self.encode(m): s for m, s in mapping.items()})
+        return len(mapping)
+
+    def _zrem(self, key, *members) -> int:
+        zset = self.zsets.get(self.encode(key), {})
+        return sum(zset.pop(self.encode(member), None) is not None for member in members)
+
+    def _zcard(self, key) -> int:
+        return len(self.zsets.get(self.encode(key), {}))
+
+    def _zrevrange(self, key, start, stop) -> list[bytes]:
+        members = sorted(self.zsets.get(self.encode(key), {}).items(), key=lambda item: item[1], reverse=True)
+        return [member for member, _ in members][start : None if stop == -1 else stop + 1]
+
+    async def setex(self, key, ttl, value) -> bool:
+        self.round_trips += 1
+        return self._setex(key, ttl, value)
+
+    async def set(self, key, value) -> bool:
+        self.round_trips += 1
+        return self._set(key, value)
+
+    async def get(self, key) -> bytes | None:
+        self.round_trips += 1
+        return self.data.get(self.encode(key))
+
+    async def mget(self, keys) -> list[bytes | None]:
+        self.round_trips += 1
+        return [self.data.get(self.encode(key)) for key in keys]
+
+    async def exists(self, key) -> int:
+        self.round_trips += 1
+        return int(self.encode(key) in self.data)
+
+    async def delete(self, *keys) -> int:
+        self.round_trips += 1
+        return self._delete(*keys)
+
+    async def hget(self, key, name) -> bytes | None:
+        self.round_trips += 1
+        return self.hashes.get(self.encode(key), {}).get(self.encode(name))
+
+    async def hgetall(self, key) -> dict[bytes, bytes]:
+        self.round_trips += 1
+        return self._hgetall(key)
+
+    async def strlen(self, key) -> int:
+        self.round_trips += 1
+        return len(self.data.get(self.encode(key), b""))
+
+    async def getrange(self, key, start, end) -> bytes:
+        self.round_trips += 1
+        return self.data.get(self.encode(key), b"")[start : end + 1]
+
+    async def zrem(self, key, *members) -> int:
+        self.round_trips += 1
+        return self._zrem(key, *members)
+
+    async def ping(self) -> bool:
+        return True
+
+    async def scan_iter(self, match: bytes, count: int):
+        self.round_trips += 1
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key.decode("utf-8"), match.decode("utf-8")):
+                yield key
+
+
+@pytest.fixture
+def fake_redis() -> FakeAsyncRedis:
+    return FakeAsyncRedis()
+
+
+@pytest.fixture
+def storage(fake_redis) -> AsyncRedisStorage:
+    storage = AsyncRedisStorage()
+    storage._client = fake_redis
+    return storage
+
+
+class TestAsyncRedisStorageInit:
+    """Test AsyncRedisStorage configuration and client creation."""
+
+    @patch.dict("os.environ", {"REDIS_HOST": "env-host", "REDIS_PORT": "6381", "REDIS_MAX_CONNECTIONS": "7"})
+    def test_init_from_env_vars(self):
+        """Test initialization from environment variables."""
+        storage = AsyncRedisStorage()
+
+        assert storage.host == "env-host"
+        assert storage.port == 6381
+        assert storage.max_connections == 7
+
+    @patch("rossum_agent.async_redis_storage.aioredis.Redis")
+    @patch("rossum_agent.async_redis_storage.aioredis.ConnectionPool")
+    def test_client_uses_bounded_connection_pool(self, mock_pool, mock_redis):
+        """Test that the client is created once on top of a bounded connection pool."""
+        storage = AsyncRedisStorage(host="h", port=1, max_connections=5)
+
+        client = storage.client
+
+        mock_pool.assert_called_once_with(
+            host="h", port=1, max_connections=5, decode_responses=False, socket_connect_timeout=5
+        )
+        mock_redis.assert_called_once_with(connection_pool=mock_pool.return_value)
+        assert storage.client is client
+
+    async def test_close_closes_client_and_pool(self):
+        """Test close() closes the client including its pool."""
+        storage = AsyncRedisStorage()
+        mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
+        storage._client = mock_client
+
+        await storage.close()
+
+        mock_client.aclose.assert_awaited_once_with(close_connection_pool=True)
+        assert storage._client is None
+
+
+class TestAsyncRedisStorageChats:
+    """Test chat persistence."""
+
+    async def test_save_and_load_round_trip(self, storage):
+        """Test that a saved chat is loaded back with metadata."""
+        messages = [{"role": "user", "content": "Hello"}]
+        metadata = ChatMetadata(total_input_tokens=10, mcp_mode="read-write")
+
+        assert await storage.save_chat("u1", "chat_20240101120000_abc", messages, metadata=metadata) is True
+        chat_data = await storage.load_chat("u1", "chat_20240101120000_abc")
+
+        assert chat_data is not None
+        assert chat_data.messages == messages
+        assert chat_data.metadata.total_input_tokens == 10
+        assert chat_data.metadata.mcp_mode == "read-write"
+
+    async def test_save_chat_pipelines_chat_and_files(self, storage, fake_redis, tmp_path):
+        """Test that the chat and all output files are written in one pipeline after reading the file index."""
+        (tmp_path / "a.csv").write_bytes(b"a")
+        (tmp_path / "b.html").write_bytes(b"b")
+
+        await storage.save_chat(None, "chat_20240101120000_abc", [], output_dir=tmp_path)
+
+        assert fake_redis.round_trips == 2
+        assert set(fake_redis.hashes[b"file_index:chat_20240101120000_abc"]) == {b"a.csv", b"b.html"}
+        assert {key for key in fake_redis.data if key.startswith(b"file_blob:")} == {
+            f"file_blob:chat_20240101120000_abc:{hashlib.sha256(content).hexdigest()}".encode()
+            for content in (b"a", b"b")
+        }
+
+    async def test_load_chat_restores_files(self, storage, tmp_path):
+        """Test that files are restored to the output directory."""
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "report.csv").write_bytes(b"x,y")
+        await storage.save_chat(None, "chat_20240101120000_abc", [], output_dir=source)
+
+        target = tmp_path / "dst"
+        chat_data = await storage.load_chat(None, "chat_20240101120000_abc", output_dir=target)
+
+        assert chat_data is not None
+        assert (target / "report.csv").read_bytes() == b"x,y"
+
+    async def test_load_missing_chat_returns_none(self, storage):
+        """Test loading a chat that does not exist."""
+        assert await storage.load_chat(None, "chat_missing") is None
+
+    async def test_exists_and_delete(self, storage):
+        """Test chat_exists and delete_chat."""
+        await storage.save_chat("u1", "chat_20240101120000_abc", [])
+
+        assert await storage.chat_exists("u1", "chat_20240101120000_abc") is True
+        assert await storage.delete_chat("u1", "chat_20240101120000_abc") is True
+        assert await storage.chat_exists("u1", "chat_20240101120000_abc") is False
+
+    async def test_list_chats_reads_only_the_index(self, storage, fake_redis):
+        """Test listing reads one page of the index and its summaries in two round trips, newest first."""
+        await storage.save_chat("u1", "chat_20240101120000_aaa", [{"role": "user", "content": "first"}])
+        await storage.save_chat("u1", "chat_20240102120000_bbb", [{"role": "user", "content": "second"}])
+        await storage.save_chat("u2", "chat_20240103120000_ccc", [])
+        fake_redis.round_trips = 0
+
+        chats = await storage.list_all_chats("u1")
+
+        assert [chat["chat_id"] for chat in chats] == ["chat_20240102120000_bbb", "chat_20240101120000_aaa"]
+        assert chats[0]["preview"] == "second"
+        assert fake_redis.round_trips == 2
+
+    async def test_list_chats_paginates_with_total(self, storage, fake_redis):
+        """Test that limit/offset select a page while total counts all indexed chats."""
+        for day in range(1, 6):
+            await storage.save_chat("u1", f"chat_202401{day:02d}120000_x", [])
+
+        chats, total = await storage.list_chats("u1", limit=2, offset=1)
+
+        assert [chat["chat_id"] for chat in chats] == ["chat_20240104120000_x", "chat_20240103120000_x"]
+        assert total == 5
+
+    async def test_delete_chat_removes_index_entry(self, storage, fake_redis):
+        """Test that deleting a chat drops its summary and index entry."""
+        await storage.save_chat("u1", "chat_20240101120000_abc", [])
+
+        await storage.delete_chat("u1", "chat_20240101120000_abc")
+
+        assert await storage.list_chats("u1") == ([], 0)
+        assert fake_redis.hashes == {}
+
+    async def test_list_chats_prunes_expired_summaries(self, storage, fake_redis):
+        """Test that index entries whose summary expired are skipped and removed."""
+        await storage.save_chat("u1", "chat_20240101120000_aaa", [])
+        await storage.save_chat("u1", "chat_20240102120000_bbb", [])
+        del fake_redis.hashes[b"chat_summary:user:u1:chat_20240102120000_bbb"]
+
+        chats, total = await storage.list_chats("u1")
+
+        assert [chat["chat_id"] for chat in chats] == ["chat_20240101120000_aaa"]
+        assert total == 1
+        assert fake_redis.zsets[b"chat_index:user:u1"].keys() == {b"chat_20240101120000_aaa"}
+
+    async def test_ensure_chat_index_indexes_existing_chats_once(self, storage, fake_redis):
+        """Test that chats stored before indexing existed are indexed on first startup only."""
+        await storage.save_chat("u1", "chat_20240101120000_aaa", [{"role": "user", "content": "old"}])
+        await storage.save_chat(None, "chat_20240102120000_bbb", [])
+        fake_redis.hashes.clear()
+        fake_redis.zsets.clear()
+
+        assert await storage.ensure_chat_index() == 2
+        assert await storage.ensure_chat_index() == 0
+
+        chats, _ = await storage.list_chats("u1")
+        assert chats[0]["preview"] == "old"
+        assert [chat["chat_id"] for chat in (await storage.list_chats(None))[0]] == ["chat_20240102120000_bbb"]
+
+    async def test_shares_payload_format_with_sync_storage(self, storage, fake_redis):
+        """Test that chats written by the sync storage can be read by the async one."""
+        sync_storage = RedisStorage()
+        sync_client = MagicMock()
+        sync_storage._client = sync_client
+        sync_storage.save_chat("u1", "chat_20240101120000_abc", [{"role": "user", "content": "hi"}])
+        key, _, value = sync_client.setex.call_args[0]
+        fake_redis.data[key.encode("utf-8")] = value
+
+        chat_data = await storage.load_chat("u1", "chat_20240101120000_abc")
+
+        assert chat_data is not None
+        assert chat_data.messages == [{"role": "user", "content": "hi"}]
+
+    async def test_errors_are_logged_not_raised(self, storage, fake_redis):
+        """Test that Redis errors are reported via return values."""
+        fake_redis.get = AsyncMock(side_effect=ConnectionError("down"))
+
+        assert await storage.load_chat(None, "chat_x") is None
+
+
+class TestAsyncRedisStorageFiles:
+    """Test file persistence."""
+
+    async def test_save_load_list_delete_file(self, storage):
+        """Test the single-file lifecycle."""
+        assert await storage.save_file("chat_1", "out.txt", b"hello") is True
+
+        assert await storage.load_file("chat_1", "out.txt") == b"hello"
+        files = await storage.list_files("chat_1")
+        assert [(f["filename"], f["size"]) for f in files] == [("out.txt", 5)]
+        assert await storage.delete_file("chat_1", "out.txt") is True
+        assert await storage.load_file("chat_1", "out.txt") is None
+
+    async def test_save_file_reads_from_disk(self, storage, tmp_path):
+        """Test that content is read from the path when not given."""
+        path = tmp_path / "data.json"
+        path.write_bytes(b"{}")
+
+        assert await storage.save_file("chat_1", path) is True
+        assert await storage.load_file("chat_1", "data.json") == b"{}"
+
+    async def test_save_file_missing_path(self, storage):
+        """Test saving a non-existent file fails gracefully."""
+        assert await storage.save_file("chat_1", Path("/nonexistent/file.txt")) is False
+
+    async def test_delete_all_files(self, storage):
+        """Test deleting all files of a chat leaves other chats untouched."""
+        await storage.save_file("chat_1", "a.txt", b"a")
+        await storage.save_file("chat_1", "b.txt", b"b")
+        await storage.save_file("chat_2", "c.txt", b"c")
+
+        assert await storage.delete_all_files("chat_1") == 2
+        assert await storage.list_files("chat_1") == []
+        assert len(await storage.list_files("chat_2")) == 1
+
+    async def test_save_all_files_empty_dir(self, storage, tmp_path):
+        """Test saving an empty or missing directory."""
+        assert await storage.save_all_files("chat_1", tmp_path) == 0
+        assert await storage.save_all_files("chat_1", tmp_path / "missing") == 0
+
+    async def test_save_all_files_uploads_only_changes(self, storage, fake_redis, tmp_path):
+        """Test that unchanged files are skipped and modified files replace their old content."""
+        (tmp_path / "a.txt").write_bytes(b"a")
+        (tmp_path / "b.txt").write_bytes(b"b")
+        assert await storage.save_all_files("chat_1", tmp_path) == 2
+
+        assert await storage.save_all_files("chat_1", tmp_path) == 0
+
+        (tmp_path / "b.txt").write_bytes(b"changed")
+        assert await storage.save_all_files("chat_1", tmp_path) == 1
+        assert await storage.load_file("chat_1", "b.txt") == b"changed"
+        assert f"file_blob:chat_1:{hashlib.sha256(b'b').hexdigest()}".encode() not in fake_redis.data
+
+    async def test_identical_content_is_stored_once(self, storage, fake_redis):
+        """Test that files with the same content share one stored blob."""
+        await storage.save_file("chat_1", "a.txt", b"same")
+        await storage.save_file("chat_1", "b.txt", b"same")
+
+        assert [key for key in fake_redis.data if key.startswith(b"file_blob:")] == [
+            f"file_blob:chat_1:{hashlib.sha256(b'same').hexdigest()}".encode()
+        ]
+        assert await storage.delete_file("chat_1", "a.txt") is True
+        assert await storage.load_file("chat_1", "b.txt") == b"same"
+
+    async def test_iter_file_streams_byte_range(self, storage, monkeypatch):
+        """Test that a byte range is streamed in chunks."""
+        monkeypatch.setattr("rossum_agent.async_redis_storage.FILE_CHUNK_SIZE", 4)
+        await storage.save_file("chat_1", "data.bin", b"0123456789")
+        entry = await storage.get_file_entry("chat_1", "data.bin")
+
+        chunks = [chunk async for chunk in storage.iter_file("chat_1", entry, 2, 8)]
+
+        assert chunks == [b"2345", b"678"]
+        assert b"".join([chunk async for chunk in storage.iter_file("chat_1", entry)]) == b"0123456789"
+
+    async def test_get_file_entry_requires_stored_content(self, storage, fake_redis):
+        """Test that an index entry whose content blob is gone is reported as missing."""
+        await storage.save_file("chat_1", "data.bin", b"0123456789")
+        assert await storage.get_file_entry("chat_1", "data.bin") is not None
+
+        del fake_redis.data[f"file_blob:chat_1:{hashlib.sha256(b'0123456789').hexdigest()}".encode()]
+
+        assert await storage.get_file_entry("chat_1", "data.bin") is None
+
+    async def test_ensure_file_index_migrates_legacy_files(self, storage, fake_redis):
+        """Test that legacy base64 JSON files are moved into the file index once."""
+        payload = {"filename": "old.txt", "size": 3, "timestamp": "", "content": base64.b64encode(b"old").decode()}
+        fake_redis.data[b"file:chat_1:old.txt"] = json.dumps(payload).encode()
+
+        assert await storage.ensure_file_index() == 1
+        assert await storage.ensure_file_index() == 0
+
+        assert b"file:chat_1:old.txt" not in fake_redis.data
+        assert await storage.load_file("chat_1", "old.txt") == b"old"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+from rossum_agent.tools.core import AgentRunContext, set_run_context
 from rossum_agent.tools.dynamic_tools import (
     DISCOVERY_TOOL_NAME,
     CatalogData,
@@ -13,6 +14,7 @@ from rossum_agent.tools.dynamic_tools import (
     _filter_mcp_tools_by_names,
     _load_categories_impl,
     get_dynamic_tools,
+    get_dynamic_tools_state,
     get_global_state,
     get_load_tool_category_definition,
     get_load_tool_definition,
@@ -326,6 +328,34 @@ class TestDynamicToolsState:
         assert len(state.tools) == 1
 
 
+class TestGetDynamicToolsState:
+    """Tests for resolving dynamic tool state from the run context."""
+
+    def test_uses_run_context_state(self) -> None:
+        run_context = AgentRunContext()
+        set_run_context(run_context)
+
+        assert get_dynamic_tools_state() is run_context.dynamic_tools
+        assert get_dynamic_tools() is run_context.dynamic_tools.tools
+
+    def test_falls_back_to_global_state(self) -> None:
+        set_run_context(None)
+
+        assert get_dynamic_tools_state() is get_global_state()
+
+    def test_runs_do_not_share_loaded_tools(self) -> None:
+        first, second = AgentRunContext(), AgentRunContext()
+
+        set_run_context(first)
+        get_dynamic_tools().append({"name": "list_queues"})
+        get_loaded_categories().add("queues")
+        set_run_context(second)
+
+        assert get_dynamic_tools() == []
+        assert get_loaded_categories() == set()
+        assert first.dynamic_tools.loaded_categories == {"queues"}
+
+
 class TestGetGlobalState:
     """Tests for get_global_state function."""
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import subprocess
 import tempfile
@@ -13,11 +14,22 @@ from rossum_agent.redis_storage import (
     ChatData,
     ChatMetadata,
     RedisStorage,
+    build_chat_summary,
+    build_file_entry,
+    encode_chat_summary,
     extract_text_from_content,
     get_commit_sha,
+    get_file_blob_key,
+    parse_chat_key,
 )
 
 
+def _summary_fields(chat_id: str, messages: list[dict], metadata: ChatMetadata | None = None) -> dict[bytes, bytes]:
+    """Build chat summary hash fields as returned by HGETALL."""
+    summary = build_chat_summary(chat_id, ChatData(messages=messages, metadata=metadata or ChatMetadata()))
+    return {name.encode(): value.encode() for name, value in encode_chat_summary(summary).items()}
+
+
 class TestExtractTextFromContent:
     """Test extract_text_from_content function."""
 
@@ -160,11 +172,22 @@ class TestChatMetadata:
             "commit_sha": "abc123",
             "total_input_tokens": 100,
             "total_output_tokens": 50,
+            "total_cache_creation_input_tokens": 0,
+            "total_cache_read_input_tokens": 0,
             "total_tool_calls": 5,
             "total_steps": 3,
             "mcp_mode": "read-only",
         }
 
+    def test_cache_token_round_trip(self):
+        """Test prompt cache token counters survive serialization."""
+        metadata = ChatMetadata(total_cache_creation_input_tokens=1200, total_cache_read_input_tokens=8000)
+
+        restored = ChatMetadata.from_dict(metadata.to_dict())
+
+        assert restored.total_cache_creation_input_tokens == 1200
+        assert restored.total_cache_read_input_tokens == 8000
+
     def test_from_dict(self):
         """Test from_dict class method."""
         data = {
@@ -412,7 +435,7 @@ class TestRedisStorage:
         """Test loading chat with output_dir triggers file restoration."""
         mock_client = MagicMock()
         mock_client.get.return_value = b'{"messages": [{"role": "user", "content": "Hello"}], "output_dir": "/original/path", "metadata": {"commit_sha": "abc123"}}'
-        mock_client.keys.return_value = []
+        mock_client.hgetall.return_value = {}
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -422,7 +445,7 @@ class TestRedisStorage:
         assert len(chat_data.messages) == 1
         assert chat_data.output_dir == "/original/path"
         assert chat_data.metadata.commit_sha == "abc123"
-        mock_client.keys.assert_called_once_with(b"file:chat_123:*")
+        mock_client.hgetall.assert_called_once_with("file_index:chat_123")
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_load_chat_not_found(self, mock_redis):
@@ -590,13 +613,12 @@ class TestRedisStorage:
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_list_all_chats_success(self, mock_redis):
-        """Test listing all chats."""
+        """Test listing all chats from the chat index."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [b"chat:test_20240115120000"]
-        mock_client.get.return_value = (
-            b'{"messages": [{"role": "user", "content": "Hello"}], '
-            b'"output_dir": null, "metadata": {"commit_sha": "abc123"}}'
-        )
+        mock_client.pipeline.return_value.execute.side_effect = [
+            [1, [b"test_20240115120000"]],
+            [_summary_fields("test_20240115120000", [{"role": "user", "content": "Hello"}], ChatMetadata("abc123"))],
+        ]
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -606,28 +628,46 @@ class TestRedisStorage:
         assert chats[0]["chat_id"] == "test_20240115120000"
         assert chats[0]["message_count"] == 1
         assert chats[0]["commit_sha"] == "abc123"
+        mock_client.keys.assert_not_called()
 
     @patch("rossum_agent.redis_storage.redis.Redis")
-    def test_list_all_chats_with_user_id(self, mock_redis):
-        """Test listing all chats with user_id."""
+    def test_list_chats_reads_requested_page(self, mock_redis):
+        """Test that only the requested page of the user's index is read."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [b"user:user123:chat:test_20240115120000"]
-        mock_client.get.return_value = (
-            b'{"messages": [{"role": "user", "content": "Hello user"}], "output_dir": null, "metadata": {}}'
-        )
+        pipe = mock_client.pipeline.return_value
+        pipe.execute.side_effect = [[7, [b"chat_b"]], [_summary_fields("chat_b", [])]]
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
-        chats = storage.list_all_chats(user_id="user123")
+        chats, total = storage.list_chats(user_id="user123", limit=1, offset=2)
 
-        assert len(chats) == 1
-        mock_client.keys.assert_called_once_with(b"user:user123:chat:*")
+        assert [chat["chat_id"] for chat in chats] == ["chat_b"]
+        assert total == 7
+        pipe.zrevrange.assert_called_once_with("chat_index:user:user123", 2, 2)
+        pipe.hgetall.assert_called_once_with("chat_summary:user:user123:chat_b")
+
+    @patch("rossum_agent.redis_storage.redis.Redis")
+    def test_list_chats_prunes_expired_summaries(self, mock_redis):
+        """Test that index entries whose summary expired are skipped and removed."""
+        mock_client = MagicMock()
+        mock_client.pipeline.return_value.execute.side_effect = [
+            [2, [b"chat_a", b"chat_b"]],
+            [{}, _summary_fields("chat_b", [])],
+        ]
+        mock_redis.return_value = mock_client
+
+        storage = RedisStorage()
+        chats, total = storage.list_chats()
+
+        assert [chat["chat_id"] for chat in chats] == ["chat_b"]
+        assert total == 1
+        mock_client.zrem.assert_called_once_with("chat_index:shared", b"chat_a")
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_list_all_chats_empty(self, mock_redis):
         """Test listing chats when none exist."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = []
+        mock_client.pipeline.return_value.execute.return_value = [0, []]
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -639,7 +679,7 @@ class TestRedisStorage:
     def test_list_all_chats_failure(self, mock_redis):
         """Test list chats failure handling."""
         mock_client = MagicMock()
-        mock_client.keys.side_effect = Exception("Connection error")
+        mock_client.pipeline.return_value.execute.side_effect = Exception("Connection error")
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -648,36 +688,71 @@ class TestRedisStorage:
         assert chats == []
 
     @patch("rossum_agent.redis_storage.redis.Redis")
-    def test_list_all_chats_with_multimodal_content(self, mock_redis):
-        """Test listing chats with multimodal content."""
+    def test_save_chat_updates_chat_index(self, mock_redis):
+        """Test that saving a chat refreshes its summary hash and index entry."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [b"chat:test_20240115120000"]
-        mock_client.get.return_value = (
-            b'{"messages": [{"role": "user", "content": [{"type": "text", "text": "Hello multimodal"}]}], '
-            b'"output_dir": null, "metadata": {}}'
-        )
+        pipe = mock_client.pipeline.return_value
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
-        chats = storage.list_all_chats()
+        storage.save_chat("user123", "chat_20240115120000_abc", [{"role": "user", "content": "Hi"}])
 
-        assert len(chats) == 1
-        assert chats[0]["preview"] == "Hello multimodal"
+        (summary_key,) = pipe.hset.call_args[0]
+        assert summary_key == "chat_summary:user:user123:chat_20240115120000_abc"
+        assert json.loads(pipe.hset.call_args[1]["mapping"]["preview"]) == "Hi"
+        pipe.zadd.assert_called_once()
+        assert pipe.zadd.call_args[0][0] == "chat_index:user:user123"
+        pipe.execute.assert_called_once()
 
     @patch("rossum_agent.redis_storage.redis.Redis")
-    def test_list_all_chats_empty_messages(self, mock_redis):
-        """Test listing chats with empty messages."""
+    def test_delete_chat_removes_index_entry(self, mock_redis):
+        """Test that deleting a chat removes its summary hash and index entry."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [b"chat:test_20240115120000"]
-        mock_client.get.return_value = b'{"messages": [], "output_dir": null, "metadata": {}}'
+        pipe = mock_client.pipeline.return_value
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
-        chats = storage.list_all_chats()
+        storage.delete_chat(None, "chat_123")
 
-        assert len(chats) == 1
-        assert chats[0]["message_count"] == 0
-        assert chats[0]["preview"] is None
+        pipe.delete.assert_called_once_with("chat_summary:shared:chat_123")
+        pipe.zrem.assert_called_once_with("chat_index:shared", "chat_123")
+
+    @patch("rossum_agent.redis_storage.redis.Redis")
+    def test_ensure_chat_index_builds_once(self, mock_redis):
+        """Test that existing chats are indexed when the index version is missing."""
+        mock_client = MagicMock()
+        mock_client.get.return_value = None
+        mock_client.scan_iter.side_effect = [[b"chat:chat_20240115120000_a"], [b"user:u1:chat:chat_20240116120000_b"]]
+        mock_client.mget.return_value = [
+            b'{"messages": [], "output_dir": null, "metadata": {}}',
+            b'{"messages": [], "output_dir": null, "metadata": {}}',
+        ]
+        pipe = mock_client.pipeline.return_value
+        mock_redis.return_value = mock_client
+
+        storage = RedisStorage()
+        indexed = storage.ensure_chat_index()
+
+        assert indexed == 2
+        assert [call[0][0] for call in pipe.zadd.call_args_list] == ["chat_index:shared", "chat_index:user:u1"]
+        mock_client.set.assert_called_once_with("chat_index:version", b"1")
+
+    @patch("rossum_agent.redis_storage.redis.Redis")
+    def test_ensure_chat_index_skips_when_built(self, mock_redis):
+        """Test that the index is not rebuilt once its version is recorded."""
+        mock_client = MagicMock()
+        mock_client.get.return_value = b"1"
+        mock_redis.return_value = mock_client
+
+        storage = RedisStorage()
+
+        assert storage.ensure_chat_index() == 0
+        mock_client.scan_iter.assert_not_called()
+
+    def test_parse_chat_key(self):
+        """Test splitting chat keys back into user and chat IDs."""
+        assert parse_chat_key("chat:chat_1") == (None, "chat_1")
+        assert parse_chat_key("user:u1:chat:chat_1") == ("u1", "chat_1")
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_close_connection(self, mock_redis):
@@ -700,22 +775,48 @@ class TestRedisStorage:
         mock_redis.return_value.close.assert_not_called()
 
 
+def _file_index(**files: bytes) -> dict[bytes, bytes]:
+    """Build a file index hash as returned by HGETALL for the given file contents."""
+    return {name.encode(): json.dumps(build_file_entry(name, content)).encode() for name, content in files.items()}
+
+
+def _blob_key(chat_id: str, content: bytes) -> str:
+    return get_file_blob_key(chat_id, hashlib.sha256(content).hexdigest())
+
+
 class TestRedisStorageFileOperations:
     """Test RedisStorage file operations."""
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_save_file_with_content(self, mock_redis):
-        """Test saving file with provided content."""
+        """Test saving file stores raw bytes by content hash and indexes the file."""
         mock_client = MagicMock()
+        mock_client.hgetall.return_value = {}
+        pipe = mock_client.pipeline.return_value
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
         result = storage.save_file("chat_123", "test.txt", content=b"Hello World")
 
         assert result is True
-        mock_client.setex.assert_called_once()
-        call_args = mock_client.setex.call_args[0]
-        assert call_args[0] == "file:chat_123:test.txt"
+        pipe.set.assert_called_once_with(_blob_key("chat_123", b"Hello World"), b"Hello World", ex=storage.ttl)
+        index_key, mapping = pipe.hset.call_args[0][0], pipe.hset.call_args[1]["mapping"]
+        assert index_key == "file_index:chat_123"
+        assert json.loads(mapping["test.txt"])["size"] == 11
+
+    @patch("rossum_agent.redis_storage.redis.Redis")
+    def test_save_file_skips_known_content(self, mock_redis):
+        """Test that content already stored for the chat is not uploaded again."""
+        mock_client = MagicMock()
+        mock_client.hgetall.return_value = _file_index(**{"a.txt": b"same"})
+        pipe = mock_client.pipeline.return_value
+        mock_redis.return_value = mock_client
+
+        storage = RedisStorage()
+        assert storage.save_file("chat_123", "b.txt", content=b"same") is True
+
+        pipe.set.assert_not_called()
+        pipe.expire.assert_any_call(_blob_key("chat_123", b"same"), storage.ttl)
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_save_file_from_path(self, mock_redis, tmp_path):
@@ -760,7 +861,7 @@ class TestRedisStorageFileOperations:
     def test_save_file_failure(self, mock_redis):
         """Test save file failure handling."""
         mock_client = MagicMock()
-        mock_client.setex.side_effect = Exception("Redis error")
+        mock_client.pipeline.return_value.execute.side_effect = Exception("Redis error")
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -772,26 +873,21 @@ class TestRedisStorageFileOperations:
     def test_load_file_success(self, mock_redis):
         """Test loading file successfully."""
         mock_client = MagicMock()
-        content = b"Hello World"
-        metadata = {
-            "filename": "test.txt",
-            "size": len(content),
-            "timestamp": "2024-01-15T12:00:00",
-            "content": base64.b64encode(content).decode("utf-8"),
-        }
-        mock_client.get.return_value = json.dumps(metadata).encode("utf-8")
+        mock_client.hget.return_value = _file_index(**{"test.txt": b"Hello World"})[b"test.txt"]
+        mock_client.get.return_value = b"Hello World"
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
         result = storage.load_file("chat_123", "test.txt")
 
         assert result == b"Hello World"
+        mock_client.get.assert_called_once_with(_blob_key("chat_123", b"Hello World"))
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_load_file_not_found(self, mock_redis):
         """Test loading non-existent file."""
         mock_client = MagicMock()
-        mock_client.get.return_value = None
+        mock_client.hget.return_value = None
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -803,7 +899,7 @@ class TestRedisStorageFileOperations:
     def test_load_file_failure(self, mock_redis):
         """Test load file failure handling."""
         mock_client = MagicMock()
-        mock_client.get.side_effect = Exception("Redis error")
+        mock_client.hget.side_effect = Exception("Redis error")
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -813,16 +909,9 @@ class TestRedisStorageFileOperations:
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_list_files_success(self, mock_redis):
-        """Test listing files."""
+        """Test listing files reads only the file index."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [
-            b"file:chat_123:test1.txt",
-            b"file:chat_123:test2.txt",
-        ]
-        mock_client.get.side_effect = [
-            b'{"filename": "test1.txt", "size": 100, "timestamp": "2024-01-15T12:00:00"}',
-            b'{"filename": "test2.txt", "size": 200, "timestamp": "2024-01-15T12:01:00"}',
-        ]
+        mock_client.hgetall.return_value = _file_index(**{"test1.txt": b"a" * 100, "test2.txt": b"b" * 200})
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -832,12 +921,15 @@ class TestRedisStorageFileOperations:
         assert files[0]["filename"] == "test1.txt"
         assert files[0]["size"] == 100
         assert files[1]["filename"] == "test2.txt"
+        mock_client.hgetall.assert_called_once_with("file_index:chat_123")
+        mock_client.keys.assert_not_called()
+        mock_client.get.assert_not_called()
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_list_files_empty(self, mock_redis):
         """Test listing files when none exist."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = []
+        mock_client.hgetall.return_value = {}
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -849,7 +941,7 @@ class TestRedisStorageFileOperations:
     def test_list_files_failure(self, mock_redis):
         """Test list files failure handling."""
         mock_client = MagicMock()
-        mock_client.keys.side_effect = Exception("Redis error")
+        mock_client.hgetall.side_effect = Exception("Redis error")
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -859,22 +951,37 @@ class TestRedisStorageFileOperations:
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_delete_file_success(self, mock_redis):
-        """Test deleting file successfully."""
+        """Test deleting file removes its index entry and unshared content."""
         mock_client = MagicMock()
-        mock_client.delete.return_value = 1
+        mock_client.hgetall.return_value = _file_index(**{"test.txt": b"x"})
+        pipe = mock_client.pipeline.return_value
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
         result = storage.delete_file("chat_123", "test.txt")
 
         assert result is True
-        mock_client.delete.assert_called_once_with("file:chat_123:test.txt")
+        pipe.hdel.assert_called_once_with("file_index:chat_123", "test.txt")
+        pipe.delete.assert_called_once_with(_blob_key("chat_123", b"x"))
+
+    @patch("rossum_agent.redis_storage.redis.Redis")
+    def test_delete_file_keeps_shared_content(self, mock_redis):
+        """Test deleting a file keeps content still referenced by another file."""
+        mock_client = MagicMock()
+        mock_client.hgetall.return_value = _file_index(**{"a.txt": b"x", "b.txt": b"x"})
+        pipe = mock_client.pipeline.return_value
+        mock_redis.return_value = mock_client
+
+        storage = RedisStorage()
+
+        assert storage.delete_file("chat_123", "a.txt") is True
+        pipe.delete.assert_not_called()
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_delete_file_not_found(self, mock_redis):
         """Test deleting non-existent file."""
         mock_client = MagicMock()
-        mock_client.delete.return_value = 0
+        mock_client.hgetall.return_value = {}
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -886,7 +993,7 @@ class TestRedisStorageFileOperations:
     def test_delete_file_failure(self, mock_redis):
         """Test delete file failure handling."""
         mock_client = MagicMock()
-        mock_client.delete.side_effect = Exception("Redis error")
+        mock_client.hgetall.side_effect = Exception("Redis error")
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -896,25 +1003,23 @@ class TestRedisStorageFileOperations:
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_delete_all_files_success(self, mock_redis):
-        """Test deleting all files."""
+        """Test deleting all files removes the index and all content in one call."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [
-            b"file:chat_123:test1.txt",
-            b"file:chat_123:test2.txt",
-        ]
-        mock_client.delete.return_value = 2
+        mock_client.hgetall.return_value = _file_index(**{"test1.txt": b"1", "test2.txt": b"2"})
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
         count = storage.delete_all_files("chat_123")
 
         assert count == 2
+        deleted_keys = mock_client.delete.call_args[0]
+        assert set(deleted_keys) == {"file_index:chat_123", _blob_key("chat_123", b"1"), _blob_key("chat_123", b"2")}
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_delete_all_files_empty(self, mock_redis):
         """Test deleting all files when none exist."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = []
+        mock_client.hgetall.return_value = {}
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -926,7 +1031,7 @@ class TestRedisStorageFileOperations:
     def test_delete_all_files_failure(self, mock_redis):
         """Test delete all files failure handling."""
         mock_client = MagicMock()
-        mock_client.keys.side_effect = Exception("Redis error")
+        mock_client.hgetall.side_effect = Exception("Redis error")
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -936,8 +1041,10 @@ class TestRedisStorageFileOperations:
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_save_all_files_success(self, mock_redis, tmp_path):
-        """Test saving all files from directory."""
+        """Test saving all files from directory in one pipeline."""
         mock_client = MagicMock()
+        mock_client.hgetall.return_value = {}
+        pipe = mock_client.pipeline.return_value
         mock_redis.return_value = mock_client
 
         (tmp_path / "file1.txt").write_bytes(b"content1")
@@ -948,7 +1055,41 @@ class TestRedisStorageFileOperations:
         count = storage.save_all_files("chat_123", tmp_path)
 
         assert count == 2
-        assert mock_client.setex.call_count == 2
+        assert pipe.set.call_count == 2
+        pipe.execute.assert_called_once()
+
+    @patch("rossum_agent.redis_storage.redis.Redis")
+    def test_save_all_files_skips_unchanged(self, mock_redis, tmp_path):
+        """Test that files matching their stored size and mtime are neither read nor uploaded."""
+        mock_client = MagicMock()
+        unchanged = tmp_path / "unchanged.txt"
+        unchanged.write_bytes(b"same")
+        entry = build_file_entry("unchanged.txt", b"same", unchanged.stat().st_mtime_ns)
+        mock_client.hgetall.return_value = {b"unchanged.txt": json.dumps(entry).encode()}
+        pipe = mock_client.pipeline.return_value
+        mock_redis.return_value = mock_client
+        (tmp_path / "new.txt").write_bytes(b"new")
+
+        storage = RedisStorage()
+        count = storage.save_all_files("chat_123", tmp_path)
+
+        assert count == 1
+        pipe.set.assert_called_once_with(_blob_key("chat_123", b"new"), b"new", ex=storage.ttl)
+        assert set(pipe.hset.call_args[1]["mapping"]) == {"new.txt"}
+
+    @patch("rossum_agent.redis_storage.redis.Redis")
+    def test_save_all_files_replaces_modified_content(self, mock_redis, tmp_path):
+        """Test that content of a modified file no longer referenced is deleted."""
+        mock_client = MagicMock()
+        mock_client.hgetall.return_value = _file_index(**{"report.txt": b"old"})
+        pipe = mock_client.pipeline.return_value
+        mock_redis.return_value = mock_client
+        (tmp_path / "report.txt").write_bytes(b"new content")
+
+        storage = RedisStorage()
+
+        assert storage.save_all_files("chat_123", tmp_path) == 1
+        pipe.delete.assert_called_once_with(_blob_key("chat_123", b"old"))
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_save_all_files_nonexistent_dir(self, mock_redis):
@@ -974,9 +1115,9 @@ class TestRedisStorageFileOperations:
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_save_all_files_failure(self, mock_redis, tmp_path):
-        """Test save all files with partial failure."""
+        """Test save all files failure handling."""
         mock_client = MagicMock()
-        mock_client.setex.side_effect = Exception("Redis error")
+        mock_client.pipeline.return_value.execute.side_effect = Exception("Redis error")
         mock_redis.return_value = mock_client
 
         (tmp_path / "file1.txt").write_bytes(b"content1")
@@ -988,20 +1129,10 @@ class TestRedisStorageFileOperations:
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_load_all_files_success(self, mock_redis, tmp_path):
-        """Test loading all files to directory."""
+        """Test loading all files to directory with a single MGET."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [b"file:chat_123:test.txt"]
-        content = b"Hello World"
-        metadata = {
-            "filename": "test.txt",
-            "size": len(content),
-            "timestamp": "2024-01-15T12:00:00",
-            "content": base64.b64encode(content).decode("utf-8"),
-        }
-        mock_client.get.side_effect = [
-            b'{"filename": "test.txt", "size": 11, "timestamp": "2024-01-15T12:00:00"}',
-            json.dumps(metadata).encode("utf-8"),
-        ]
+        mock_client.hgetall.return_value = _file_index(**{"test.txt": b"Hello World"})
+        mock_client.mget.return_value = [b"Hello World"]
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -1009,12 +1140,13 @@ class TestRedisStorageFileOperations:
 
         assert count == 1
         assert (tmp_path / "test.txt").read_bytes() == b"Hello World"
+        mock_client.mget.assert_called_once_with([_blob_key("chat_123", b"Hello World")])
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_load_all_files_empty(self, mock_redis, tmp_path):
         """Test loading files when none exist."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = []
+        mock_client.hgetall.return_value = {}
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -1026,7 +1158,7 @@ class TestRedisStorageFileOperations:
     def test_load_all_files_failure(self, mock_redis, tmp_path):
         """Test load all files failure handling."""
         mock_client = MagicMock()
-        mock_client.keys.side_effect = Exception("Redis error")
+        mock_client.hgetall.side_effect = Exception("Redis error")
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -1038,7 +1170,7 @@ class TestRedisStorageFileOperations:
     def test_load_all_files_creates_directory(self, mock_redis, tmp_path):
         """Test that load_all_files creates output directory."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = []
+        mock_client.hgetall.return_value = {}
         mock_redis.return_value = mock_client
 
         new_dir = tmp_path / "new_dir" / "nested"
@@ -1051,11 +1183,8 @@ class TestRedisStorageFileOperations:
     def test_load_all_files_with_missing_content(self, mock_redis, tmp_path):
         """Test loading files when file content is missing."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [b"file:chat_123:test.txt"]
-        mock_client.get.side_effect = [
-            b'{"filename": "test.txt", "size": 11, "timestamp": "2024-01-15T12:00:00"}',
-            None,
-        ]
+        mock_client.hgetall.return_value = _file_index(**{"test.txt": b"Hello World"})
+        mock_client.mget.return_value = [None]
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -1065,7 +1194,7 @@ class TestRedisStorageFileOperations:
 
     @patch("rossum_agent.redis_storage.redis.Redis")
     def test_save_all_files_exception_during_iteration(self, mock_redis, tmp_path):
-        """Test save_all_files handles exception during file iteration."""
+        """Test save_all_files handles exception while reading the output directory."""
         mock_client = MagicMock()
         mock_redis.return_value = mock_client
 
@@ -1073,8 +1202,7 @@ class TestRedisStorageFileOperations:
 
         storage = RedisStorage()
 
-        with patch.object(storage, "save_file") as mock_save:
-            mock_save.side_effect = Exception("Unexpected error during iteration")
+        with patch.object(Path, "read_bytes", side_effect=OSError("Unexpected error during iteration")):
             count = storage.save_all_files("chat_123", tmp_path)
 
         assert count == 0
@@ -1083,18 +1211,8 @@ class TestRedisStorageFileOperations:
     def test_load_all_files_exception_during_write(self, mock_redis, tmp_path):
         """Test load_all_files handles exception during file write."""
         mock_client = MagicMock()
-        mock_client.keys.return_value = [b"file:chat_123:test.txt"]
-        content = b"Hello World"
-        metadata = {
-            "filename": "test.txt",
-            "size": len(content),
-            "timestamp": "2024-01-15T12:00:00",
-            "content": base64.b64encode(content).decode("utf-8"),
-        }
-        mock_client.get.side_effect = [
-            b'{"filename": "test.txt", "size": 11, "timestamp": "2024-01-15T12:00:00"}',
-            json.dumps(metadata).encode("utf-8"),
-        ]
+        mock_client.hgetall.return_value = _file_index(**{"test.txt": b"Hello World"})
+        mock_client.mget.return_value = [b"Hello World"]
         mock_redis.return_value = mock_client
 
         storage = RedisStorage()
@@ -1103,3 +1221,21 @@ class TestRedisStorageFileOperations:
             count = storage.load_all_files("chat_123", tmp_path)
 
         assert count == 0
+
+    @patch("rossum_agent.redis_storage.redis.Redis")
+    def test_ensure_file_index_migrates_legacy_files(self, mock_redis):
+        """Test that legacy base64 JSON files are moved into the file index and removed."""
+        mock_client = MagicMock()
+        mock_client.get.return_value = None
+        mock_client.scan_iter.return_value = [b"file:chat_123:old.txt"]
+        payload = {"filename": "old.txt", "size": 3, "timestamp": "", "content": base64.b64encode(b"old").decode()}
+        mock_client.mget.return_value = [json.dumps(payload).encode()]
+        pipe = mock_client.pipeline.return_value
+        mock_redis.return_value = mock_client
+
+        storage = RedisStorage()
+
+        assert storage.ensure_file_index() == 1
+        pipe.set.assert_called_once_with(_blob_key("chat_123", b"old"), b"old", ex=storage.ttl)
+        pipe.delete.assert_called_once_with(b"file:chat_123:old.txt")
+        mock_client.set.assert_called_once_with("file_index:version", b"1")
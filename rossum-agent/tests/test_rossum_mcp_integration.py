@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastmcp.exceptions import ToolError
 from rossum_agent.rossum_mcp_integration import (
     MCPConnection,
+    MCPConnectionPool,
     connect_mcp_server,
     create_mcp_transport,
     mcp_tools_to_anthropic_format,
@@ -207,6 +210,36 @@ class TestMCPConnection:
         # Should return structured_content, not data
         assert result == {"id": 1, "config": {"code": "print(1)"}}
 
+    @pytest.mark.asyncio
+    async def test_call_tool_reports_rejected_token(self):
+        """Test that a tool failing with a Rossum 401 triggers on_unauthorized and still raises."""
+        mock_client = AsyncMock()
+        mock_client.call_tool.side_effect = ToolError(
+            "[GET] https://api.rossum.ai/v1/queues/1 - HTTP 401 - Invalid token."
+        )
+        on_unauthorized = MagicMock()
+        connection = MCPConnection(client=mock_client, on_unauthorized=on_unauthorized)
+
+        with pytest.raises(ToolError):
+            await connection.call_tool("get_queue", {"queue_id": 1})
+
+        on_unauthorized.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_call_tool_ignores_other_tool_errors(self):
+        """Test that on_unauthorized is not called for unrelated tool failures."""
+        mock_client = AsyncMock()
+        mock_client.call_tool.side_effect = ToolError(
+            "[GET] https://api.rossum.ai/v1/queues/1 - HTTP 404 - Not found."
+        )
+        on_unauthorized = MagicMock()
+        connection = MCPConnection(client=mock_client, on_unauthorized=on_unauthorized)
+
+        with pytest.raises(ToolError):
+            await connection.call_tool("get_queue", {"queue_id": 1})
+
+        on_unauthorized.assert_not_called()
+
 
 class TestConnectMCPServer:
     """Test connect_mcp_server context manager."""
@@ -259,3 +292,270 @@ class TestConnectMCPServer:
                 mcp_mode="read-write",
             )
             mock_client_class.assert_called_once_with(mock_transport)
+
+
+def _make_pool_client() -> AsyncMock:
+    client = AsyncMock()
+    client.is_connected = MagicMock(return_value=True)
+    client.ping.return_value = True
+    return client
+
+
+class TestMCPConnectionPool:
+    """Test MCPConnectionPool leasing, eviction and health checks."""
+
+    @pytest.mark.asyncio
+    async def test_lease_reuses_connection_for_same_credentials(self):
+        """Test that a released connection is reused for the same key."""
+        clients = [_make_pool_client(), _make_pool_client()]
+        pool = MCPConnectionPool(max_size=2)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", side_effect=clients) as mock_client_class,
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai") as first:
+                pass
+            async with pool.lease("token", "https://api.rossum.ai/") as second:
+                pass
+
+        assert first is second
+        mock_client_class.assert_called_once()
+        clients[0].__aenter__.assert_awaited_once()
+        assert pool.stats.created == 1
+        assert pool.stats.reused == 1
+
+    @pytest.mark.asyncio
+    async def test_lease_separates_modes_and_tokens(self):
+        """Test that different credentials or modes never share a connection."""
+        pool = MCPConnectionPool(max_size=4)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", side_effect=lambda _: _make_pool_client()),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai") as read_only:
+                pass
+            async with pool.lease("token", "https://api.rossum.ai", mcp_mode="read-write") as read_write:
+                pass
+            async with pool.lease("other", "https://api.rossum.ai") as other_token:
+                pass
+
+        assert len({id(read_only), id(read_write), id(other_token)}) == 3
+        assert pool.stats.size == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_get_distinct_connections(self):
+        """Test that a connection is leased exclusively."""
+        pool = MCPConnectionPool(max_size=2)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", side_effect=lambda _: _make_pool_client()),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai") as first:
+                async with pool.lease("token", "https://api.rossum.ai") as second:
+                    assert first is not second
+                    assert pool.stats.in_use == 2
+
+    @pytest.mark.asyncio
+    async def test_max_size_evicts_least_recently_used_idle_connection(self):
+        """Test that the pool closes the LRU idle connection when full."""
+        clients = [_make_pool_client(), _make_pool_client()]
+        pool = MCPConnectionPool(max_size=1)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", side_effect=clients),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            async with pool.lease("token-a", "https://api.rossum.ai"):
+                pass
+            async with pool.lease("token-b", "https://api.rossum.ai"):
+                pass
+
+        clients[0].__aexit__.assert_awaited_once()
+        assert pool.stats.size == 1
+        assert pool.stats.evicted == 1
+
+    @pytest.mark.asyncio
+    async def test_max_size_waits_for_release_when_all_leased(self):
+        """Test that a lease waits for a slot when every connection is in use."""
+        pool = MCPConnectionPool(max_size=1)
+        order: list[str] = []
+
+        async def hold() -> None:
+            async with pool.lease("token", "https://api.rossum.ai"):
+                order.append("first-acquired")
+                await asyncio.sleep(0.01)
+                order.append("first-released")
+
+        async def wait() -> None:
+            await asyncio.sleep(0)
+            async with pool.lease("token", "https://api.rossum.ai"):
+                order.append("second-acquired")
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", side_effect=lambda _: _make_pool_client()),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            await asyncio.gather(hold(), wait())
+
+        assert order == ["first-acquired", "first-released", "second-acquired"]
+        assert pool.stats.created == 1
+
+    @pytest.mark.asyncio
+    async def test_evict_idle_closes_expired_connections(self):
+        """Test that idle connections past idle_timeout are closed."""
+        client = _make_pool_client()
+        pool = MCPConnectionPool(max_size=2, idle_timeout=0.0)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", return_value=client),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai"):
+                pass
+            evicted = await pool.evict_idle()
+
+        assert evicted == 1
+        client.__aexit__.assert_awaited_once()
+        assert pool.stats.size == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_health_check_replaces_connection(self):
+        """Test that an unhealthy idle connection is discarded and replaced."""
+        stale, fresh = _make_pool_client(), _make_pool_client()
+        stale.ping.side_effect = RuntimeError("broken pipe")
+        pool = MCPConnectionPool(max_size=2, health_check_interval=0.0)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", side_effect=[stale, fresh]),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai"):
+                pass
+            async with pool.lease("token", "https://api.rossum.ai") as connection:
+                assert connection.client is fresh
+
+        stale.__aexit__.assert_awaited_once()
+        assert pool.stats.failed_health_checks == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_discarded_when_lease_body_raises(self):
+        """Test that a connection is not returned to the pool after an error."""
+        client = _make_pool_client()
+        pool = MCPConnectionPool(max_size=2)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", return_value=client),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+            pytest.raises(ValueError, match="boom"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai"):
+                raise ValueError("boom")
+
+        client.__aexit__.assert_awaited_once()
+        assert pool.stats.size == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_startup_frees_reserved_slot(self):
+        """Test that a failed server start does not leak pool capacity."""
+        broken = _make_pool_client()
+        broken.__aenter__.side_effect = RuntimeError("spawn failed")
+        pool = MCPConnectionPool(max_size=1)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", side_effect=[broken, _make_pool_client()]),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            with pytest.raises(RuntimeError, match="spawn failed"):
+                async with pool.lease("token", "https://api.rossum.ai"):
+                    pass
+            async with pool.lease("token", "https://api.rossum.ai"):
+                pass
+
+        assert pool.stats.created == 1
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_idle_connections(self):
+        """Test that close() terminates idle server processes."""
+        client = _make_pool_client()
+        pool = MCPConnectionPool(max_size=2)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", return_value=client),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai"):
+                pass
+            await pool.close()
+
+        client.__aexit__.assert_awaited_once()
+        assert pool.stats.size == 0
+
+    @pytest.mark.asyncio
+    async def test_close_discards_leased_connections_on_release(self):
+        """Test that connections leased during close() are closed when released, not pooled."""
+        client = _make_pool_client()
+        pool = MCPConnectionPool(max_size=2)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", return_value=client),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai"):
+                await pool.close()
+                client.__aexit__.assert_not_awaited()
+
+        client.__aexit__.assert_awaited_once()
+        assert pool.stats.size == 0
+
+    @pytest.mark.asyncio
+    async def test_lease_after_close_raises(self):
+        """Test that a closed pool grants no new leases."""
+        pool = MCPConnectionPool(max_size=2)
+        await pool.close()
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client") as mock_client_class,
+            pytest.raises(RuntimeError, match="closed"),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai"):
+                pass
+
+        mock_client_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reaper_evicts_idle_connections_without_traffic(self):
+        """Test that idle connections are closed in the background when no lease arrives."""
+        client = _make_pool_client()
+        pool = MCPConnectionPool(max_size=2, idle_timeout=0.0)
+        sleeps: list[float] = []
+
+        async def fast_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        with (
+            patch("rossum_agent.rossum_mcp_integration.Client", return_value=client),
+            patch("rossum_agent.rossum_mcp_integration.create_mcp_transport"),
+            patch("rossum_agent.rossum_mcp_integration.asyncio.sleep", side_effect=fast_sleep),
+        ):
+            async with pool.lease("token", "https://api.rossum.ai"):
+                pass
+            reaper = pool._reaper
+            assert reaper is not None
+            await reaper
+
+        client.__aexit__.assert_awaited_once()
+        assert pool.stats.size == 0
+        assert sleeps == [1.0]
+
+    def test_defaults_from_environment(self, monkeypatch):
+        """Test that pool limits can be configured via environment variables."""
+        monkeypatch.setenv("ROSSUM_MCP_POOL_MAX_SIZE", "3")
+        monkeypatch.setenv("ROSSUM_MCP_POOL_IDLE_TIMEOUT", "12.5")
+
+        pool = MCPConnectionPool()
+
+        assert pool.max_size == 3
+        assert pool.idle_timeout == 12.5
@@ -385,6 +385,28 @@ class TestAddFieldsToContent:
         assert tuple_children[0]["id"] == "new_col"
         assert "new_col" in added
 
+    def test_add_field_to_table_with_tuple_without_id(self):
+        """Test adding column to a table whose tuple has no ID."""
+        content = [
+            {
+                "id": "items_section",
+                "category": "section",
+                "children": [
+                    {"id": "line_items", "category": "multivalue", "children": {"category": "tuple", "children": []}}
+                ],
+            }
+        ]
+        fields_to_add = [
+            {"id": "col1", "label": "Column 1", "parent_section": "items_section", "table_id": "line_items"},
+            {"id": "col2", "label": "Column 2", "parent_section": "items_section", "table_id": "line_items"},
+        ]
+
+        modified, added = _add_fields_to_content(content, fields_to_add)
+
+        tuple_children = modified[0]["children"][0]["children"]["children"]
+        assert [child["id"] for child in tuple_children] == ["col1", "col2"]
+        assert added == ["col1", "col2"]
+
     def test_add_multiple_fields(self):
         """Test adding multiple fields."""
         content = [{"id": "header", "category": "section", "children": []}]
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import threading
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 from rossum_agent.tools.core import (
+    AgentRunContext,
     SubAgentProgress,
     SubAgentText,
     SubAgentTokenUsage,
@@ -16,6 +18,7 @@ from rossum_agent.tools.core import (
     get_mcp_event_loop,
     get_mcp_mode,
     get_output_dir,
+    get_run_context,
     is_read_only_mode,
     report_progress,
     report_text,
@@ -23,6 +26,7 @@ from rossum_agent.tools.core import (
     set_mcp_connection,
     set_output_dir,
     set_progress_callback,
+    set_run_context,
     set_text_callback,
     set_token_callback,
 )
@@ -38,6 +42,7 @@ def _reset_core_state() -> Iterator[None]:
     """Reset core module state between tests to avoid leakage."""
     yield  # type: ignore[misc]
     set_output_dir(None)
+    set_run_context(None)
     set_progress_callback(None)
     set_text_callback(None)
     set_token_callback(None)
@@ -305,6 +310,59 @@ class TestContextVarIsolation:
         assert callback1.call_args[0][0].tool_name == "t1"
 
 
+class TestAgentRunContext:
+    """Tests for the per-run agent context."""
+
+    def test_run_context_output_dir_takes_precedence(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "run"
+        set_output_dir(tmp_path)
+        set_run_context(AgentRunContext(output_dir=run_dir))
+
+        assert get_output_dir() == run_dir
+
+    def test_run_context_without_output_dir_falls_back(self, tmp_path: Path) -> None:
+        set_output_dir(tmp_path)
+        set_run_context(AgentRunContext())
+
+        assert get_output_dir() == tmp_path
+
+    def test_clear_run_context(self) -> None:
+        set_run_context(AgentRunContext())
+        set_run_context(None)
+
+        assert get_run_context() is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_see_own_run_context(self, tmp_path: Path) -> None:
+        """Test that concurrent runs on one event loop never observe each other's context."""
+        seen: dict[str, list[Path]] = {"a": [], "b": []}
+
+        async def run(name: str) -> None:
+            set_run_context(AgentRunContext(output_dir=tmp_path / name))
+            for _ in range(3):
+                await asyncio.sleep(0)
+                seen[name].append(get_output_dir())
+
+        await asyncio.gather(run("a"), run("b"))
+
+        assert seen == {"a": [tmp_path / "a"] * 3, "b": [tmp_path / "b"] * 3}
+        assert get_run_context() is None
+
+    def test_executor_threads_share_run_context_instance(self) -> None:
+        """Test that tools running in a copied context mutate the owning run's state."""
+        run_context = AgentRunContext()
+        set_run_context(run_context)
+
+        ctx = contextvars.copy_context()
+        thread = threading.Thread(
+            target=ctx.run, args=(lambda: get_run_context().dynamic_tools.loaded_categories.add("queues"),)
+        )
+        thread.start()
+        thread.join()
+
+        assert run_context.dynamic_tools.loaded_categories == {"queues"}
+
+
 class TestMCPConnection:
     """Tests for MCP connection functions."""
 
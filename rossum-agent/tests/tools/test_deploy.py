@@ -23,7 +23,8 @@ from rossum_agent.tools.deploy import (
 )
 from rossum_deploy.models import (
     CopyResult,
-    DeployResult,
+    DeployObjectResult,
+    DeployStatus,
     DiffResult,
     DiffStatus,
     ObjectDiff,
@@ -609,15 +610,25 @@ class TestDeployToOrg:
 
     def test_successful_deploy(self, tmp_path: Path):
         """Test successful deploy to org operation."""
-        mock_result = DeployResult(
-            created=[(ObjectType.HOOK, 1, "New Hook")],
-            updated=[(ObjectType.SCHEMA, 2, "Updated Schema")],
-            skipped=[],
-            failed=[],
-        )
-
         mock_workspace = MagicMock()
-        mock_workspace.deploy.return_value = mock_result
+        mock_workspace.iter_deploy.return_value = iter(
+            [
+                DeployObjectResult(
+                    object_type=ObjectType.SCHEMA,
+                    source_id=2,
+                    target_id=20,
+                    name="Updated Schema",
+                    status=DeployStatus.UPDATED,
+                ),
+                DeployObjectResult(
+                    object_type=ObjectType.HOOK,
+                    source_id=3,
+                    name="Unmapped Hook",
+                    status=DeployStatus.SKIPPED,
+                    detail="no target mapping",
+                ),
+            ]
+        )
         mock_workspace.path = tmp_path
 
         with patch("rossum_agent.tools.deploy.create_workspace", return_value=mock_workspace):
@@ -626,25 +637,82 @@ class TestDeployToOrg:
         result = json.loads(result_json)
         assert result["status"] == "success"
         assert result["dry_run"] is False
-        assert result["created_count"] == 1
+        assert result["created_count"] == 0
         assert result["updated_count"] == 1
-        assert result["skipped_count"] == 0
+        assert result["skipped_count"] == 1
         assert result["failed_count"] == 0
-        mock_workspace.deploy.assert_called_once_with(
+        mock_workspace.iter_deploy.assert_called_once_with(
             target_org_id=200,
             target_api_base=None,
             target_token=None,
             dry_run=False,
+            resume=False,
         )
 
-    def test_deploy_dry_run(self, tmp_path: Path):
-        """Test deploy dry run mode."""
-        mock_result = DeployResult(
-            created=[(ObjectType.HOOK, 1, "Would Create Hook")], updated=[], skipped=[], failed=[]
+    def test_deploy_summary_is_ordered_by_type_and_id(self, tmp_path: Path):
+        """Test that the summary does not depend on the order objects completed in."""
+        mock_workspace = MagicMock()
+        mock_workspace.iter_deploy.return_value = iter(
+            [
+                DeployObjectResult(
+                    object_type=ObjectType.HOOK, source_id=5, target_id=50, name="Hook", status=DeployStatus.UPDATED
+                ),
+                DeployObjectResult(
+                    object_type=ObjectType.QUEUE,
+                    source_id=2,
+                    target_id=20,
+                    name="Queue B",
+                    status=DeployStatus.UPDATED,
+                ),
+                DeployObjectResult(
+                    object_type=ObjectType.QUEUE,
+                    source_id=1,
+                    target_id=10,
+                    name="Queue A",
+                    status=DeployStatus.UPDATED,
+                ),
+            ]
         )
+        mock_workspace.path = tmp_path
+
+        with patch("rossum_agent.tools.deploy.create_workspace", return_value=mock_workspace):
+            result_json = deploy_to_org(target_org_id=200, workspace_path=str(tmp_path))
 
+        summary = json.loads(result_json)["summary"]
+        assert summary.index("Queue A") < summary.index("Queue B") < summary.index("Hook")
+
+    def test_deploy_reports_progress_per_object(self, tmp_path: Path):
+        """Test that each deployed object is reported while the deploy runs."""
+        mock_workspace = MagicMock()
+        mock_workspace.iter_deploy.return_value = iter(
+            [
+                DeployObjectResult(
+                    object_type=ObjectType.QUEUE,
+                    source_id=1,
+                    target_id=10,
+                    name="Invoices",
+                    status=DeployStatus.FAILED,
+                    detail="API error",
+                )
+            ]
+        )
+        mock_workspace.path = tmp_path
+
+        with (
+            patch("rossum_agent.tools.deploy.create_workspace", return_value=mock_workspace),
+            patch("rossum_agent.tools.deploy.report_text") as mock_report_text,
+        ):
+            result_json = deploy_to_org(target_org_id=200, workspace_path=str(tmp_path))
+
+        assert json.loads(result_json)["failed_count"] == 1
+        reported = mock_report_text.call_args.args[0]
+        assert reported.tool_name == "deploy_to_org"
+        assert reported.text == "[1] failed: queue Invoices (1) - API error\n"
+
+    def test_deploy_dry_run(self, tmp_path: Path):
+        """Test deploy dry run mode."""
         mock_workspace = MagicMock()
-        mock_workspace.deploy.return_value = mock_result
+        mock_workspace.iter_deploy.return_value = iter([])
         mock_workspace.path = tmp_path
 
         with patch("rossum_agent.tools.deploy.create_workspace", return_value=mock_workspace):
@@ -653,15 +721,25 @@ class TestDeployToOrg:
         result = json.loads(result_json)
         assert result["status"] == "success"
         assert result["dry_run"] is True
-        mock_workspace.deploy.assert_called_once_with(
-            target_org_id=200, target_api_base=None, target_token=None, dry_run=True
+        mock_workspace.iter_deploy.assert_called_once_with(
+            target_org_id=200, target_api_base=None, target_token=None, dry_run=True, resume=False
         )
 
+    def test_deploy_resume(self, tmp_path: Path):
+        """Test that resume is passed through to the workspace."""
+        mock_workspace = MagicMock()
+        mock_workspace.iter_deploy.return_value = iter([])
+        mock_workspace.path = tmp_path
+
+        with patch("rossum_agent.tools.deploy.create_workspace", return_value=mock_workspace):
+            deploy_to_org(target_org_id=200, resume=True, workspace_path=str(tmp_path))
+
+        assert mock_workspace.iter_deploy.call_args.kwargs["resume"] is True
+
     def test_deploy_with_target_credentials(self, tmp_path: Path):
         """Test deploy with custom target credentials."""
-        mock_result = DeployResult(created=[], updated=[], skipped=[], failed=[])
         mock_workspace = MagicMock()
-        mock_workspace.deploy.return_value = mock_result
+        mock_workspace.iter_deploy.return_value = iter([])
         mock_workspace.path = tmp_path
 
         with patch("rossum_agent.tools.deploy.create_workspace", return_value=mock_workspace):
@@ -672,17 +750,18 @@ class TestDeployToOrg:
                 workspace_path=str(tmp_path),
             )
 
-        mock_workspace.deploy.assert_called_once_with(
+        mock_workspace.iter_deploy.assert_called_once_with(
             target_org_id=200,
             target_api_base="https://sandbox.api.rossum.ai/v1",
             target_token="sandbox_token",
             dry_run=False,
+            resume=False,
         )
 
     def test_deploy_handles_error(self, tmp_path: Path):
         """Test deploy error handling."""
         mock_workspace = MagicMock()
-        mock_workspace.deploy.side_effect = Exception("ID mapping not found")
+        mock_workspace.iter_deploy.side_effect = Exception("ID mapping not found")
         mock_workspace.path = tmp_path
 
         with patch("rossum_agent.tools.deploy.create_workspace", return_value=mock_workspace):
@@ -788,9 +867,8 @@ class TestExecuteDeployTool:
 
     def test_execute_deploy_to_org(self, tmp_path: Path):
         """Test execute_tool with deploy_to_org."""
-        mock_result = DeployResult(created=[], updated=[], skipped=[], failed=[])
         mock_workspace = MagicMock()
-        mock_workspace.deploy.return_value = mock_result
+        mock_workspace.iter_deploy.return_value = iter([])
         mock_workspace.path = tmp_path
 
         set_output_dir(tmp_path)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from functools import partial
+from typing import TYPE_CHECKING
+
+from rossum_api.exceptions import APIClientError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 2.0
+
+
+def call_with_rate_limit_retry[R](
+    func: Callable[[], R], retries: int = RATE_LIMIT_RETRIES, backoff: float = RATE_LIMIT_BACKOFF
+) -> R:
+    """Call `func`, backing off when the API still answers HTTP 429 after the client's own retries.
+
+    rossum-api retries transient errors per request; this adds a coarser, pool-level backoff so
+    that many concurrent workers do not keep hammering an organization that is rate limited.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except APIClientError as e:
+            if e.status_code != 429 or attempt == retries:
+                raise
+            delay = backoff * 2**attempt
+            logger.warning("Rate limited by API, retrying in %.1fs (attempt %d/%d)", delay, attempt + 1, retries)
+            time.sleep(delay)
+    raise RuntimeError("Unreachable: retry loop produced no result")
+
+
+def map_concurrently[T, R](
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_MAX_WORKERS
+) -> list[R]:
+    """Apply `func` to `items` on a bounded thread pool, preserving input order."""
+    item_list = list(items)
+
+    def run(item: T) -> R:
+        return call_with_rate_limit_retry(partial(func, item))
+
+    if max_workers <= 1 or len(item_list) <= 1:
+        return [run(item) for item in item_list]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(item_list))) as executor:
+        return list(executor.map(run, item_list))
+
+
+def iter_completed[T, R](
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_MAX_WORKERS
+) -> Iterator[tuple[T, R]]:
+    """Apply `func` to `items` on a bounded thread pool, yielding `(item, result)` pairs as they complete.
+
+    Items not started yet are cancelled when the consumer stops iterating early or a call fails;
+    calls already running are waited for.
+    """
+    item_list = list(items)
+
+    def run(item: T) -> R:
+        return call_with_rate_limit_retry(partial(func, item))
+
+    if max_workers <= 1 or len(item_list) <= 1:
+        for item in item_list:
+            yield item, run(item)
+        return
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(item_list)))
+    try:
+        futures: dict[Future[R], T] = {executor.submit(run, item): item for item in item_list}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_dependency_graph[K: Hashable](
+    tasks: Mapping[K, Callable[[], None]],
+    dependencies: Mapping[K, Iterable[K]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> None:
+    """Run `tasks` concurrently, starting each one as soon as all of its dependencies finished.
+
+    Dependencies that are not part of `tasks` are treated as already satisfied. The first
+    failing task stops scheduling of further tasks and its exception is re-raised once the
+    tasks already in flight have finished.
+
+    Raises:
+        ValueError: If the dependencies among `tasks` contain a cycle.
+    """
+    pending = {key: {dep for dep in dependencies.get(key, ()) if dep in tasks} for key in tasks}
+    running: dict[Future[None], K] = {}
+
+    def run(key: K) -> None:
+        call_with_rate_limit_retry(tasks[key])
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while pending or running:
+            for key in [key for key, deps in pending.items() if not deps]:
+                del pending[key]
+                running[executor.submit(run, key)] = key
+
+            if not running:
+                raise ValueError(f"Dependency cycle between tasks: {sorted(map(str, pending))}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                if (error := future.exception()) is not None:
+                    wait(running)
+                    raise error
+                for deps in pending.values():
+                    deps.discard(key)
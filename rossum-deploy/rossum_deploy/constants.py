@@ -61,3 +61,17 @@ DIFFABLE_TYPES = [
 ]
 
 PUSHABLE_TYPES = DIFFABLE_TYPES
+
+# Object types whose pull reads local state written by the pull of other types.
+# Queues are filtered by pulled workspaces; everything else hangs off the pulled queues.
+PULL_DEPENDENCIES: dict[ObjectType, tuple[ObjectType, ...]] = {
+    ObjectType.WORKSPACE: (),
+    ObjectType.QUEUE: (ObjectType.WORKSPACE,),
+    ObjectType.SCHEMA: (ObjectType.QUEUE,),
+    ObjectType.INBOX: (ObjectType.QUEUE,),
+    ObjectType.HOOK: (ObjectType.QUEUE,),
+    ObjectType.CONNECTOR: (ObjectType.QUEUE,),
+    ObjectType.ENGINE: (ObjectType.QUEUE,),
+    ObjectType.EMAIL_TEMPLATE: (ObjectType.QUEUE,),
+    ObjectType.RULE: (ObjectType.QUEUE,),
+}
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _find_repo_root(path: Path) -> Path | None:
+    """Return the closest directory at or above `path` containing `.git` (a directory, or a file for worktrees)."""
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+class GitStatus:
+    """Snapshot of `git status` for a directory, taken with a single subprocess call.
+
+    Take one snapshot per operation and consult it for every file instead of asking Git
+    about each file separately. Outside a Git repository, or without Git installed, no
+    file is reported as modified.
+
+    Only modifications to tracked files count: untracked files (`??`) and newly staged
+    files (`A `) represent a fresh pull, not user edits.
+
+    Example:
+        >>> status = GitStatus.capture(Path("./my-project"))
+        >>> status.is_modified(Path("./my-project/queues/Invoices_123.json"))
+    """
+
+    def __init__(self, modified: set[Path] | None = None) -> None:
+        self._modified = modified or set()
+
+    @classmethod
+    def capture(cls, path: Path) -> GitStatus:
+        """Run `git status --porcelain` once for everything under `path`."""
+        path = path.resolve()
+        git_executable = shutil.which("git")
+        repo_root = _find_repo_root(path)
+        if not git_executable or repo_root is None or not path.exists():
+            return cls()
+
+        try:
+            result = subprocess.run(
+                [git_executable, "status", "--porcelain=v1", "-z", "--untracked-files=no", "--", str(path)],
+                cwd=path,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except FileNotFoundError:
+            return cls()
+        if result.returncode != 0:
+            return cls()
+
+        return cls(cls._parse_porcelain(result.stdout, repo_root))
+
+    @staticmethod
+    def _parse_porcelain(output: str, repo_root: Path) -> set[Path]:
+        """Collect paths with a modification (`M`) in either the index or the worktree column.
+
+        Porcelain paths are relative to the repository root. With `-z`, renames and copies
+        are followed by an extra entry holding the original path, which is skipped.
+        """
+        modified: set[Path] = set()
+        entries = iter(output.split("\0"))
+        for entry in entries:
+            if len(entry) < 4:
+                continue
+            status_code, rel_path = entry[:2], entry[3:]
+            if status_code[0] in "RC":
+                next(entries, None)
+            if "M" in status_code:
+                modified.add((repo_root / rel_path).resolve())
+        return modified
+
+    def is_modified(self, file_path: Path) -> bool:
+        return file_path.resolve() in self._modified
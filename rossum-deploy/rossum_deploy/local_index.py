@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_jsonable_python
+
+from rossum_deploy.constants import OBJECT_FOLDERS
+from rossum_deploy.models import LocalObject, ObjectType
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".local_index.json"
+INDEX_VERSION = 1
+
+
+def hash_object_data(data: dict[str, Any]) -> str:
+    """Content hash of object data, stable across a JSON round-trip of the local file."""
+    canonical = json.dumps(to_jsonable_python(data), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class IndexEntry(BaseModel):
+    """What the index remembers about one local object file."""
+
+    object_type: ObjectType
+    object_id: int
+    name: str
+    url: str | None = None
+    schema_url: str | None = None
+    remote_modified_at: datetime | None = None
+    mtime_ns: int
+    size: int
+    data_hash: str
+
+
+class LocalIndex:
+    """Persistent index of the local object files of a workspace.
+
+    Keeps the type, ID, URL, file stats and content hash of every object file in
+    `.local_index.json`, so lookups by type/ID/URL are dictionary hits instead of a
+    walk over the JSON tree. `refresh` re-parses only files whose mtime or size changed;
+    `record` updates a single entry right after the file is written.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._entries: dict[str, IndexEntry] = {}
+        self._by_type: dict[ObjectType, dict[int, str]] = {obj_type: {} for obj_type in ObjectType}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_FILENAME
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if raw.get("version") != INDEX_VERSION:
+                return
+            for rel_path, entry in raw.get("entries", {}).items():
+                self._set(rel_path, IndexEntry.model_validate(entry))
+        except (OSError, ValueError, ValidationError) as e:
+            logger.warning("Ignoring unreadable local index %s: %s", self.index_path, e)
+            self._entries.clear()
+            self._by_type = {obj_type: {} for obj_type in ObjectType}
+
+    def save(self) -> None:
+        """Write the index to disk if it changed since it was loaded or last saved."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {rel_path: entry.model_dump(mode="json") for rel_path, entry in sorted(self._entries.items())}
+            self._dirty = False
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "entries": entries}, f, indent=2)
+
+    def _set(self, rel_path: str, entry: IndexEntry) -> None:
+        if rel_path in self._entries:
+            self._remove(rel_path)
+        self._entries[rel_path] = entry
+        by_id = self._by_type[entry.object_type]
+        # A renamed object leaves its old file behind; the most recently written file wins
+        current = by_id.get(entry.object_id)
+        if current is None or self._entries[current].mtime_ns <= entry.mtime_ns:
+            by_id[entry.object_id] = rel_path
+
+    def _remove(self, rel_path: str) -> None:
+        entry = self._entries.pop(rel_path)
+        by_id = self._by_type[entry.object_type]
+        if by_id.get(entry.object_id) != rel_path:
+            return
+        del by_id[entry.object_id]
+        candidates = [
+            (other.mtime_ns, other_path)
+            for other_path, other in self._entries.items()
+            if other.object_type == entry.object_type and other.object_id == entry.object_id
+        ]
+        if candidates:
+            by_id[entry.object_id] = max(candidates)[1]
+
+    def record(self, path: Path, local_obj: LocalObject) -> None:
+        """Index a file that was just written with the given content."""
+        data = local_obj.data
+        stat = path.stat()
+        entry = IndexEntry(
+            object_type=local_obj.meta.object_type,
+            object_id=local_obj.meta.object_id,
+            name=data.get("name") or f"Object {local_obj.meta.object_id}",
+            url=data.get("url"),
+            schema_url=data.get("schema") if isinstance(data.get("schema"), str) else None,
+            remote_modified_at=local_obj.meta.remote_modified_at,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            data_hash=hash_object_data(data),
+        )
+        with self._lock:
+            self._set(path.relative_to(self.root).as_posix(), entry)
+            self._dirty = True
+
+    def refresh(self) -> None:
+        """Bring the index in line with the files on disk, parsing only new or changed files."""
+        seen: set[str] = set()
+        for folder in OBJECT_FOLDERS.values():
+            folder_path = self.root / folder
+            if not folder_path.exists():
+                continue
+            for path in folder_path.glob("*.json"):
+                rel_path = path.relative_to(self.root).as_posix()
+                seen.add(rel_path)
+                stat = path.stat()
+                entry = self._entries.get(rel_path)
+                if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                    continue
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        local_obj = LocalObject.model_validate(json.load(f))
+                except (OSError, ValueError, ValidationError) as e:
+                    logger.warning("Skipping unreadable local object %s: %s", path, e)
+                    continue
+                self.record(path, local_obj)
+
+        with self._lock:
+            for rel_path in set(self._entries) - seen:
+                self._remove(rel_path)
+                self._dirty = True
+
+    def entries(self, obj_type: ObjectType) -> list[tuple[Path, IndexEntry]]:
+        """All indexed objects of a type with their absolute paths, ordered by object ID."""
+        by_id = self._by_type[obj_type]
+        return [(self.root / by_id[obj_id], self._entries[by_id[obj_id]]) for obj_id in sorted(by_id)]
+
+    def ids(self, obj_type: ObjectType) -> set[int]:
+        return set(self._by_type[obj_type])
+
+    def path_of(self, obj_type: ObjectType, obj_id: int) -> Path | None:
+        rel_path = self._by_type[obj_type].get(obj_id)
+        return self.root / rel_path if rel_path is not None else None
+
+    def get(self, obj_type: ObjectType, obj_id: int) -> IndexEntry | None:
+        rel_path = self._by_type[obj_type].get(obj_id)
+        return self._entries[rel_path] if rel_path is not None else None
+
+    def is_fresh(self, path: Path) -> bool:
+        """Whether the indexed entry still describes the file on disk."""
+        entry = self._entries.get(path.relative_to(self.root).as_posix())
+        if entry is None or not path.exists():
+            return False
+        stat = path.stat()
+        return entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size
@@ -325,6 +325,45 @@ class CopyResult(BaseModel):
         return "\n".join(lines)
 
 
+class DeployStatus(str, Enum):
+    """Outcome of deploying a single object."""
+
+    UPDATED = "updated"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+class DeployObjectResult(BaseModel):
+    """Outcome of deploying a single object, as yielded by `Workspace.iter_deploy`."""
+
+    object_type: ObjectType
+    source_id: int
+    target_id: int | None = None
+    name: str
+    status: DeployStatus
+    detail: str | None = Field(default=None, description="Skip reason or error message")
+
+
+class DeployCheckpoint(BaseModel):
+    """Objects already deployed from a source org to a target org, used to resume a deploy.
+
+    Each deployed object is recorded with the content hash of the local data that was deployed,
+    so a local edit made after the deploy makes the object eligible again.
+    """
+
+    source_org_id: int
+    target_org_id: int
+    deployed: dict[str, dict[int, str]] = Field(default_factory=dict)
+
+    def mark_deployed(self, obj_type: ObjectType, source_id: int, data_hash: str) -> None:
+        """Record that the object was deployed with the given local content."""
+        self.deployed.setdefault(obj_type.value, {})[source_id] = data_hash
+
+    def is_deployed(self, obj_type: ObjectType, source_id: int, data_hash: str) -> bool:
+        """Whether the object was already deployed with exactly this local content."""
+        return self.deployed.get(obj_type.value, {}).get(source_id) == data_hash
+
+
 class DeployResult(BaseModel):
     """Result of deploying local changes to a target organization."""
 
@@ -333,6 +372,15 @@ class DeployResult(BaseModel):
     skipped: list[tuple[ObjectType, int, str, str]] = Field(default_factory=list)
     failed: list[tuple[ObjectType, int, str, str]] = Field(default_factory=list)
 
+    def add(self, outcome: DeployObjectResult) -> None:
+        """Record the outcome of a single object."""
+        if outcome.status == DeployStatus.UPDATED and outcome.target_id is not None:
+            self.updated.append((outcome.object_type, outcome.target_id, outcome.name))
+        elif outcome.status == DeployStatus.SKIPPED:
+            self.skipped.append((outcome.object_type, outcome.source_id, outcome.name, outcome.detail or ""))
+        elif outcome.status == DeployStatus.FAILED:
+            self.failed.append((outcome.object_type, outcome.source_id, outcome.name, outcome.detail or ""))
+
     def summary(self) -> str:
         """Human-readable summary of the deploy."""
         lines = ["# Deploy Summary", ""]
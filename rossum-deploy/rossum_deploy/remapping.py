@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from rossum_deploy.constants import OBJECT_TYPE_TO_RESOURCE
+from rossum_deploy.models import ObjectType
+
+if TYPE_CHECKING:
+    from rossum_deploy.models import IdMapping
+
+# A numeric path segment such as the "123" in ".../queues/123" or ".../queues/123/"
+_URL_ID_PATTERN = re.compile(r"/(\d+)(?!\d)")
+# A standalone number, e.g. a queue ID literal inside hook code
+_NUMBER_PATTERN = re.compile(r"(?<!\d)(\d+)(?!\d)")
+
+
+class IdRemapper:
+    """Compiled form of an `IdMapping` for fast, single-pass ID substitution.
+
+    Free-text substitution scans a string once with a regex matching numeric tokens and
+    resolves each token with a dictionary lookup, so its cost depends on the length of the
+    string rather than on the number of mapped objects. Known reference fields are remapped
+    structurally with `remap_url`.
+
+    Build one remapper per operation; it does not see mappings added to the `IdMapping`
+    afterwards.
+
+    Example:
+        >>> remapper = IdRemapper(id_mapping)
+        >>> remapper.remap_urls("https://api.elis.rossum.ai/v1/queues/123")
+        'https://api.elis.rossum.ai/v1/queues/456'
+    """
+
+    def __init__(self, id_mapping: IdMapping) -> None:
+        self.id_mapping = id_mapping
+        self._by_type = {obj_type: id_mapping.get_all(obj_type) for obj_type in ObjectType}
+
+        # One lookup table across all types; earlier types win if source IDs collide
+        self._url_ids: dict[str, str] = {}
+        for mappings in self._by_type.values():
+            for source_id, target_id in mappings.items():
+                self._url_ids.setdefault(str(source_id), str(target_id))
+        self._queue_ids = {
+            str(source_id): str(target_id) for source_id, target_id in self._by_type[ObjectType.QUEUE].items()
+        }
+
+    @classmethod
+    def of(cls, id_mapping: IdMapping | IdRemapper) -> IdRemapper:
+        """Return `id_mapping` if it is already compiled, otherwise compile it."""
+        return id_mapping if isinstance(id_mapping, IdRemapper) else cls(id_mapping)
+
+    def get(self, obj_type: ObjectType, source_id: int) -> int | None:
+        return self._by_type[obj_type].get(source_id)
+
+    def remap_urls(self, value: str) -> str:
+        """Replace every mapped ID that appears as a path segment (`/<id>`) in `value`."""
+        if not self._url_ids or "/" not in value:
+            return value
+        return _URL_ID_PATTERN.sub(lambda m: "/" + self._url_ids.get(m.group(1), m.group(1)), value)
+
+    def remap_queue_ids(self, code: str) -> str:
+        """Replace every mapped queue ID that appears as a standalone number in `code`."""
+        if not self._queue_ids:
+            return code
+        return _NUMBER_PATTERN.sub(lambda m: self._queue_ids.get(m.group(1), m.group(1)), code)
+
+    def remap_url(self, url: str, obj_type: ObjectType, target_base: str) -> str | None:
+        """Point a reference URL of the given type at its mapped target, or None if unmapped."""
+        target_id = self.get(obj_type, int(url.rstrip("/").split("/")[-1]))
+        if target_id is None:
+            return None
+        return f"{target_base}/{OBJECT_TYPE_TO_RESOURCE[obj_type].value}/{target_id}"
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from rossum_deploy.models import ObjectType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rossum_api import SyncRossumAPIClient
+
+_LISTERS: dict[ObjectType, Callable[[SyncRossumAPIClient], Any]] = {
+    ObjectType.WORKSPACE: lambda client: client.list_workspaces(),
+    ObjectType.QUEUE: lambda client: client.list_queues(),
+    ObjectType.INBOX: lambda client: client.request_paginated("inboxes"),
+    ObjectType.HOOK: lambda client: client.list_hooks(),
+    ObjectType.CONNECTOR: lambda client: client.list_connectors(),
+    ObjectType.ENGINE: lambda client: client.list_engines(),
+    ObjectType.EMAIL_TEMPLATE: lambda client: client.list_email_templates(),
+    ObjectType.RULE: lambda client: client.list_rules(),
+}
+
+
+def _field(item: Any, name: str) -> Any:
+    """Read a field from an API model or a raw JSON dict (inboxes are fetched as dicts)."""
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+class OrgSnapshot:
+    """In-memory view of an organization's remote objects for the duration of one operation.
+
+    Each resource type is listed at most once, on first access, and indexed by ID and URL so
+    that all filters and cross-references of an operation share the same listing. Safe to use
+    from the concurrent pull workers.
+
+    Example:
+        >>> snapshot = OrgSnapshot(client)
+        >>> queues = snapshot.objects(ObjectType.QUEUE)
+        >>> engine = snapshot.get_by_url(ObjectType.ENGINE, queues[0].dedicated_engine)
+    """
+
+    def __init__(self, client: SyncRossumAPIClient) -> None:
+        self.client = client
+        self._items: dict[ObjectType, list[Any]] = {}
+        self._by_id: dict[ObjectType, dict[int, Any]] = {}
+        self._by_url: dict[ObjectType, dict[str, Any]] = {}
+        self._locks = {obj_type: threading.Lock() for obj_type in _LISTERS}
+
+    def objects(self, obj_type: ObjectType) -> list[Any]:
+        """Return all objects of the given type, listing them from the API on first use."""
+        if obj_type not in _LISTERS:
+            raise ValueError(f"Object type {obj_type.value} cannot be listed in a snapshot")
+
+        with self._locks[obj_type]:
+            if obj_type not in self._items:
+                items = list(_LISTERS[obj_type](self.client))
+                self._by_id[obj_type] = {_field(item, "id"): item for item in items}
+                self._by_url[obj_type] = {url: item for item in items if (url := _field(item, "url"))}
+                self._items[obj_type] = items
+        return self._items[obj_type]
+
+    def get(self, obj_type: ObjectType, obj_id: int) -> Any | None:
+        """Return the object with the given ID, or None if it does not exist."""
+        self.objects(obj_type)
+        return self._by_id[obj_type].get(obj_id)
+
+    def get_by_url(self, obj_type: ObjectType, url: str) -> Any | None:
+        """Return the object with the given URL, or None if it does not exist."""
+        self.objects(obj_type)
+        return self._by_url[obj_type].get(url)
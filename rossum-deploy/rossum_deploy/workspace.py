@@ -3,9 +3,9 @@ from __future__ import annotations
 import dataclasses
 import json
 import logging
-import shutil
-import subprocess
+import threading
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -13,18 +13,31 @@ from rossum_api import SyncRossumAPIClient
 from rossum_api.domain_logic.resources import Resource
 from rossum_api.dtos import Token
 
+from rossum_deploy.concurrency import (
+    DEFAULT_MAX_WORKERS,
+    call_with_rate_limit_retry,
+    iter_completed,
+    map_concurrently,
+    run_dependency_graph,
+)
 from rossum_deploy.constants import (
     DIFFABLE_TYPES,
     IGNORED_FIELDS,
     OBJECT_FOLDERS,
     OBJECT_TYPE_TO_RESOURCE,
+    PULL_DEPENDENCIES,
     PUSHABLE_TYPES,
     TYPE_SPECIFIC_IGNORED_FIELDS,
 )
+from rossum_deploy.git_status import GitStatus
+from rossum_deploy.local_index import IndexEntry, LocalIndex, hash_object_data
 from rossum_deploy.models import (
     CompareResult,
     CopyResult,
+    DeployCheckpoint,
+    DeployObjectResult,
     DeployResult,
+    DeployStatus,
     DiffResult,
     DiffStatus,
     FieldDiff,
@@ -37,15 +50,23 @@ from rossum_deploy.models import (
     PullResult,
     PushResult,
 )
+from rossum_deploy.remapping import IdRemapper
+from rossum_deploy.snapshot import OrgSnapshot
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
     from rossum_api.models import Connector, EmailTemplate, Engine, Hook, Queue, Rule
     from rossum_api.models import Workspace as RossumWorkspace
 
 logger = logging.getLogger(__name__)
 
+# One object to create during a copy: type, source ID, name, and the call that creates it
+_CopyTask = tuple[ObjectType, int, str, "Callable[[IdMapping, CopyResult], None]"]
+
+# Updated objects between two saves of the deploy checkpoint while an object type is deploying
+_DEPLOY_CHECKPOINT_INTERVAL = 25
+
 
 class WorkspaceConfig:
     """Configuration for a local workspace."""
@@ -70,6 +91,12 @@ class Workspace:
 
     Provides pull/diff/push operations for safe configuration deployment.
 
+    Args:
+        path: Local directory holding the workspace files
+        api_base: Rossum API base URL
+        token: Rossum API token
+        max_workers: Upper bound on concurrent API requests issued by bulk operations
+
     Example:
         >>> ws = Workspace("./my-project", api_base="https://api.elis.rossum.ai/v1", token="...")
         >>> ws.pull(org_id=123456)
@@ -77,19 +104,35 @@ class Workspace:
         >>> ws.push()
     """
 
-    def __init__(self, path: str | Path, api_base: str, token: str) -> None:
+    def __init__(self, path: str | Path, api_base: str, token: str, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
         self.path = Path(path)
+        self.max_workers = max_workers
 
         api_base = api_base.rstrip("/")
         self._api_base = api_base
         self._token = token
         self._config = WorkspaceConfig(api_base=api_base)
         self._client = SyncRossumAPIClient(api_base, Token(token))
+        self._index: LocalIndex | None = None
+        self._index_lock = threading.Lock()
 
     @property
     def client(self) -> SyncRossumAPIClient:
         return self._client
 
+    @property
+    def _local_index(self) -> LocalIndex:
+        """Index of local object files, loaded from disk and refreshed on first use."""
+        return self._index if self._index is not None else self._refresh_index()
+
+    def _refresh_index(self) -> LocalIndex:
+        """Pick up files changed outside of this instance; called at the start of each operation."""
+        with self._index_lock:
+            if self._index is None:
+                self._index = LocalIndex(self.path)
+            self._index.refresh()
+            return self._index
+
     def _object_folder(self, obj_type: ObjectType) -> Path:
         folder = self.path / OBJECT_FOLDERS[obj_type]
         folder.mkdir(parents=True, exist_ok=True)
@@ -119,6 +162,7 @@ class Workspace:
         path = self._object_path(obj_type, obj_id, name)
         with open(path, "w", encoding="utf-8") as f:
             json.dump(local_obj.model_dump(by_alias=True, mode="json"), f, indent=2)
+        self._local_index.record(path, local_obj)
         return path
 
     def _load_object(self, path: Path) -> LocalObject:
@@ -127,34 +171,23 @@ class Workspace:
             return result
 
     def _list_local_objects(self, obj_type: ObjectType) -> list[Path]:
-        folder = self.path / OBJECT_FOLDERS[obj_type]
-        if not folder.exists():
-            return []
-        return list(folder.glob("*.json"))
+        return [path for path, _ in self._local_index.entries(obj_type)]
 
     def _get_workspace_ids(self) -> set[int]:
         """Get IDs of all local workspaces."""
-        ws_paths = self._list_local_objects(ObjectType.WORKSPACE)
-        return {self._load_object(p).meta.object_id for p in ws_paths}
+        return self._local_index.ids(ObjectType.WORKSPACE)
 
     def _get_queue_urls(self) -> set[str]:
         """Get URLs of all local queues."""
-        queue_paths = self._list_local_objects(ObjectType.QUEUE)
-        return {data["url"] for qp in queue_paths if "url" in (data := self._load_object(qp).data)}
+        return {entry.url for _, entry in self._local_index.entries(ObjectType.QUEUE) if entry.url}
 
     def _get_schema_ids_from_queues(self) -> set[int]:
         """Get schema IDs referenced by local queues."""
-        queue_paths = self._list_local_objects(ObjectType.QUEUE)
-        return {
-            int(data["schema"].split("/")[-1])
-            for qp in queue_paths
-            if (data := self._load_object(qp).data).get("schema")
-        }
+        return {int(url.split("/")[-1]) for url in self._get_schema_urls_from_queues()}
 
     def _get_schema_urls_from_queues(self) -> set[str]:
         """Get schema URLs referenced by local queues."""
-        queue_paths = self._list_local_objects(ObjectType.QUEUE)
-        return {data["schema"] for qp in queue_paths if (data := self._load_object(qp).data).get("schema")}
+        return {entry.schema_url for _, entry in self._local_index.entries(ObjectType.QUEUE) if entry.schema_url}
 
     def pull(self, org_id: int) -> PullResult:
         """Pull objects from Rossum to local workspace.
@@ -168,15 +201,8 @@ class Workspace:
 
         self._config.org_id = org_id
 
-        self._pull_workspaces(self.client, org_id, result)
-        self._pull_queues(self.client, result)
-        self._pull_schemas(self.client, result)
-        self._pull_inboxes(self.client, result)
-        self._pull_hooks(self.client, result)
-        self._pull_connectors(self.client, result)
-        self._pull_engines(self.client, result)
-        self._pull_email_templates(self.client, result)
-        self._pull_rules(self.client, result)
+        self._refresh_index()
+        self._run_pull(result, org_id=org_id)
 
         return result
 
@@ -190,6 +216,7 @@ class Workspace:
 
         logger.info("Pulling workspace %d from API: %s", workspace_id, self._api_base)
 
+        self._refresh_index()
         ws = self.client.retrieve_workspace(workspace_id)
         org_id = int(ws.organization.split("/")[-1]) if ws.organization else None
         self._config.org_id = org_id
@@ -198,17 +225,38 @@ class Workspace:
         self._save_object(ObjectType.WORKSPACE, ws.id, ws.name, data, modified_at)
         result.pulled.append((ObjectType.WORKSPACE, ws.id, ws.name))
 
-        self._pull_queues(self.client, result)
-        self._pull_schemas(self.client, result)
-        self._pull_inboxes(self.client, result)
-        self._pull_hooks(self.client, result)
-        self._pull_connectors(self.client, result)
-        self._pull_engines(self.client, result)
-        self._pull_email_templates(self.client, result)
-        self._pull_rules(self.client, result)
+        self._run_pull(result)
 
         return result
 
+    def _run_pull(self, result: PullResult, org_id: int | None = None) -> None:
+        """Pull all object types, running independent types concurrently.
+
+        Types are scheduled along `PULL_DEPENDENCIES`, so a type starts as soon as the local
+        objects it is filtered by are on disk. All types share one `OrgSnapshot`, so each resource
+        type is listed from the API once. Workspaces are only pulled when `org_id` is given.
+        """
+        snapshot = OrgSnapshot(self.client)
+        pull_tasks: dict[ObjectType, Callable[[], None]] = {
+            ObjectType.QUEUE: lambda: self._pull_queues(snapshot, result),
+            ObjectType.SCHEMA: lambda: self._pull_schemas(snapshot, result),
+            ObjectType.INBOX: lambda: self._pull_inboxes(snapshot, result),
+            ObjectType.HOOK: lambda: self._pull_hooks(snapshot, result),
+            ObjectType.CONNECTOR: lambda: self._pull_connectors(snapshot, result),
+            ObjectType.ENGINE: lambda: self._pull_engines(snapshot, result),
+            ObjectType.EMAIL_TEMPLATE: lambda: self._pull_email_templates(snapshot, result),
+            ObjectType.RULE: lambda: self._pull_rules(snapshot, result),
+        }
+        if org_id is not None:
+            pull_tasks[ObjectType.WORKSPACE] = lambda: self._pull_workspaces(snapshot, org_id, result)
+
+        run_dependency_graph(pull_tasks, PULL_DEPENDENCIES, self.max_workers)
+
+        # Types finish in nondeterministic order; keep the result grouped by type for stable summaries
+        type_order = list(PULL_DEPENDENCIES)
+        result.pulled.sort(key=lambda pulled: type_order.index(pulled[0]))
+        self._local_index.save()
+
     def _normalize_id_mapping(self, id_mapping: IdMapping, local_ws_id: int, target_ws_id: int) -> IdMapping:
         """Ensure id_mapping is in the correct direction (local_ws_id -> target_ws_id).
 
@@ -241,6 +289,8 @@ class Workspace:
                 matched by their original IDs (for comparing same workspace
                 before and after changes).
         """
+        self._refresh_index()
+        target_workspace._refresh_index()
         source_ws_paths = self._list_local_objects(ObjectType.WORKSPACE)
         target_ws_paths = target_workspace._list_local_objects(ObjectType.WORKSPACE)
 
@@ -254,13 +304,14 @@ class Workspace:
 
         effective_mapping = self._normalize_id_mapping(id_mapping, source_ws_id, target_ws_id) if id_mapping else None
 
+        remapper = IdRemapper(effective_mapping) if effective_mapping else None
         for obj_type in DIFFABLE_TYPES:
-            self._compare_object_type(target_workspace, obj_type, effective_mapping, result)
+            self._compare_object_type(target_workspace, obj_type, remapper, result)
 
         return result
 
     def _compare_object_type(
-        self, target_workspace: Workspace, obj_type: ObjectType, id_mapping: IdMapping | None, result: CompareResult
+        self, target_workspace: Workspace, obj_type: ObjectType, id_mapping: IdRemapper | None, result: CompareResult
     ) -> None:
         """Compare all objects of a given type between source and target."""
         source_objects: dict[int, LocalObject] = {}
@@ -310,11 +361,12 @@ class Workspace:
         self,
         source_data: dict[str, Any],
         target_data: dict[str, Any],
-        id_mapping: IdMapping | None,
+        id_mapping: IdMapping | IdRemapper | None,
         obj_type: ObjectType | None = None,
     ) -> list[FieldDiff]:
         """Compare two object data dicts, returning field-level diffs."""
         diffs: list[FieldDiff] = []
+        remapper = IdRemapper.of(id_mapping) if id_mapping else None
 
         all_keys = set(source_data.keys()) | set(target_data.keys())
         type_ignored = TYPE_SPECIFIC_IGNORED_FIELDS.get(obj_type, set()) if obj_type else set()
@@ -327,7 +379,7 @@ class Workspace:
             source_val = source_data.get(key)
             target_val = target_data.get(key)
 
-            normalized_source = self._normalize_value(source_val, id_mapping, key)
+            normalized_source = self._normalize_value(source_val, remapper, key)
             normalized_target = self._normalize_value(target_val, None, key)
 
             if normalized_source != normalized_target:
@@ -335,42 +387,46 @@ class Workspace:
 
         return diffs
 
-    def _normalize_value(self, value: Any, id_mapping: IdMapping | None, field_name: str | None = None) -> Any:
-        """Normalize a value for comparison, remapping IDs if needed."""
+    def _normalize_value(
+        self, value: Any, id_mapping: IdMapping | IdRemapper | None, field_name: str | None = None
+    ) -> Any:
+        """Normalize a value for comparison, remapping IDs if needed.
+
+        Pass a prebuilt `IdRemapper` when normalizing many values with the same mapping.
+        """
         if value is None:
             return value
 
+        remapper = IdRemapper.of(id_mapping) if id_mapping else None
+
         if isinstance(value, str):
             # Normalize message field: strip trailing whitespace (API may add/remove \n)
             if field_name == "message":
                 value = value.rstrip()
 
-            if id_mapping:
-                for obj_type in ObjectType:
-                    mappings = id_mapping.get_all(obj_type)
-                    for source_id, target_id in mappings.items():
-                        value = value.replace(f"/{source_id}", f"/{target_id}")
+            if remapper:
+                value = remapper.remap_urls(value)
             return value
 
         if isinstance(value, list):
-            return [self._normalize_value(v, id_mapping) for v in value]
+            return [self._normalize_value(v, remapper) for v in value]
 
         if isinstance(value, dict):
-            return {k: self._normalize_value(v, id_mapping, k) for k, v in value.items()}
+            return {k: self._normalize_value(v, remapper, k) for k, v in value.items()}
 
         return value
 
-    def _pull_workspaces(self, client: SyncRossumAPIClient, org_id: int, result: PullResult) -> None:
-        for ws in client.list_workspaces():
+    def _pull_workspaces(self, snapshot: OrgSnapshot, org_id: int, result: PullResult) -> None:
+        for ws in snapshot.objects(ObjectType.WORKSPACE):
             if ws.organization and str(org_id) in ws.organization:
                 data = dataclasses.asdict(ws)
                 modified_at = getattr(ws, "modified_at", None)
                 self._save_object(ObjectType.WORKSPACE, ws.id, ws.name, data, modified_at)
                 result.pulled.append((ObjectType.WORKSPACE, ws.id, ws.name))
 
-    def _pull_queues(self, client: SyncRossumAPIClient, result: PullResult) -> None:
+    def _pull_queues(self, snapshot: OrgSnapshot, result: PullResult) -> None:
         ws_ids = self._get_workspace_ids()
-        for queue in client.list_queues():
+        for queue in snapshot.objects(ObjectType.QUEUE):
             if queue.workspace:
                 ws_id = int(queue.workspace.split("/")[-1])
                 if ws_id in ws_ids:
@@ -384,9 +440,9 @@ class Workspace:
                     )
                     result.pulled.append((ObjectType.QUEUE, queue.id, queue.name))
 
-    def _pull_inboxes(self, client: SyncRossumAPIClient, result: PullResult) -> None:
+    def _pull_inboxes(self, snapshot: OrgSnapshot, result: PullResult) -> None:
         queue_urls = self._get_queue_urls()
-        for inbox in client.request_paginated("inboxes"):
+        for inbox in snapshot.objects(ObjectType.INBOX):
             inbox_queues = set(inbox.get("queues", []))
             if inbox_queues & queue_urls:
                 name = inbox.get("name", f"Inbox {inbox['id']}")
@@ -396,10 +452,9 @@ class Workspace:
                 self._save_object(ObjectType.INBOX, inbox["id"], name, inbox, modified_at)
                 result.pulled.append((ObjectType.INBOX, inbox["id"], name))
 
-    def _pull_schemas(self, client: SyncRossumAPIClient, result: PullResult) -> None:
-        schema_ids = self._get_schema_ids_from_queues()
-        for schema_id in schema_ids:
-            schema = client.retrieve_schema(schema_id)
+    def _pull_schemas(self, snapshot: OrgSnapshot, result: PullResult) -> None:
+        schema_ids = sorted(self._get_schema_ids_from_queues())
+        for schema in map_concurrently(snapshot.client.retrieve_schema, schema_ids, self.max_workers):
             data = dataclasses.asdict(schema)
             modified_at = getattr(schema, "modified_at", None)
             self._save_object(ObjectType.SCHEMA, schema.id, schema.name, data, modified_at)
@@ -421,24 +476,28 @@ class Workspace:
                 self._save_object(obj_type, item.id, item.name, data, modified_at)  # type: ignore[attr-defined]
                 result.pulled.append((obj_type, item.id, item.name))  # type: ignore[attr-defined]
 
-    def _pull_hooks(self, client: SyncRossumAPIClient, result: PullResult) -> None:
+    def _pull_hooks(self, snapshot: OrgSnapshot, result: PullResult) -> None:
         self._pull_queue_linked_objects(
-            list(client.list_hooks()), ObjectType.HOOK, self._get_queue_urls(), result, lambda h: set(h.queues or [])
+            snapshot.objects(ObjectType.HOOK),
+            ObjectType.HOOK,
+            self._get_queue_urls(),
+            result,
+            lambda h: set(h.queues or []),
         )
 
-    def _pull_connectors(self, client: SyncRossumAPIClient, result: PullResult) -> None:
+    def _pull_connectors(self, snapshot: OrgSnapshot, result: PullResult) -> None:
         self._pull_queue_linked_objects(
-            list(client.list_connectors()),
+            snapshot.objects(ObjectType.CONNECTOR),
             ObjectType.CONNECTOR,
             self._get_queue_urls(),
             result,
             lambda c: set(c.queues or []),
         )
 
-    def _collect_engine_urls_from_queues(self, client: SyncRossumAPIClient, queue_urls: set[str]) -> set[str]:
+    def _collect_engine_urls_from_queues(self, queues: Iterable[Queue], queue_urls: set[str]) -> set[str]:
         """Collect engine URLs referenced by queues in the given queue_urls set."""
         engine_urls: set[str] = set()
-        for queue in client.list_queues():
+        for queue in queues:
             if queue.url not in queue_urls:
                 continue
             if queue.dedicated_engine:
@@ -457,21 +516,22 @@ class Workspace:
                     engine_urls.add(engine_url)
         return engine_urls
 
-    def _pull_engines(self, client: SyncRossumAPIClient, result: PullResult) -> None:
+    def _pull_engines(self, snapshot: OrgSnapshot, result: PullResult) -> None:
         queue_urls = self._get_queue_urls()
-        engine_urls_to_pull = self._collect_engine_urls_from_queues(client, queue_urls)
+        engine_urls_to_pull = self._collect_engine_urls_from_queues(snapshot.objects(ObjectType.QUEUE), queue_urls)
 
-        for engine in client.list_engines():
-            if engine.url not in engine_urls_to_pull:
+        for engine_url in sorted(engine_urls_to_pull):
+            engine = snapshot.get_by_url(ObjectType.ENGINE, engine_url)
+            if engine is None:
                 continue
             data = dataclasses.asdict(engine)
             modified_at = getattr(engine, "modified_at", None)
             self._save_object(ObjectType.ENGINE, engine.id, engine.name, data, modified_at)
             result.pulled.append((ObjectType.ENGINE, engine.id, engine.name))
 
-    def _pull_email_templates(self, client: SyncRossumAPIClient, result: PullResult) -> None:
+    def _pull_email_templates(self, snapshot: OrgSnapshot, result: PullResult) -> None:
         queue_urls = self._get_queue_urls()
-        for template in client.list_email_templates():
+        for template in snapshot.objects(ObjectType.EMAIL_TEMPLATE):
             # EmailTemplate has singular 'queue' field, not 'queues'
             if template.queue in queue_urls:
                 data = dataclasses.asdict(template)
@@ -482,10 +542,10 @@ class Workspace:
                 self._save_object(ObjectType.EMAIL_TEMPLATE, template.id, template.name, data, modified_at)
                 result.pulled.append((ObjectType.EMAIL_TEMPLATE, template.id, template.name))
 
-    def _pull_rules(self, client: SyncRossumAPIClient, result: PullResult) -> None:
+    def _pull_rules(self, snapshot: OrgSnapshot, result: PullResult) -> None:
         """Pull rules linked to schemas of local queues."""
         schema_urls = self._get_schema_urls_from_queues()
-        for rule in client.list_rules():
+        for rule in snapshot.objects(ObjectType.RULE):
             if rule.schema in schema_urls:
                 data = dataclasses.asdict(rule)
                 modified_at = getattr(rule, "modified_at", None)
@@ -508,65 +568,120 @@ class Workspace:
         """
         result = DiffResult()
 
-        for obj_type in DIFFABLE_TYPES:
-            for file_path in self._list_local_objects(obj_type):
-                local_obj = self._load_object(file_path)
-                obj_id = local_obj.meta.object_id
-                name = local_obj.data.get("name", f"Object {obj_id}")
-
-                try:
-                    remote_data, remote_modified = self._fetch_remote_object(self.client, obj_type, obj_id)
-                except Exception:
-                    result.objects.append(
-                        ObjectDiff(object_type=obj_type, object_id=obj_id, name=name, status=DiffStatus.LOCAL_ONLY)
-                    )
-                    continue
+        for obj_diff in self.iter_diff():
+            if obj_diff.status == DiffStatus.UNCHANGED:
+                result.total_unchanged += 1
+            elif obj_diff.status == DiffStatus.CONFLICT:
+                result.total_conflicts += 1
+            elif obj_diff.status == DiffStatus.LOCAL_MODIFIED:
+                result.total_local_modified += 1
+            elif obj_diff.status == DiffStatus.REMOTE_MODIFIED:
+                result.total_remote_modified += 1
+            result.objects.append(obj_diff)
+
+        # Diffs arrive in fetch completion order; report them grouped by type like the local folders
+        result.objects.sort(key=lambda obj: (DIFFABLE_TYPES.index(obj.object_type), obj.object_id))
+        return result
 
-                stored_remote_modified = local_obj.meta.remote_modified_at
-                changed_fields = self._compare_objects(local_obj.data, remote_data, obj_type)
+    def iter_diff(self) -> Iterator[ObjectDiff]:
+        """Yield the diff of each local object as soon as its remote counterpart is fetched.
 
-                field_diffs = [
-                    FieldDiff(
-                        field=field,
-                        source_value=remote_data.get(field),
-                        target_value=local_obj.data.get(field),
-                    )
-                    for field in changed_fields
-                ]
+        Remote objects are retrieved concurrently, bounded by `max_workers`. See `diff` for
+        the meaning of the statuses; unlike `diff`, results come in completion order.
+        """
+        index = self._refresh_index()
+        local_files = [
+            (obj_type, path, entry) for obj_type in DIFFABLE_TYPES for path, entry in index.entries(obj_type)
+        ]
+        git_status = GitStatus.capture(self.path)
+        for (obj_type, file_path, entry), (local_obj, remote) in iter_completed(
+            self._load_with_remote, local_files, self.max_workers
+        ):
+            yield self._diff_object(obj_type, file_path, entry, local_obj, remote, git_status)
+        index.save()
+
+    def _load_with_remote(
+        self, local_file: tuple[ObjectType, Path, IndexEntry]
+    ) -> tuple[LocalObject | None, tuple[dict[str, Any], datetime | None] | None]:
+        """Fetch the remote counterpart of a local object, or None if it cannot be fetched.
+
+        The local file is only read when its content may differ: if it is unchanged since it
+        was indexed and its indexed hash matches the remote data, None is returned instead.
+        """
+        obj_type, file_path, entry = local_file
+        try:
+            remote = call_with_rate_limit_retry(
+                partial(self._fetch_remote_object, self.client, obj_type, entry.object_id)
+            )
+        except Exception:
+            return None, None
 
-                is_local_modified = self._is_git_modified(file_path)
-                is_remote_modified = stored_remote_modified != remote_modified
-
-                if not changed_fields:
-                    status = DiffStatus.UNCHANGED
-                    result.total_unchanged += 1
-                elif is_local_modified and is_remote_modified:
-                    status = DiffStatus.CONFLICT
-                    result.total_conflicts += 1
-                elif is_local_modified:
-                    status = DiffStatus.LOCAL_MODIFIED
-                    result.total_local_modified += 1
-                elif is_remote_modified:
-                    status = DiffStatus.REMOTE_MODIFIED
-                    result.total_remote_modified += 1
-                else:
-                    status = DiffStatus.LOCAL_MODIFIED
-                    result.total_local_modified += 1
-
-                result.objects.append(
-                    ObjectDiff(
-                        object_type=obj_type,
-                        object_id=obj_id,
-                        name=name,
-                        status=status,
-                        local_modified_at=stored_remote_modified,
-                        remote_modified_at=remote_modified,
-                        changed_fields=changed_fields,
-                        field_diffs=field_diffs,
-                    )
-                )
+        if self._local_index.is_fresh(file_path) and entry.data_hash == hash_object_data(remote[0]):
+            return None, remote
+        return self._load_object(file_path), remote
 
-        return result
+    def _diff_object(
+        self,
+        obj_type: ObjectType,
+        file_path: Path,
+        entry: IndexEntry,
+        local_obj: LocalObject | None,
+        remote: tuple[dict[str, Any], datetime | None] | None,
+        git_status: GitStatus,
+    ) -> ObjectDiff:
+        obj_id = entry.object_id
+
+        if remote is None:
+            return ObjectDiff(object_type=obj_type, object_id=obj_id, name=entry.name, status=DiffStatus.LOCAL_ONLY)
+
+        if local_obj is None:
+            return ObjectDiff(
+                object_type=obj_type,
+                object_id=obj_id,
+                name=entry.name,
+                status=DiffStatus.UNCHANGED,
+                local_modified_at=entry.remote_modified_at,
+                remote_modified_at=remote[1],
+            )
+
+        name = local_obj.data.get("name", f"Object {obj_id}")
+        remote_data, remote_modified = remote
+        stored_remote_modified = local_obj.meta.remote_modified_at
+        changed_fields = self._compare_objects(local_obj.data, remote_data, obj_type)
+
+        field_diffs = [
+            FieldDiff(
+                field=field,
+                source_value=remote_data.get(field),
+                target_value=local_obj.data.get(field),
+            )
+            for field in changed_fields
+        ]
+
+        is_local_modified = self._is_git_modified(file_path, git_status)
+        is_remote_modified = stored_remote_modified != remote_modified
+
+        if not changed_fields:
+            status = DiffStatus.UNCHANGED
+        elif is_local_modified and is_remote_modified:
+            status = DiffStatus.CONFLICT
+        elif is_local_modified:
+            status = DiffStatus.LOCAL_MODIFIED
+        elif is_remote_modified:
+            status = DiffStatus.REMOTE_MODIFIED
+        else:
+            status = DiffStatus.LOCAL_MODIFIED
+
+        return ObjectDiff(
+            object_type=obj_type,
+            object_id=obj_id,
+            name=name,
+            status=status,
+            local_modified_at=stored_remote_modified,
+            remote_modified_at=remote_modified,
+            changed_fields=changed_fields,
+            field_diffs=field_diffs,
+        )
 
     def _retrieve_remote_object(self, client: SyncRossumAPIClient, obj_type: ObjectType, obj_id: int) -> Any:
         """Retrieve raw remote object by type."""
@@ -620,40 +735,15 @@ class Workspace:
                 changed.append(key)
         return changed
 
-    def _is_git_modified(self, file_path: Path) -> bool:
+    def _is_git_modified(self, file_path: Path, git_status: GitStatus | None = None) -> bool:
         """Check if a file has uncommitted modifications using Git.
 
-        Only returns True for actual modifications to tracked files.
-        Untracked files (??) and newly staged files (A) are not considered
-        "modified" since they represent a fresh pull, not user edits.
-
-        Git status codes:
-        - "M " = staged modified
-        - " M" = unstaged modified
-        - "MM" = both staged and unstaged modifications
-        - "A " = staged new file (excluded)
-        - "??" = untracked file (excluded)
+        Pass the `GitStatus` snapshot of the running operation; without one, a fresh
+        snapshot of the whole workspace is taken.
         """
-        try:
-            git_executable = shutil.which("git")
-            if not git_executable:
-                return False
-            result = subprocess.run(
-                [git_executable, "status", "-s", "--", str(file_path.resolve())],
-                cwd=file_path.parent,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode != 0:
-                return False
-            status = result.stdout.strip()
-            if not status:
-                return False
-            status_code = status[:2]
-            return "M" in status_code
-        except FileNotFoundError:
-            return False
+        if git_status is None:
+            git_status = GitStatus.capture(self.path)
+        return git_status.is_modified(file_path)
 
     def push(self, dry_run: bool = False, force: bool = False) -> PushResult:
         """Push local changes to Rossum.
@@ -816,10 +906,7 @@ class Workspace:
         return False
 
     def _find_object_path(self, obj_type: ObjectType, obj_id: int) -> Path | None:
-        for path in self._list_local_objects(obj_type):
-            if f"_{obj_id}.json" in path.name:
-                return path
-        return None
+        return self._local_index.path_of(obj_type, obj_id)
 
     def copy_workspace(
         self,
@@ -827,17 +914,24 @@ class Workspace:
         target_org_id: int,
         target_api_base: str | None = None,
         target_token: str | None = None,
+        resume: bool = False,
     ) -> CopyResult:
         """Copy a single workspace and all its objects to a target org.
 
         Copies the workspace, all queues within it, schemas, engines, hooks,
         connectors, inboxes, email templates, and rules associated with those queues.
 
+        Objects are created level by level (workspace, schemas, queues, then everything
+        that references queues or schemas), concurrently within a level up to `max_workers`.
+        The ID mapping is saved after every created object, so an interrupted copy can be
+        continued with `resume=True` without creating anything twice.
+
         Args:
             source_workspace_id: Source workspace ID to copy
             target_org_id: Target organization ID to copy to
             target_api_base: API base for target org (if different from source)
             target_token: API token for target org (if different from source)
+            resume: Continue from the saved ID mapping, skipping objects that were already copied
         """
         source_client = self.client
         target_client = self._get_target_client(target_api_base, target_token)
@@ -847,7 +941,7 @@ class Workspace:
         source_ws = source_client.retrieve_workspace(source_workspace_id)
         source_org_id = int(source_ws.organization.split("/")[-1]) if source_ws.organization else 0
 
-        id_mapping = IdMapping(source_org_id=source_org_id, target_org_id=target_org_id)
+        id_mapping = self._start_id_mapping(source_org_id, target_org_id, resume)
 
         self._copy_workspaces([source_ws], target_client, target_org_id, id_mapping, result)
 
@@ -857,12 +951,18 @@ class Workspace:
         source_queue_urls = {f"{source_client.internal_client.base_url}/queues/{q.id}" for q, _ in source_queues}
         source_schema_urls = {q.schema for q, _ in source_queues if q.schema}
 
-        self._copy_engines(source_client, target_client, source_queue_urls, id_mapping, result)
-        self._copy_hooks(source_client, target_client, source_queue_urls, id_mapping, result)
-        self._copy_connectors(source_client, target_client, source_queue_urls, id_mapping, result)
-        self._copy_inboxes(source_client, target_client, source_queue_urls, id_mapping, result)
-        self._copy_email_templates(source_client, target_client, source_queue_urls, id_mapping, result)
-        self._copy_rules(source_client, target_client, source_schema_urls, id_mapping, result)
+        self._run_copy_level(
+            [
+                *self._engine_copy_tasks(source_client, target_client, source_queue_urls),
+                *self._hook_copy_tasks(source_client, target_client, source_queue_urls),
+                *self._connector_copy_tasks(source_client, target_client, source_queue_urls),
+                *self._inbox_copy_tasks(source_client, target_client, source_queue_urls),
+                *self._email_template_copy_tasks(source_client, target_client, source_queue_urls),
+                *self._rule_copy_tasks(source_client, target_client, source_schema_urls),
+            ],
+            id_mapping,
+            result,
+        )
 
         result.id_mapping = id_mapping
         self._save_id_mapping(id_mapping)
@@ -875,21 +975,53 @@ class Workspace:
             if queue.workspace and int(queue.workspace.split("/")[-1]) == workspace_id
         ]
 
-    def _copy_engines(
-        self,
-        source_client: SyncRossumAPIClient,
-        target_client: SyncRossumAPIClient,
-        source_queue_urls: set[str],
-        id_mapping: IdMapping,
-        result: CopyResult,
-    ) -> None:
-        engine_urls_to_copy = self._collect_engine_urls_from_queues(source_client, source_queue_urls)
+    def _start_id_mapping(self, source_org_id: int, target_org_id: int, resume: bool) -> IdMapping:
+        if resume and (saved := self._load_id_mapping(source_org_id, target_org_id)) is not None:
+            logger.info(f"Resuming copy from saved ID mapping {source_org_id} -> {target_org_id}")
+            return saved
+        return IdMapping(source_org_id=source_org_id, target_org_id=target_org_id)
 
-        for engine in source_client.list_engines():
-            if engine.url not in engine_urls_to_copy:
-                continue
+    def _run_copy_level(self, tasks: list[_CopyTask], id_mapping: IdMapping, result: CopyResult) -> None:
+        """Create one level of the copy graph concurrently, checkpointing the ID mapping per object.
 
-            self._copy_single_engine(engine, target_client, id_mapping, result)
+        Objects already present in `id_mapping` are skipped. Objects only reference objects of
+        earlier levels, so every task works on a private copy of the mapping taken at the start
+        of the level; its additions and outcome are merged back and saved as soon as it finishes.
+        """
+        pending: list[Callable[[IdMapping, CopyResult], None]] = []
+        for obj_type, obj_id, name, copy in tasks:
+            if id_mapping.get(obj_type, obj_id) is not None:
+                result.skipped.append((obj_type, obj_id, name, "already copied"))
+            else:
+                pending.append(copy)
+
+        level_start = id_mapping.model_dump()
+        merge_lock = threading.Lock()
+
+        def run(copy: Callable[[IdMapping, CopyResult], None]) -> None:
+            task_mapping = IdMapping.model_validate(level_start)
+            task_result = CopyResult()
+            copy(task_mapping, task_result)
+            with merge_lock:
+                for obj_type, source_id, target_id, _ in task_result.created:
+                    id_mapping.add(obj_type, source_id, target_id)
+                result.created.extend(task_result.created)
+                result.skipped.extend(task_result.skipped)
+                result.failed.extend(task_result.failed)
+                if task_result.created:
+                    self._save_id_mapping(id_mapping)
+
+        map_concurrently(run, pending, self.max_workers)
+
+    def _engine_copy_tasks(
+        self, source_client: SyncRossumAPIClient, target_client: SyncRossumAPIClient, source_queue_urls: set[str]
+    ) -> list[_CopyTask]:
+        engine_urls_to_copy = self._collect_engine_urls_from_queues(source_client.list_queues(), source_queue_urls)
+        return [
+            (ObjectType.ENGINE, engine.id, engine.name, partial(self._copy_single_engine, engine, target_client))
+            for engine in source_client.list_engines()
+            if engine.url in engine_urls_to_copy
+        ]
 
     def _copy_single_engine(
         self, engine: Engine, target_client: SyncRossumAPIClient, id_mapping: IdMapping, result: CopyResult
@@ -916,26 +1048,25 @@ class Workspace:
         except Exception as e:
             result.failed.append((ObjectType.ENGINE, engine.id, engine.name, str(e)))
 
-    def _copy_connectors(
-        self,
-        source_client: SyncRossumAPIClient,
-        target_client: SyncRossumAPIClient,
-        source_queue_urls: set[str],
-        id_mapping: IdMapping,
-        result: CopyResult,
-    ) -> None:
+    def _connector_copy_tasks(
+        self, source_client: SyncRossumAPIClient, target_client: SyncRossumAPIClient, source_queue_urls: set[str]
+    ) -> list[_CopyTask]:
         try:
             connectors = list(source_client.list_connectors())
         except Exception as e:
             logger.warning(f"Failed to list connectors (SDK deserialization issue): {e}")
-            return
-
-        for connector in connectors:
-            connector_queues = set(connector.queues or [])
-            if not (connector_queues & source_queue_urls):
-                continue
+            return []
 
-            self._copy_single_connector(connector, target_client, id_mapping, result)
+        return [
+            (
+                ObjectType.CONNECTOR,
+                connector.id,
+                connector.name,
+                partial(self._copy_single_connector, connector, target_client),
+            )
+            for connector in connectors
+            if set(connector.queues or []) & source_queue_urls
+        ]
 
     def _copy_single_connector(
         self, connector: Connector, target_client: SyncRossumAPIClient, id_mapping: IdMapping, result: CopyResult
@@ -967,20 +1098,19 @@ class Workspace:
         except Exception as e:
             result.failed.append((ObjectType.CONNECTOR, connector.id, connector.name, str(e)))
 
-    def _copy_inboxes(
-        self,
-        source_client: SyncRossumAPIClient,
-        target_client: SyncRossumAPIClient,
-        source_queue_urls: set[str],
-        id_mapping: IdMapping,
-        result: CopyResult,
-    ) -> None:
-        for inbox in source_client.request_paginated("inboxes"):
-            inbox_queues = set(inbox.get("queues", []))
-            if not (inbox_queues & source_queue_urls):
-                continue
-
-            self._copy_single_inbox(inbox, target_client, id_mapping, result)
+    def _inbox_copy_tasks(
+        self, source_client: SyncRossumAPIClient, target_client: SyncRossumAPIClient, source_queue_urls: set[str]
+    ) -> list[_CopyTask]:
+        return [
+            (
+                ObjectType.INBOX,
+                inbox["id"],
+                inbox.get("name", f"Inbox {inbox['id']}"),
+                partial(self._copy_single_inbox, inbox, target_client),
+            )
+            for inbox in source_client.request_paginated("inboxes")
+            if set(inbox.get("queues", [])) & source_queue_urls
+        ]
 
     def _copy_single_inbox(
         self, inbox: dict[str, Any], target_client: SyncRossumAPIClient, id_mapping: IdMapping, result: CopyResult
@@ -1017,19 +1147,19 @@ class Workspace:
             inbox_name = inbox.get("name", f"Inbox {inbox['id']}")
             result.failed.append((ObjectType.INBOX, inbox["id"], inbox_name, str(e)))
 
-    def _copy_email_templates(
-        self,
-        source_client: SyncRossumAPIClient,
-        target_client: SyncRossumAPIClient,
-        source_queue_urls: set[str],
-        id_mapping: IdMapping,
-        result: CopyResult,
-    ) -> None:
-        for template in source_client.list_email_templates():
-            if not template.queue or template.queue not in source_queue_urls:
-                continue
-
-            self._copy_single_email_template(template, target_client, id_mapping, result)
+    def _email_template_copy_tasks(
+        self, source_client: SyncRossumAPIClient, target_client: SyncRossumAPIClient, source_queue_urls: set[str]
+    ) -> list[_CopyTask]:
+        return [
+            (
+                ObjectType.EMAIL_TEMPLATE,
+                template.id,
+                template.name,
+                partial(self._copy_single_email_template, template, target_client),
+            )
+            for template in source_client.list_email_templates()
+            if template.queue and template.queue in source_queue_urls
+        ]
 
     def _copy_single_email_template(
         self, template: EmailTemplate, target_client: SyncRossumAPIClient, id_mapping: IdMapping, result: CopyResult
@@ -1074,19 +1204,14 @@ class Workspace:
         except Exception as e:
             result.failed.append((ObjectType.EMAIL_TEMPLATE, template.id, template.name, str(e)))
 
-    def _copy_rules(
-        self,
-        source_client: SyncRossumAPIClient,
-        target_client: SyncRossumAPIClient,
-        source_schema_urls: set[str],
-        id_mapping: IdMapping,
-        result: CopyResult,
-    ) -> None:
-        for rule in source_client.list_rules():
-            if rule.schema is None or rule.schema not in source_schema_urls:
-                continue
-
-            self._copy_single_rule(rule, target_client, id_mapping, result)
+    def _rule_copy_tasks(
+        self, source_client: SyncRossumAPIClient, target_client: SyncRossumAPIClient, source_schema_urls: set[str]
+    ) -> list[_CopyTask]:
+        return [
+            (ObjectType.RULE, rule.id, rule.name, partial(self._copy_single_rule, rule, target_client))
+            for rule in source_client.list_rules()
+            if rule.schema is not None and rule.schema in source_schema_urls
+        ]
 
     def _copy_single_rule(
         self, rule: Rule, target_client: SyncRossumAPIClient, id_mapping: IdMapping, result: CopyResult
@@ -1135,23 +1260,28 @@ class Workspace:
         target_org_id: int,
         target_api_base: str | None = None,
         target_token: str | None = None,
+        resume: bool = False,
     ) -> CopyResult:
         """Copy all objects from source org to target org.
 
         Creates new objects in target org, mapping IDs for references.
         Use this to set up a sandbox that mirrors production.
 
+        Like `copy_workspace`, objects are created concurrently level by level and the ID
+        mapping is saved after every created object, so the copy can be resumed.
+
         Args:
             source_org_id: Source organization ID (e.g., production)
             target_org_id: Target organization ID (e.g., sandbox)
             target_api_base: API base for target org (if different from source)
             target_token: API token for target org (if different from source)
+            resume: Continue from the saved ID mapping, skipping objects that were already copied
         """
         source_client = self.client
         target_client = self._get_target_client(target_api_base, target_token)
 
         result = CopyResult()
-        id_mapping = IdMapping(source_org_id=source_org_id, target_org_id=target_org_id)
+        id_mapping = self._start_id_mapping(source_org_id, target_org_id, resume)
 
         source_workspaces = [
             ws for ws in source_client.list_workspaces() if ws.organization and str(source_org_id) in ws.organization
@@ -1187,16 +1317,33 @@ class Workspace:
         result: CopyResult,
     ) -> None:
         target_org_url = f"{target_client.internal_client.base_url}/organizations/{target_org_id}"
+        tasks: list[_CopyTask] = [
+            (
+                ObjectType.WORKSPACE,
+                ws.id,
+                ws.name,
+                partial(self._copy_single_workspace, ws, target_client, target_org_url),
+            )
+            for ws in source_workspaces
+        ]
+        self._run_copy_level(tasks, id_mapping, result)
 
-        for ws in source_workspaces:
-            try:
-                new_ws = target_client.create_new_workspace(
-                    {"name": ws.name, "organization": target_org_url, "metadata": ws.metadata or {}}
-                )
-                id_mapping.add(ObjectType.WORKSPACE, ws.id, new_ws.id)
-                result.created.append((ObjectType.WORKSPACE, ws.id, new_ws.id, ws.name))
-            except Exception as e:
-                result.failed.append((ObjectType.WORKSPACE, ws.id, ws.name, str(e)))
+    def _copy_single_workspace(
+        self,
+        ws: RossumWorkspace,
+        target_client: SyncRossumAPIClient,
+        target_org_url: str,
+        id_mapping: IdMapping,
+        result: CopyResult,
+    ) -> None:
+        try:
+            new_ws = target_client.create_new_workspace(
+                {"name": ws.name, "organization": target_org_url, "metadata": ws.metadata or {}}
+            )
+            id_mapping.add(ObjectType.WORKSPACE, ws.id, new_ws.id)
+            result.created.append((ObjectType.WORKSPACE, ws.id, new_ws.id, ws.name))
+        except Exception as e:
+            result.failed.append((ObjectType.WORKSPACE, ws.id, ws.name, str(e)))
 
     def _get_source_queues(self, source_client: SyncRossumAPIClient, id_mapping: IdMapping) -> list[tuple[Queue, int]]:
         source_ws_ids = set(id_mapping.get_all(ObjectType.WORKSPACE).keys())
@@ -1216,51 +1363,104 @@ class Workspace:
         id_mapping: IdMapping,
         result: CopyResult,
     ) -> None:
-        """Copy queues and their schemas to target org."""
+        """Copy queues and their schemas to target org.
+
+        Schemas are created first, once per source schema, so queues sharing a schema keep
+        sharing its copy; queues follow once all schemas exist.
+        """
+        queues_to_copy: list[tuple[Queue, int]] = []
         for queue, source_ws_id in source_queues:
-            target_ws_id = id_mapping.get(ObjectType.WORKSPACE, source_ws_id)
-            if not target_ws_id:
+            if not id_mapping.get(ObjectType.WORKSPACE, source_ws_id):
                 result.skipped.append((ObjectType.QUEUE, queue.id, queue.name, "workspace not copied"))
                 continue
+            queues_to_copy.append((queue, source_ws_id))
+
+        schema_ids = sorted({int(queue.schema.split("/")[-1]) for queue, _ in queues_to_copy if queue.schema})
+        schema_tasks: list[_CopyTask] = [
+            (
+                ObjectType.SCHEMA,
+                schema_id,
+                f"Schema {schema_id}",
+                partial(self._copy_single_schema, schema_id, source_client, target_client),
+            )
+            for schema_id in schema_ids
+        ]
+        self._run_copy_level(schema_tasks, id_mapping, result)
+
+        queue_tasks: list[_CopyTask] = [
+            (
+                ObjectType.QUEUE,
+                queue.id,
+                queue.name,
+                partial(self._copy_single_queue, queue, source_ws_id, target_client),
+            )
+            for queue, source_ws_id in queues_to_copy
+        ]
+        self._run_copy_level(queue_tasks, id_mapping, result)
 
-            try:
-                source_schema = source_client.retrieve_schema(int(queue.schema.split("/")[-1]))
-                schema_content = self._serialize_schema_content(source_schema.content or [])
-                new_schema = target_client.create_new_schema(
-                    {
-                        "name": source_schema.name,
-                        "content": schema_content,
-                    }
-                )
-                id_mapping.add(ObjectType.SCHEMA, source_schema.id, new_schema.id)
-                result.created.append((ObjectType.SCHEMA, source_schema.id, new_schema.id, source_schema.name))
-
-                target_ws_url = f"{target_client.internal_client.base_url}/workspaces/{target_ws_id}"
-                target_schema_url = f"{target_client.internal_client.base_url}/schemas/{new_schema.id}"
-
-                new_queue = target_client.create_new_queue(
-                    {
-                        "name": queue.name,
-                        "workspace": target_ws_url,
-                        "schema": target_schema_url,
-                        "session_timeout": queue.session_timeout,
-                        # rir_url is internal cluster URL, not valid for copying
-                        "automation_enabled": queue.automation_enabled,
-                        "automation_level": queue.automation_level,
-                        "default_score_threshold": queue.default_score_threshold,
-                        "locale": queue.locale,
-                        "metadata": queue.metadata or {},
-                        "settings": queue.settings or {},
-                        "use_confirmed_state": queue.use_confirmed_state,
-                        "document_lifetime": queue.document_lifetime,
-                        "delete_after": queue.delete_after,
-                        "training_enabled": queue.training_enabled,
-                    }
-                )
-                id_mapping.add(ObjectType.QUEUE, queue.id, new_queue.id)
-                result.created.append((ObjectType.QUEUE, queue.id, new_queue.id, queue.name))
-            except Exception as e:
-                result.failed.append((ObjectType.QUEUE, queue.id, queue.name, str(e)))
+    def _copy_single_schema(
+        self,
+        schema_id: int,
+        source_client: SyncRossumAPIClient,
+        target_client: SyncRossumAPIClient,
+        id_mapping: IdMapping,
+        result: CopyResult,
+    ) -> None:
+        try:
+            source_schema = source_client.retrieve_schema(schema_id)
+            schema_content = self._serialize_schema_content(source_schema.content or [])
+            new_schema = target_client.create_new_schema(
+                {
+                    "name": source_schema.name,
+                    "content": schema_content,
+                }
+            )
+            id_mapping.add(ObjectType.SCHEMA, source_schema.id, new_schema.id)
+            result.created.append((ObjectType.SCHEMA, source_schema.id, new_schema.id, source_schema.name))
+        except Exception as e:
+            result.failed.append((ObjectType.SCHEMA, schema_id, f"Schema {schema_id}", str(e)))
+
+    def _copy_single_queue(
+        self,
+        queue: Queue,
+        source_ws_id: int,
+        target_client: SyncRossumAPIClient,
+        id_mapping: IdMapping,
+        result: CopyResult,
+    ) -> None:
+        try:
+            target_ws_id = id_mapping.get(ObjectType.WORKSPACE, source_ws_id)
+            target_schema_id = id_mapping.get(ObjectType.SCHEMA, int(queue.schema.split("/")[-1]))
+            if not target_schema_id:
+                result.skipped.append((ObjectType.QUEUE, queue.id, queue.name, "schema not copied"))
+                return
+
+            target_ws_url = f"{target_client.internal_client.base_url}/workspaces/{target_ws_id}"
+            target_schema_url = f"{target_client.internal_client.base_url}/schemas/{target_schema_id}"
+
+            new_queue = target_client.create_new_queue(
+                {
+                    "name": queue.name,
+                    "workspace": target_ws_url,
+                    "schema": target_schema_url,
+                    "session_timeout": queue.session_timeout,
+                    # rir_url is internal cluster URL, not valid for copying
+                    "automation_enabled": queue.automation_enabled,
+                    "automation_level": queue.automation_level,
+                    "default_score_threshold": queue.default_score_threshold,
+                    "locale": queue.locale,
+                    "metadata": queue.metadata or {},
+                    "settings": queue.settings or {},
+                    "use_confirmed_state": queue.use_confirmed_state,
+                    "document_lifetime": queue.document_lifetime,
+                    "delete_after": queue.delete_after,
+                    "training_enabled": queue.training_enabled,
+                }
+            )
+            id_mapping.add(ObjectType.QUEUE, queue.id, new_queue.id)
+            result.created.append((ObjectType.QUEUE, queue.id, new_queue.id, queue.name))
+        except Exception as e:
+            result.failed.append((ObjectType.QUEUE, queue.id, queue.name, str(e)))
 
     def _copy_hooks(
         self,
@@ -1270,12 +1470,18 @@ class Workspace:
         id_mapping: IdMapping,
         result: CopyResult,
     ) -> None:
-        for hook in source_client.list_hooks():
-            hook_queues = set(hook.queues or [])
-            if not (hook_queues & source_queue_urls):
-                continue
+        self._run_copy_level(
+            self._hook_copy_tasks(source_client, target_client, source_queue_urls), id_mapping, result
+        )
 
-            self._copy_single_hook(hook, target_client, id_mapping, result)
+    def _hook_copy_tasks(
+        self, source_client: SyncRossumAPIClient, target_client: SyncRossumAPIClient, source_queue_urls: set[str]
+    ) -> list[_CopyTask]:
+        return [
+            (ObjectType.HOOK, hook.id, hook.name, partial(self._copy_single_hook, hook, target_client))
+            for hook in source_client.list_hooks()
+            if set(hook.queues or []) & source_queue_urls
+        ]
 
     def _copy_single_hook(
         self, hook: Hook, target_client: SyncRossumAPIClient, id_mapping: IdMapping, result: CopyResult
@@ -1319,13 +1525,10 @@ class Workspace:
         except Exception as e:
             result.failed.append((ObjectType.HOOK, hook.id, hook.name, str(e)))
 
-    def _remap_hook_config(self, hook_config: dict[str, Any], id_mapping: IdMapping) -> dict[str, Any]:
+    def _remap_hook_config(self, hook_config: dict[str, Any], id_mapping: IdMapping | IdRemapper) -> dict[str, Any]:
         """Remap queue IDs in hook config code."""
         if "code" in hook_config:
-            code = hook_config["code"]
-            for src_id, tgt_id in id_mapping.get_all(ObjectType.QUEUE).items():
-                code = code.replace(str(src_id), str(tgt_id))
-            hook_config["code"] = code
+            hook_config["code"] = IdRemapper.of(id_mapping).remap_queue_ids(hook_config["code"])
         return hook_config
 
     def _serialize_schema_content(self, content: list[Any]) -> list[dict[str, Any]]:
@@ -1405,12 +1608,18 @@ class Workspace:
 
         return cleaned
 
-    def _save_id_mapping(self, id_mapping: IdMapping) -> Path:
+    def _write_checkpoint_file(self, path: Path, data: dict[str, Any]) -> Path:
+        """Write JSON via a temporary file and rename, so an interruption never leaves a truncated file."""
         self.path.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        tmp_path.replace(path)
+        return path
+
+    def _save_id_mapping(self, id_mapping: IdMapping) -> Path:
         mapping_path = self.path / f".id_mapping_{id_mapping.source_org_id}_to_{id_mapping.target_org_id}.json"
-        with open(mapping_path, "w") as f:
-            json.dump(id_mapping.model_dump(mode="json"), f, indent=2)
-        return mapping_path
+        return self._write_checkpoint_file(mapping_path, id_mapping.model_dump(mode="json"))
 
     def _load_id_mapping(self, source_org_id: int, target_org_id: int) -> IdMapping | None:
         mapping_path = self.path / f".id_mapping_{source_org_id}_to_{target_org_id}.json"
@@ -1420,6 +1629,19 @@ class Workspace:
             result: IdMapping = IdMapping.model_validate(json.load(f))
             return result
 
+    def _save_deploy_checkpoint(self, checkpoint: DeployCheckpoint) -> Path:
+        checkpoint_path = (
+            self.path / f".deploy_checkpoint_{checkpoint.source_org_id}_to_{checkpoint.target_org_id}.json"
+        )
+        return self._write_checkpoint_file(checkpoint_path, checkpoint.model_dump(mode="json"))
+
+    def _load_deploy_checkpoint(self, source_org_id: int, target_org_id: int) -> DeployCheckpoint | None:
+        checkpoint_path = self.path / f".deploy_checkpoint_{source_org_id}_to_{target_org_id}.json"
+        if not checkpoint_path.exists():
+            return None
+        with open(checkpoint_path) as f:
+            return DeployCheckpoint.model_validate(json.load(f))
+
     def deploy(
         self,
         target_org_id: int,
@@ -1427,6 +1649,7 @@ class Workspace:
         target_token: str | None = None,
         id_mapping: IdMapping | None = None,
         dry_run: bool = False,
+        resume: bool = False,
     ) -> DeployResult:
         """Deploy local changes to a target organization.
 
@@ -1440,12 +1663,55 @@ class Workspace:
             target_token: API token for target org (if different)
             id_mapping: ID mapping from copy_org (auto-loaded if not provided)
             dry_run: If True, only show what would be deployed
+            resume: Skip objects the previous deploy to this org already updated with the
+                same local content, so only failed, unfinished or edited objects are deployed
 
         Raises:
             ValueError: If no source org_id is configured (run pull first)
             ValueError: If no ID mapping found (run copy_org first)
         """
+        return self.collect_deploy_result(
+            self.iter_deploy(
+                target_org_id,
+                target_api_base=target_api_base,
+                target_token=target_token,
+                id_mapping=id_mapping,
+                dry_run=dry_run,
+                resume=resume,
+            )
+        )
+
+    @staticmethod
+    def collect_deploy_result(outcomes: Iterable[DeployObjectResult]) -> DeployResult:
+        """Build a `DeployResult` from `iter_deploy` outcomes.
+
+        Outcomes arrive in completion order; they are reported grouped by type in deploy
+        order and by source ID within a type, so the summary does not depend on timing.
+        """
+        result = DeployResult()
+        for outcome in sorted(
+            outcomes, key=lambda outcome: (PUSHABLE_TYPES.index(outcome.object_type), outcome.source_id)
+        ):
+            result.add(outcome)
+        return result
 
+    def iter_deploy(
+        self,
+        target_org_id: int,
+        target_api_base: str | None = None,
+        target_token: str | None = None,
+        id_mapping: IdMapping | None = None,
+        dry_run: bool = False,
+        resume: bool = False,
+    ) -> Iterator[DeployObjectResult]:
+        """Deploy local changes to a target organization, yielding each object's outcome as it completes.
+
+        Object types are deployed one after another in `PUSHABLE_TYPES` order; the objects of a
+        type are updated concurrently, bounded by `max_workers`. Successful updates are recorded
+        in a `.deploy_checkpoint_{source}_to_{target}.json` file, saved after every type and every
+        `_DEPLOY_CHECKPOINT_INTERVAL` updates, which `resume=True` uses to retry only what did not
+        go through. See `deploy` for the arguments.
+        """
         source_client = self.client
 
         if target_api_base and target_token:
@@ -1465,49 +1731,110 @@ class Workspace:
                 f"No ID mapping found for {source_org_id} → {target_org_id}. Run copy_org first to create the sandbox."
             )
 
+        index = self._refresh_index()
         source_ws_paths = self._list_local_objects(ObjectType.WORKSPACE)
         if source_ws_paths:
             source_ws_id = self._load_object(source_ws_paths[0]).meta.object_id
             target_ws_id = id_mapping.get(ObjectType.WORKSPACE, source_ws_id) or 0
             id_mapping = self._normalize_id_mapping(id_mapping, source_ws_id, target_ws_id)
 
-        result = DeployResult()
-
+        checkpoint = self._load_deploy_checkpoint(source_org_id, target_org_id) if resume else None
+        if checkpoint is None:
+            checkpoint = DeployCheckpoint(source_org_id=source_org_id, target_org_id=target_org_id)
+        remapper = IdRemapper(id_mapping)
+
+        deploy_object = partial(
+            self._deploy_object,
+            id_mapping=id_mapping,
+            remapper=remapper,
+            target_client=target_client,
+            checkpoint=checkpoint,
+            dry_run=dry_run,
+        )
         for obj_type in PUSHABLE_TYPES:
-            for path in self._list_local_objects(obj_type):
-                local_obj = self._load_object(path)
-                source_id = local_obj.meta.object_id
-                name = local_obj.data.get("name", f"Object {source_id}")
-
-                target_id = id_mapping.get(obj_type, source_id)
-                if not target_id:
-                    result.skipped.append((obj_type, source_id, name, "no target mapping"))
-                    continue
+            items = [(obj_type, path, entry) for path, entry in index.entries(obj_type)]
+            outcomes = iter_completed(deploy_object, items, self.max_workers)
+            if dry_run:
+                yield from (outcome for _, outcome in outcomes)
+            else:
+                yield from self._checkpoint_deployed(outcomes, checkpoint)
 
-                if dry_run:
-                    result.updated.append((obj_type, target_id, name))
-                    continue
+    def _checkpoint_deployed(
+        self,
+        outcomes: Iterator[tuple[tuple[ObjectType, Path, IndexEntry], DeployObjectResult]],
+        checkpoint: DeployCheckpoint,
+    ) -> Iterator[DeployObjectResult]:
+        """Record updated objects in the checkpoint as their outcomes pass through.
 
-                try:
-                    data = self._prepare_deploy_data(local_obj.data, obj_type, id_mapping, target_client)
-                    self._push_object(target_client, obj_type, target_id, data)
-                    result.updated.append((obj_type, target_id, name))
-                except Exception as e:
-                    result.failed.append((obj_type, source_id, name, str(e)))
+        The checkpoint is saved every `_DEPLOY_CHECKPOINT_INTERVAL` updates and once the
+        outcomes are exhausted or the consumer stops early.
+        """
+        unsaved = 0
+        try:
+            for (obj_type, _, entry), outcome in outcomes:
+                if outcome.status == DeployStatus.UPDATED:
+                    checkpoint.mark_deployed(obj_type, entry.object_id, entry.data_hash)
+                    unsaved += 1
+                    if unsaved >= _DEPLOY_CHECKPOINT_INTERVAL:
+                        self._save_deploy_checkpoint(checkpoint)
+                        unsaved = 0
+                yield outcome
+        finally:
+            if unsaved:
+                self._save_deploy_checkpoint(checkpoint)
+
+    def _deploy_object(
+        self,
+        item: tuple[ObjectType, Path, IndexEntry],
+        *,
+        id_mapping: IdMapping,
+        remapper: IdRemapper,
+        target_client: SyncRossumAPIClient,
+        checkpoint: DeployCheckpoint,
+        dry_run: bool,
+    ) -> DeployObjectResult:
+        obj_type, path, entry = item
+        outcome = DeployObjectResult(
+            object_type=obj_type, source_id=entry.object_id, name=entry.name, status=DeployStatus.SKIPPED
+        )
+        outcome.target_id = id_mapping.get(obj_type, entry.object_id)
+        if not outcome.target_id:
+            outcome.detail = "no target mapping"
+            return outcome
+        if checkpoint.is_deployed(obj_type, entry.object_id, entry.data_hash):
+            outcome.detail = "already deployed"
+            return outcome
+        if dry_run:
+            outcome.status = DeployStatus.UPDATED
+            return outcome
 
-        return result
+        try:
+            data = self._prepare_deploy_data(self._load_object(path).data, obj_type, remapper, target_client)
+            call_with_rate_limit_retry(partial(self._push_object, target_client, obj_type, outcome.target_id, data))
+        except Exception as e:
+            outcome.status = DeployStatus.FAILED
+            outcome.detail = str(e)
+            return outcome
+
+        outcome.status = DeployStatus.UPDATED
+        return outcome
 
     def _prepare_deploy_data(
-        self, data: dict[str, Any], obj_type: ObjectType, id_mapping: IdMapping, target_client: SyncRossumAPIClient
+        self,
+        data: dict[str, Any],
+        obj_type: ObjectType,
+        id_mapping: IdMapping | IdRemapper,
+        target_client: SyncRossumAPIClient,
     ) -> dict[str, Any]:
         """Prepare object data for deployment by replacing IDs."""
         prepared = {k: v for k, v in data.items() if k not in IGNORED_FIELDS and not k.startswith("_")}
         target_base = target_client.internal_client.base_url
+        remapper = IdRemapper.of(id_mapping)
 
         if obj_type == ObjectType.QUEUE:
-            self._prepare_queue_deploy_data(prepared, id_mapping, target_base)
+            self._prepare_queue_deploy_data(prepared, remapper, target_base)
         elif obj_type == ObjectType.HOOK:
-            self._prepare_hook_deploy_data(prepared, id_mapping, target_base)
+            self._prepare_hook_deploy_data(prepared, remapper, target_base)
         elif obj_type == ObjectType.INBOX:
             # Inbox-queue relationship is immutable after creation
             # email and email_hash are auto-generated and cannot be updated
@@ -1516,52 +1843,46 @@ class Workspace:
             prepared.pop("email", None)
             prepared.pop("email_hash", None)
         elif obj_type == ObjectType.EMAIL_TEMPLATE:
-            self._prepare_email_template_deploy_data(prepared, id_mapping, target_base)
+            self._prepare_email_template_deploy_data(prepared, remapper, target_base)
         elif obj_type == ObjectType.SCHEMA and "content" in prepared:
             prepared["content"] = self._clean_schema_content(prepared["content"])
 
         return prepared
 
-    def _prepare_queue_deploy_data(self, prepared: dict[str, Any], id_mapping: IdMapping, target_base: str) -> None:
+    def _prepare_queue_deploy_data(self, prepared: dict[str, Any], remapper: IdRemapper, target_base: str) -> None:
         """Remap queue references for deployment."""
-        if "schema" in prepared:
-            source_schema_id = int(prepared["schema"].split("/")[-1])
-            target_schema_id = id_mapping.get(ObjectType.SCHEMA, source_schema_id)
-            if target_schema_id:
-                prepared["schema"] = f"{target_base}/schemas/{target_schema_id}"
+        if "schema" in prepared and (
+            schema_url := remapper.remap_url(prepared["schema"], ObjectType.SCHEMA, target_base)
+        ):
+            prepared["schema"] = schema_url
 
-        if "workspace" in prepared:
-            source_ws_id = int(prepared["workspace"].split("/")[-1])
-            target_ws_id = id_mapping.get(ObjectType.WORKSPACE, source_ws_id)
-            if target_ws_id:
-                prepared["workspace"] = f"{target_base}/workspaces/{target_ws_id}"
+        if "workspace" in prepared and (
+            workspace_url := remapper.remap_url(prepared["workspace"], ObjectType.WORKSPACE, target_base)
+        ):
+            prepared["workspace"] = workspace_url
 
         # Always remove inbox - it's immutable after queue creation
         # Trying to update it (even with a remapped value) causes API errors
         prepared.pop("inbox", None)
 
-    def _prepare_hook_deploy_data(self, prepared: dict[str, Any], id_mapping: IdMapping, target_base: str) -> None:
+    def _prepare_hook_deploy_data(self, prepared: dict[str, Any], remapper: IdRemapper, target_base: str) -> None:
         """Remap hook references for deployment."""
         if "queues" in prepared:
-            target_queues = []
-            for q_url in prepared["queues"]:
-                source_q_id = int(q_url.split("/")[-1])
-                target_q_id = id_mapping.get(ObjectType.QUEUE, source_q_id)
-                if target_q_id:
-                    target_queues.append(f"{target_base}/queues/{target_q_id}")
-            prepared["queues"] = target_queues
+            prepared["queues"] = [
+                queue_url
+                for q_url in prepared["queues"]
+                if (queue_url := remapper.remap_url(q_url, ObjectType.QUEUE, target_base))
+            ]
 
         if "config" in prepared and isinstance(prepared["config"], dict):
-            prepared["config"] = self._remap_hook_config(prepared["config"], id_mapping)
+            prepared["config"] = self._remap_hook_config(prepared["config"], remapper)
 
     def _prepare_email_template_deploy_data(
-        self, prepared: dict[str, Any], id_mapping: IdMapping, target_base: str
+        self, prepared: dict[str, Any], remapper: IdRemapper, target_base: str
     ) -> None:
         """Remap email template references for deployment."""
         if prepared.get("queue"):
-            source_q_id = int(prepared["queue"].split("/")[-1])
-            target_q_id = id_mapping.get(ObjectType.QUEUE, source_q_id)
-            if target_q_id:
-                prepared["queue"] = f"{target_base}/queues/{target_q_id}"
+            if queue_url := remapper.remap_url(prepared["queue"], ObjectType.QUEUE, target_base):
+                prepared["queue"] = queue_url
             else:
                 del prepared["queue"]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from rossum_api.exceptions import APIClientError
+from rossum_deploy.concurrency import (
+    call_with_rate_limit_retry,
+    iter_completed,
+    map_concurrently,
+    run_dependency_graph,
+)
+
+
+class TestCallWithRateLimitRetry:
+    def test_returns_result(self):
+        assert call_with_rate_limit_retry(lambda: 42) == 42
+
+    def test_retries_on_rate_limit(self):
+        func = Mock(side_effect=[APIClientError("GET", "/queues", 429, "Too Many Requests"), "ok"])
+
+        with patch("rossum_deploy.concurrency.time.sleep") as mock_sleep:
+            assert call_with_rate_limit_retry(func, backoff=1.0) == "ok"
+
+        assert func.call_count == 2
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_gives_up_after_retries(self):
+        func = Mock(side_effect=APIClientError("GET", "/queues", 429, "Too Many Requests"))
+
+        with patch("rossum_deploy.concurrency.time.sleep"), pytest.raises(APIClientError):
+            call_with_rate_limit_retry(func, retries=2)
+
+        assert func.call_count == 3
+
+    def test_does_not_retry_other_errors(self):
+        func = Mock(side_effect=APIClientError("GET", "/queues/1", 404, "Not Found"))
+
+        with pytest.raises(APIClientError):
+            call_with_rate_limit_retry(func)
+
+        func.assert_called_once()
+
+
+class TestMapConcurrently:
+    def test_preserves_order(self):
+        assert map_concurrently(lambda x: x * 2, [3, 1, 2], max_workers=4) == [6, 2, 4]
+
+    def test_sequential_with_single_worker(self):
+        thread_ids: set[int] = set()
+
+        def record(x: int) -> int:
+            thread_ids.add(threading.get_ident())
+            return x
+
+        assert map_concurrently(record, [1, 2, 3], max_workers=1) == [1, 2, 3]
+        assert thread_ids == {threading.get_ident()}
+
+    def test_runs_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_others(x: int) -> int:
+            barrier.wait()
+            return x
+
+        assert map_concurrently(wait_for_others, [1, 2, 3], max_workers=3) == [1, 2, 3]
+
+
+class TestIterCompleted:
+    def test_yields_in_completion_order(self):
+        release_first = threading.Event()
+
+        def work(x: int) -> int:
+            if x == 1:
+                release_first.wait(timeout=5)
+            return x * 10
+
+        results = iter_completed(work, [1, 2], max_workers=2)
+
+        assert next(results) == (2, 20)
+        release_first.set()
+        assert next(results) == (1, 10)
+
+    def test_sequential_with_single_worker(self):
+        assert list(iter_completed(lambda x: x + 1, [1, 2, 3], max_workers=1)) == [(1, 2), (2, 3), (3, 4)]
+
+    def test_propagates_errors(self):
+        def fail(x: int) -> int:
+            raise RuntimeError(f"failed {x}")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            list(iter_completed(fail, [1, 2], max_workers=2))
+
+
+class TestRunDependencyGraph:
+    def test_respects_dependencies(self):
+        order: list[str] = []
+        lock = threading.Lock()
+
+        def task(name: str):
+            def run() -> None:
+                with lock:
+                    order.append(name)
+
+            return run
+
+        run_dependency_graph(
+            {"a": task("a"), "b": task("b"), "c": task("c"), "d": task("d")},
+            {"b": ["a"], "c": ["a"], "d": ["b", "c"]},
+        )
+
+        assert order[0] == "a"
+        assert order[-1] == "d"
+        assert set(order) == {"a", "b", "c", "d"}
+
+    def test_independent_tasks_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        run_dependency_graph({"a": barrier.wait, "b": barrier.wait}, {}, max_workers=2)
+
+    def test_missing_dependencies_are_satisfied(self):
+        ran = Mock()
+
+        run_dependency_graph({"b": ran}, {"b": ["a"]})
+
+        ran.assert_called_once()
+
+    def test_failure_stops_dependents(self):
+        dependent = Mock()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_dependency_graph({"a": Mock(side_effect=RuntimeError("boom")), "b": dependent}, {"b": ["a"]})
+
+        dependent.assert_not_called()
+
+    def test_cycle_raises(self):
+        with pytest.raises(ValueError, match="cycle"):
+            run_dependency_graph({"a": Mock(), "b": Mock()}, {"a": ["b"], "b": ["a"]})
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from rossum_deploy.git_status import GitStatus
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    return tmp_path
+
+
+class TestGitStatusCapture:
+    def test_outside_repository(self, tmp_path: Path):
+        (tmp_path / "queue.json").write_text("{}")
+
+        with patch("subprocess.run") as mock_run:
+            status = GitStatus.capture(tmp_path)
+
+        assert status.is_modified(tmp_path / "queue.json") is False
+        mock_run.assert_not_called()
+
+    def test_git_not_installed(self, git_repo: Path):
+        with patch("rossum_deploy.git_status.shutil.which", return_value=None):
+            status = GitStatus.capture(git_repo)
+
+        assert status.is_modified(git_repo / "queue.json") is False
+
+    def test_git_failure(self, git_repo: Path):
+        with patch("subprocess.run", return_value=Mock(returncode=128, stdout="")):
+            status = GitStatus.capture(git_repo)
+
+        assert status.is_modified(git_repo / "queue.json") is False
+
+    def test_detects_modified_files_in_one_call(self, git_repo: Path):
+        workspace = git_repo / "project"
+        (workspace / "queues").mkdir(parents=True)
+        for name in ("staged", "unstaged", "clean"):
+            (workspace / "queues" / f"{name}.json").write_text("{}")
+        _git(git_repo, "add", ".")
+        _git(git_repo, "commit", "-q", "-m", "pull")
+
+        (workspace / "queues" / "staged.json").write_text('{"a": 1}')
+        _git(git_repo, "add", "project/queues/staged.json")
+        (workspace / "queues" / "unstaged.json").write_text('{"a": 1}')
+        (workspace / "queues" / "untracked.json").write_text("{}")
+        (workspace / "queues" / "added.json").write_text("{}")
+        _git(git_repo, "add", "project/queues/added.json")
+
+        with patch("rossum_deploy.git_status.subprocess.run", wraps=subprocess.run) as mock_run:
+            status = GitStatus.capture(workspace)
+
+        mock_run.assert_called_once()
+        assert status.is_modified(workspace / "queues" / "staged.json") is True
+        assert status.is_modified(workspace / "queues" / "unstaged.json") is True
+        assert status.is_modified(workspace / "queues" / "clean.json") is False
+        assert status.is_modified(workspace / "queues" / "untracked.json") is False
+        assert status.is_modified(workspace / "queues" / "added.json") is False
+
+
+class TestParsePorcelain:
+    def test_modified_codes(self, tmp_path: Path):
+        output = " M a.json\0M  b.json\0MM c.json\0A  d.json\0"
+
+        modified = GitStatus._parse_porcelain(output, tmp_path)
+
+        assert modified == {(tmp_path / name).resolve() for name in ("a.json", "b.json", "c.json")}
+
+    def test_rename_skips_original_path(self, tmp_path: Path):
+        output = "RM new.json\0old.json\0 M other.json\0"
+
+        modified = GitStatus._parse_porcelain(output, tmp_path)
+
+        assert modified == {(tmp_path / "new.json").resolve(), (tmp_path / "other.json").resolve()}
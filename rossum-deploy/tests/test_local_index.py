@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from rossum_deploy.local_index import INDEX_FILENAME, LocalIndex, hash_object_data
+from rossum_deploy.models import LocalObject, ObjectMeta, ObjectType
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_object(root: Path, folder: str, filename: str, obj_type: ObjectType, data: dict) -> Path:
+    local_obj = LocalObject(
+        _meta=ObjectMeta(pulled_at=datetime.now(UTC), object_type=obj_type, object_id=data["id"]),
+        data=data,
+    )
+    path = root / folder / filename
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(local_obj.model_dump(by_alias=True, mode="json")))
+    return path
+
+
+class TestHashObjectData:
+    def test_stable_across_json_round_trip(self):
+        data = {"id": 1, "modified_at": datetime(2024, 1, 1, tzinfo=UTC), "settings": {"b": 1, "a": [1, 2]}}
+        round_tripped = json.loads(
+            json.dumps(LocalObject.model_validate({"_meta": _meta(), "data": data}).model_dump(mode="json")["data"])
+        )
+
+        assert hash_object_data(data) == hash_object_data(round_tripped)
+
+    def test_differs_on_content_change(self):
+        assert hash_object_data({"id": 1, "name": "A"}) != hash_object_data({"id": 1, "name": "B"})
+
+
+def _meta() -> dict:
+    return {"pulled_at": datetime.now(UTC).isoformat(), "object_type": "queue", "object_id": 1}
+
+
+class TestLocalIndex:
+    def test_refresh_indexes_objects(self, tmp_path: Path):
+        queue_path = _write_object(
+            tmp_path,
+            "queues",
+            "Queue_1.json",
+            ObjectType.QUEUE,
+            {"id": 1, "name": "Queue", "url": "https://api/queues/1", "schema": "https://api/schemas/5"},
+        )
+        index = LocalIndex(tmp_path)
+        index.refresh()
+
+        entry = index.get(ObjectType.QUEUE, 1)
+        assert entry is not None
+        assert entry.name == "Queue"
+        assert entry.url == "https://api/queues/1"
+        assert entry.schema_url == "https://api/schemas/5"
+        assert index.path_of(ObjectType.QUEUE, 1) == queue_path
+        assert index.ids(ObjectType.QUEUE) == {1}
+        assert index.path_of(ObjectType.QUEUE, 2) is None
+
+    def test_persists_and_skips_unchanged_files(self, tmp_path: Path):
+        _write_object(tmp_path, "hooks", "Hook_1.json", ObjectType.HOOK, {"id": 1, "name": "Hook"})
+        index = LocalIndex(tmp_path)
+        index.refresh()
+        index.save()
+
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+        reloaded = LocalIndex(tmp_path)
+        with patch("rossum_deploy.local_index.LocalObject.model_validate") as mock_validate:
+            reloaded.refresh()
+
+        mock_validate.assert_not_called()
+        assert reloaded.ids(ObjectType.HOOK) == {1}
+
+    def test_refresh_picks_up_changed_and_removed_files(self, tmp_path: Path):
+        hook_path = _write_object(tmp_path, "hooks", "Hook_1.json", ObjectType.HOOK, {"id": 1, "name": "Hook"})
+        rule_path = _write_object(tmp_path, "rules", "Rule_2.json", ObjectType.RULE, {"id": 2, "name": "Rule"})
+        index = LocalIndex(tmp_path)
+        index.refresh()
+
+        _write_object(tmp_path, "hooks", "Hook_1.json", ObjectType.HOOK, {"id": 1, "name": "Renamed hook"})
+        stat = hook_path.stat()
+        os.utime(hook_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        rule_path.unlink()
+        index.refresh()
+
+        assert index.get(ObjectType.HOOK, 1).name == "Renamed hook"
+        assert index.ids(ObjectType.RULE) == set()
+
+    def test_latest_file_wins_for_duplicate_ids(self, tmp_path: Path):
+        old_path = _write_object(tmp_path, "hooks", "Old_1.json", ObjectType.HOOK, {"id": 1, "name": "Old"})
+        stat = old_path.stat()
+        os.utime(old_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+        new_path = _write_object(tmp_path, "hooks", "New_1.json", ObjectType.HOOK, {"id": 1, "name": "New"})
+        index = LocalIndex(tmp_path)
+        index.refresh()
+
+        assert index.path_of(ObjectType.HOOK, 1) == new_path
+
+        new_path.unlink()
+        index.refresh()
+
+        assert index.path_of(ObjectType.HOOK, 1) == old_path
+
+    def test_ignores_unreadable_index(self, tmp_path: Path):
+        (tmp_path / INDEX_FILENAME).write_text("not json")
+        _write_object(tmp_path, "hooks", "Hook_1.json", ObjectType.HOOK, {"id": 1, "name": "Hook"})
+
+        index = LocalIndex(tmp_path)
+        index.refresh()
+
+        assert index.ids(ObjectType.HOOK) == {1}
+
+    def test_is_fresh(self, tmp_path: Path):
+        path = _write_object(tmp_path, "hooks", "Hook_1.json", ObjectType.HOOK, {"id": 1, "name": "Hook"})
+        index = LocalIndex(tmp_path)
+        index.refresh()
+
+        assert index.is_fresh(path) is True
+
+        path.write_text(path.read_text() + "\n")
+
+        assert index.is_fresh(path) is False
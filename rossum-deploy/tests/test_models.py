@@ -9,7 +9,10 @@ from rossum_deploy.models import (
     _RESET,
     CompareResult,
     CopyResult,
+    DeployCheckpoint,
+    DeployObjectResult,
     DeployResult,
+    DeployStatus,
     DiffResult,
     DiffStatus,
     FieldDiff,
@@ -249,6 +252,51 @@ class TestDeployResult:
         assert "Hook 1" in summary
         assert "API error" in summary
 
+    def test_add_outcomes(self):
+        result = DeployResult()
+        result.add(
+            DeployObjectResult(
+                object_type=ObjectType.QUEUE, source_id=1, target_id=10, name="Q", status=DeployStatus.UPDATED
+            )
+        )
+        result.add(
+            DeployObjectResult(
+                object_type=ObjectType.HOOK, source_id=2, name="H", status=DeployStatus.SKIPPED, detail="no mapping"
+            )
+        )
+        result.add(
+            DeployObjectResult(
+                object_type=ObjectType.RULE,
+                source_id=3,
+                target_id=30,
+                name="R",
+                status=DeployStatus.FAILED,
+                detail="boom",
+            )
+        )
+
+        assert result.updated == [(ObjectType.QUEUE, 10, "Q")]
+        assert result.skipped == [(ObjectType.HOOK, 2, "H", "no mapping")]
+        assert result.failed == [(ObjectType.RULE, 3, "R", "boom")]
+
+
+class TestDeployCheckpoint:
+    def test_is_deployed_requires_same_content(self):
+        checkpoint = DeployCheckpoint(source_org_id=1, target_org_id=2)
+        checkpoint.mark_deployed(ObjectType.QUEUE, 100, "hash-a")
+
+        assert checkpoint.is_deployed(ObjectType.QUEUE, 100, "hash-a")
+        assert not checkpoint.is_deployed(ObjectType.QUEUE, 100, "hash-b")
+        assert not checkpoint.is_deployed(ObjectType.HOOK, 100, "hash-a")
+
+    def test_round_trips_through_json(self):
+        checkpoint = DeployCheckpoint(source_org_id=1, target_org_id=2)
+        checkpoint.mark_deployed(ObjectType.SCHEMA, 5, "hash")
+
+        loaded = DeployCheckpoint.model_validate_json(checkpoint.model_dump_json())
+
+        assert loaded.is_deployed(ObjectType.SCHEMA, 5, "hash")
+
 
 class TestDiffResultToMarkdown:
     def test_to_markdown_returns_summary(self):
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from rossum_deploy.models import IdMapping, ObjectType
+from rossum_deploy.remapping import IdRemapper
+
+
+def _mapping(**by_type: dict[int, int]) -> IdMapping:
+    mapping = IdMapping(source_org_id=1, target_org_id=2)
+    for type_name, pairs in by_type.items():
+        for source_id, target_id in pairs.items():
+            mapping.add(ObjectType(type_name), source_id, target_id)
+    return mapping
+
+
+class TestRemapUrls:
+    def test_remaps_all_types_in_one_pass(self):
+        remapper = IdRemapper(_mapping(queue={100: 200}, schema={50: 60}))
+
+        value = "queues/100 uses https://api.example.com/v1/schemas/50/"
+
+        assert remapper.remap_urls(value) == "queues/200 uses https://api.example.com/v1/schemas/60/"
+
+    def test_does_not_touch_longer_ids(self):
+        remapper = IdRemapper(_mapping(queue={12: 99}))
+
+        assert remapper.remap_urls("https://api.example.com/v1/queues/123") == "https://api.example.com/v1/queues/123"
+
+    def test_does_not_chain_replacements(self):
+        remapper = IdRemapper(_mapping(queue={100: 200, 200: 300}))
+
+        assert remapper.remap_urls("/queues/100,/queues/200") == "/queues/200,/queues/300"
+
+    def test_earlier_type_wins_on_collision(self):
+        remapper = IdRemapper(_mapping(workspace={5: 6}, queue={5: 7}))
+
+        assert remapper.remap_urls("/5") == "/6"
+
+    def test_empty_mapping(self):
+        assert IdRemapper(_mapping()).remap_urls("/queues/1") == "/queues/1"
+
+    def test_scales_with_many_mappings(self):
+        remapper = IdRemapper(_mapping(queue={i: i + 100_000 for i in range(1, 10_001)}))
+
+        assert remapper.remap_urls("/queues/9999") == "/queues/109999"
+
+
+class TestRemapQueueIds:
+    def test_remaps_standalone_numbers(self):
+        remapper = IdRemapper(_mapping(queue={100: 200}))
+
+        assert remapper.remap_queue_ids("QUEUES = [100, 1000, 2100]") == "QUEUES = [200, 1000, 2100]"
+
+    def test_ignores_other_types(self):
+        remapper = IdRemapper(_mapping(schema={100: 200}))
+
+        assert remapper.remap_queue_ids("QUEUE = 100") == "QUEUE = 100"
+
+
+class TestRemapUrl:
+    def test_remaps_reference(self):
+        remapper = IdRemapper(_mapping(schema={50: 60}))
+
+        assert (
+            remapper.remap_url("https://source/v1/schemas/50", ObjectType.SCHEMA, "https://target/v1")
+            == "https://target/v1/schemas/60"
+        )
+
+    def test_email_template_path(self):
+        remapper = IdRemapper(_mapping(email_template={1: 2}))
+
+        assert remapper.remap_url("https://s/v1/email_templates/1", ObjectType.EMAIL_TEMPLATE, "https://t/v1") == (
+            "https://t/v1/email_templates/2"
+        )
+
+    def test_unmapped_reference(self):
+        remapper = IdRemapper(_mapping(queue={1: 2}))
+
+        assert remapper.remap_url("https://source/v1/queues/3", ObjectType.QUEUE, "https://target/v1") is None
+
+
+class TestOf:
+    def test_reuses_compiled_remapper(self):
+        remapper = IdRemapper(_mapping())
+
+        assert IdRemapper.of(remapper) is remapper
+
+    def test_compiles_mapping(self):
+        assert IdRemapper.of(_mapping(queue={1: 2})).get(ObjectType.QUEUE, 1) == 2
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from rossum_deploy.models import ObjectType
+from rossum_deploy.snapshot import OrgSnapshot
+
+
+def _queue(queue_id: int) -> Mock:
+    queue = Mock()
+    queue.id = queue_id
+    queue.url = f"https://api.example.com/v1/queues/{queue_id}"
+    return queue
+
+
+class TestOrgSnapshot:
+    def test_lists_resource_type_once(self):
+        client = MagicMock()
+        client.list_queues.return_value = iter([_queue(1), _queue(2)])
+        snapshot = OrgSnapshot(client)
+
+        assert [q.id for q in snapshot.objects(ObjectType.QUEUE)] == [1, 2]
+        assert [q.id for q in snapshot.objects(ObjectType.QUEUE)] == [1, 2]
+        client.list_queues.assert_called_once()
+
+    def test_get_by_id_and_url(self):
+        client = MagicMock()
+        client.list_queues.return_value = [_queue(1), _queue(2)]
+        snapshot = OrgSnapshot(client)
+
+        assert snapshot.get(ObjectType.QUEUE, 2).id == 2
+        assert snapshot.get_by_url(ObjectType.QUEUE, "https://api.example.com/v1/queues/1").id == 1
+        assert snapshot.get(ObjectType.QUEUE, 3) is None
+        assert snapshot.get_by_url(ObjectType.QUEUE, "https://api.example.com/v1/queues/3") is None
+        client.list_queues.assert_called_once()
+
+    def test_indexes_raw_inbox_dicts(self):
+        client = MagicMock()
+        client.request_paginated.return_value = [{"id": 5, "url": "https://api.example.com/v1/inboxes/5"}]
+        snapshot = OrgSnapshot(client)
+
+        assert snapshot.get(ObjectType.INBOX, 5) == {"id": 5, "url": "https://api.example.com/v1/inboxes/5"}
+        assert snapshot.get_by_url(ObjectType.INBOX, "https://api.example.com/v1/inboxes/5")["id"] == 5
+        client.request_paginated.assert_called_once_with("inboxes")
+
+    def test_types_are_listed_independently(self):
+        client = MagicMock()
+        client.list_hooks.return_value = []
+        client.list_rules.return_value = []
+        snapshot = OrgSnapshot(client)
+
+        snapshot.objects(ObjectType.HOOK)
+
+        client.list_hooks.assert_called_once()
+        client.list_rules.assert_not_called()
+
+    def test_schemas_cannot_be_listed(self):
+        snapshot = OrgSnapshot(MagicMock())
+
+        with pytest.raises(ValueError, match="schema"):
+            snapshot.objects(ObjectType.SCHEMA)
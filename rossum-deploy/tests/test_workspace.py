@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import json
+import threading
 from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from rossum_deploy.constants import DIFFABLE_TYPES, OBJECT_TYPE_TO_RESOURCE, PUSHABLE_TYPES
-from rossum_deploy.models import CopyResult, IdMapping, ObjectType
+from rossum_deploy.git_status import GitStatus
+from rossum_deploy.models import CopyResult, DeployStatus, DiffStatus, IdMapping, ObjectType
+from rossum_deploy.snapshot import OrgSnapshot
 from rossum_deploy.workspace import Workspace, WorkspaceConfig
 
 if TYPE_CHECKING:
@@ -191,6 +196,81 @@ class TestDiffMethod:
         assert result.total_local_modified == 1
         assert result.objects[0].changed_fields == ["name"]
 
+    def test_diff_fetches_remote_objects_concurrently(self, workspace: Workspace):
+        modified_at = datetime(2024, 1, 1, tzinfo=UTC)
+        for hook_id in (3, 1, 2):
+            workspace._save_object(
+                ObjectType.HOOK, hook_id, f"Hook {hook_id}", {"id": hook_id}, remote_modified_at=modified_at
+            )
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch_remote(client, obj_type, obj_id):
+            barrier.wait()
+            return {"id": obj_id}, modified_at
+
+        with patch.object(workspace, "_fetch_remote_object", side_effect=fetch_remote):
+            result = workspace.diff()
+
+        assert result.total_unchanged == 3
+        assert [obj.object_id for obj in result.objects] == [1, 2, 3]
+
+    def test_diff_remote_missing_is_local_only(self, workspace: Workspace):
+        workspace._save_object(ObjectType.HOOK, 1, "Deleted Hook", {"id": 1, "name": "Deleted Hook"})
+
+        with patch.object(workspace, "_fetch_remote_object", side_effect=Exception("404")):
+            result = workspace.diff()
+
+        assert result.objects[0].status == DiffStatus.LOCAL_ONLY
+        assert result.total_unchanged == 0
+
+    def test_diff_skips_reading_unchanged_files(self, workspace: Workspace):
+        data = {"id": 1, "name": "Queue", "settings": {"key": "value"}}
+        modified_at = datetime(2024, 1, 1, tzinfo=UTC)
+        workspace._save_object(ObjectType.QUEUE, 1, "Queue", data, remote_modified_at=modified_at)
+
+        with (
+            patch.object(workspace, "_fetch_remote_object", return_value=(dict(data), modified_at)),
+            patch.object(workspace, "_load_object") as mock_load,
+        ):
+            result = workspace.diff()
+
+        mock_load.assert_not_called()
+        assert result.total_unchanged == 1
+        assert result.objects[0].name == "Queue"
+        assert result.objects[0].local_modified_at == modified_at
+
+    def test_diff_reads_files_edited_outside_the_workspace(self, workspace: Workspace):
+        data = {"id": 1, "name": "Queue"}
+        modified_at = datetime(2024, 1, 1, tzinfo=UTC)
+        path = workspace._save_object(ObjectType.QUEUE, 1, "Queue", data, remote_modified_at=modified_at)
+        workspace._local_index.save()
+
+        local = json.loads(path.read_text())
+        local["data"]["name"] = "Edited"
+        path.write_text(json.dumps(local))
+
+        fresh_workspace = Workspace(workspace.path, api_base="https://api.example.com/v1", token="test-token")
+        with (
+            patch.object(fresh_workspace, "_fetch_remote_object", return_value=(dict(data), modified_at)),
+            patch.object(fresh_workspace, "_is_git_modified", return_value=True),
+        ):
+            result = fresh_workspace.diff()
+
+        assert result.total_local_modified == 1
+        assert result.objects[0].changed_fields == ["name"]
+
+    def test_iter_diff_yields_each_object(self, workspace: Workspace):
+        modified_at = datetime(2024, 1, 1, tzinfo=UTC)
+        workspace._save_object(ObjectType.QUEUE, 1, "Queue", {"id": 1}, remote_modified_at=modified_at)
+        workspace._save_object(ObjectType.SCHEMA, 2, "Schema", {"id": 2}, remote_modified_at=modified_at)
+
+        with patch.object(workspace, "_fetch_remote_object", side_effect=lambda c, t, i: ({"id": i}, modified_at)):
+            diffs = list(workspace.iter_diff())
+
+        assert {(d.object_type, d.object_id) for d in diffs} == {(ObjectType.QUEUE, 1), (ObjectType.SCHEMA, 2)}
+        assert all(d.status == DiffStatus.UNCHANGED for d in diffs)
+
 
 class TestPushMethod:
     """Tests for push method."""
@@ -728,6 +808,15 @@ class TestCopyMethods:
         assert "100" not in result["code"]
         assert "101" not in result["code"]
 
+    def test_remap_hook_config_keeps_longer_numbers(self, workspace: Workspace):
+        mapping = IdMapping(source_org_id=1, target_org_id=2)
+        mapping.add(ObjectType.QUEUE, 100, 200)
+
+        config = {"code": "QUEUE_ID = 100\nTIMEOUT_MS = 1000"}
+        result = workspace._remap_hook_config(config, mapping)
+
+        assert result["code"] == "QUEUE_ID = 200\nTIMEOUT_MS = 1000"
+
     def test_remap_hook_config_no_code(self, workspace: Workspace):
         mapping = IdMapping(source_org_id=1, target_org_id=2)
         config = {"runtime": "python3.12"}
@@ -1187,6 +1276,143 @@ class TestCopyOrgMethod:
 
         assert len(result.failed) == 1
 
+    def test_copy_queues_shares_copied_schema(self, workspace: Workspace):
+        queues = []
+        for queue_id in (200, 201):
+            queue = Mock()
+            queue.id = queue_id
+            queue.name = f"Queue {queue_id}"
+            queue.workspace = "https://api.example.com/v1/workspaces/100"
+            queue.schema = "https://api.example.com/v1/schemas/300"
+            queues.append((queue, 100))
+
+        mock_schema = Mock()
+        mock_schema.id = 300
+        mock_schema.name = "Shared Schema"
+        mock_schema.content = []
+
+        mock_client = MagicMock()
+        mock_client.internal_client.base_url = "https://api.example.com/v1"
+        mock_client.retrieve_schema.return_value = mock_schema
+        mock_client.create_new_schema.return_value = Mock(id=301)
+        mock_client.create_new_queue.side_effect = [Mock(id=400), Mock(id=401)]
+
+        mapping = IdMapping(source_org_id=1, target_org_id=2)
+        mapping.add(ObjectType.WORKSPACE, 100, 101)
+        result = CopyResult()
+
+        workspace._copy_queues(queues, mock_client, mock_client, mapping, result)
+
+        mock_client.create_new_schema.assert_called_once()
+        assert {call.args[0]["schema"] for call in mock_client.create_new_queue.call_args_list} == {
+            "https://api.example.com/v1/schemas/301"
+        }
+        assert set(mapping.get_all(ObjectType.QUEUE)) == {200, 201}
+
+    def test_copy_checkpoints_id_mapping_after_each_object(self, workspace: Workspace):
+        mocks = create_copy_test_mocks()
+
+        with patch.object(workspace, "_client") as mock_client:
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            mock_client.list_workspaces.return_value = [mocks["workspace"]]
+            mock_client.list_queues.return_value = [mocks["queue"]]
+            mock_client.retrieve_schema.return_value = mocks["schema"]
+            mock_client.create_new_workspace.return_value = mocks["new_workspace"]
+            mock_client.create_new_schema.return_value = mocks["new_schema"]
+            mock_client.create_new_queue.return_value = mocks["new_queue"]
+            mock_client.list_hooks.side_effect = KeyboardInterrupt
+
+            with pytest.raises(KeyboardInterrupt):
+                workspace.copy_org(source_org_id=123, target_org_id=456)
+
+        saved = workspace._load_id_mapping(123, 456)
+        assert saved is not None
+        assert saved.get(ObjectType.WORKSPACE, 100) == 101
+        assert saved.get(ObjectType.SCHEMA, 300) == 301
+        assert saved.get(ObjectType.QUEUE, 200) == 201
+
+    def test_copy_org_resume_skips_copied_objects(self, workspace: Workspace):
+        mocks = create_copy_test_mocks()
+        saved = IdMapping(source_org_id=123, target_org_id=456)
+        saved.add(ObjectType.WORKSPACE, 100, 101)
+        saved.add(ObjectType.SCHEMA, 300, 301)
+        workspace._save_id_mapping(saved)
+
+        with patch.object(workspace, "_client") as mock_client:
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            mock_client.list_workspaces.return_value = [mocks["workspace"]]
+            mock_client.list_queues.return_value = [mocks["queue"]]
+            mock_client.list_hooks.return_value = []
+            mock_client.create_new_queue.return_value = mocks["new_queue"]
+
+            result = workspace.copy_org(source_org_id=123, target_org_id=456, resume=True)
+
+        mock_client.create_new_workspace.assert_not_called()
+        mock_client.create_new_schema.assert_not_called()
+        assert result.created == [(ObjectType.QUEUE, 200, 201, "Test Queue")]
+        assert {(obj_type, reason) for obj_type, _, _, reason in result.skipped} == {
+            (ObjectType.WORKSPACE, "already copied"),
+            (ObjectType.SCHEMA, "already copied"),
+        }
+        assert mock_client.create_new_queue.call_args.args[0]["schema"] == "https://api.example.com/v1/schemas/301"
+
+    def test_copy_org_without_resume_ignores_saved_mapping(self, workspace: Workspace):
+        mocks = create_copy_test_mocks()
+        saved = IdMapping(source_org_id=123, target_org_id=456)
+        saved.add(ObjectType.WORKSPACE, 100, 999)
+        workspace._save_id_mapping(saved)
+
+        with patch.object(workspace, "_client") as mock_client:
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            mock_client.list_workspaces.return_value = [mocks["workspace"]]
+            mock_client.list_queues.return_value = []
+            mock_client.list_hooks.return_value = []
+            mock_client.create_new_workspace.return_value = mocks["new_workspace"]
+
+            result = workspace.copy_org(source_org_id=123, target_org_id=456)
+
+        assert result.id_mapping is not None
+        assert result.id_mapping.get(ObjectType.WORKSPACE, 100) == 101
+
+    def test_run_copy_level_creates_objects_concurrently(self, workspace: Workspace):
+        workspace.max_workers = 2
+        barrier = threading.Barrier(2, timeout=5)
+
+        def copy(source_id: int, id_mapping: IdMapping, result: CopyResult) -> None:
+            barrier.wait()
+            id_mapping.add(ObjectType.HOOK, source_id, source_id + 1000)
+            result.created.append((ObjectType.HOOK, source_id, source_id + 1000, f"Hook {source_id}"))
+
+        mapping = IdMapping(source_org_id=1, target_org_id=2)
+        result = CopyResult()
+        tasks = [(ObjectType.HOOK, hook_id, f"Hook {hook_id}", partial(copy, hook_id)) for hook_id in (1, 2)]
+
+        workspace._run_copy_level(tasks, mapping, result)
+
+        assert mapping.get_all(ObjectType.HOOK) == {1: 1001, 2: 1002}
+        assert len(result.created) == 2
+
+    def test_run_copy_level_saves_id_mapping_after_each_created_object(self, workspace: Workspace):
+        workspace.max_workers = 1
+
+        def copy(source_id: int, id_mapping: IdMapping, result: CopyResult) -> None:
+            if source_id == 2:
+                result.failed.append((ObjectType.HOOK, source_id, f"Hook {source_id}", "API error"))
+                return
+            id_mapping.add(ObjectType.HOOK, source_id, source_id + 1000)
+            result.created.append((ObjectType.HOOK, source_id, source_id + 1000, f"Hook {source_id}"))
+
+        mapping = IdMapping(source_org_id=1, target_org_id=2)
+        tasks = [(ObjectType.HOOK, hook_id, f"Hook {hook_id}", partial(copy, hook_id)) for hook_id in range(4)]
+        saved: list[dict[int, int]] = []
+
+        with patch.object(
+            workspace, "_save_id_mapping", side_effect=lambda m: saved.append(dict(m.get_all(ObjectType.HOOK)))
+        ):
+            workspace._run_copy_level(tasks, mapping, CopyResult())
+
+        assert saved == [{0: 1000}, {0: 1000, 1: 1001}, {0: 1000, 1: 1001, 3: 1003}]
+
 
 class TestDeployMethod:
     """Extended tests for deploy method."""
@@ -1260,6 +1486,160 @@ class TestDeployMethod:
 
         assert len(result.updated) == 1
 
+    def test_iter_deploy_streams_outcomes(self, workspace: Workspace):
+        workspace._config = WorkspaceConfig(api_base="https://api.example.com/v1", org_id=123)
+
+        mapping = IdMapping(source_org_id=123, target_org_id=456)
+        mapping.add(ObjectType.QUEUE, 100, 200)
+        workspace._save_object(ObjectType.QUEUE, 100, "Mapped Queue", {"id": 100, "name": "Mapped Queue"})
+        workspace._save_object(ObjectType.QUEUE, 101, "Unmapped Queue", {"id": 101, "name": "Unmapped Queue"})
+
+        with patch.object(workspace, "_client") as mock_client:
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            outcomes = {o.source_id: o for o in workspace.iter_deploy(target_org_id=456, id_mapping=mapping)}
+
+        assert outcomes[100].status == DeployStatus.UPDATED
+        assert outcomes[100].target_id == 200
+        assert outcomes[101].status == DeployStatus.SKIPPED
+        assert outcomes[101].detail == "no target mapping"
+
+    def test_iter_deploy_stops_pushing_when_consumer_stops(self, workspace: Workspace):
+        workspace._config = WorkspaceConfig(api_base="https://api.example.com/v1", org_id=123)
+        workspace.max_workers = 2
+        release = threading.Event()
+        pushed: list[int] = []
+
+        mapping = IdMapping(source_org_id=123, target_org_id=456)
+        for source_id in range(100, 106):
+            mapping.add(ObjectType.HOOK, source_id, source_id + 100)
+            workspace._save_object(
+                ObjectType.HOOK, source_id, f"Hook {source_id}", {"id": source_id, "name": f"Hook {source_id}"}
+            )
+
+        def push(_client, _obj_type, target_id, _data):
+            pushed.append(target_id)
+            if len(pushed) > 1:
+                release.wait(timeout=5)
+
+        with (
+            patch.object(workspace, "_client") as mock_client,
+            patch.object(workspace, "_push_object", side_effect=push),
+        ):
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            outcomes = workspace.iter_deploy(target_org_id=456, id_mapping=mapping)
+            assert next(outcomes).status == DeployStatus.UPDATED
+            threading.Timer(0.1, release.set).start()
+            outcomes.close()
+
+        assert len(pushed) <= 3
+
+    def test_deploy_updates_objects_of_a_type_concurrently(self, workspace: Workspace):
+        workspace._config = WorkspaceConfig(api_base="https://api.example.com/v1", org_id=123)
+        workspace.max_workers = 2
+        barrier = threading.Barrier(2, timeout=5)
+
+        mapping = IdMapping(source_org_id=123, target_org_id=456)
+        for source_id in (100, 101):
+            mapping.add(ObjectType.HOOK, source_id, source_id + 100)
+            workspace._save_object(
+                ObjectType.HOOK, source_id, f"Hook {source_id}", {"id": source_id, "name": f"Hook {source_id}"}
+            )
+
+        with (
+            patch.object(workspace, "_client") as mock_client,
+            patch.object(workspace, "_push_object", side_effect=lambda *_: barrier.wait()),
+        ):
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            result = workspace.deploy(target_org_id=456, id_mapping=mapping)
+
+        assert result.updated == [(ObjectType.HOOK, 200, "Hook 100"), (ObjectType.HOOK, 201, "Hook 101")]
+
+    def test_deploy_resume_retries_only_failed_objects(self, workspace: Workspace):
+        workspace._config = WorkspaceConfig(api_base="https://api.example.com/v1", org_id=123)
+
+        mapping = IdMapping(source_org_id=123, target_org_id=456)
+        mapping.add(ObjectType.QUEUE, 100, 200)
+        mapping.add(ObjectType.QUEUE, 101, 201)
+        workspace._save_object(ObjectType.QUEUE, 100, "Queue A", {"id": 100, "name": "Queue A"})
+        workspace._save_object(ObjectType.QUEUE, 101, "Queue B", {"id": 101, "name": "Queue B"})
+
+        def push(client, obj_type, target_id, data):
+            if target_id == 201:
+                raise Exception("Push failed")
+
+        with (
+            patch.object(workspace, "_client") as mock_client,
+            patch.object(workspace, "_push_object", side_effect=push) as mock_push,
+        ):
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            first = workspace.deploy(target_org_id=456, id_mapping=mapping)
+
+            mock_push.reset_mock(side_effect=True)
+            second = workspace.deploy(target_org_id=456, id_mapping=mapping, resume=True)
+
+        assert first.failed == [(ObjectType.QUEUE, 101, "Queue B", "Push failed")]
+        assert second.updated == [(ObjectType.QUEUE, 201, "Queue B")]
+        assert second.skipped == [(ObjectType.QUEUE, 100, "Queue A", "already deployed")]
+        mock_push.assert_called_once()
+
+    def test_deploy_resume_redeploys_locally_edited_objects(self, workspace: Workspace):
+        workspace._config = WorkspaceConfig(api_base="https://api.example.com/v1", org_id=123)
+
+        mapping = IdMapping(source_org_id=123, target_org_id=456)
+        mapping.add(ObjectType.QUEUE, 100, 200)
+        workspace._save_object(ObjectType.QUEUE, 100, "Queue A", {"id": 100, "name": "Queue A"})
+
+        with (
+            patch.object(workspace, "_client") as mock_client,
+            patch.object(workspace, "_push_object") as mock_push,
+        ):
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            workspace.deploy(target_org_id=456, id_mapping=mapping)
+            workspace._save_object(ObjectType.QUEUE, 100, "Queue A", {"id": 100, "name": "Queue A v2"})
+            result = workspace.deploy(target_org_id=456, id_mapping=mapping, resume=True)
+
+        assert result.updated == [(ObjectType.QUEUE, 200, "Queue A v2")]
+        assert mock_push.call_count == 2
+
+    def test_dry_run_does_not_write_checkpoint(self, workspace: Workspace):
+        workspace._config = WorkspaceConfig(api_base="https://api.example.com/v1", org_id=123)
+
+        mapping = IdMapping(source_org_id=123, target_org_id=456)
+        mapping.add(ObjectType.QUEUE, 100, 200)
+        workspace._save_object(ObjectType.QUEUE, 100, "Queue A", {"id": 100, "name": "Queue A"})
+
+        with patch.object(workspace, "_client") as mock_client:
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            workspace.deploy(target_org_id=456, id_mapping=mapping, dry_run=True)
+
+        assert workspace._load_deploy_checkpoint(123, 456) is None
+
+    def test_deploy_batches_checkpoint_saves(self, workspace: Workspace):
+        workspace._config = WorkspaceConfig(api_base="https://api.example.com/v1", org_id=123)
+
+        mapping = IdMapping(source_org_id=123, target_org_id=456)
+        for source_id in range(100, 105):
+            mapping.add(ObjectType.HOOK, source_id, source_id + 100)
+            workspace._save_object(
+                ObjectType.HOOK, source_id, f"Hook {source_id}", {"id": source_id, "name": f"Hook {source_id}"}
+            )
+        mapping.add(ObjectType.QUEUE, 10, 20)
+        workspace._save_object(ObjectType.QUEUE, 10, "Queue", {"id": 10, "name": "Queue"})
+
+        with (
+            patch("rossum_deploy.workspace._DEPLOY_CHECKPOINT_INTERVAL", 2),
+            patch.object(workspace, "_client") as mock_client,
+            patch.object(workspace, "_push_object"),
+            patch.object(workspace, "_save_deploy_checkpoint") as mock_save,
+        ):
+            mock_client.internal_client.base_url = "https://api.example.com/v1"
+            workspace.deploy(target_org_id=456, id_mapping=mapping)
+
+        # The queue at the end of its type, then hooks after the 2nd and 4th and at the end of their type
+        assert mock_save.call_count == 4
+        checkpoint = mock_save.call_args.args[0]
+        assert set(checkpoint.deployed[ObjectType.HOOK.value]) == set(range(100, 105))
+
 
 class TestPullMethods2:
     """Additional tests for pull methods."""
@@ -1284,7 +1664,7 @@ class TestPullMethods2:
             mock_client.list_queues.return_value = [mock_queue1, mock_queue2, mock_queue3]
 
             queue_urls = {"https://api.example.com/v1/queues/100", "https://api.example.com/v1/queues/200"}
-            engine_urls = workspace._collect_engine_urls_from_queues(mock_client, queue_urls)
+            engine_urls = workspace._collect_engine_urls_from_queues(mock_client.list_queues(), queue_urls)
 
         assert "https://api.example.com/v1/engines/10" in engine_urls
         assert "https://api.example.com/v1/engines/20" in engine_urls
@@ -1299,7 +1679,7 @@ class TestPullMethods2:
             mock_client.list_queues.return_value = [mock_queue]
 
             queue_urls = {"https://api.example.com/v1/queues/100"}
-            engine_urls = workspace._collect_engine_urls_from_queues(mock_client, queue_urls)
+            engine_urls = workspace._collect_engine_urls_from_queues(mock_client.list_queues(), queue_urls)
 
         assert "https://api.example.com/v1/engines/10" in engine_urls
 
@@ -1378,7 +1758,11 @@ class TestCopyConnectorsAndInboxes:
             mapping.add(ObjectType.QUEUE, 100, 200)
             result = CopyResult()
 
-            workspace._copy_connectors(mock_source_client, mock_target_client, source_queue_urls, mapping, result)
+            workspace._run_copy_level(
+                workspace._connector_copy_tasks(mock_source_client, mock_target_client, source_queue_urls),
+                mapping,
+                result,
+            )
 
         assert len(result.created) == 1
 
@@ -1406,7 +1790,9 @@ class TestCopyConnectorsAndInboxes:
             mapping.add(ObjectType.QUEUE, 100, 200)
             result = CopyResult()
 
-            workspace._copy_inboxes(mock_source_client, mock_target_client, source_queue_urls, mapping, result)
+            workspace._run_copy_level(
+                workspace._inbox_copy_tasks(mock_source_client, mock_target_client, source_queue_urls), mapping, result
+            )
 
         assert len(result.created) == 1
 
@@ -1435,7 +1821,11 @@ class TestCopyConnectorsAndInboxes:
             mapping.add(ObjectType.QUEUE, 100, 200)
             result = CopyResult()
 
-            workspace._copy_email_templates(mock_source_client, mock_target_client, source_queue_urls, mapping, result)
+            workspace._run_copy_level(
+                workspace._email_template_copy_tasks(mock_source_client, mock_target_client, source_queue_urls),
+                mapping,
+                result,
+            )
 
         assert len(result.created) == 1
 
@@ -1471,7 +1861,9 @@ class TestCopyConnectorsAndInboxes:
             mapping.add(ObjectType.SCHEMA, 50, 60)
             result = CopyResult()
 
-            workspace._copy_rules(mock_source_client, mock_target_client, source_schema_urls, mapping, result)
+            workspace._run_copy_level(
+                workspace._rule_copy_tasks(mock_source_client, mock_target_client, source_schema_urls), mapping, result
+            )
 
         assert len(result.created) == 1
 
@@ -1618,6 +2010,115 @@ class TestPullOrgMethod:
         assert len(ws_pulled) == 1
         assert workspace._config.org_id == 123
 
+    def test_pull_org_groups_result_by_type(self, workspace: Workspace):
+        mock_workspace = Mock()
+        mock_workspace.id = 100
+        mock_workspace.name = "Test Workspace"
+        mock_workspace.organization = "https://api.example.com/v1/organizations/123"
+        mock_workspace.url = "https://api.example.com/v1/workspaces/100"
+        mock_workspace.modified_at = None
+
+        mock_queue = Mock()
+        mock_queue.id = 200
+        mock_queue.name = "Queue"
+        mock_queue.workspace = "https://api.example.com/v1/workspaces/100"
+        mock_queue.url = "https://api.example.com/v1/queues/200"
+        mock_queue.dedicated_engine = None
+        mock_queue.generic_engine = None
+
+        mock_hook = Mock()
+        mock_hook.id = 300
+        mock_hook.name = "Hook"
+        mock_hook.url = "https://api.example.com/v1/hooks/300"
+        mock_hook.queues = ["https://api.example.com/v1/queues/200"]
+        mock_hook.modified_at = None
+
+        def asdict(obj: Mock) -> dict:
+            return {"id": obj.id, "url": obj.url}
+
+        with (
+            patch.object(workspace, "_client") as mock_client,
+            patch("rossum_deploy.workspace.dataclasses.asdict", side_effect=asdict),
+        ):
+            mock_client.list_workspaces.return_value = [mock_workspace]
+            mock_client.list_queues.side_effect = lambda: iter([mock_queue])
+            mock_client.list_hooks.return_value = [mock_hook]
+            mock_client.list_connectors.return_value = []
+            mock_client.list_engines.return_value = []
+            mock_client.list_email_templates.return_value = []
+            mock_client.list_rules.return_value = []
+            mock_client.request_paginated.return_value = []
+
+            result = workspace.pull(org_id=123)
+
+        assert [(p[0], p[1]) for p in result.pulled] == [
+            (ObjectType.WORKSPACE, 100),
+            (ObjectType.QUEUE, 200),
+            (ObjectType.HOOK, 300),
+        ]
+
+    def test_pull_org_lists_each_resource_type_once(self, workspace: Workspace):
+        mock_workspace = Mock()
+        mock_workspace.id = 100
+        mock_workspace.name = "Test Workspace"
+        mock_workspace.organization = "https://api.example.com/v1/organizations/123"
+        mock_workspace.url = "https://api.example.com/v1/workspaces/100"
+        mock_workspace.modified_at = None
+
+        mock_queue = Mock()
+        mock_queue.id = 200
+        mock_queue.name = "Queue"
+        mock_queue.workspace = "https://api.example.com/v1/workspaces/100"
+        mock_queue.url = "https://api.example.com/v1/queues/200"
+        mock_queue.dedicated_engine = "https://api.example.com/v1/engines/10"
+        mock_queue.generic_engine = None
+
+        mock_engine = Mock()
+        mock_engine.id = 10
+        mock_engine.name = "Engine"
+        mock_engine.url = "https://api.example.com/v1/engines/10"
+        mock_engine.modified_at = None
+
+        def asdict(obj: Mock) -> dict:
+            return {"id": obj.id, "url": obj.url}
+
+        with (
+            patch.object(workspace, "_client") as mock_client,
+            patch("rossum_deploy.workspace.dataclasses.asdict", side_effect=asdict),
+        ):
+            mock_client.list_workspaces.return_value = [mock_workspace]
+            mock_client.list_queues.return_value = [mock_queue]
+            mock_client.list_hooks.return_value = []
+            mock_client.list_connectors.return_value = []
+            mock_client.list_engines.return_value = [mock_engine]
+            mock_client.list_email_templates.return_value = []
+            mock_client.list_rules.return_value = []
+            mock_client.request_paginated.return_value = []
+
+            result = workspace.pull(org_id=123)
+
+        assert (ObjectType.ENGINE, 10, "Engine") in result.pulled
+        for lister in (
+            mock_client.list_workspaces,
+            mock_client.list_queues,
+            mock_client.list_hooks,
+            mock_client.list_connectors,
+            mock_client.list_engines,
+            mock_client.list_email_templates,
+            mock_client.list_rules,
+            mock_client.request_paginated,
+        ):
+            lister.assert_called_once()
+
+    def test_pull_org_propagates_errors(self, workspace: Workspace):
+        with patch.object(workspace, "_client") as mock_client:
+            mock_client.list_workspaces.side_effect = RuntimeError("API down")
+
+            with pytest.raises(RuntimeError, match="API down"):
+                workspace.pull(org_id=123)
+
+        mock_client.list_queues.assert_not_called()
+
 
 class TestPullWorkspacesMethod:
     """Tests for _pull_workspaces method."""
@@ -1646,7 +2147,7 @@ class TestPullWorkspacesMethod:
             mock_asdict.return_value = {"id": 100}
             mock_client.list_workspaces.return_value = [mock_ws1, mock_ws2]
 
-            workspace._pull_workspaces(mock_client, 123, result)
+            workspace._pull_workspaces(OrgSnapshot(mock_client), 123, result)
 
         assert len(result.pulled) == 1
         assert result.pulled[0][1] == 100
@@ -1684,7 +2185,7 @@ class TestPullQueuesMethod:
             mock_asdict.return_value = {"id": 200}
             mock_client.list_queues.return_value = [mock_q1, mock_q2, mock_q3]
 
-            workspace._pull_queues(mock_client, result)
+            workspace._pull_queues(OrgSnapshot(mock_client), result)
 
         assert len(result.pulled) == 1
         assert result.pulled[0][1] == 200
@@ -1713,7 +2214,7 @@ class TestPullInboxesMethod:
         with patch.object(workspace, "_client") as mock_client:
             mock_client.request_paginated.return_value = [inbox_matching, inbox_not_matching]
 
-            workspace._pull_inboxes(mock_client, result)
+            workspace._pull_inboxes(OrgSnapshot(mock_client), result)
 
         assert len(result.pulled) == 1
         assert result.pulled[0][1] == 500
@@ -1743,11 +2244,44 @@ class TestPullSchemasMethod:
             mock_asdict.return_value = {"id": 50, "name": "Test Schema"}
             mock_client.retrieve_schema.return_value = mock_schema
 
-            workspace._pull_schemas(mock_client, result)
+            workspace._pull_schemas(OrgSnapshot(mock_client), result)
 
         assert len(result.pulled) == 1
         assert result.pulled[0][1] == 50
 
+    def test_pull_schemas_retrieves_concurrently(self, workspace: Workspace):
+        for queue_id, schema_id in [(100, 50), (101, 51), (102, 52)]:
+            workspace._save_object(
+                ObjectType.QUEUE,
+                queue_id,
+                f"Queue {queue_id}",
+                {"id": queue_id, "schema": f"https://api.example.com/v1/schemas/{schema_id}"},
+            )
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def retrieve_schema(schema_id: int) -> Mock:
+            barrier.wait()
+            schema = Mock()
+            schema.id = schema_id
+            schema.name = f"Schema {schema_id}"
+            schema.modified_at = None
+            return schema
+
+        from rossum_deploy.models import PullResult
+
+        result = PullResult()
+
+        with (
+            patch.object(workspace, "_client") as mock_client,
+            patch("rossum_deploy.workspace.dataclasses.asdict", return_value={}),
+        ):
+            mock_client.retrieve_schema.side_effect = retrieve_schema
+
+            workspace._pull_schemas(OrgSnapshot(mock_client), result)
+
+        assert [p[1] for p in result.pulled] == [50, 51, 52]
+
 
 class TestPullEnginesMethod:
     """Tests for _pull_engines method."""
@@ -1780,7 +2314,7 @@ class TestPullEnginesMethod:
             mock_client.list_queues.return_value = [mock_queue]
             mock_client.list_engines.return_value = [mock_engine]
 
-            workspace._pull_engines(mock_client, result)
+            workspace._pull_engines(OrgSnapshot(mock_client), result)
 
         assert len(result.pulled) == 1
         assert result.pulled[0][1] == 10
@@ -1812,7 +2346,7 @@ class TestPullEmailTemplatesMethod:
             mock_asdict.return_value = {"id": 800, "name": "Template", "message": "Test message\n\n"}
             mock_client.list_email_templates.return_value = [mock_template]
 
-            workspace._pull_email_templates(mock_client, result)
+            workspace._pull_email_templates(OrgSnapshot(mock_client), result)
 
         assert len(result.pulled) == 1
 
@@ -1842,7 +2376,7 @@ class TestPullRulesMethod:
             mock_asdict.return_value = {"id": 1000, "name": "Rule"}
             mock_client.list_rules.return_value = [mock_rule]
 
-            workspace._pull_rules(mock_client, result)
+            workspace._pull_rules(OrgSnapshot(mock_client), result)
 
         assert len(result.pulled) == 1
         assert result.pulled[0][1] == 1000
@@ -1968,55 +2502,37 @@ class TestNormalizeValueMessageField:
 class TestIsGitModified:
     """Tests for _is_git_modified method."""
 
-    def test_is_git_modified_git_not_found(self, workspace: Workspace):
-        workspace._save_object(ObjectType.QUEUE, 1, "Queue", {"id": 1})
-        paths = workspace._list_local_objects(ObjectType.QUEUE)
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("git not found")
-            result = workspace._is_git_modified(paths[0])
-
-        assert result is False
-
-    def test_is_git_modified_non_zero_return(self, workspace: Workspace):
-        workspace._save_object(ObjectType.QUEUE, 1, "Queue", {"id": 1})
-        paths = workspace._list_local_objects(ObjectType.QUEUE)
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=128, stdout="")
-            result = workspace._is_git_modified(paths[0])
-
-        assert result is False
-
-    def test_is_git_modified_no_status(self, workspace: Workspace):
-        workspace._save_object(ObjectType.QUEUE, 1, "Queue", {"id": 1})
-        paths = workspace._list_local_objects(ObjectType.QUEUE)
+    def test_is_git_modified_uses_given_snapshot(self, workspace: Workspace):
+        path = workspace._save_object(ObjectType.QUEUE, 1, "Queue", {"id": 1})
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout="")
-            result = workspace._is_git_modified(paths[0])
+            assert workspace._is_git_modified(path, GitStatus({path.resolve()})) is True
+            assert workspace._is_git_modified(path, GitStatus()) is False
 
-        assert result is False
+        mock_run.assert_not_called()
 
-    def test_is_git_modified_with_M_status(self, workspace: Workspace):
-        workspace._save_object(ObjectType.QUEUE, 1, "Queue", {"id": 1})
-        paths = workspace._list_local_objects(ObjectType.QUEUE)
+    def test_is_git_modified_without_snapshot_captures_one(self, workspace: Workspace):
+        path = workspace._save_object(ObjectType.QUEUE, 1, "Queue", {"id": 1})
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout=" M queues/Queue_1.json")
-            result = workspace._is_git_modified(paths[0])
+        with patch("rossum_deploy.workspace.GitStatus.capture", return_value=GitStatus({path.resolve()})) as capture:
+            assert workspace._is_git_modified(path) is True
 
-        assert result is True
+        capture.assert_called_once_with(workspace.path)
 
-    def test_is_git_modified_with_staged(self, workspace: Workspace):
-        workspace._save_object(ObjectType.QUEUE, 1, "Queue", {"id": 1})
-        paths = workspace._list_local_objects(ObjectType.QUEUE)
+    def test_diff_runs_git_once(self, workspace: Workspace):
+        modified_at = datetime(2024, 1, 1, tzinfo=UTC)
+        for queue_id in (1, 2, 3):
+            workspace._save_object(
+                ObjectType.QUEUE, queue_id, f"Queue {queue_id}", {"id": queue_id}, remote_modified_at=modified_at
+            )
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0, stdout="M  queues/Queue_1.json")
-            result = workspace._is_git_modified(paths[0])
+        with (
+            patch("rossum_deploy.workspace.GitStatus.capture", return_value=GitStatus()) as capture,
+            patch.object(workspace, "_fetch_remote_object", side_effect=lambda c, t, i: ({"id": i}, modified_at)),
+        ):
+            workspace.diff()
 
-        assert result is True
+        capture.assert_called_once()
 
 
 class TestPushMethodEdgeCases:
@@ -2356,10 +2872,10 @@ class TestCopySingleRuleNullSchema:
 
 
 class TestCopyRulesNullSchema:
-    """Tests for _copy_rules filtering rules with null schema."""
+    """Tests for _rule_copy_tasks filtering rules with null schema."""
 
     def test_copy_rules_skips_null_schema_rules(self, workspace: Workspace):
-        """Rules with schema=None should be skipped in _copy_rules."""
+        """Rules with schema=None should be skipped when collecting rule copy tasks."""
         mock_rule_with_schema = Mock()
         mock_rule_with_schema.id = 1000
         mock_rule_with_schema.name = "Rule with schema"
@@ -2396,7 +2912,9 @@ class TestCopyRulesNullSchema:
             mapping.add(ObjectType.SCHEMA, 50, 60)
             result = CopyResult()
 
-            workspace._copy_rules(mock_source_client, mock_target_client, source_schema_urls, mapping, result)
+            workspace._run_copy_level(
+                workspace._rule_copy_tasks(mock_source_client, mock_target_client, source_schema_urls), mapping, result
+            )
 
         assert len(result.created) == 1
         assert result.created[0][0] == ObjectType.RULE
@@ -2542,7 +3060,7 @@ class TestPrepareEmailTemplateDeployData:
 
 
 class TestCopyEngines:
-    """Tests for _copy_engines method."""
+    """Tests for _engine_copy_tasks method."""
 
     def test_copy_engines(self, workspace: Workspace):
         mock_engine = Mock()
@@ -2574,13 +3092,15 @@ class TestCopyEngines:
         mapping = IdMapping(source_org_id=1, target_org_id=2)
 
         result = CopyResult()
-        workspace._copy_engines(mock_source_client, mock_target_client, source_queue_urls, mapping, result)
+        workspace._run_copy_level(
+            workspace._engine_copy_tasks(mock_source_client, mock_target_client, source_queue_urls), mapping, result
+        )
 
         assert len(result.created) == 1
 
 
 class TestCopyConnectorsWarning:
-    """Tests for _copy_connectors SDK deserialization warning."""
+    """Tests for _connector_copy_tasks SDK deserialization warning."""
 
     def test_copy_connectors_sdk_error(self, workspace: Workspace):
         source_queue_urls = {"https://api.example.com/v1/queues/100"}
@@ -2593,7 +3113,9 @@ class TestCopyConnectorsWarning:
         mapping = IdMapping(source_org_id=1, target_org_id=2)
         result = CopyResult()
 
-        workspace._copy_connectors(mock_source_client, mock_target_client, source_queue_urls, mapping, result)
+        workspace._run_copy_level(
+            workspace._connector_copy_tasks(mock_source_client, mock_target_client, source_queue_urls), mapping, result
+        )
 
         assert len(result.created) == 0
         assert len(result.failed) == 0
@@ -2660,7 +3182,7 @@ class TestPullHooksConnectors:
             mock_asdict.return_value = {"id": 500, "name": "Hook"}
             mock_client.list_hooks.return_value = [mock_hook]
 
-            workspace._pull_hooks(mock_client, result)
+            workspace._pull_hooks(OrgSnapshot(mock_client), result)
 
         assert len(result.pulled) == 1
 
@@ -2686,6 +3208,6 @@ class TestPullHooksConnectors:
             mock_asdict.return_value = {"id": 600, "name": "Connector"}
             mock_client.list_connectors.return_value = [mock_connector]
 
-            workspace._pull_connectors(mock_client, result)
+            workspace._pull_connectors(OrgSnapshot(mock_client), result)
 
         assert len(result.pulled) == 1
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import glob
+import json
 import logging
+import math
+import time
 from collections.abc import Sequence  # noqa: TC003 - needed at runtime for FastMCP
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from rossum_api.models.annotation import Annotation
 
@@ -14,10 +21,26 @@ from rossum_mcp.tools.base import delete_resource, is_read_write_mode
 if TYPE_CHECKING:
     from fastmcp import FastMCP
     from rossum_api import AsyncRossumAPIClient
+    from rossum_api.models.task import Task
 
 logger = logging.getLogger(__name__)
 
 type Sideload = Literal["content", "document", "automation_blocker"]
+type BulkAnnotationAction = Literal["start", "confirm", "delete", "update_fields"]
+
+BULK_UPLOAD_MAX_CONCURRENCY = 8
+BULK_UPLOAD_POLL_INTERVAL_S = 2.0
+
+# Largest page the annotations endpoint returns
+MAX_ANNOTATIONS_PAGE_SIZE = 100
+DEFAULT_ANNOTATION_STATUSES = "importing,to_review,confirmed,exported"
+
+# Query parameters a list_annotations_page cursor may carry
+_CURSOR_KEYS = frozenset({"queue", "status", "ordering", "fields", "page_size", "page"})
+
+BULK_ANNOTATION_MAX_CONCURRENCY = 8
+# Upper bound on annotations selected by a queue filter in one bulk action
+BULK_ANNOTATION_MAX_ITEMS = 1000
 
 
 async def _upload_document(client: AsyncRossumAPIClient, file_path: str, queue_id: int) -> dict:
@@ -61,6 +84,85 @@ async def _upload_document(client: AsyncRossumAPIClient, file_path: str, queue_i
     }
 
 
+def _resolve_upload_files(source: str) -> list[Path]:
+    """Files to upload for a file path, a directory (its non-hidden files) or a glob pattern."""
+    path = Path(source).expanduser()
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.is_file() and not p.name.startswith("."))
+    return sorted(p for p in map(Path, glob.glob(str(path), recursive=True)) if p.is_file())
+
+
+async def _wait_for_upload(client: AsyncRossumAPIClient, task: Task, deadline: float) -> dict:
+    """Poll the upload task until it finishes and return the documents and annotations it created."""
+    while task.status == "running" and time.monotonic() < deadline:
+        await asyncio.sleep(BULK_UPLOAD_POLL_INTERVAL_S)
+        task = await client.retrieve_task(task.id)
+
+    result: dict = {"task_status": task.status}
+    if task.status == "succeeded" and task.result_url:
+        upload = await client.retrieve_upload(int(task.result_url.rstrip("/").rsplit("/", 1)[-1]))
+        result["documents"] = upload.documents
+        result["annotations"] = upload.annotations
+    elif task.status == "failed":
+        result["error"] = task.detail or "Upload task failed"
+    return result
+
+
+async def _bulk_upload_documents(
+    client: AsyncRossumAPIClient,
+    source: str,
+    queue_id: int,
+    max_concurrency: int = BULK_UPLOAD_MAX_CONCURRENCY,
+    wait_for_import: bool = False,
+    timeout_s: float = 300,
+) -> dict:
+    if not is_read_write_mode():
+        return {"error": "bulk_upload_documents is not available in read-only mode"}
+
+    files = _resolve_upload_files(source)
+    if not files:
+        return {"error": f"No files found for '{source}'"}
+
+    logger.debug(f"Bulk uploading documents: source={source}, files={len(files)}, queue_id={queue_id}")
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    deadline = time.monotonic() + timeout_s
+
+    async def upload_file(path: Path) -> dict:
+        file_result: dict = {"file": str(path)}
+        async with semaphore:
+            try:
+                # The SDK client retries transient failures of each request itself. Retrying the whole
+                # upload here could POST the file twice when only the follow-up task lookup failed.
+                task = (await client.upload_document(queue_id, [(str(path), path.name)]))[0]
+            except Exception as e:
+                logger.error(f"Upload of {path} failed: {type(e).__name__}: {e}")
+                return {**file_result, "status": "failed", "error": f"{type(e).__name__}: {e!s}"}
+
+        file_result.update(
+            {"status": "uploaded", "task_id": task.id, "task_url": task.url, "task_status": task.status}
+        )
+        if wait_for_import:
+            try:
+                file_result.update(await _wait_for_upload(client, task, deadline))
+            except Exception as e:
+                file_result["error"] = f"Could not check upload result: {type(e).__name__}: {e!s}"
+            if file_result["task_status"] == "failed":
+                file_result["status"] = "failed"
+        return file_result
+
+    results = await asyncio.gather(*(upload_file(path) for path in files))
+    failed = sum(1 for result in results if result["status"] == "failed")
+    return {
+        "queue_id": queue_id,
+        "total": len(results),
+        "uploaded": len(results) - failed,
+        "failed": failed,
+        "files": results,
+    }
+
+
 async def _get_annotation(
     client: AsyncRossumAPIClient, annotation_id: int, sideloads: Sequence[Sideload] = ()
 ) -> Annotation:
@@ -72,16 +174,20 @@ async def _get_annotation(
 async def _list_annotations(
     client: AsyncRossumAPIClient,
     queue_id: int,
-    status: str | None = "importing,to_review,confirmed,exported",
+    status: str | None = DEFAULT_ANNOTATION_STATUSES,
     ordering: Sequence[str] = (),
     first_n: int | None = None,
 ) -> list[Annotation]:
     logger.debug(f"Listing annotations: queue_id={queue_id}, status={status}, ordering={ordering}, first_n={first_n}")
-    params: dict = {"queue": queue_id, "page_size": 100}
+    params: dict = {"queue": queue_id, "page_size": MAX_ANNOTATIONS_PAGE_SIZE}
     if status:
         params["status"] = status
     if ordering:
         params["ordering"] = ordering
+    if first_n is not None:
+        # The SDK requests all remaining pages at once after the first one; cap them to what is needed
+        params["page_size"] = max(1, min(first_n, MAX_ANNOTATIONS_PAGE_SIZE))
+        params["max_pages"] = max(1, math.ceil(first_n / params["page_size"]))
 
     annotations_list: list[Annotation] = []
     async for item in client.list_annotations(**params):
@@ -91,6 +197,75 @@ async def _list_annotations(
     return annotations_list
 
 
+def _encode_cursor(params: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(params, separators=(",", ":")).encode()).decode()
+
+
+def _is_positive_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def _decode_cursor(cursor: str) -> dict[str, Any]:
+    """Decode a cursor from list_annotations_page, accepting only the query parameters it encodes."""
+    try:
+        params = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if (
+        not isinstance(params, dict)
+        or not params.keys() <= _CURSOR_KEYS
+        or not all(_is_positive_int(params.get(key)) for key in ("queue", "page", "page_size"))
+        or params["page_size"] > MAX_ANNOTATIONS_PAGE_SIZE
+        or not all(isinstance(params.get(key, ""), str) for key in ("status", "ordering", "fields"))
+    ):
+        raise ValueError("Invalid cursor")
+    return params
+
+
+async def _list_annotations_page(
+    client: AsyncRossumAPIClient,
+    queue_id: int | None = None,
+    status: str | None = DEFAULT_ANNOTATION_STATUSES,
+    ordering: Sequence[str] = (),
+    page_size: int = MAX_ANNOTATIONS_PAGE_SIZE,
+    fields: Sequence[str] = (),
+    cursor: str | None = None,
+    count_only: bool = False,
+) -> dict:
+    if cursor is not None:
+        try:
+            params = _decode_cursor(cursor)
+        except ValueError as e:
+            return {"error": str(e)}
+    else:
+        if queue_id is None:
+            return {"error": "queue_id is required unless a cursor is given"}
+        params: dict[str, Any] = {"queue": queue_id, "page": 1}
+        if status:
+            params["status"] = status
+        if ordering:
+            params["ordering"] = ",".join(ordering)
+        if fields:
+            params["fields"] = ",".join(fields)
+        params["page_size"] = max(1, min(page_size, MAX_ANNOTATIONS_PAGE_SIZE))
+
+    if count_only:
+        # A single one-item page carries the total count of matching annotations
+        count_params = {**params, "page": 1, "page_size": 1, "include_total": "true"}
+        count_params.pop("fields", None)
+        logger.debug(f"Counting annotations: params={count_params}")
+        data = await client._http_client.request_json("GET", "annotations", params=count_params)
+        return {"count": data["pagination"]["total"]}
+
+    logger.debug(f"Listing annotations page: params={params}")
+    data = await client._http_client.request_json("GET", "annotations", params=params)
+    has_next = bool(data.get("pagination", {}).get("next"))
+    return {
+        "results": data["results"],
+        "next_cursor": _encode_cursor({**params, "page": params["page"] + 1}) if has_next else None,
+    }
+
+
 async def _start_annotation(client: AsyncRossumAPIClient, annotation_id: int) -> dict:
     if not is_read_write_mode():
         return {"error": "start_annotation is not available in read-only mode"}
@@ -136,6 +311,87 @@ async def _delete_annotation(client: AsyncRossumAPIClient, annotation_id: int) -
     )
 
 
+async def _select_annotation_ids(
+    client: AsyncRossumAPIClient, queue_id: int, status: str, max_annotations: int
+) -> list[int]:
+    """IDs of up to max_annotations annotations of a queue, fetched page by page as IDs only."""
+    ids: list[int] = []
+    page = await _list_annotations_page(client, queue_id, status, fields=["id"])
+    while True:
+        ids.extend(annotation["id"] for annotation in page["results"])
+        if len(ids) >= max_annotations or not page["next_cursor"]:
+            return ids[:max_annotations]
+        page = await _list_annotations_page(client, cursor=page["next_cursor"])
+
+
+async def _bulk_annotation_action(
+    client: AsyncRossumAPIClient,
+    action: BulkAnnotationAction,
+    annotation_ids: Sequence[int] = (),
+    queue_id: int | None = None,
+    status: str | None = None,
+    operations: dict[int, list[dict]] | None = None,
+    max_concurrency: int = BULK_ANNOTATION_MAX_CONCURRENCY,
+    max_annotations: int = BULK_ANNOTATION_MAX_ITEMS,
+) -> dict:
+    if not is_read_write_mode():
+        return {"error": "bulk_annotation_action is not available in read-only mode"}
+
+    actions = {
+        "start": client.start_annotation,
+        "confirm": client.confirm_annotation,
+        "delete": client.delete_annotation,
+    }
+    if action != "update_fields" and action not in actions:
+        return {"error": f"Invalid action '{action}'. Must be one of: start, confirm, delete, update_fields"}
+
+    field_operations: dict[int, list[dict]] = {}
+    if action == "update_fields":
+        if not operations:
+            return {"error": "operations (annotation ID -> field operations) is required for 'update_fields'"}
+        field_operations = operations
+        ids = list(field_operations)
+    elif annotation_ids:
+        ids = list(dict.fromkeys(annotation_ids))
+    elif queue_id is not None:
+        if not status and action in ("confirm", "delete"):
+            # Never fall back to every status for irreversible actions
+            return {"error": f"status is required when selecting annotations by queue_id for '{action}'"}
+        ids = await _select_annotation_ids(client, queue_id, status or DEFAULT_ANNOTATION_STATUSES, max_annotations)
+    else:
+        return {"error": "Specify annotation_ids or queue_id"}
+
+    logger.debug(f"Bulk annotation action: action={action}, annotations={len(ids)}")
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(annotation_id: int) -> str | None:
+        async with semaphore:
+            try:
+                if action == "update_fields":
+                    await client.bulk_update_annotation_data(annotation_id, field_operations[annotation_id])
+                else:
+                    await actions[action](annotation_id)
+            except Exception as e:
+                logger.error(f"{action} failed for annotation {annotation_id}: {type(e).__name__}: {e}")
+                return f"{type(e).__name__}: {e!s}"
+        return None
+
+    errors = await asyncio.gather(*(run(annotation_id) for annotation_id in ids))
+    failed = [
+        {"annotation_id": annotation_id, "error": error}
+        for annotation_id, error in zip(ids, errors, strict=True)
+        if error is not None
+    ]
+    return {
+        "action": action,
+        "total": len(ids),
+        "succeeded": len(ids) - len(failed),
+        "failed": len(failed),
+        "succeeded_ids": [annotation_id for annotation_id, error in zip(ids, errors, strict=True) if error is None],
+        "errors": failed,
+    }
+
+
 def register_annotation_tools(mcp: FastMCP, client: AsyncRossumAPIClient) -> None:
     """Register annotation-related tools with the FastMCP server."""
 
@@ -143,6 +399,23 @@ def register_annotation_tools(mcp: FastMCP, client: AsyncRossumAPIClient) -> Non
     async def upload_document(file_path: str, queue_id: int) -> dict:
         return await _upload_document(client, file_path, queue_id)
 
+    @mcp.tool(
+        description="""Upload many documents to a queue in one call.
+
+source is a file, a directory (all its files) or a glob pattern (e.g. '/data/invoices/**/*.pdf').
+Files are uploaded concurrently (max_concurrency at a time); one failing file does not stop the others.
+Returns per-file status with task ID/URL; with wait_for_import=True, also waits (up to timeout_s)
+for each upload to finish and returns the created annotation URLs."""
+    )
+    async def bulk_upload_documents(
+        source: str,
+        queue_id: int,
+        max_concurrency: int = BULK_UPLOAD_MAX_CONCURRENCY,
+        wait_for_import: bool = False,
+        timeout_s: float = 300,
+    ) -> dict:
+        return await _bulk_upload_documents(client, source, queue_id, max_concurrency, wait_for_import, timeout_s)
+
     @mcp.tool(description="Retrieve annotation data. Use 'content' sideload to get extracted data.")
     async def get_annotation(annotation_id: int, sideloads: Sequence[Sideload] = ()) -> Annotation:
         return await _get_annotation(client, annotation_id, sideloads)
@@ -150,12 +423,30 @@ def register_annotation_tools(mcp: FastMCP, client: AsyncRossumAPIClient) -> Non
     @mcp.tool(description="List annotations for a queue. Use ordering=['-created_at'] to sort by newest first.")
     async def list_annotations(
         queue_id: int,
-        status: str | None = "importing,to_review,confirmed,exported",
+        status: str | None = DEFAULT_ANNOTATION_STATUSES,
         ordering: Sequence[str] = (),
         first_n: int | None = None,
     ) -> list[Annotation]:
         return await _list_annotations(client, queue_id, status, ordering, first_n)
 
+    @mcp.tool(
+        description="""List one page of annotations as JSON, for large queues.
+
+Pass next_cursor from the previous response as cursor to get the following page (the cursor
+keeps the original filters). fields limits each annotation to the given fields
+(e.g. ['id', 'status', 'modified_at']). count_only=True returns only {"count": N}."""
+    )
+    async def list_annotations_page(
+        queue_id: int | None = None,
+        status: str | None = DEFAULT_ANNOTATION_STATUSES,
+        ordering: Sequence[str] = (),
+        page_size: int = MAX_ANNOTATIONS_PAGE_SIZE,
+        fields: Sequence[str] = (),
+        cursor: str | None = None,
+        count_only: bool = False,
+    ) -> dict:
+        return await _list_annotations_page(client, queue_id, status, ordering, page_size, fields, cursor, count_only)
+
     @mcp.tool(description="Start annotation (move from 'to_review' to 'reviewing').")
     async def start_annotation(annotation_id: int) -> dict:
         return await _start_annotation(client, annotation_id)
@@ -172,6 +463,28 @@ def register_annotation_tools(mcp: FastMCP, client: AsyncRossumAPIClient) -> Non
     async def confirm_annotation(annotation_id: int) -> dict:
         return await _confirm_annotation(client, annotation_id)
 
+    @mcp.tool(
+        description="""Start, confirm, delete or update fields of many annotations in one call.
+
+Select annotations with annotation_ids, or with queue_id + status (at most max_annotations;
+status is required for 'confirm' and 'delete'). For action='update_fields', pass operations as {annotation_id: [field operations]}
+(same format as bulk_update_annotation_fields); annotation_ids is then ignored.
+Runs max_concurrency actions at a time; one failure does not stop the rest. Returns counts,
+succeeded IDs and per-annotation errors."""
+    )
+    async def bulk_annotation_action(
+        action: BulkAnnotationAction,
+        annotation_ids: Sequence[int] = (),
+        queue_id: int | None = None,
+        status: str | None = None,
+        operations: dict[int, list[dict]] | None = None,
+        max_concurrency: int = BULK_ANNOTATION_MAX_CONCURRENCY,
+        max_annotations: int = BULK_ANNOTATION_MAX_ITEMS,
+    ) -> dict:
+        return await _bulk_annotation_action(
+            client, action, annotation_ids, queue_id, status, operations, max_concurrency, max_annotations
+        )
+
     @mcp.tool(description="Delete an annotation. Moves to 'deleted' status (soft delete).")
     async def delete_annotation(annotation_id: int) -> dict:
         return await _delete_annotation(client, annotation_id)
@@ -37,12 +37,17 @@ TOOL_CATALOG: dict[str, ToolCategory] = {
         description="Document processing: upload, retrieve, update, and confirm annotations",
         tools=[
             ToolInfo("upload_document", "Upload document to queue", read_only=False),
+            ToolInfo("bulk_upload_documents", "Upload a directory or glob of documents to queue", read_only=False),
             ToolInfo("get_annotation", "Retrieve annotation with extracted data"),
             ToolInfo("list_annotations", "List annotations for a queue"),
+            ToolInfo("list_annotations_page", "Page through or count annotations with cursors"),
             ToolInfo("start_annotation", "Start annotation (to_review -> reviewing)", read_only=False),
             ToolInfo("bulk_update_annotation_fields", "Bulk update annotation fields", read_only=False),
             ToolInfo("confirm_annotation", "Confirm annotation (-> confirmed)", read_only=False),
             ToolInfo("delete_annotation", "Delete annotation (soft delete)", read_only=False),
+            ToolInfo(
+                "bulk_annotation_action", "Start/confirm/delete/update many annotations at once", read_only=False
+            ),
         ],
         keywords=["annotation", "document", "upload", "extract", "confirm", "review"],
     ),
@@ -54,6 +59,7 @@ TOOL_CATALOG: dict[str, ToolCategory] = {
             ToolInfo("list_queues", "List all queues"),
             ToolInfo("get_queue_schema", "Get queue's schema"),
             ToolInfo("get_queue_engine", "Get queue's AI engine"),
+            ToolInfo("get_queue_context", "Get queue with schema, engine, hooks, inbox and workspace"),
             ToolInfo("create_queue", "Create a queue", read_only=False),
             ToolInfo("update_queue", "Update queue settings", read_only=False),
             ToolInfo("get_queue_template_names", "List available queue templates"),
@@ -71,6 +77,7 @@ TOOL_CATALOG: dict[str, ToolCategory] = {
             ToolInfo("update_schema", "Update schema", read_only=False),
             ToolInfo("create_schema", "Create new schema", read_only=False),
             ToolInfo("patch_schema", "Add/update/remove schema fields", read_only=False),
+            ToolInfo("bulk_patch_schema", "Apply several schema field changes at once", read_only=False),
             ToolInfo("get_schema_tree_structure", "Get lightweight schema tree"),
             ToolInfo("prune_schema_fields", "Bulk remove schema fields", read_only=False),
             ToolInfo("delete_schema", "Delete schema", read_only=False),
@@ -99,6 +106,7 @@ TOOL_CATALOG: dict[str, ToolCategory] = {
             ToolInfo("create_hook", "Create new hook", read_only=False),
             ToolInfo("update_hook", "Update hook configuration", read_only=False),
             ToolInfo("list_hook_logs", "View hook execution logs"),
+            ToolInfo("summarize_hook_logs", "Aggregate hook logs: error rates, latency, top errors"),
             ToolInfo("list_hook_templates", "List Rossum Store templates"),
             ToolInfo("create_hook_from_template", "Create hook from template", read_only=False),
             ToolInfo("delete_hook", "Delete hook", read_only=False),
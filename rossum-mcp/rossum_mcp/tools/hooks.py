@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import logging
+import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Annotated, Any, Literal
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Annotated, Any, Literal, cast
 
 from rossum_api.models.hook import Hook, HookRunData, HookType
 
 from rossum_mcp.tools.base import TRUNCATED_MARKER, delete_resource, is_read_write_mode
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from fastmcp import FastMCP
     from rossum_api import AsyncRossumAPIClient
 
@@ -184,6 +188,337 @@ async def _list_hook_logs(
     return [log async for log in client.list_hook_run_data(**filters)]
 
 
+# The hook logs endpoint returns at most this many logs per request
+HOOK_LOGS_WINDOW_SIZE = 100
+DEFAULT_HOOK_LOGS_SCAN_LIMIT = 5000
+# Relative precision of latency percentiles (bucket width of the latency histogram)
+_LATENCY_BUCKET_GROWTH = 1.05
+# Number of distinct error messages tracked per summary
+_TRACKED_ERROR_MESSAGES = 100
+_SAMPLE_TEXT_LIMIT = 500
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _log_key(log: HookRunData) -> tuple:
+    return (log.uuid, log.request_id, log.hook_id, log.timestamp)
+
+
+async def _iter_hook_logs(
+    client: AsyncRossumAPIClient, filters: dict[str, Any], max_logs: int, overflowed: set[str] | None = None
+) -> AsyncIterator[HookRunData]:
+    """Stream hook logs newest first, beyond the per-request limit of the endpoint.
+
+    The endpoint returns at most HOOK_LOGS_WINDOW_SIZE logs, newest first, so logs are read in
+    windows: each request asks for logs at or before the oldest timestamp seen so far. Logs on
+    the window boundary are de-duplicated; only the keys of that boundary are kept in memory.
+    When more logs than one window share a timestamp, the rest of them cannot be requested;
+    the scan then continues just below that timestamp and adds it to `overflowed`.
+    """
+    timestamp_before = filters.get("timestamp_before")
+    boundary_keys: set[tuple] = set()
+    yielded = 0
+
+    while yielded < max_logs:
+        window_filters = {**filters, "page_size": HOOK_LOGS_WINDOW_SIZE}
+        if timestamp_before is not None:
+            window_filters["timestamp_before"] = timestamp_before
+
+        received = 0
+        new = 0
+        oldest: str | None = None
+        oldest_keys: set[tuple] = set()
+        async for log in client.list_hook_run_data(**window_filters):
+            received += 1
+            key = _log_key(log)
+            if oldest is None or log.timestamp < oldest:
+                oldest, oldest_keys = log.timestamp, {key}
+            elif log.timestamp == oldest:
+                oldest_keys.add(key)
+            if key in boundary_keys:
+                continue
+            new += 1
+            yield log
+            yielded += 1
+            if yielded >= max_logs:
+                return
+
+        if received < HOOK_LOGS_WINDOW_SIZE or not oldest:
+            return
+        if new == 0:
+            # The whole window repeats the boundary timestamp, so it holds more logs than a window
+            if (boundary := _parse_timestamp(oldest)) is None:
+                return
+            if overflowed is not None:
+                overflowed.add(oldest)
+            boundary_keys = set()
+            timestamp_before = (boundary - timedelta(microseconds=1)).isoformat()
+            continue
+        boundary_keys = boundary_keys | oldest_keys if oldest == timestamp_before else oldest_keys
+        timestamp_before = oldest
+
+
+class _LatencyHistogram:
+    """Log-scale latency histogram; percentiles are accurate to the bucket growth factor."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: float | None = None
+        self.max_ms: float | None = None
+        self._buckets: dict[int, int] = {}
+
+    def add(self, latency_ms: float) -> None:
+        latency_ms = max(latency_ms, 0.0)
+        self.count += 1
+        self.total_ms += latency_ms
+        self.min_ms = latency_ms if self.min_ms is None else min(self.min_ms, latency_ms)
+        self.max_ms = latency_ms if self.max_ms is None else max(self.max_ms, latency_ms)
+        bucket = math.ceil(math.log(latency_ms, _LATENCY_BUCKET_GROWTH)) if latency_ms >= 1 else 0
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def percentile(self, pct: float) -> float | None:
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                upper = _LATENCY_BUCKET_GROWTH**bucket if bucket else 1.0
+                return round(min(upper, cast("float", self.max_ms)), 1)
+        return self.max_ms
+
+    def summary(self) -> dict[str, Any] | None:
+        if not self.count:
+            return None
+        return {
+            "count": self.count,
+            "min": round(cast("float", self.min_ms), 1),
+            "mean": round(self.total_ms / self.count, 1),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": round(cast("float", self.max_ms), 1),
+        }
+
+
+class _TopMessages:
+    """Space-saving counter of the most frequent messages within a fixed number of slots.
+
+    Counts are exact while fewer than `capacity` distinct messages have been seen; beyond that
+    they are upper bounds, overestimated by at most the reported `error` of each message.
+    """
+
+    def __init__(self, capacity: int = _TRACKED_ERROR_MESSAGES) -> None:
+        self.capacity = capacity
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+
+    def add(self, message: str) -> None:
+        if message in self._counts:
+            self._counts[message] += 1
+            return
+        error = 0
+        if len(self._counts) >= self.capacity:
+            evicted = min(self._counts, key=self._counts.__getitem__)
+            error = self._counts.pop(evicted)
+            self._errors.pop(evicted)
+        self._counts[message] = error + 1
+        self._errors[message] = error
+
+    def top(self, n: int) -> list[dict[str, Any]]:
+        ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)[:n]
+        return [
+            {"message": message, "count": count, **({"error": self._errors[message]} if self._errors[message] else {})}
+            for message, count in ranked
+        ]
+
+
+def _normalize_error_message(log: HookRunData) -> str:
+    text = (log.message or log.output or "").strip()
+    if not text:
+        return f"<no message> (status={log.status}, status_code={log.status_code})"
+    # Tracebacks end with the exception line, plain messages start with the relevant line
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    line = lines[-1] if lines[0].startswith("Traceback") else lines[0]
+    return line[:200]
+
+
+def _is_error_log(log: HookRunData) -> bool:
+    return log.log_level == "ERROR" or (log.status_code is not None and log.status_code >= 400)
+
+
+def _status_label(log: HookRunData) -> str:
+    if log.status_code is not None:
+        return str(log.status_code)
+    return log.status or log.log_level
+
+
+def _compact_log(log: HookRunData) -> dict[str, Any]:
+    """A hook log without request/response payloads and with long texts truncated."""
+
+    def _clip(text: str | None) -> str | None:
+        if text and len(text) > _SAMPLE_TEXT_LIMIT:
+            return text[:_SAMPLE_TEXT_LIMIT] + TRUNCATED_MARKER
+        return text
+
+    return {
+        "timestamp": log.timestamp,
+        "hook_id": log.hook_id,
+        "log_level": log.log_level,
+        "event": log.event,
+        "action": log.action,
+        "status": log.status,
+        "status_code": log.status_code,
+        "queue_id": log.queue_id,
+        "annotation_id": log.annotation_id,
+        "request_id": log.request_id,
+        "message": _clip(log.message),
+        "output": _clip(log.output),
+    }
+
+
+class HookLogStats:
+    """Single-pass aggregation of hook logs in memory bounded independently of the log count.
+
+    Tracks per-hook error rates and latency percentiles (from `start`/`end`), the most frequent
+    error messages, a status histogram per time bucket and a few sample logs.
+
+    Example:
+        >>> stats = HookLogStats(bucket_minutes=60)
+        >>> for log in logs:
+        ...     stats.add(log)
+        >>> stats.summary()["hooks"][0]["error_rate"]
+    """
+
+    def __init__(self, bucket_minutes: int = 60, sample_size: int = 5, top_errors: int = 10) -> None:
+        self.bucket = timedelta(minutes=bucket_minutes)
+        self.sample_size = sample_size
+        self.top_errors = top_errors
+        self.total = 0
+        self.oldest: str | None = None
+        self.newest: str | None = None
+        self._hooks: dict[int, dict[str, Any]] = {}
+        self._messages = _TopMessages()
+        self._histogram: dict[datetime, dict[str, int]] = {}
+        self._error_samples: list[dict[str, Any]] = []
+        self._other_samples: list[dict[str, Any]] = []
+
+    def add(self, log: HookRunData) -> None:
+        self.total += 1
+        if log.timestamp:
+            self.oldest = log.timestamp if self.oldest is None else min(self.oldest, log.timestamp)
+            self.newest = log.timestamp if self.newest is None else max(self.newest, log.timestamp)
+
+        hook = self._hooks.setdefault(
+            log.hook_id,
+            {"hook_type": log.hook_type, "total": 0, "errors": 0, "warnings": 0, "latency": _LatencyHistogram()},
+        )
+        hook["total"] += 1
+        is_error = _is_error_log(log)
+        if is_error:
+            hook["errors"] += 1
+            self._messages.add(_normalize_error_message(log))
+        elif log.log_level == "WARNING":
+            hook["warnings"] += 1
+
+        start, end = _parse_timestamp(log.start), _parse_timestamp(log.end)
+        if start is not None and end is not None:
+            hook["latency"].add((end - start).total_seconds() * 1000)
+
+        if (timestamp := _parse_timestamp(log.timestamp)) is not None:
+            epoch = datetime(1970, 1, 1, tzinfo=timestamp.tzinfo)
+            bucket_start = timestamp - (timestamp - epoch) % self.bucket
+            statuses = self._histogram.setdefault(bucket_start, {})
+            label = _status_label(log)
+            statuses[label] = statuses.get(label, 0) + 1
+
+        samples = self._error_samples if is_error else self._other_samples
+        if len(samples) < self.sample_size:
+            samples.append(_compact_log(log))
+
+    def summary(self) -> dict[str, Any]:
+        hooks = [
+            {
+                "hook_id": hook_id,
+                "hook_type": hook["hook_type"],
+                "total": hook["total"],
+                "errors": hook["errors"],
+                "warnings": hook["warnings"],
+                "error_rate": round(hook["errors"] / hook["total"], 4),
+                "latency_ms": hook["latency"].summary(),
+            }
+            for hook_id, hook in self._hooks.items()
+        ]
+        hooks.sort(key=lambda hook: (hook["errors"], hook["total"]), reverse=True)
+        return {
+            "total_logs": self.total,
+            "oldest": self.oldest,
+            "newest": self.newest,
+            "hooks": hooks,
+            "top_errors": self._messages.top(self.top_errors),
+            "status_histogram": [
+                {"bucket_start": bucket_start.isoformat(), "statuses": statuses}
+                for bucket_start, statuses in sorted(self._histogram.items())
+            ],
+            "error_samples": self._error_samples,
+            "samples": self._other_samples,
+        }
+
+
+async def _summarize_hook_logs(
+    client: AsyncRossumAPIClient,
+    hook_id: int | None = None,
+    queue_id: int | None = None,
+    annotation_id: int | None = None,
+    log_level: Literal["INFO", "ERROR", "WARNING"] | None = None,
+    status: str | None = None,
+    status_code: int | None = None,
+    timestamp_before: Timestamp | None = None,
+    timestamp_after: Timestamp | None = None,
+    search: str | None = None,
+    max_logs: int = DEFAULT_HOOK_LOGS_SCAN_LIMIT,
+    bucket_minutes: int = 60,
+    top_errors: int = 10,
+    sample_size: int = 3,
+) -> dict:
+    if max_logs < 1:
+        return {"error": "max_logs must be at least 1"}
+    if bucket_minutes < 1:
+        return {"error": "bucket_minutes must be at least 1"}
+
+    filter_mapping: dict[str, Any] = {
+        "hook": hook_id,
+        "queue": queue_id,
+        "annotation": annotation_id,
+        "log_level": log_level,
+        "status": status,
+        "status_code": status_code,
+        "timestamp_before": timestamp_before,
+        "timestamp_after": timestamp_after,
+        "search": search,
+    }
+    filters = {k: v for k, v in filter_mapping.items() if v is not None}
+    logger.debug(f"Summarizing hook logs: filters={filters}, max_logs={max_logs}")
+
+    stats = HookLogStats(bucket_minutes=bucket_minutes, sample_size=sample_size, top_errors=top_errors)
+    overflowed: set[str] = set()
+    async for log in _iter_hook_logs(client, filters, max_logs, overflowed):
+        stats.add(log)
+
+    summary = stats.summary()
+    summary["truncated"] = stats.total >= max_logs or bool(overflowed)
+    return summary
+
+
 async def _list_hook_templates(client: AsyncRossumAPIClient) -> list[HookTemplate]:
     templates: list[HookTemplate] = []
     async for item in client.request_paginated("hook_templates"):
@@ -324,6 +659,46 @@ def register_hook_tools(mcp: FastMCP, client: AsyncRossumAPIClient) -> None:
             page_size,
         )
 
+    @mcp.tool(
+        description="Summarize hook execution logs instead of returning raw records. Streams up to max_logs logs "
+        "(newest first, beyond the 100-log limit of list_hook_logs) and returns per-hook error rates and latency "
+        "percentiles (ms), the most frequent error messages, a status histogram per bucket_minutes time bucket and a "
+        "few compact sample logs. 'truncated' is true when max_logs was reached or at least 100 logs shared one "
+        "timestamp (any beyond 100 of those cannot be read). Use list_hook_logs with request_id "
+        "or annotation_id to inspect individual runs."
+    )
+    async def summarize_hook_logs(
+        hook_id: int | None = None,
+        queue_id: int | None = None,
+        annotation_id: int | None = None,
+        log_level: Literal["INFO", "ERROR", "WARNING"] | None = None,
+        status: str | None = None,
+        status_code: int | None = None,
+        timestamp_before: Timestamp | None = None,
+        timestamp_after: Timestamp | None = None,
+        search: str | None = None,
+        max_logs: int = DEFAULT_HOOK_LOGS_SCAN_LIMIT,
+        bucket_minutes: int = 60,
+        top_errors: int = 10,
+        sample_size: int = 3,
+    ) -> dict:
+        return await _summarize_hook_logs(
+            client,
+            hook_id,
+            queue_id,
+            annotation_id,
+            log_level,
+            status,
+            status_code,
+            timestamp_before,
+            timestamp_after,
+            search,
+            max_logs,
+            bucket_minutes,
+            top_errors,
+            sample_size,
+        )
+
     @mcp.tool(
         description="List available hook templates from Rossum Store. Hook templates provide pre-built extension configurations (e.g., data validation, field mapping, notifications) that can be used to quickly create hooks instead of writing code from scratch. Use list_hook_templates first to find a suitable template, then use create_hook_from_template to create a hook based on that template."
     )
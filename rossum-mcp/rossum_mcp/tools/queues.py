@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from dataclasses import replace
@@ -11,17 +12,32 @@ from rossum_api import APIClientError
 from rossum_api.domain_logic.resources import Resource
 from rossum_api.models import deserialize_default
 from rossum_api.models.engine import Engine
+from rossum_api.models.hook import Hook
+from rossum_api.models.inbox import Inbox
 from rossum_api.models.queue import Queue
 from rossum_api.models.schema import Schema
-
-from rossum_mcp.tools.base import build_resource_url, delete_resource, is_read_write_mode, truncate_dict_fields
+from rossum_api.models.workspace import Workspace
+
+from rossum_mcp.tools.base import (
+    TRUNCATED_MARKER,
+    build_resource_url,
+    delete_resource,
+    is_read_write_mode,
+    truncate_dict_fields,
+)
+from rossum_mcp.tools.schemas import schema_tree
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from fastmcp import FastMCP
     from rossum_api import AsyncRossumAPIClient
 
 logger = logging.getLogger(__name__)
 
+# Fields to truncate in hook.config for queue context responses
+_HOOK_CONFIG_TRUNCATE_FIELDS = ("code",)
+
 # Fields to truncate in queue.settings for list responses
 _QUEUE_SETTINGS_TRUNCATE_FIELDS = (
     "accepted_mime_types",
@@ -64,19 +80,16 @@ async def _list_queues(
     return [_truncate_queue_for_list(queue) for queue in queues]
 
 
-async def _get_queue_schema(client: AsyncRossumAPIClient, queue_id: int) -> Schema:
-    logger.debug(f"Retrieving queue schema: queue_id={queue_id}")
-    queue: Queue = await client.retrieve_queue(queue_id)
-    schema_url = queue.schema
-    schema_id = int(schema_url.rstrip("/").split("/")[-1])
-    schema: Schema = await client.retrieve_schema(schema_id)
-    return schema
+def _id_from_url(url: str) -> int:
+    return int(url.rstrip("/").split("/")[-1])
 
 
-async def _get_queue_engine(client: AsyncRossumAPIClient, queue_id: int) -> Engine | dict:
-    logger.debug(f"Retrieving queue engine: queue_id={queue_id}")
-    queue: Queue = await client.retrieve_queue(queue_id)
+async def _retrieve_queue_schema(client: AsyncRossumAPIClient, queue: Queue) -> Schema:
+    schema: Schema = await client.retrieve_schema(_id_from_url(queue.schema))
+    return schema
 
+
+async def _resolve_queue_engine(client: AsyncRossumAPIClient, queue: Queue) -> Engine | dict:
     engine_url = None
     if queue.dedicated_engine:
         engine_url = queue.dedicated_engine
@@ -90,8 +103,7 @@ async def _get_queue_engine(client: AsyncRossumAPIClient, queue_id: int) -> Engi
 
     try:
         if isinstance(engine_url, str):
-            engine_id = int(engine_url.rstrip("/").split("/")[-1])
-            engine: Engine = await client.retrieve_engine(engine_id)
+            engine: Engine = await client.retrieve_engine(_id_from_url(engine_url))
         else:
             engine = deserialize_default(Resource.Engine, engine_url)
     except APIClientError as e:
@@ -102,6 +114,93 @@ async def _get_queue_engine(client: AsyncRossumAPIClient, queue_id: int) -> Engi
     return engine
 
 
+async def _get_queue_schema(client: AsyncRossumAPIClient, queue_id: int) -> Schema:
+    logger.debug(f"Retrieving queue schema: queue_id={queue_id}")
+    queue: Queue = await client.retrieve_queue(queue_id)
+    return await _retrieve_queue_schema(client, queue)
+
+
+async def _get_queue_engine(client: AsyncRossumAPIClient, queue_id: int) -> Engine | dict:
+    logger.debug(f"Retrieving queue engine: queue_id={queue_id}")
+    queue: Queue = await client.retrieve_queue(queue_id)
+    return await _resolve_queue_engine(client, queue)
+
+
+def _truncate_hook_for_context(hook: Hook) -> Hook:
+    """Drop hook code and UI metadata; get_hook returns the full hook."""
+    return replace(
+        hook,
+        config=truncate_dict_fields(hook.config, _HOOK_CONFIG_TRUNCATE_FIELDS),
+        guide=TRUNCATED_MARKER if hook.guide else hook.guide,
+        settings_schema=TRUNCATED_MARKER if hook.settings_schema else hook.settings_schema,
+    )
+
+
+async def _list_queue_hooks(client: AsyncRossumAPIClient, queue_id: int) -> list[Hook]:
+    return [_truncate_hook_for_context(hook) async for hook in client.list_hooks(queue=queue_id)]
+
+
+async def _retrieve_queue_inbox(client: AsyncRossumAPIClient, queue: Queue) -> Inbox | None:
+    if not queue.inbox:
+        return None
+    inbox_data = await client._http_client.fetch_one(Resource.Inbox, _id_from_url(queue.inbox))
+    return cast("Inbox", client._deserializer(Resource.Inbox, inbox_data))
+
+
+async def _retrieve_queue_workspace(client: AsyncRossumAPIClient, queue: Queue) -> Workspace | None:
+    if not queue.workspace:
+        return None
+    workspace: Workspace = await client.retrieve_workspace(_id_from_url(queue.workspace))
+    return workspace
+
+
+async def _context_part[T](name: str, awaitable: Awaitable[T], errors: dict[str, str]) -> T | None:
+    """Await one part of the queue context, recording API errors instead of failing the whole call."""
+    try:
+        return await awaitable
+    except APIClientError as e:
+        logger.warning(f"Failed to load queue context part {name}: {e}")
+        errors[name] = str(e)
+        return None
+
+
+async def _get_queue_context(client: AsyncRossumAPIClient, queue_id: int) -> dict:
+    """Fetch a queue together with its schema, engine, hooks, inbox and workspace.
+
+    The API has no sideloads for these relations on queues, so they are fetched concurrently:
+    hooks are listed by queue ID alongside the queue itself, and everything referenced by the
+    queue follows in a single parallel round. Verbose fields are truncated.
+    """
+    logger.debug(f"Retrieving queue context: queue_id={queue_id}")
+    errors: dict[str, str] = {}
+    hooks_task = asyncio.create_task(_list_queue_hooks(client, queue_id))
+    try:
+        queue: Queue = await client.retrieve_queue(queue_id)
+    except BaseException:
+        hooks_task.cancel()
+        raise
+
+    schema, engine, inbox, workspace, hooks = await asyncio.gather(
+        _context_part("schema", _retrieve_queue_schema(client, queue), errors),
+        _context_part("engine", _resolve_queue_engine(client, queue), errors),
+        _context_part("inbox", _retrieve_queue_inbox(client, queue), errors),
+        _context_part("workspace", _retrieve_queue_workspace(client, queue), errors),
+        _context_part("hooks", hooks_task, errors),
+    )
+
+    context: dict = {
+        "queue": _truncate_queue_for_list(queue),
+        "schema": replace(schema, content=schema_tree(schema)) if schema is not None else None,
+        "engine": engine,
+        "hooks": hooks,
+        "inbox": inbox,
+        "workspace": workspace,
+    }
+    if errors:
+        context["errors"] = errors
+    return context
+
+
 async def _create_queue(
     client: AsyncRossumAPIClient,
     name: str,
@@ -252,6 +351,14 @@ def register_queue_tools(mcp: FastMCP, client: AsyncRossumAPIClient) -> None:
     async def get_queue_engine(queue_id: int) -> Engine | dict:
         return await _get_queue_engine(client, queue_id)
 
+    @mcp.tool(
+        description="Retrieve a queue with its schema (field tree only), engine, hooks (code omitted), inbox and "
+        "workspace in one call. Related objects are fetched in parallel; parts that fail to load are reported "
+        "under 'errors'. Use get_queue_schema or get_hook for full details."
+    )
+    async def get_queue_context(queue_id: int) -> dict:
+        return await _get_queue_context(client, queue_id)
+
     @mcp.tool(description="Create a queue.")
     async def create_queue(
         name: str,
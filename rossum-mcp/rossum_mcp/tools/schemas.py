@@ -5,7 +5,8 @@ from __future__ import annotations
 import copy
 import logging
 from dataclasses import asdict, dataclass, is_dataclass, replace
-from typing import TYPE_CHECKING, Any, Literal
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from rossum_api import APIClientError
 from rossum_api.domain_logic.resources import Resource
@@ -14,6 +15,8 @@ from rossum_api.models.schema import Schema
 from rossum_mcp.tools.base import TRUNCATED_MARKER, delete_resource, is_read_write_mode
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from fastmcp import FastMCP
     from rossum_api import AsyncRossumAPIClient
 
@@ -234,33 +237,18 @@ class SchemaNodeUpdate:
 SchemaNode = SchemaDatapoint | SchemaMultivalue | SchemaTuple
 
 
-def _find_node_in_children(
-    children: list[dict], node_id: str, parent_node: dict | None = None
-) -> tuple[dict | None, int | None, list[dict] | None, dict | None]:
-    """Recursively find a node by ID in schema children.
+@dataclass
+class SchemaPatchStep:
+    """One operation of a bulk schema patch.
 
-    Returns (node, index, parent_children_list, parent_node) or (None, None, None, None) if not found.
-    The parent_node is needed for multivalue's dict children where we need to modify the parent directly.
+    Fields have the same meaning as the parameters of `patch_schema`.
     """
-    for i, child in enumerate(children):
-        if child.get("id") == node_id:
-            return child, i, children, parent_node
-
-        nested_children = child.get("children")
-        if nested_children:
-            if isinstance(nested_children, list):
-                result = _find_node_in_children(nested_children, node_id, child)
-                if result[0] is not None:
-                    return result
-            elif isinstance(nested_children, dict):
-                if nested_children.get("id") == node_id:
-                    return nested_children, 0, None, child
-                if "children" in nested_children:
-                    result = _find_node_in_children(nested_children["children"], node_id, nested_children)
-                    if result[0] is not None:
-                        return result
-
-    return None, None, None, None
+
+    operation: PatchOperation
+    node_id: str
+    node_data: SchemaNode | SchemaNodeUpdate | None = None
+    parent_id: str | None = None
+    position: int | None = None
 
 
 def _is_multivalue_node(node: dict) -> bool:
@@ -268,46 +256,189 @@ def _is_multivalue_node(node: dict) -> bool:
     return node.get("category") == "multivalue" or ("children" in node and isinstance(node["children"], dict))
 
 
-def _find_parent_children_list(content: list[dict], parent_id: str) -> tuple[list[dict] | None, bool]:
-    """Find the children list of a parent node by its ID.
+def _get_section_children_as_list(section: dict) -> list[dict]:
+    """Get section children as a list, handling both list and dict (multivalue) cases."""
+    children = section.get("children")
+    if children is None:
+        return []
+    if isinstance(children, list):
+        return children
+    if isinstance(children, dict):
+        return [children]
+    return []
 
-    Returns (children_list, is_multivalue) tuple.
-    For multivalue nodes, returns (None, True) since they can't have children added.
+
+def _children_list(node: dict) -> list[dict] | None:
+    """Return the list children of a node, creating it when missing. None for nodes that cannot hold a list."""
+    if "children" not in node:
+        node["children"] = []
+    children = node["children"]
+    return children if isinstance(children, list) else None
+
+
+class SchemaIndex:
+    """Index of schema nodes by ID, built in one pass and kept current as the content is mutated.
+
+    Maps each node ID to its node, its parent node and the IDs of its ancestors, so lookups
+    do not search the tree. `add`, `update` and `remove` mutate the content in place and
+    re-index only the affected subtree. If node IDs are duplicated, the first node in
+    document order is indexed.
+
+    Example:
+        >>> index = SchemaIndex(content)
+        >>> index.add("line_item", {"id": "item_note", "label": "Note", "category": "datapoint", "type": "string"})
+        >>> index.path("item_note")
+        ('line_items_section', 'line_items', 'line_item')
     """
-    for section in content:
-        if section.get("id") == parent_id:
-            if _is_multivalue_node(section):
-                return None, True
-            children: list[dict] = section.setdefault("children", [])
-            return children, False
 
-        section_children = section.get("children")
-        if section_children is None:
-            continue
+    def __init__(self, nodes: list[dict], parent: dict | None = None) -> None:
+        """Index `nodes`, the schema content or the children list of `parent`."""
+        self._roots = nodes
+        self._nodes: dict[str, dict] = {}
+        self._parents: dict[str, dict | None] = {}
+        self._paths: dict[str, tuple[str, ...]] = {}
+        for node in nodes:
+            self._index(node, parent, ())
 
-        if isinstance(section_children, list):
-            node, _, _, _ = _find_node_in_children(section_children, parent_id)
+    def _index(self, node: dict, parent: dict | None, path: tuple[str, ...]) -> None:
+        node_id = node.get("id")
+        if node_id and node_id not in self._nodes:
+            self._nodes[node_id] = node
+            self._parents[node_id] = parent
+            self._paths[node_id] = path
+        child_path = (*path, node_id) if node_id else path
+        for child in _get_section_children_as_list(node):
+            self._index(child, node, child_path)
+
+    def _unindex(self, node: dict) -> None:
+        node_id = node.get("id")
+        if node_id and self._nodes.get(node_id) is node:
+            del self._nodes[node_id], self._parents[node_id], self._paths[node_id]
+        for child in _get_section_children_as_list(node):
+            self._unindex(child)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._nodes
+
+    def get(self, node_id: str) -> dict | None:
+        return self._nodes.get(node_id)
+
+    def parent(self, node_id: str) -> dict | None:
+        return self._parents.get(node_id)
+
+    def path(self, node_id: str) -> tuple[str, ...]:
+        """IDs of the ancestors of a node, outermost first."""
+        return self._paths.get(node_id, ())
+
+    def ids(self) -> set[str]:
+        return set(self._nodes)
+
+    def ancestors(self, node_ids: Iterable[str]) -> set[str]:
+        """IDs of all containers (sections, multivalues, tuples) of the given nodes."""
+        result: set[str] = set()
+        for node_id in node_ids:
+            result.update(self._paths.get(node_id, ()))
+        return result
+
+    def subtree_ids(self, node_id: str) -> set[str]:
+        """IDs of a node and all its descendants."""
+        node = self._nodes.get(node_id)
+        if node is None:
+            return set()
+        ids: set[str] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current_id := current.get("id"):
+                ids.add(current_id)
+            stack.extend(_get_section_children_as_list(current))
+        return ids
+
+    def locate(self, node_id: str) -> tuple[dict | None, int | None, list[dict] | None, dict | None]:
+        """Return (node, index, parent_children_list, parent_node) for a node.
+
+        For a child of a multivalue, index is 0 and parent_children_list is None.
+        """
+        node = self._nodes.get(node_id)
+        if node is None:
+            return None, None, None, None
+        parent = self._parents[node_id]
+        siblings = self._roots if parent is None else parent.get("children")
+        if not isinstance(siblings, list):
+            return node, 0, None, parent
+        return node, next(i for i, sibling in enumerate(siblings) if sibling is node), siblings, parent
+
+    def add(self, parent_id: str, node: dict, position: int | None = None) -> None:
+        parent = self._nodes.get(parent_id)
+        if parent is not None and _is_multivalue_node(parent):
+            raise ValueError(
+                f"Cannot add children to multivalue '{parent_id}'. "
+                "Multivalue nodes have a single child (tuple or datapoint). "
+                "Use 'update' to replace the multivalue's children, or add to the tuple inside it."
+            )
+        siblings = _children_list(parent) if parent is not None else None
+        if siblings is None:
+            raise ValueError(f"Parent node '{parent_id}' not found in schema")
+
+        if position is not None and 0 <= position <= len(siblings):
+            siblings.insert(position, node)
         else:
-            if section_children.get("id") == parent_id:
-                node = section_children
-            elif "children" in section_children:
-                node, _, _, _ = _find_node_in_children(section_children.get("children", []), parent_id)
-            else:
-                node = None
-
-        if node is not None:
-            if _is_multivalue_node(node):
-                return None, True
-            if "children" in node:
-                if isinstance(node["children"], list):
-                    result: list[dict] = node["children"]
-                    return result, False
-            else:
-                node["children"] = []
-                node_children: list[dict] = node["children"]
-                return node_children, False
+            siblings.append(node)
+        self._index(node, parent, (*self._paths[parent_id], parent_id))
+
+    def update(self, node_id: str, node_data: dict) -> dict:
+        node = self._nodes.get(node_id)
+        if node is None:
+            raise ValueError(f"Node '{node_id}' not found in schema")
+
+        parent, path = self._parents[node_id], self._paths[node_id]
+        self._unindex(node)
+        node.update(node_data)
+        self._index(node, parent, path)
+        return node
+
+    def remove(self, node_id: str) -> dict:
+        node, idx, siblings, parent = self.locate(node_id)
+        if node is None:
+            raise ValueError(f"Node '{node_id}' not found in schema")
+
+        if parent is None:
+            if node.get("category") == "section":
+                raise ValueError("Cannot remove a section - sections must exist")
+            raise ValueError(f"Cannot determine how to remove node '{node_id}'")
+        if siblings is None or idx is None:
+            if parent.get("category") == "multivalue":
+                raise ValueError(f"Cannot remove '{node_id}' from multivalue - remove the multivalue instead")
+            raise ValueError(f"Cannot remove '{node_id}' - unexpected parent structure")
+
+        siblings.pop(idx)
+        self._unindex(node)
+        return node
 
-    return None, False
+
+def _find_node_in_children(
+    children: list[dict], node_id: str, parent_node: dict | None = None
+) -> tuple[dict | None, int | None, list[dict] | None, dict | None]:
+    """Find a node by ID in schema children.
+
+    Returns (node, index, parent_children_list, parent_node) or (None, None, None, None) if not found.
+    The parent_node is needed for multivalue's dict children where we need to modify the parent directly.
+    """
+    return SchemaIndex(children, parent_node).locate(node_id)
+
+
+def _find_parent_children_list(content: list[dict], parent_id: str) -> tuple[list[dict] | None, bool]:
+    """Find the children list of a parent node by its ID.
+
+    Returns (children_list, is_multivalue) tuple.
+    For multivalue nodes, returns (None, True) since they can't have children added.
+    """
+    node = SchemaIndex(content).get(parent_id)
+    if node is None:
+        return None, False
+    if _is_multivalue_node(node):
+        return None, True
+    return _children_list(node), False
 
 
 def _apply_add_operation(
@@ -318,92 +449,33 @@ def _apply_add_operation(
     if parent_id is None:
         raise ValueError("parent_id is required for 'add' operation")
 
-    node_data = copy.deepcopy(node_data)
-    node_data["id"] = node_id
-
-    parent_children, is_multivalue = _find_parent_children_list(content, parent_id)
-    if is_multivalue:
-        raise ValueError(
-            f"Cannot add children to multivalue '{parent_id}'. "
-            "Multivalue nodes have a single child (tuple or datapoint). "
-            "Use 'update' to replace the multivalue's children, or add to the tuple inside it."
-        )
-    if parent_children is None:
-        raise ValueError(f"Parent node '{parent_id}' not found in schema")
-
-    if position is not None and 0 <= position <= len(parent_children):
-        parent_children.insert(position, node_data)
-    else:
-        parent_children.append(node_data)
+    SchemaIndex(content).add(parent_id, {**copy.deepcopy(node_data), "id": node_id}, position)
     return content
 
 
-def _get_section_children_as_list(section: dict) -> list[dict]:
-    """Get section children as a list, handling both list and dict (multivalue) cases."""
-    children = section.get("children")
-    if children is None:
-        return []
-    if isinstance(children, list):
-        return children
-    if isinstance(children, dict):
-        return [children]
-    return []
-
-
 def _find_node_anywhere(
     content: list[dict], node_id: str
 ) -> tuple[dict | None, int | None, list[dict] | None, dict | None]:
     """Find a node by ID anywhere in the schema content.
 
-    Returns (node, index, parent_children_list, parent_node).
+    Returns (node, index, parent_children_list, parent_node); sections are returned as (section, None, None, None).
     """
-    for section in content:
-        if section.get("id") == node_id:
-            return section, None, None, None
-
-        section_children = _get_section_children_as_list(section)
-        result = _find_node_in_children(section_children, node_id, section)
-        if result[0] is not None:
-            return result
-
-    return None, None, None, None
+    node, idx, siblings, parent = SchemaIndex(content).locate(node_id)
+    if node is not None and parent is None:
+        return node, None, None, None
+    return node, idx, siblings, parent
 
 
 def _apply_update_operation(content: list[dict], node_id: str, node_data: dict | None) -> list[dict]:
     if node_data is None:
         raise ValueError("node_data is required for 'update' operation")
 
-    node, _, _, _ = _find_node_anywhere(content, node_id)
-
-    if node is None:
-        raise ValueError(f"Node '{node_id}' not found in schema")
-
-    node.update(node_data)
+    SchemaIndex(content).update(node_id, node_data)
     return content
 
 
 def _apply_remove_operation(content: list[dict], node_id: str) -> list[dict]:
-    for section in content:
-        if section.get("id") == node_id and section.get("category") == "section":
-            raise ValueError("Cannot remove a section - sections must exist")
-
-    node, idx, parent_list, parent_node = _find_node_anywhere(content, node_id)
-
-    if node is None:
-        raise ValueError(f"Node '{node_id}' not found in schema")
-
-    if idx is None and parent_list is None:
-        if node.get("category") == "section":
-            raise ValueError("Cannot remove a section - sections must exist")
-        raise ValueError(f"Cannot determine how to remove node '{node_id}'")
-
-    if parent_list is not None and idx is not None:
-        parent_list.pop(idx)
-    elif parent_node is not None:
-        if parent_node.get("category") == "multivalue":
-            raise ValueError(f"Cannot remove '{node_id}' from multivalue - remove the multivalue instead")
-        raise ValueError(f"Cannot remove '{node_id}' - unexpected parent structure")
-
+    SchemaIndex(content).remove(node_id)
     return content
 
 
@@ -428,6 +500,66 @@ def apply_schema_patch(
     return content
 
 
+def _node_data_to_dict(node_data: SchemaNode | SchemaNodeUpdate | dict | None) -> dict | None:
+    if node_data is None or isinstance(node_data, dict):
+        return node_data
+    if hasattr(node_data, "to_dict"):
+        return node_data.to_dict()
+    return asdict(node_data)
+
+
+def apply_schema_patches(content: list[dict], operations: list[SchemaPatchStep]) -> list[dict]:
+    """Apply patch operations in order, mutating `content` in place.
+
+    Nodes are looked up through a `SchemaIndex` built once for the whole batch. Added nodes are
+    validated after the last operation, so a batch may add a node and then update it.
+    Raises ValueError naming the first failing operation; `content` is then partially
+    patched and must be discarded.
+    """
+    index = SchemaIndex(content)
+    added: dict[str, int] = {}
+
+    for i, step in enumerate(operations):
+        context = f"Operation {i} ({step.operation} '{step.node_id}')"
+        node_data = _node_data_to_dict(step.node_data)
+        try:
+            if step.operation == "add":
+                if node_data is None:
+                    raise ValueError("node_data is required for 'add' operation")
+                if step.parent_id is None:
+                    raise ValueError("parent_id is required for 'add' operation")
+                node = {**copy.deepcopy(node_data), "id": step.node_id}
+                index.add(step.parent_id, node, step.position)
+                added[step.node_id] = i
+            elif step.operation == "update":
+                if node_data is None:
+                    raise ValueError("node_data is required for 'update' operation")
+                index.update(step.node_id, node_data)
+            elif step.operation == "remove":
+                index.remove(step.node_id)
+                added.pop(step.node_id, None)
+            else:
+                raise ValueError(f"Invalid operation '{step.operation}'. Must be 'add', 'update', or 'remove'.")
+        except ValueError as e:
+            raise ValueError(f"{context}: {e}") from e
+
+    for node_id, i in added.items():
+        if (node := index.get(node_id)) is not None:
+            _validate_node(node, f" (operation {i}, node '{node_id}')")
+
+    return content
+
+
+def _same_timestamp(actual: str | None, expected: str) -> bool:
+    """Compare API timestamps, tolerating different ISO 8601 spellings of the same instant."""
+    if actual is None:
+        return False
+    try:
+        return datetime.fromisoformat(actual) == datetime.fromisoformat(expected)
+    except ValueError:
+        return actual == expected
+
+
 async def _get_schema(client: AsyncRossumAPIClient, schema_id: int) -> Schema | dict:
     try:
         schema: Schema = await client.retrieve_schema(schema_id)
@@ -482,26 +614,18 @@ def _extract_schema_tree(content: list[dict]) -> list[dict]:
     return [_build_tree_node(section).to_dict() for section in content]
 
 
-def _collect_all_field_ids(content: list[dict]) -> set[str]:
-    """Collect all field IDs from schema content recursively."""
-    ids: set[str] = set()
-
-    def _traverse(node: dict) -> None:
-        node_id = node.get("id")
-        if node_id:
-            ids.add(node_id)
-        children = node.get("children")
-        if children is not None:
-            if isinstance(children, list):
-                for child in children:
-                    _traverse(child)
-            elif isinstance(children, dict):
-                _traverse(children)
+def schema_tree(schema: Schema) -> list[dict]:
+    """Extract the lightweight tree structure of a deserialized schema."""
+    content_dicts: list[dict[str, Any]] = [
+        asdict(section) if is_dataclass(section) else dict(section)  # type: ignore[arg-type]
+        for section in schema.content
+    ]
+    return _extract_schema_tree(content_dicts)
 
-    for section in content:
-        _traverse(section)
 
-    return ids
+def _collect_all_field_ids(content: list[dict]) -> set[str]:
+    """Collect all field IDs from schema content recursively."""
+    return SchemaIndex(content).ids()
 
 
 def _collect_ancestor_ids(content: list[dict], target_ids: set[str]) -> set[str]:
@@ -509,27 +633,7 @@ def _collect_ancestor_ids(content: list[dict], target_ids: set[str]) -> set[str]
 
     Returns set of IDs for all parent containers (multivalue, tuple, section) of target fields.
     """
-    ancestors: set[str] = set()
-
-    def _find_ancestors(node: dict, path: list[str]) -> None:
-        node_id = node.get("id", "")
-        current_path = [*path, node_id] if node_id else path
-
-        if node_id in target_ids:
-            ancestors.update(current_path[:-1])
-
-        children = node.get("children")
-        if children is not None:
-            if isinstance(children, list):
-                for child in children:
-                    _find_ancestors(child, current_path)
-            elif isinstance(children, dict):
-                _find_ancestors(children, current_path)
-
-    for section in content:
-        _find_ancestors(section, [])
-
-    return ancestors
+    return SchemaIndex(content).ancestors(target_ids)
 
 
 def _remove_fields_from_content(content: list[dict], fields_to_remove: set[str]) -> tuple[list[dict], list[str]]:
@@ -672,15 +776,47 @@ async def _patch_schema(
     return updated_schema
 
 
+async def _bulk_patch_schema(
+    client: AsyncRossumAPIClient,
+    schema_id: int,
+    operations: list[SchemaPatchStep],
+    expected_modified_at: str | None = None,
+) -> Schema | dict:
+    if not is_read_write_mode():
+        return {"error": "bulk_patch_schema is not available in read-only mode"}
+
+    if not operations:
+        return {"error": "operations must contain at least one operation"}
+
+    logger.debug(f"Bulk patching schema: schema_id={schema_id}, operations={len(operations)}")
+
+    current_schema: dict = await client._http_client.request_json("GET", f"schemas/{schema_id}")
+    if expected_modified_at is not None and not _same_timestamp(
+        current_schema.get("modified_at"), expected_modified_at
+    ):
+        return {
+            "error": f"Schema {schema_id} was modified at {current_schema.get('modified_at')}, "
+            f"expected {expected_modified_at}. Re-read the schema and retry.",
+        }
+
+    content = current_schema.get("content", [])
+    if not isinstance(content, list):
+        return {"error": "Unexpected schema content format"}
+
+    try:
+        apply_schema_patches(content, operations)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    response = await client._http_client.update(Resource.Schema, schema_id, {"content": content})
+    return cast("Schema", client._deserializer(Resource.Schema, response))
+
+
 async def _get_schema_tree_structure(client: AsyncRossumAPIClient, schema_id: int) -> list[dict] | dict:
     schema = await _get_schema(client, schema_id)
     if isinstance(schema, dict):
         return schema
-    content_dicts: list[dict[str, Any]] = [
-        asdict(section) if is_dataclass(section) else dict(section)  # type: ignore[arg-type]
-        for section in schema.content
-    ]
-    return _extract_schema_tree(content_dicts)
+    return schema_tree(schema)
 
 
 async def _prune_schema_fields(
@@ -701,14 +837,14 @@ async def _prune_schema_fields(
     content = current_schema.get("content", [])
     if not isinstance(content, list):
         return {"error": "Unexpected schema content format"}
-    all_ids = _collect_all_field_ids(content)
+    index = SchemaIndex(content)
+    all_ids = index.ids()
 
     section_ids = {s.get("id") for s in content if s.get("category") == "section"}
 
     if fields_to_keep:
         fields_to_keep_set = set(fields_to_keep) | section_ids
-        ancestor_ids = _collect_ancestor_ids(content, fields_to_keep_set)
-        fields_to_keep_set |= ancestor_ids
+        fields_to_keep_set |= index.ancestors(fields_to_keep_set)
         remove_set = all_ids - fields_to_keep_set
     else:
         remove_set = set(fields_to_remove) - section_ids  # type: ignore[arg-type]
@@ -775,6 +911,21 @@ Important: Datapoints inside a tuple MUST have an "id" field. Section-level data
     ) -> Schema | dict:
         return await _patch_schema(client, schema_id, operation, node_id, node_data, parent_id, position)
 
+    @mcp.tool(
+        description="""Apply an ordered list of add/update/remove operations to a schema in one call.
+
+Each operation has the fields of patch_schema (operation, node_id, node_data, parent_id, position).
+Operations see the result of the previous ones; the schema is written once, only if all succeed.
+Prefer this over repeated patch_schema calls when changing several fields.
+
+Pass expected_modified_at (the schema's modified_at when you read it) to fail instead of
+overwriting a concurrent change."""
+    )
+    async def bulk_patch_schema(
+        schema_id: int, operations: list[SchemaPatchStep], expected_modified_at: str | None = None
+    ) -> Schema | dict:
+        return await _bulk_patch_schema(client, schema_id, operations, expected_modified_at)
+
     @mcp.tool(description="Get lightweight tree structure of schema with only ids, labels, categories, and types.")
     async def get_schema_tree_structure(schema_id: int) -> list[dict] | dict:
         return await _get_schema_tree_structure(client, schema_id)
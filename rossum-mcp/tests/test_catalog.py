@@ -44,12 +44,15 @@ class TestToolCatalog:
         tool_names = {t.name for t in annotations.tools}
         expected = {
             "upload_document",
+            "bulk_upload_documents",
             "get_annotation",
             "list_annotations",
+            "list_annotations_page",
             "start_annotation",
             "bulk_update_annotation_fields",
             "confirm_annotation",
             "delete_annotation",
+            "bulk_annotation_action",
         }
         assert tool_names == expected
 
@@ -61,6 +64,7 @@ class TestToolCatalog:
             "list_queues",
             "get_queue_schema",
             "get_queue_engine",
+            "get_queue_context",
             "create_queue",
             "update_queue",
             "get_queue_template_names",
@@ -75,10 +79,12 @@ class TestToolCatalog:
         ]
         expected_write = {
             ("annotations", "upload_document"),
+            ("annotations", "bulk_upload_documents"),
             ("annotations", "start_annotation"),
             ("annotations", "bulk_update_annotation_fields"),
             ("annotations", "confirm_annotation"),
             ("annotations", "delete_annotation"),
+            ("annotations", "bulk_annotation_action"),
             ("queues", "create_queue"),
             ("queues", "update_queue"),
             ("queues", "create_queue_from_template"),
@@ -86,6 +92,7 @@ class TestToolCatalog:
             ("schemas", "update_schema"),
             ("schemas", "create_schema"),
             ("schemas", "patch_schema"),
+            ("schemas", "bulk_patch_schema"),
             ("schemas", "prune_schema_fields"),
             ("schemas", "delete_schema"),
             ("engines", "update_engine"),
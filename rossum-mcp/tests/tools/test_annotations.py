@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from conftest import create_mock_annotation
-from rossum_mcp.tools import base
+from rossum_api import APIClientError
+from rossum_mcp.tools import annotations, base
 from rossum_mcp.tools.annotations import register_annotation_tools
 
 if TYPE_CHECKING:
@@ -174,6 +176,156 @@ class TestUploadDocument:
         assert "Document upload failed: RuntimeError: Connection timeout" in str(exc_info.value)
 
 
+def _mock_task(task_id: int, status: str = "running", result_url: str | None = None) -> Mock:
+    task = Mock()
+    task.id = task_id
+    task.url = f"https://api.test.rossum.ai/v1/tasks/{task_id}"
+    task.status = status
+    task.result_url = result_url
+    task.detail = None
+    return task
+
+
+@pytest.mark.unit
+class TestBulkUploadDocuments:
+    """Tests for bulk_upload_documents tool."""
+
+    @pytest.fixture(autouse=True)
+    def read_write_mode(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("ROSSUM_MCP_MODE", "read-write")
+        importlib.reload(base)
+
+    @pytest.mark.asyncio
+    async def test_uploads_directory(self, mock_mcp: Mock, mock_client: AsyncMock, tmp_path: Path) -> None:
+        """Test that every non-hidden file in a directory is uploaded with its task reported."""
+        register_annotation_tools(mock_mcp, mock_client)
+        for name in ("a.pdf", "b.pdf", ".hidden"):
+            (tmp_path / name).write_text("content")
+
+        mock_client.upload_document.side_effect = [[_mock_task(1)], [_mock_task(2)]]
+
+        result = await mock_mcp._tools["bulk_upload_documents"](source=str(tmp_path), queue_id=100)
+
+        assert result["total"] == 2
+        assert result["uploaded"] == 2
+        assert result["failed"] == 0
+        assert [f["file"] for f in result["files"]] == [str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")]
+        assert result["files"][0]["task_url"] == "https://api.test.rossum.ai/v1/tasks/1"
+        mock_client.upload_document.assert_any_call(100, [(str(tmp_path / "a.pdf"), "a.pdf")])
+
+    @pytest.mark.asyncio
+    async def test_glob_pattern(self, mock_mcp: Mock, mock_client: AsyncMock, tmp_path: Path) -> None:
+        """Test that a glob pattern selects matching files only."""
+        register_annotation_tools(mock_mcp, mock_client)
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "invoice.pdf").write_text("content")
+        (tmp_path / "notes.txt").write_text("content")
+
+        mock_client.upload_document.return_value = [_mock_task(1)]
+
+        result = await mock_mcp._tools["bulk_upload_documents"](source=str(tmp_path / "**" / "*.pdf"), queue_id=100)
+
+        assert [f["file"] for f in result["files"]] == [str(tmp_path / "nested" / "invoice.pdf")]
+
+    @pytest.mark.asyncio
+    async def test_no_matching_files(self, mock_mcp: Mock, mock_client: AsyncMock, tmp_path: Path) -> None:
+        """Test error when the source matches no files."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        result = await mock_mcp._tools["bulk_upload_documents"](source=str(tmp_path / "*.pdf"), queue_id=100)
+
+        assert result == {"error": f"No files found for '{tmp_path / '*.pdf'}'"}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, mock_mcp: Mock, mock_client: AsyncMock, tmp_path: Path) -> None:
+        """Test that no more than max_concurrency uploads run at once."""
+        register_annotation_tools(mock_mcp, mock_client)
+        for i in range(6):
+            (tmp_path / f"{i}.pdf").write_text("content")
+
+        running = 0
+        peak = 0
+
+        async def upload(queue_id: int, files: list) -> list:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [_mock_task(1)]
+
+        mock_client.upload_document.side_effect = upload
+
+        result = await mock_mcp._tools["bulk_upload_documents"](source=str(tmp_path), queue_id=100, max_concurrency=2)
+
+        assert result["uploaded"] == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_per_file(self, mock_mcp: Mock, mock_client: AsyncMock, tmp_path: Path) -> None:
+        """Test that a failed upload is reported per file and not re-posted."""
+        register_annotation_tools(mock_mcp, mock_client)
+        (tmp_path / "a.pdf").write_text("content")
+        (tmp_path / "b.pdf").write_text("content")
+
+        async def upload(queue_id: int, files: list) -> list:
+            if files[0][1] == "b.pdf":
+                raise APIClientError("POST", "uploads", 503, "Service Unavailable")
+            return [_mock_task(1)]
+
+        mock_client.upload_document.side_effect = upload
+
+        result = await mock_mcp._tools["bulk_upload_documents"](source=str(tmp_path), queue_id=100, max_concurrency=1)
+
+        file_a, file_b = result["files"]
+        assert file_a["status"] == "uploaded"
+        assert mock_client.upload_document.await_count == 2
+        assert file_b["status"] == "failed"
+        assert "503" in file_b["error"]
+        assert result["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_for_import_reports_annotations(
+        self, mock_mcp: Mock, mock_client: AsyncMock, tmp_path: Path
+    ) -> None:
+        """Test that waiting resolves the annotation URLs of the created upload."""
+        register_annotation_tools(mock_mcp, mock_client)
+        (tmp_path / "a.pdf").write_text("content")
+
+        mock_client.upload_document.return_value = [_mock_task(1)]
+        mock_client.retrieve_task.return_value = _mock_task(
+            1, status="succeeded", result_url="https://api.test.rossum.ai/v1/uploads/77"
+        )
+        upload = Mock()
+        upload.documents = ["https://api.test.rossum.ai/v1/documents/5"]
+        upload.annotations = ["https://api.test.rossum.ai/v1/annotations/6"]
+        mock_client.retrieve_upload.return_value = upload
+
+        with patch.object(annotations.asyncio, "sleep", AsyncMock()):
+            result = await mock_mcp._tools["bulk_upload_documents"](
+                source=str(tmp_path), queue_id=100, wait_for_import=True
+            )
+
+        file_result = result["files"][0]
+        assert file_result["task_status"] == "succeeded"
+        assert file_result["annotations"] == ["https://api.test.rossum.ai/v1/annotations/6"]
+        mock_client.retrieve_upload.assert_called_once_with(77)
+
+    @pytest.mark.asyncio
+    async def test_read_only_mode(
+        self, mock_mcp: Mock, mock_client: AsyncMock, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test bulk_upload_documents is blocked in read-only mode."""
+        monkeypatch.setenv("ROSSUM_MCP_MODE", "read-only")
+        importlib.reload(base)
+        register_annotation_tools(mock_mcp, mock_client)
+
+        result = await mock_mcp._tools["bulk_upload_documents"](source=str(tmp_path), queue_id=100)
+
+        assert result == {"error": "bulk_upload_documents is not available in read-only mode"}
+        mock_client.upload_document.assert_not_called()
+
+
 @pytest.mark.unit
 class TestGetAnnotation:
     """Tests for get_annotation tool."""
@@ -250,6 +402,133 @@ class TestListAnnotations:
         assert len(result) == 0
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_list_annotations_first_n_limits_pages(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that first_n bounds the page size and number of pages requested."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        async def async_iter():
+            for i in range(5):
+                yield create_mock_annotation(id=i)
+
+        mock_client.list_annotations = Mock(side_effect=lambda **kwargs: async_iter())
+
+        list_annotations = mock_mcp._tools["list_annotations"]
+        result = await list_annotations(queue_id=100, first_n=3)
+
+        assert [a.id for a in result] == [0, 1, 2]
+        kwargs = mock_client.list_annotations.call_args.kwargs
+        assert kwargs["page_size"] == 3
+        assert kwargs["max_pages"] == 1
+
+        await list_annotations(queue_id=100, first_n=250)
+        kwargs = mock_client.list_annotations.call_args.kwargs
+        assert kwargs["page_size"] == 100
+        assert kwargs["max_pages"] == 3
+
+
+@pytest.mark.unit
+class TestListAnnotationsPage:
+    """Tests for list_annotations_page tool."""
+
+    @pytest.mark.asyncio
+    async def test_first_page_with_projection(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that filters and projected fields are sent and a cursor is returned."""
+        register_annotation_tools(mock_mcp, mock_client)
+        mock_client._http_client.request_json.return_value = {
+            "pagination": {"next": "https://api.test.rossum.ai/v1/annotations?page=2"},
+            "results": [{"id": 1, "status": "to_review"}],
+        }
+
+        list_annotations_page = mock_mcp._tools["list_annotations_page"]
+        result = await list_annotations_page(
+            queue_id=100, status="to_review", ordering=["-created_at"], page_size=500, fields=["id", "status"]
+        )
+
+        assert result["results"] == [{"id": 1, "status": "to_review"}]
+        assert result["next_cursor"] is not None
+        mock_client._http_client.request_json.assert_called_once_with(
+            "GET",
+            "annotations",
+            params={
+                "queue": 100,
+                "page": 1,
+                "status": "to_review",
+                "ordering": "-created_at",
+                "fields": "id,status",
+                "page_size": 100,
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_cursor_resumes_query(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that the cursor requests the next page with the original filters."""
+        register_annotation_tools(mock_mcp, mock_client)
+        mock_client._http_client.request_json.side_effect = [
+            {"pagination": {"next": "next-url"}, "results": [{"id": 1}]},
+            {"pagination": {"next": None}, "results": [{"id": 2}]},
+        ]
+
+        list_annotations_page = mock_mcp._tools["list_annotations_page"]
+        first = await list_annotations_page(queue_id=100, page_size=1)
+        second = await list_annotations_page(cursor=first["next_cursor"])
+
+        assert second == {"results": [{"id": 2}], "next_cursor": None}
+        params = mock_client._http_client.request_json.call_args.kwargs["params"]
+        assert params["page"] == 2
+        assert params["queue"] == 100
+        assert params["page_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_count_only(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that count_only requests a single item and returns the total."""
+        register_annotation_tools(mock_mcp, mock_client)
+        mock_client._http_client.request_json.return_value = {
+            "pagination": {"total": 12345, "next": "next-url"},
+            "results": [{"id": 1}],
+        }
+
+        list_annotations_page = mock_mcp._tools["list_annotations_page"]
+        result = await list_annotations_page(queue_id=100, fields=["id"], count_only=True)
+
+        assert result == {"count": 12345}
+        params = mock_client._http_client.request_json.call_args.kwargs["params"]
+        assert params["page_size"] == 1
+        assert params["include_total"] == "true"
+        assert "fields" not in params
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that a malformed cursor is reported."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        list_annotations_page = mock_mcp._tools["list_annotations_page"]
+
+        assert await list_annotations_page(cursor="not-a-cursor") == {"error": "Invalid cursor"}
+        assert await list_annotations_page() == {"error": "queue_id is required unless a cursor is given"}
+        mock_client._http_client.request_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"queue": 1, "page": "2", "page_size": 100},
+            {"queue": 1, "page": 0, "page_size": 100},
+            {"queue": 1, "page": 2, "page_size": 1000},
+            {"queue": 1, "page": 2, "page_size": 100, "status": ["to_review"]},
+            {"queue": 1, "page": 2, "page_size": 100, "modifier": 5},
+            {"page": 2, "page_size": 100},
+        ],
+    )
+    async def test_tampered_cursor_rejected(self, mock_mcp: Mock, mock_client: AsyncMock, params: dict) -> None:
+        """Test that a cursor with unknown keys or invalid values is not replayed as query parameters."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        result = await mock_mcp._tools["list_annotations_page"](cursor=annotations._encode_cursor(params))
+
+        assert result == {"error": "Invalid cursor"}
+        mock_client._http_client.request_json.assert_not_called()
+
 
 @pytest.mark.unit
 class TestStartAnnotation:
@@ -401,3 +680,129 @@ class TestDeleteAnnotation:
 
         assert result["error"] == "delete_annotation is not available in read-only mode"
         mock_client.delete_annotation.assert_not_called()
+
+
+@pytest.mark.unit
+class TestBulkAnnotationAction:
+    """Tests for bulk_annotation_action tool."""
+
+    @pytest.fixture(autouse=True)
+    def read_write_mode(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("ROSSUM_MCP_MODE", "read-write")
+        importlib.reload(base)
+
+    @pytest.mark.asyncio
+    async def test_confirm_ids_with_per_item_errors(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that every annotation is processed and failures are reported per item."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        async def confirm(annotation_id: int) -> None:
+            if annotation_id == 2:
+                raise APIClientError("POST", "annotations/2/confirm", 409, "Conflict")
+
+        mock_client.confirm_annotation.side_effect = confirm
+
+        bulk_annotation_action = mock_mcp._tools["bulk_annotation_action"]
+        result = await bulk_annotation_action(action="confirm", annotation_ids=[1, 2, 3, 1])
+
+        assert result["total"] == 3
+        assert result["succeeded"] == 2
+        assert result["succeeded_ids"] == [1, 3]
+        assert result["failed"] == 1
+        assert result["errors"][0]["annotation_id"] == 2
+        assert "409" in result["errors"][0]["error"]
+        assert mock_client.confirm_annotation.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_by_queue_filter(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that a queue filter selects the annotations to act on."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        mock_client._http_client.request_json.side_effect = [
+            {"results": [{"id": 10}, {"id": 11}], "pagination": {"next": "page-2"}},
+            {"results": [{"id": 12}, {"id": 13}], "pagination": {"next": "page-3"}},
+        ]
+
+        bulk_annotation_action = mock_mcp._tools["bulk_annotation_action"]
+        result = await bulk_annotation_action(action="delete", queue_id=100, status="to_review", max_annotations=3)
+
+        assert result["succeeded_ids"] == [10, 11, 12]
+        first, second = (call.kwargs["params"] for call in mock_client._http_client.request_json.call_args_list)
+        assert first == {"queue": 100, "page": 1, "status": "to_review", "fields": "id", "page_size": 100}
+        assert second["page"] == 2
+        mock_client.delete_annotation.assert_any_await(10)
+        mock_client.list_annotations.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("action", ["confirm", "delete"])
+    async def test_queue_filter_requires_status(self, mock_mcp: Mock, mock_client: AsyncMock, action: str) -> None:
+        """Test that irreversible actions never select annotations in every status."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        result = await mock_mcp._tools["bulk_annotation_action"](action=action, queue_id=100)
+
+        assert result == {"error": f"status is required when selecting annotations by queue_id for '{action}'"}
+        mock_client._http_client.request_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_fields_per_annotation(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that each annotation gets its own field operations."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        operations = {
+            1: [{"op": "replace", "id": 101, "value": {"content": {"value": "A"}}}],
+            2: [{"op": "replace", "id": 201, "value": {"content": {"value": "B"}}}],
+        }
+
+        bulk_annotation_action = mock_mcp._tools["bulk_annotation_action"]
+        result = await bulk_annotation_action(action="update_fields", operations=operations)
+
+        assert result["succeeded_ids"] == [1, 2]
+        mock_client.bulk_update_annotation_data.assert_any_await(1, operations[1])
+        mock_client.bulk_update_annotation_data.assert_any_await(2, operations[2])
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that no more than max_concurrency actions run at once."""
+        register_annotation_tools(mock_mcp, mock_client)
+        running = 0
+        peak = 0
+
+        async def start(annotation_id: int) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        mock_client.start_annotation.side_effect = start
+
+        bulk_annotation_action = mock_mcp._tools["bulk_annotation_action"]
+        result = await bulk_annotation_action(action="start", annotation_ids=list(range(10)), max_concurrency=3)
+
+        assert result["succeeded"] == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_requires_selection(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test errors for missing selection, missing operations and invalid actions."""
+        register_annotation_tools(mock_mcp, mock_client)
+
+        bulk_annotation_action = mock_mcp._tools["bulk_annotation_action"]
+
+        assert await bulk_annotation_action(action="confirm") == {"error": "Specify annotation_ids or queue_id"}
+        assert "operations" in (await bulk_annotation_action(action="update_fields", annotation_ids=[1]))["error"]
+        assert "Invalid action" in (await bulk_annotation_action(action="export", annotation_ids=[1]))["error"]
+
+    @pytest.mark.asyncio
+    async def test_read_only_mode(self, mock_mcp: Mock, mock_client: AsyncMock, monkeypatch: MonkeyPatch) -> None:
+        """Test bulk_annotation_action is blocked in read-only mode."""
+        monkeypatch.setenv("ROSSUM_MCP_MODE", "read-only")
+        importlib.reload(base)
+        register_annotation_tools(mock_mcp, mock_client)
+
+        bulk_annotation_action = mock_mcp._tools["bulk_annotation_action"]
+        result = await bulk_annotation_action(action="delete", annotation_ids=[1])
+
+        assert result == {"error": "bulk_annotation_action is not available in read-only mode"}
+        mock_client.delete_annotation.assert_not_called()
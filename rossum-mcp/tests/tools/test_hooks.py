@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import importlib
+from datetime import datetime
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 from conftest import create_mock_hook
+from rossum_api.models.hook import HookRunData
 from rossum_mcp.tools import base
-from rossum_mcp.tools.hooks import register_hook_tools
+from rossum_mcp.tools.hooks import HookLogStats, register_hook_tools
 
 if TYPE_CHECKING:
     from _pytest.monkeypatch import MonkeyPatch
@@ -552,6 +554,184 @@ class TestListHookLogs:
         )
 
 
+def create_hook_log(**kwargs) -> HookRunData:
+    """Create a HookRunData instance with default values."""
+    defaults = {
+        "log_level": "INFO",
+        "action": "initialize",
+        "event": "annotation_content",
+        "request_id": "req-1",
+        "organization_id": 1,
+        "hook_id": 123,
+        "hook_type": "function",
+        "status": "completed",
+        "status_code": 200,
+        "timestamp": "2024-01-15T10:30:00.000000Z",
+        "start": "2024-01-15T10:30:00.000000Z",
+        "end": "2024-01-15T10:30:00.100000Z",
+    }
+    defaults.update(kwargs)
+    return HookRunData(**defaults)
+
+
+def mock_hook_log_windows(mock_client: AsyncMock, logs: list[HookRunData]) -> list[dict]:
+    """Serve logs newest first like the API: at most page_size logs with timestamp <= timestamp_before."""
+    calls: list[dict] = []
+    ordered = sorted(logs, key=lambda log: log.timestamp, reverse=True)
+
+    async def list_hook_run_data(**filters):
+        calls.append(filters)
+        before = filters.get("timestamp_before")
+        matching = [
+            log
+            for log in ordered
+            if before is None or datetime.fromisoformat(log.timestamp) <= datetime.fromisoformat(before)
+        ]
+        for log in matching[: filters["page_size"]]:
+            yield log
+
+    mock_client.list_hook_run_data = list_hook_run_data
+    return calls
+
+
+@pytest.mark.unit
+class TestSummarizeHookLogs:
+    """Tests for summarize_hook_logs tool."""
+
+    @pytest.mark.asyncio
+    async def test_summarize_hook_logs_aggregates(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test per-hook error rates, latency, top errors, histogram and samples."""
+        register_hook_tools(mock_mcp, mock_client)
+        logs = [
+            create_hook_log(request_id="a", timestamp="2024-01-15T10:05:00Z"),
+            create_hook_log(request_id="b", timestamp="2024-01-15T10:10:00Z", end="2024-01-15T10:30:00.300000Z"),
+            create_hook_log(
+                request_id="c",
+                timestamp="2024-01-15T11:15:00Z",
+                log_level="ERROR",
+                status="failed",
+                status_code=None,
+                message="Traceback (most recent call last):\n  File x\nKeyError: 'amount'",
+            ),
+            create_hook_log(
+                request_id="d", hook_id=456, timestamp="2024-01-15T11:20:00Z", status_code=500, message="Boom"
+            ),
+        ]
+        calls = mock_hook_log_windows(mock_client, logs)
+
+        result = await mock_mcp._tools["summarize_hook_logs"](hook_id=None, queue_id=7)
+
+        assert calls[0] == {"queue": 7, "page_size": 100}
+        assert result["total_logs"] == 4
+        assert result["truncated"] is False
+        assert result["oldest"] == "2024-01-15T10:05:00Z"
+        assert result["newest"] == "2024-01-15T11:20:00Z"
+        hooks = {hook["hook_id"]: hook for hook in result["hooks"]}
+        assert hooks[123]["total"] == 3
+        assert hooks[123]["errors"] == 1
+        assert hooks[123]["error_rate"] == pytest.approx(0.3333)
+        assert hooks[123]["latency_ms"]["max"] == 300.0
+        assert hooks[456]["error_rate"] == 1.0
+        assert {e["message"]: e["count"] for e in result["top_errors"]} == {"KeyError: 'amount'": 1, "Boom": 1}
+        assert result["status_histogram"] == [
+            {"bucket_start": "2024-01-15T10:00:00+00:00", "statuses": {"200": 2}},
+            {"bucket_start": "2024-01-15T11:00:00+00:00", "statuses": {"failed": 1, "500": 1}},
+        ]
+        assert [sample["request_id"] for sample in result["error_samples"]] == ["d", "c"]
+        assert "request" not in result["error_samples"][0]
+
+    @pytest.mark.asyncio
+    async def test_summarize_hook_logs_streams_past_window_limit(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that logs beyond one window are read by moving timestamp_before, without duplicates."""
+        register_hook_tools(mock_mcp, mock_client)
+        logs = [
+            create_hook_log(request_id=f"r{i}", uuid=f"u{i}", timestamp=f"2024-01-15T10:{i // 60:02d}:{i % 60:02d}Z")
+            for i in range(250)
+        ]
+        calls = mock_hook_log_windows(mock_client, logs)
+
+        result = await mock_mcp._tools["summarize_hook_logs"](hook_id=123)
+
+        assert result["total_logs"] == 250
+        assert result["hooks"][0]["total"] == 250
+        assert len(calls) == 3
+        assert calls[1]["timestamp_before"] == "2024-01-15T10:02:30Z"
+
+    @pytest.mark.asyncio
+    async def test_summarize_hook_logs_steps_past_crowded_timestamp(
+        self, mock_mcp: Mock, mock_client: AsyncMock
+    ) -> None:
+        """Test that more logs than a window at one timestamp do not end the scan silently."""
+        register_hook_tools(mock_mcp, mock_client)
+        logs = [create_hook_log(uuid=f"same{i}", timestamp="2024-01-15T10:30:00Z") for i in range(150)]
+        logs += [create_hook_log(uuid=f"old{i}", timestamp=f"2024-01-15T10:{i:02d}:00Z") for i in range(10)]
+        calls = mock_hook_log_windows(mock_client, logs)
+
+        result = await mock_mcp._tools["summarize_hook_logs"](hook_id=123)
+
+        assert result["total_logs"] == 110
+        assert result["truncated"] is True
+        assert result["oldest"] == "2024-01-15T10:00:00Z"
+        assert calls[-1]["timestamp_before"] == "2024-01-15T10:29:59.999999+00:00"
+
+    @pytest.mark.asyncio
+    async def test_summarize_hook_logs_respects_max_logs(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that scanning stops at max_logs and the summary is flagged as truncated."""
+        register_hook_tools(mock_mcp, mock_client)
+        logs = [create_hook_log(uuid=f"u{i}", timestamp=f"2024-01-15T10:{i:02d}:00Z") for i in range(50)]
+        mock_hook_log_windows(mock_client, logs)
+
+        result = await mock_mcp._tools["summarize_hook_logs"](max_logs=10, sample_size=2)
+
+        assert result["total_logs"] == 10
+        assert result["truncated"] is True
+        assert result["newest"] == "2024-01-15T10:49:00Z"
+        assert len(result["samples"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_summarize_hook_logs_invalid_arguments(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test validation of scan limits."""
+        register_hook_tools(mock_mcp, mock_client)
+
+        result = await mock_mcp._tools["summarize_hook_logs"](max_logs=0)
+
+        assert result == {"error": "max_logs must be at least 1"}
+
+
+@pytest.mark.unit
+class TestHookLogStats:
+    """Tests for HookLogStats aggregation helpers."""
+
+    def test_latency_percentiles_within_bucket_precision(self) -> None:
+        stats = HookLogStats()
+        for ms in range(1, 1001):
+            stats.add(
+                create_hook_log(
+                    start="2024-01-15T10:30:00Z", end=f"2024-01-15T10:30:{ms // 1000:02d}.{ms % 1000:03d}Z"
+                )
+            )
+
+        latency = stats.summary()["hooks"][0]["latency_ms"]
+
+        assert latency["min"] == 1.0
+        assert latency["max"] == 1000.0
+        assert latency["p50"] == pytest.approx(500, rel=0.05)
+        assert latency["p99"] == pytest.approx(990, rel=0.05)
+
+    def test_top_errors_bounded_by_capacity(self) -> None:
+        stats = HookLogStats(top_errors=2)
+        for i in range(500):
+            stats.add(create_hook_log(log_level="ERROR", message=f"unique error {i}"))
+        for _ in range(50):
+            stats.add(create_hook_log(log_level="ERROR", message="frequent error"))
+
+        top = stats.summary()["top_errors"]
+
+        assert len(stats._messages._counts) <= stats._messages.capacity
+        assert top[0]["message"] == "frequent error"
+        assert top[0]["count"] >= 50
+
+
 @pytest.mark.unit
 class TestListHookTemplates:
     """Tests for list_hook_templates tool."""
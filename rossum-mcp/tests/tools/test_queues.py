@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import logging
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from conftest import create_mock_hook, create_mock_workspace
 from rossum_api import APIClientError
 from rossum_api.domain_logic.resources import Resource
+from rossum_api.models import deserialize_default
 from rossum_api.models.engine import Engine
 from rossum_api.models.queue import Queue
 from rossum_api.models.schema import Schema
@@ -480,6 +483,178 @@ class TestGetQueueEngine:
             mock_client.retrieve_engine.assert_not_called()
 
 
+@pytest.mark.unit
+class TestGetQueueContext:
+    """Tests for get_queue_context tool."""
+
+    @staticmethod
+    def _setup_client(mock_client: AsyncMock, hooks: list | None = None) -> dict:
+        """Wire the client mocks used by get_queue_context and return captured hook filters."""
+        mock_client.retrieve_queue.return_value = create_mock_queue(
+            id=100,
+            schema="https://api.test.rossum.ai/v1/schemas/50",
+            engine="https://api.test.rossum.ai/v1/engines/7",
+            inbox="https://api.test.rossum.ai/v1/inboxes/3",
+            workspace="https://api.test.rossum.ai/v1/workspaces/2",
+            settings={"accepted_mime_types": ["application/pdf"], "ui_upload_enabled": True},
+        )
+        mock_client.retrieve_schema.return_value = deserialize_default(
+            Resource.Schema,
+            {
+                "id": 50,
+                "url": "https://api.test.rossum.ai/v1/schemas/50",
+                "name": "Invoice Schema",
+                "queues": [],
+                "metadata": {},
+                "content": [
+                    {
+                        "id": "header",
+                        "label": "Header",
+                        "category": "section",
+                        "children": [
+                            {
+                                "id": "invoice_id",
+                                "label": "Invoice ID",
+                                "category": "datapoint",
+                                "type": "string",
+                                "rir_field_names": ["document_id"],
+                                "constraints": {"required": False},
+                            }
+                        ],
+                    }
+                ],
+            },
+        )
+        mock_client.retrieve_engine.return_value = create_mock_engine(id=7)
+        mock_client.retrieve_workspace.return_value = create_mock_workspace(id=2)
+        mock_client._http_client.fetch_one.return_value = {"id": 3, "email": "in@test.rossum.app"}
+        mock_client._deserializer.side_effect = lambda resource, data: data
+
+        filters_received: dict = {}
+
+        async def mock_list_hooks(**filters):
+            filters_received.update(filters)
+            for hook in hooks or []:
+                yield hook
+
+        mock_client.list_hooks = mock_list_hooks
+        return filters_received
+
+    @pytest.mark.asyncio
+    async def test_get_queue_context_success(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that all related objects are fetched and returned together."""
+        register_queue_tools(mock_mcp, mock_client)
+        hook = create_mock_hook(id=9, config={"code": "def handler(): ...", "runtime": "python3.12"})
+        filters_received = self._setup_client(mock_client, hooks=[hook])
+
+        result = await mock_mcp._tools["get_queue_context"](queue_id=100)
+
+        assert result["queue"].id == 100
+        assert result["schema"].id == 50
+        assert result["engine"].id == 7
+        assert result["inbox"] == {"id": 3, "email": "in@test.rossum.app"}
+        assert result["workspace"].id == 2
+        assert [h.id for h in result["hooks"]] == [9]
+        assert "errors" not in result
+        assert filters_received == {"queue": 100}
+        mock_client.retrieve_queue.assert_called_once_with(100)
+        mock_client.retrieve_schema.assert_called_once_with(50)
+        mock_client.retrieve_engine.assert_called_once_with(7)
+        mock_client.retrieve_workspace.assert_called_once_with(2)
+        mock_client._http_client.fetch_one.assert_called_once_with(Resource.Inbox, 3)
+
+    @pytest.mark.asyncio
+    async def test_get_queue_context_truncates_verbose_fields(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that queue settings, schema content and hook code are compacted."""
+        register_queue_tools(mock_mcp, mock_client)
+        hook = create_mock_hook(
+            config={"code": "def handler(): ...", "runtime": "python3.12"},
+            guide="Long guide",
+            settings_schema={"type": "object"},
+        )
+        self._setup_client(mock_client, hooks=[hook])
+
+        result = await mock_mcp._tools["get_queue_context"](queue_id=100)
+
+        assert result["queue"].settings == {"accepted_mime_types": "<omitted>", "ui_upload_enabled": True}
+        assert result["schema"].content == [
+            {
+                "id": "header",
+                "label": "Header",
+                "category": "section",
+                "children": [{"id": "invoice_id", "label": "Invoice ID", "category": "datapoint", "type": "string"}],
+            }
+        ]
+        assert result["hooks"][0].config == {"code": "<omitted>", "runtime": "python3.12"}
+        assert result["hooks"][0].guide == "<omitted>"
+        assert result["hooks"][0].settings_schema == "<omitted>"
+
+    @pytest.mark.asyncio
+    async def test_get_queue_context_fetches_related_objects_concurrently(
+        self, mock_mcp: Mock, mock_client: AsyncMock
+    ) -> None:
+        """Test that schema, engine, inbox and workspace requests are in flight at the same time."""
+        register_queue_tools(mock_mcp, mock_client)
+        self._setup_client(mock_client)
+        barrier = asyncio.Barrier(4)
+
+        def waiting(value):
+            async def wait(*args):
+                await asyncio.wait_for(barrier.wait(), timeout=1)
+                return value
+
+            return wait
+
+        mock_client.retrieve_schema.side_effect = waiting(create_mock_schema(id=50))
+        mock_client.retrieve_engine.side_effect = waiting(create_mock_engine(id=7))
+        mock_client.retrieve_workspace.side_effect = waiting(create_mock_workspace(id=2))
+        mock_client._http_client.fetch_one.side_effect = waiting({"id": 3})
+
+        result = await mock_mcp._tools["get_queue_context"](queue_id=100)
+
+        assert result["schema"].id == 50
+        assert result["inbox"] == {"id": 3}
+
+    @pytest.mark.asyncio
+    async def test_get_queue_context_reports_failed_parts(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that a failing related object is reported without failing the whole call."""
+        register_queue_tools(mock_mcp, mock_client)
+        self._setup_client(mock_client)
+        mock_client._http_client.fetch_one.side_effect = APIClientError("GET", "inboxes/3", 403, "Forbidden")
+
+        result = await mock_mcp._tools["get_queue_context"](queue_id=100)
+
+        assert result["inbox"] is None
+        assert result["workspace"].id == 2
+        assert "403" in result["errors"]["inbox"]
+
+    @pytest.mark.asyncio
+    async def test_get_queue_context_without_inbox_and_engine(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test a queue without inbox or engine skips those requests."""
+        register_queue_tools(mock_mcp, mock_client)
+        self._setup_client(mock_client)
+        mock_client.retrieve_queue.return_value = create_mock_queue(id=100, inbox=None, engine=None)
+
+        result = await mock_mcp._tools["get_queue_context"](queue_id=100)
+
+        assert result["inbox"] is None
+        assert result["engine"] == {"message": "No engine assigned to this queue"}
+        mock_client._http_client.fetch_one.assert_not_called()
+        mock_client.retrieve_engine.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_queue_context_queue_not_found(self, mock_mcp: Mock, mock_client: AsyncMock) -> None:
+        """Test that a missing queue raises instead of returning a partial context."""
+        register_queue_tools(mock_mcp, mock_client)
+        self._setup_client(mock_client)
+        mock_client.retrieve_queue.side_effect = APIClientError("GET", "queues/100", 404, "Not Found")
+
+        with pytest.raises(APIClientError):
+            await mock_mcp._tools["get_queue_context"](queue_id=100)
+
+        mock_client.retrieve_schema.assert_not_called()
+
+
 @pytest.mark.unit
 class TestCreateQueue:
     """Tests for create_queue tool."""
@@ -11,8 +11,10 @@ from rossum_api.models.schema import Schema
 from rossum_mcp.tools import base, schemas
 from rossum_mcp.tools.schemas import (
     SchemaDatapoint,
+    SchemaIndex,
     SchemaMultivalue,
     SchemaNodeUpdate,
+    SchemaPatchStep,
     SchemaTuple,
     _apply_add_operation,
     _apply_remove_operation,
@@ -24,6 +26,7 @@ from rossum_mcp.tools.schemas import (
     _get_section_children_as_list,
     _remove_fields_from_content,
     apply_schema_patch,
+    apply_schema_patches,
     register_schema_tools,
 )
 
@@ -929,6 +932,335 @@ class TestApplySchemaPatch:
         assert result[0]["children"][0]["children"][0]["id"] == "new_field"
 
 
+def _bulk_patch_content() -> list[dict]:
+    return [
+        {
+            "id": "header_section",
+            "label": "Header",
+            "category": "section",
+            "children": [
+                {"id": "invoice_id", "label": "Invoice ID", "category": "datapoint", "type": "string"},
+                {
+                    "id": "line_items",
+                    "label": "Line Items",
+                    "category": "multivalue",
+                    "children": {
+                        "id": "line_item",
+                        "label": "Line Item",
+                        "category": "tuple",
+                        "children": [
+                            {"id": "item_amount", "label": "Amount", "category": "datapoint", "type": "number"},
+                        ],
+                    },
+                },
+            ],
+        }
+    ]
+
+
+@pytest.mark.unit
+class TestSchemaIndex:
+    """Tests for SchemaIndex class."""
+
+    def test_lookups(self) -> None:
+        """Test node, parent, path and ancestor lookups."""
+        content = _bulk_patch_content()
+        index = SchemaIndex(content)
+
+        assert index.ids() == {"header_section", "invoice_id", "line_items", "line_item", "item_amount"}
+        assert index.get("item_amount") is content[0]["children"][1]["children"]["children"][0]
+        assert index.parent("line_item") is content[0]["children"][1]
+        assert index.path("item_amount") == ("header_section", "line_items", "line_item")
+        assert index.ancestors({"item_amount", "invoice_id"}) == {"header_section", "line_items", "line_item"}
+        assert index.subtree_ids("line_items") == {"line_items", "line_item", "item_amount"}
+        assert "missing" not in index
+        assert index.get("missing") is None
+
+    def test_locate(self) -> None:
+        """Test locating nodes in list children, multivalue children and at the top level."""
+        content = _bulk_patch_content()
+        index = SchemaIndex(content)
+        section = content[0]
+        multivalue = section["children"][1]
+
+        assert index.locate("line_items") == (multivalue, 1, section["children"], section)
+        assert index.locate("line_item") == (multivalue["children"], 0, None, multivalue)
+        assert index.locate("header_section") == (section, 0, content, None)
+        assert index.locate("missing") == (None, None, None, None)
+
+    def test_incremental_updates(self) -> None:
+        """Test that add, update and remove keep the index in line with the content."""
+        content = _bulk_patch_content()
+        index = SchemaIndex(content)
+
+        index.add("line_item", {"id": "item_note", "label": "Note", "category": "datapoint", "type": "string"}, 0)
+        assert index.path("item_note") == ("header_section", "line_items", "line_item")
+        assert content[0]["children"][1]["children"]["children"][0]["id"] == "item_note"
+
+        index.update("invoice_id", {"id": "document_id"})
+        assert "invoice_id" not in index
+        assert index.get("document_id") is content[0]["children"][0]
+
+        removed = index.remove("line_items")
+        assert removed["id"] == "line_items"
+        assert index.ids() == {"header_section", "document_id"}
+        assert [child["id"] for child in content[0]["children"]] == ["document_id"]
+
+    def test_first_duplicate_wins(self) -> None:
+        """Test that the first node in document order is indexed for duplicated IDs."""
+        content = [
+            {"id": "s1", "category": "section", "children": [{"id": "dup", "label": "First"}]},
+            {"id": "s2", "category": "section", "children": [{"id": "dup", "label": "Second"}]},
+        ]
+
+        assert SchemaIndex(content).get("dup") == {"id": "dup", "label": "First"}
+
+
+@pytest.mark.unit
+class TestApplySchemaPatches:
+    """Tests for apply_schema_patches function."""
+
+    def test_applies_operations_in_order_in_place(self) -> None:
+        """Test that later operations see the result of earlier ones and content is mutated in place."""
+        content = _bulk_patch_content()
+
+        result = apply_schema_patches(
+            content,
+            [
+                SchemaPatchStep(
+                    operation="add",
+                    node_id="vendor_name",
+                    parent_id="header_section",
+                    node_data=SchemaDatapoint(label="Vendor", type="string"),
+                    position=0,
+                ),
+                SchemaPatchStep(
+                    operation="update", node_id="vendor_name", node_data=SchemaNodeUpdate(label="Vendor Name")
+                ),
+                SchemaPatchStep(
+                    operation="add",
+                    node_id="item_description",
+                    parent_id="line_item",
+                    node_data=SchemaDatapoint(label="Description", type="string"),
+                ),
+                SchemaPatchStep(operation="remove", node_id="invoice_id"),
+            ],
+        )
+
+        assert result is content
+        header_children = content[0]["children"]
+        assert [child["id"] for child in header_children] == ["vendor_name", "line_items"]
+        assert header_children[0]["label"] == "Vendor Name"
+        tuple_children = header_children[1]["children"]["children"]
+        assert [child["id"] for child in tuple_children] == ["item_amount", "item_description"]
+
+    def test_updated_children_are_indexed(self) -> None:
+        """Test that nodes introduced by an update can be targeted by later operations."""
+        content = _bulk_patch_content()
+
+        apply_schema_patches(
+            content,
+            [
+                SchemaPatchStep(
+                    operation="update",
+                    node_id="line_items",
+                    node_data=SchemaMultivalue(
+                        label="Line Items", children=SchemaTuple(id="new_item", label="New Item", children=[])
+                    ),
+                ),
+                SchemaPatchStep(
+                    operation="add",
+                    node_id="new_amount",
+                    parent_id="new_item",
+                    node_data=SchemaDatapoint(label="Amount", type="number"),
+                ),
+            ],
+        )
+
+        new_item = content[0]["children"][1]["children"]
+        assert new_item["id"] == "new_item"
+        assert new_item["children"][0]["id"] == "new_amount"
+
+    def test_removed_node_cannot_be_targeted(self) -> None:
+        """Test that a removed subtree is dropped from the index."""
+        content = _bulk_patch_content()
+
+        with pytest.raises(ValueError, match=r"Operation 1 \(update 'item_amount'\): Node 'item_amount' not found"):
+            apply_schema_patches(
+                content,
+                [
+                    SchemaPatchStep(operation="remove", node_id="line_items"),
+                    SchemaPatchStep(
+                        operation="update", node_id="item_amount", node_data=SchemaNodeUpdate(label="Total")
+                    ),
+                ],
+            )
+
+    def test_add_to_multivalue_fails(self) -> None:
+        """Test that adding directly to a multivalue is rejected."""
+        with pytest.raises(ValueError, match=r"Operation 0 .*Cannot add children to multivalue 'line_items'"):
+            apply_schema_patches(
+                _bulk_patch_content(),
+                [
+                    SchemaPatchStep(
+                        operation="add",
+                        node_id="x",
+                        parent_id="line_items",
+                        node_data=SchemaDatapoint(label="X", type="string"),
+                    )
+                ],
+            )
+
+    def test_remove_section_fails(self) -> None:
+        """Test that sections cannot be removed."""
+        with pytest.raises(ValueError, match="Cannot remove a section"):
+            apply_schema_patches(
+                _bulk_patch_content(), [SchemaPatchStep(operation="remove", node_id="header_section")]
+            )
+
+    def test_added_nodes_validated_after_all_operations(self) -> None:
+        """Test that an incomplete added node may be completed by a later update, but not left invalid."""
+        content = _bulk_patch_content()
+        add = SchemaPatchStep(
+            operation="add",
+            node_id="total",
+            parent_id="header_section",
+            node_data=SchemaDatapoint(label="Total"),
+        )
+
+        apply_schema_patches(
+            content,
+            [add, SchemaPatchStep(operation="update", node_id="total", node_data=SchemaNodeUpdate(type="number"))],
+        )
+        total = content[0]["children"][-1]
+        assert (total["id"], total["label"], total["category"], total["type"]) == (
+            "total",
+            "Total",
+            "datapoint",
+            "number",
+        )
+
+        with pytest.raises(ValueError, match="Datapoint missing required 'type' \\(operation 0, node 'total'\\)"):
+            apply_schema_patches(_bulk_patch_content(), [add])
+
+
+@pytest.mark.unit
+class TestBulkPatchSchema:
+    """Tests for bulk_patch_schema tool."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_patch_writes_once(
+        self, mock_mcp: Mock, mock_client: AsyncMock, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test that all operations are applied with a single read and a single write."""
+        monkeypatch.setenv("ROSSUM_MCP_MODE", "read-write")
+        importlib.reload(base)
+        importlib.reload(schemas)
+
+        schemas.register_schema_tools(mock_mcp, mock_client)
+
+        mock_client._http_client.request_json.return_value = {
+            "id": 50,
+            "modified_at": "2025-01-01T00:00:00Z",
+            "content": _bulk_patch_content(),
+        }
+        mock_client._http_client.update.return_value = {"id": 50}
+        mock_client._deserializer = Mock(return_value=create_mock_schema(id=50))
+
+        bulk_patch_schema = mock_mcp._tools["bulk_patch_schema"]
+        result = await bulk_patch_schema(
+            schema_id=50,
+            operations=[
+                SchemaPatchStep(
+                    operation="add",
+                    node_id="vendor_name",
+                    parent_id="header_section",
+                    node_data=SchemaDatapoint(label="Vendor", type="string"),
+                ),
+                SchemaPatchStep(operation="remove", node_id="invoice_id"),
+            ],
+            expected_modified_at="2025-01-01T00:00:00+00:00",
+        )
+
+        assert result.id == 50
+        mock_client._http_client.request_json.assert_called_once_with("GET", "schemas/50")
+        mock_client._http_client.update.assert_called_once()
+        updated_content = mock_client._http_client.update.call_args[0][2]["content"]
+        assert [child["id"] for child in updated_content[0]["children"]] == ["line_items", "vendor_name"]
+        mock_client.retrieve_schema.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_patch_stale_modified_at(
+        self, mock_mcp: Mock, mock_client: AsyncMock, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test that a concurrent modification is reported instead of overwritten."""
+        monkeypatch.setenv("ROSSUM_MCP_MODE", "read-write")
+        importlib.reload(base)
+        importlib.reload(schemas)
+
+        schemas.register_schema_tools(mock_mcp, mock_client)
+
+        mock_client._http_client.request_json.return_value = {
+            "id": 50,
+            "modified_at": "2025-01-02T00:00:00Z",
+            "content": _bulk_patch_content(),
+        }
+
+        bulk_patch_schema = mock_mcp._tools["bulk_patch_schema"]
+        result = await bulk_patch_schema(
+            schema_id=50,
+            operations=[SchemaPatchStep(operation="remove", node_id="invoice_id")],
+            expected_modified_at="2025-01-01T00:00:00Z",
+        )
+
+        assert "was modified at 2025-01-02T00:00:00Z" in result["error"]
+        mock_client._http_client.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_patch_failing_operation_writes_nothing(
+        self, mock_mcp: Mock, mock_client: AsyncMock, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test that a failing operation aborts the whole batch."""
+        monkeypatch.setenv("ROSSUM_MCP_MODE", "read-write")
+        importlib.reload(base)
+        importlib.reload(schemas)
+
+        schemas.register_schema_tools(mock_mcp, mock_client)
+
+        mock_client._http_client.request_json.return_value = {"id": 50, "content": _bulk_patch_content()}
+
+        bulk_patch_schema = mock_mcp._tools["bulk_patch_schema"]
+        result = await bulk_patch_schema(
+            schema_id=50,
+            operations=[
+                SchemaPatchStep(operation="remove", node_id="invoice_id"),
+                SchemaPatchStep(operation="remove", node_id="missing"),
+            ],
+        )
+
+        assert result == {"error": "Operation 1 (remove 'missing'): Node 'missing' not found in schema"}
+        mock_client._http_client.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_patch_read_only_mode(
+        self, mock_mcp: Mock, mock_client: AsyncMock, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test that bulk_patch_schema is blocked in read-only mode."""
+        monkeypatch.setenv("ROSSUM_MCP_MODE", "read-only")
+        importlib.reload(base)
+        importlib.reload(schemas)
+
+        schemas.register_schema_tools(mock_mcp, mock_client)
+
+        bulk_patch_schema = mock_mcp._tools["bulk_patch_schema"]
+        result = await bulk_patch_schema(
+            schema_id=50, operations=[SchemaPatchStep(operation="remove", node_id="invoice_id")]
+        )
+
+        assert result == {"error": "bulk_patch_schema is not available in read-only mode"}
+        mock_client._http_client.request_json.assert_not_called()
+
+
 @pytest.mark.unit
 class TestSchemaDataclasses:
     """Tests for schema dataclass types."""